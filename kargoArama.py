@@ -0,0 +1,166 @@
+import os
+import bisect
+import numpy as np
+import pandas as pd
+
+# Yazarken aramada gösterilen en fazla kargo sayısı (toplam eşleşme ayrıca bildirilir)
+ARAMA_SONUC_SINIRI = int(os.environ.get("KARGO_ARAMA_SINIRI", "500"))
+# Sonradan eklenen anahtarlar bu sayıya ulaşınca sıralı dizilere katılır
+ARAMA_TAMPON_ESIGI = 20000
+ARAMA_KOLONLARI = ['takip_no', 'gonderici_ad', 'alici_ad']
+
+# Türkçe harfler ASCII karşılıklarına katlanır: "Şahin", "ŞAHİN" ve "sahin" aynı anahtardır
+_TR_KATLAMA = str.maketrans({
+    'İ': 'i', 'I': 'i', 'ı': 'i', 'Ş': 's', 'ş': 's', 'Ç': 'c', 'ç': 'c',
+    'Ğ': 'g', 'ğ': 'g', 'Ö': 'o', 'ö': 'o', 'Ü': 'u', 'ü': 'u',
+    'Â': 'a', 'â': 'a', 'Î': 'i', 'î': 'i', 'Û': 'u', 'û': 'u',
+})
+# Her anahtardan büyük karakter; [önek, önek + _SON) aralığı önekle başlayan anahtarlardır
+_SON = '\U0010ffff'
+
+
+def tr_katla(metin):
+    """Aramada kullanılan katlanmış biçim (Türkçe harfler ASCII, küçük harf)."""
+    return str(metin).translate(_TR_KATLAMA).lower()
+
+
+def _katla_seri(seri):
+    """Seriyi tekil değerleri üzerinden katlar (aynı ad bir kez çevrilir)."""
+    kodlar, tekiller = pd.factorize(pd.Series(seri, dtype=object).fillna(''))
+    katlanmis = np.array([tr_katla(deger) for deger in tekiller], dtype=object)
+    return kodlar, katlanmis
+
+
+# --- Sıralı Önek İndeksi ---
+class OnekIndeksi:
+    """Katlanmış anahtar -> kargo kimlikleri; önek sorgusu sıralı dizide iki ikili aramadır.
+
+    Tekil anahtarlar sıralı bir dizide, kimlikler anahtar sırasına göre bitişik tutulur
+    (_konumlara_grupla ile aynı düzen). Yeni anahtarlar sıralı bir tampona eklenir, tampon
+    büyüyünce diziler yeniden kurulur.
+    """
+
+    def __init__(self):
+        self._anahtarlar = np.empty(0, dtype='U1')   # sıralı tekil anahtarlar
+        self._kimlikler = np.empty(0, dtype=np.int64)
+        self._sinirlar = np.zeros(1, dtype=np.int64)  # anahtar i -> _kimlikler[s[i]:s[i + 1]]
+        self._tampon = []                              # sıralı (anahtar, kimlik) listesi
+
+    def __len__(self):
+        return len(self._kimlikler) + len(self._tampon)
+
+    def olustur(self, kodlar, tekiller, kimlikler):
+        """kodlar[i], kimlikler[i] kaydının anahtarının tekiller içindeki yeridir (pd.factorize çıktısı)."""
+        tekiller = np.asarray(tekiller, dtype=str)
+        sira = np.argsort(tekiller, kind='stable')
+        # Kodlar, anahtarların sıralı dizideki yerine çevrilir; kayıtlar bu yere göre gruplanır
+        yer = np.empty(len(sira), dtype=np.int64)
+        yer[sira] = np.arange(len(sira))
+        yerler = yer[kodlar]
+        kayit_sirasi = np.argsort(yerler, kind='stable')
+        self._anahtarlar = tekiller[sira]
+        self._kimlikler = np.asarray(kimlikler, dtype=np.int64)[kayit_sirasi]
+        self._sinirlar = np.searchsorted(yerler[kayit_sirasi], np.arange(len(sira) + 1))
+        self._tampon = []
+
+    def ekle(self, anahtar, kimlik):
+        bisect.insort(self._tampon, (anahtar, kimlik))
+        if len(self._tampon) >= ARAMA_TAMPON_ESIGI:
+            self._tamponu_birlestir()
+
+    def _tamponu_birlestir(self):
+        anahtarlar = np.repeat(self._anahtarlar.astype(object), np.diff(self._sinirlar))
+        kimlikler = self._kimlikler
+        if self._tampon:
+            anahtarlar = np.concatenate([anahtarlar, np.array([a for a, _ in self._tampon], dtype=object)])
+            kimlikler = np.concatenate([kimlikler, np.array([k for _, k in self._tampon], dtype=np.int64)])
+        kodlar, tekiller = pd.factorize(anahtarlar)
+        self.olustur(kodlar, tekiller, kimlikler)
+
+    def onek(self, onek):
+        """Anahtarı onek ile başlayan kayıtların kimlikleri (tekrar içerebilir)."""
+        bas, son = np.searchsorted(self._anahtarlar, [onek, onek + _SON])
+        kimlikler = self._kimlikler[self._sinirlar[bas]:self._sinirlar[son]]
+        if not self._tampon:
+            return kimlikler
+        bas = bisect.bisect_left(self._tampon, (onek,))
+        son = bisect.bisect_left(self._tampon, (onek + _SON,))
+        return np.concatenate([kimlikler, np.array([k for _, k in self._tampon[bas:son]], dtype=np.int64)])
+
+    def iceriyor(self, anahtar):
+        i = int(np.searchsorted(self._anahtarlar, anahtar))
+        if i < len(self._anahtarlar) and self._anahtarlar[i] == anahtar:
+            return True
+        i = bisect.bisect_left(self._tampon, (anahtar,))
+        return i < len(self._tampon) and self._tampon[i][0] == anahtar
+
+
+# --- Kargo Arama İndeksi ---
+class KargoAramaIndeksi:
+    """Yazarken arama: takip numarası ve gönderici/alıcı adlarındaki kelimelerin önekleri.
+
+    Her kargoya ana tablodaki sırasıyla bir kimlik verilir. Sorgunun her kelimesi takip
+    numarası ya da ad kelimelerinden birinin öneki olmalıdır ("şah ay" -> Şahin Aydın);
+    kelime sonuçları kesiştirilir. Sorgu metin kolonlarını taramaz; maliyet eşleşme sayısı ve
+    kimlik başına bir bitlik maskeyle sınırlıdır.
+    """
+
+    def __init__(self):
+        self._nolar = []              # kimlik -> takip_no
+        self.takip = OnekIndeksi()    # katlanmış takip_no
+        self.adlar = OnekIndeksi()    # gönderici / alıcı adlarının katlanmış kelimeleri
+
+    def __len__(self):
+        return len(self._nolar)
+
+    def olustur(self, ana_df):
+        """İndeksi ana kargo tablosundan (ARAMA_KOLONLARI) kurar."""
+        n = len(ana_df)
+        self._nolar = ana_df['takip_no'].to_numpy(dtype=object).tolist()
+        kimlikler = np.arange(n, dtype=np.int64)
+        kodlar, katlanmis = _katla_seri(ana_df['takip_no'])
+        self.takip.olustur(kodlar, katlanmis, kimlikler)
+
+        # Adlar tekil değerler üzerinden kelimelere ayrılır, kelimeler satırlara kod olarak dağıtılır
+        kodlar, katlanmis = _katla_seri(pd.concat([ana_df['gonderici_ad'], ana_df['alici_ad']], ignore_index=True))
+        kelimeler = [ad.split() for ad in katlanmis]
+        adet = np.array([len(k) for k in kelimeler], dtype=np.int64)
+        ilk = np.concatenate([[0], np.cumsum(adet)[:-1]]).astype(np.int64)
+        kelime_kodlari, tekil_kelimeler = pd.factorize(
+            pd.Series([kelime for liste in kelimeler for kelime in liste], dtype=object)
+        )
+        satir_adedi = adet[kodlar]
+        toplam = int(satir_adedi.sum())
+        basa = np.repeat(np.cumsum(satir_adedi) - satir_adedi, satir_adedi)
+        yer = np.repeat(ilk[kodlar], satir_adedi) + np.arange(toplam) - basa
+        satirlar = np.repeat(np.tile(kimlikler, 2), satir_adedi)
+        self.adlar.olustur(kelime_kodlari[yer], tekil_kelimeler, satirlar)
+
+    def iceriyor(self, takip_no):
+        return self.takip.iceriyor(tr_katla(takip_no))
+
+    def ekle(self, ana_df):
+        """İndekste olmayan kargoları (ARAMA_KOLONLARI satırları) ekler."""
+        for takip_no, gonderici, alici in ana_df[ARAMA_KOLONLARI].itertuples(index=False, name=None):
+            if self.iceriyor(takip_no):
+                continue
+            kimlik = len(self._nolar)
+            self._nolar.append(takip_no)
+            self.takip.ekle(tr_katla(takip_no), kimlik)
+            for kelime in set(tr_katla(gonderici).split() + tr_katla(alici).split()):
+                self.adlar.ekle(kelime, kimlik)
+
+    def ara(self, metin, limit=ARAMA_SONUC_SINIRI):
+        """(toplam eşleşme, en fazla limit takip_no) döndürür; sonuçlar ana tablo sırasındadır."""
+        kelimeler = tr_katla(metin).split()
+        if not kelimeler:
+            return 0, []
+        # Kelime sonuçları kimlik maskelerinde birleştirilir: sıralama gerekmez, sonuçlar kimlik sırasında çıkar
+        maske = None
+        for kelime in kelimeler:
+            eslesen = np.zeros(len(self._nolar), dtype=bool)
+            eslesen[self.takip.onek(kelime)] = True
+            eslesen[self.adlar.onek(kelime)] = True
+            maske = eslesen if maske is None else maske & eslesen
+        sonuc = np.flatnonzero(maske)
+        return len(sonuc), [self._nolar[kimlik] for kimlik in sonuc[:limit].tolist()]
@@ -0,0 +1,325 @@
+import os
+import sys
+import glob
+import json
+import argparse
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import (
+    DATA_DIR, LOGLAR_DOSYASI, KARGOLAR_ANA_DOSYASI, KARGOLAR_GUNLUK_DOSYASI,
+    LOG_KOLONLARI, ANA_KOLONLARI, tarihleri_coz, tarih_metinleri, bos_log_tablosu
+)
+from kargoTarih import tarih_hata_tablosu
+from kargoOnbellek import LRUOnbellek
+from kargoEta import TESLIM_DURUMU
+from kargoCokluYazici import GrupYazici
+
+# Sıcak loglar aylık bölümlerde (loglar/kargo_loglari_YYYY-MM.csv) tutulur; yeni olaylar
+# bakıma kadar kargo_loglari.csv'ye eklenir. Teslim edilip yeterince eskiyen kargoların
+# tüm logları sıkıştırılmış arşiv bölümlerine (arsiv/kargo_loglari_YYYY-MM.csv.gz) taşınır.
+BOLUM_DIZINI = "loglar"
+ARSIV_DIZINI = "arsiv"
+BOLUM_ON_EKI = "kargo_loglari_"
+# Teslim anından bu kadar gün geçen kargolar bakımda arşivlenir
+ARSIV_YASI_GUN = int(os.environ.get("KARGO_ARSIV_GUN", "90"))
+# Bellekte tutulan (çözülmüş) arşiv bölümü sayısı; varsayılan bir yıllık arşiv
+ARSIV_ONBELLEK_BOYUTU = int(os.environ.get("KARGO_ARSIV_ONBELLEK", "12"))
+# gzip'in varsayılan 9. seviyesi bakımı birkaç kat yavaşlatıp çok az yer kazandırır
+ARSIV_SIKISTIRMA = {'method': 'gzip', 'compresslevel': 6}
+# Arşiv indeksi: sıralı takip_no'lar ve her birinin arşiv bölümü (YYYYMM); mmap ile açılır
+INDEKS_NOLAR = "indeks_nolar.npy"
+INDEKS_BOLUMLER = "indeks_bolumler.npy"
+
+
+def ay_kodlari(tarihler):
+    """Tarihleri YYYYMM tamsayılarına çevirir (vektörel); tarihsiz satırlar 0 olur."""
+    aylar = pd.to_datetime(tarihler).to_numpy(dtype='datetime64[M]')
+    bos = np.isnat(aylar)
+    ay_no = np.where(bos, 0, aylar.astype(np.int64))
+    kodlar = (1970 + ay_no // 12) * 100 + ay_no % 12 + 1
+    return np.where(bos, 0, kodlar)
+
+
+def bolum_dosya_adi(ay_kodu, uzanti=".csv"):
+    return f"{BOLUM_ON_EKI}{ay_kodu // 100:04d}-{ay_kodu % 100:02d}{uzanti}"
+
+
+def sicak_bolumler(veri_dizini):
+    """Sıcak bölüm dosyalarının yolları (ay sırasıyla)."""
+    return sorted(glob.glob(os.path.join(veri_dizini, BOLUM_DIZINI, f"{BOLUM_ON_EKI}*.csv")))
+
+
+def _bolum_ay_kodu(yol):
+    """'.../kargo_loglari_2025-12.csv(.gz)' -> 202512"""
+    ay = os.path.basename(yol)[len(BOLUM_ON_EKI):len(BOLUM_ON_EKI) + 7]
+    return int(ay[:4]) * 100 + int(ay[5:])
+
+
+def _atomik_csv_yaz(df, yol, **kwargs):
+    gecici = yol + ".tmp"
+    df.to_csv(gecici, index=False, **kwargs)
+    os.replace(gecici, yol)
+
+
+def _atomik_npy_yaz(dizi, yol):
+    gecici = yol + ".tmp"
+    with open(gecici, 'wb') as f:
+        np.save(f, dizi)
+    os.replace(gecici, yol)
+
+
+def _log_dosyasi_oku(yol, ham_tarih=False, hatalar=None, **kwargs):
+    """Log dosyasını okur; ham_tarih ile çözülemeyen tarihlerin ham metni 'ham_tarih' kolonunda tutulur.
+
+    hatalar listesi verilirse çözülemeyen tarihler (TARIH_HATA_KOLONLARI) listeye eklenir.
+    """
+    kolonlar = LOG_KOLONLARI + ['ham_tarih'] if ham_tarih else LOG_KOLONLARI
+    df = pd.read_csv(yol, dtype={'takip_no': str}, **kwargs)
+    if df.empty:
+        return pd.DataFrame(columns=kolonlar)
+    df['takip_no'] = df['takip_no'].astype(str).str.strip()
+    ham = df['tarih']
+    dosya_hatalari = []
+    df['tarih'] = tarihleri_coz(ham, dosya_hatalari)
+    if dosya_hatalari and hatalar is not None:
+        hatalar.append(tarih_hata_tablosu(os.path.basename(yol), dosya_hatalari, 2))
+    if ham_tarih:
+        df['ham_tarih'] = ham.where(df['tarih'].isna())
+    return df[kolonlar]
+
+
+def _yazilacak_tarihler(df):
+    """Yazılacak tarih metinleri; çözülemeyen tarihlerin ham metni aynen korunur (bakım veri silmesin)."""
+    metinler = tarih_metinleri(df['tarih'])
+    if 'ham_tarih' in df.columns:
+        ham = df['ham_tarih'].to_numpy(dtype=object, na_value='')
+        metinler = np.where(ham != '', ham, metinler)
+    return metinler
+
+
+def _log_tablosu_yaz(df, yol, **kwargs):
+    _atomik_csv_yaz(df[LOG_KOLONLARI].assign(tarih=_yazilacak_tarihler(df)), yol, **kwargs)
+
+
+# --- Sıkıştırılmış Log Arşivi ---
+class LogArsivi:
+    """Arşivlenmiş kargoların loglarına erişim; bölümler ilk ıskalamada diskten okunur.
+
+    İndeks dosyaları bellek eşlemeli (mmap) açılır, bu yüzden bir numaranın arşivde
+    olup olmadığına bakmak arşivi belleğe yüklemez.
+    """
+
+    def __init__(self, veri_dizini):
+        self.dizin = os.path.join(veri_dizini, ARSIV_DIZINI)
+        self._nolar = None
+        self._bolumler = None
+        self._bolum_onbellegi = LRUOnbellek(ARSIV_ONBELLEK_BOYUTU)
+
+    def _indeksi_ac(self):
+        if self._nolar is None:
+            yol = os.path.join(self.dizin, INDEKS_NOLAR)
+            if os.path.exists(yol):
+                self._nolar = np.load(yol, mmap_mode='r')
+                self._bolumler = np.load(os.path.join(self.dizin, INDEKS_BOLUMLER), mmap_mode='r')
+            else:
+                self._nolar = np.empty(0, dtype='S1')
+                self._bolumler = np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        self._indeksi_ac()
+        return len(self._nolar)
+
+    def iceriyor(self, takip_no):
+        """Numara arşivde mi (tek ikili arama; get_logs'un sıcak yolunu yavaşlatmaz)."""
+        self._indeksi_ac()
+        if not len(self._nolar):
+            return False
+        anahtar = takip_no.encode('utf-8')
+        konum = int(self._nolar.searchsorted(anahtar))
+        return konum < len(self._nolar) and self._nolar[konum] == anahtar
+
+    def bolumleri_bul(self, takip_nolar):
+        """(sahipler, ay_kodlari): takip_nolar[sahipler[i]] kargosu ay_kodlari[i] bölümündedir."""
+        self._indeksi_ac()
+        if not len(self._nolar) or not len(takip_nolar):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)
+        anahtarlar = np.array([str(t).encode('utf-8') for t in takip_nolar], dtype=bytes)
+        # Bir kargo (yeniden açılıp tekrar arşivlendiyse) birden fazla bölümde olabilir
+        baslar = np.searchsorted(self._nolar, anahtarlar, side='left')
+        bitisler = np.searchsorted(self._nolar, anahtarlar, side='right')
+        uzunluklar = bitisler - baslar
+        sahipler = np.repeat(np.arange(len(anahtarlar)), uzunluklar)
+        kaymalar = np.repeat(baslar - (np.cumsum(uzunluklar) - uzunluklar), uzunluklar)
+        return sahipler, np.asarray(self._bolumler[np.arange(uzunluklar.sum()) + kaymalar])
+
+    def _bolum(self, ay_kodu):
+        """Arşiv bölümünü (DataFrame, takip_no -> satır konumları) olarak döndürür."""
+        bolum = self._bolum_onbellegi.al(ay_kodu)
+        if bolum is None:
+            df = _log_dosyasi_oku(os.path.join(self.dizin, bolum_dosya_adi(ay_kodu, ".csv.gz")))
+            bolum = (df, df.groupby('takip_no', sort=False).indices)
+            self._bolum_onbellegi.koy(ay_kodu, bolum)
+        return bolum
+
+    def loglar_coklu(self, takip_nolar):
+        """Arşivdeki kargoların loglarını (LOG_KOLONLARI) döndürür; arşivde olmayanların satırı olmaz."""
+        sahipler, ay_kodlari = self.bolumleri_bul(takip_nolar)
+        parcalar = []
+        for ay_kodu in np.unique(ay_kodlari):
+            df, konumlar = self._bolum(int(ay_kodu))
+            secilen = [konumlar[takip_nolar[s]] for s in sahipler[ay_kodlari == ay_kodu]
+                       if takip_nolar[s] in konumlar]
+            if secilen:
+                parcalar.append(df.iloc[np.concatenate(secilen)])
+        if not parcalar:
+            return bos_log_tablosu()
+        return pd.concat(parcalar, ignore_index=True)
+
+    def tum_loglar(self, hatalar=None):
+        """Tüm arşiv bölümlerini tek tabloda döndürür (SQLite'a aktarım gibi toplu işler için)."""
+        yollar = sorted(glob.glob(os.path.join(self.dizin, f"{BOLUM_ON_EKI}*.csv.gz")))
+        if not yollar:
+            return bos_log_tablosu()
+        return pd.concat([_log_dosyasi_oku(yol, hatalar=hatalar) for yol in yollar], ignore_index=True)
+
+    def ekle(self, loglar, ay_kodlari):
+        """Logları verilen arşiv bölümlerine ekler ve indeksi yeniden yazar (bakım sırasında)."""
+        os.makedirs(self.dizin, exist_ok=True)
+        kolonlar = LOG_KOLONLARI + ['ham_tarih'] if 'ham_tarih' in loglar.columns else LOG_KOLONLARI
+        loglar = loglar[kolonlar].reset_index(drop=True)
+        for ay_kodu in np.unique(ay_kodlari):
+            yol = os.path.join(self.dizin, bolum_dosya_adi(int(ay_kodu), ".csv.gz"))
+            yeni = loglar[ay_kodlari == ay_kodu]
+            if os.path.exists(yol):
+                # Yarıda kalmış bir bakımın tekrarında aynı satırlar çoğaltılmaz
+                eski = _log_dosyasi_oku(yol, ham_tarih=True)[kolonlar]
+                yeni = pd.concat([eski, yeni], ignore_index=True).drop_duplicates()
+            yeni = yeni.sort_values(by=['takip_no', 'tarih'], kind='stable')
+            _log_tablosu_yaz(yeni, yol, compression=ARSIV_SIKISTIRMA)
+
+        # İndeks: (takip_no, bölüm) çiftleri tekil ve takip_no'ya göre sıralı
+        self._indeksi_ac()
+        ciftler = pd.DataFrame({
+            'takip_no': np.concatenate([
+                np.asarray(self._nolar, dtype=bytes),
+                loglar['takip_no'].str.encode('utf-8').to_numpy(dtype=bytes)
+            ]),
+            'bolum': np.concatenate([np.asarray(self._bolumler), ay_kodlari]).astype(np.int32),
+        }).drop_duplicates().sort_values(by=['takip_no', 'bolum'], kind='stable')
+        self._nolar = self._bolumler = None
+        _atomik_npy_yaz(ciftler['takip_no'].to_numpy(dtype=bytes), os.path.join(self.dizin, INDEKS_NOLAR))
+        _atomik_npy_yaz(ciftler['bolum'].to_numpy(dtype=np.int32), os.path.join(self.dizin, INDEKS_BOLUMLER))
+        self._bolum_onbellegi.temizle()
+
+
+# --- Bölümleme ve Arşivleme Bakımı ---
+def _mevcut_durumlar(veri_dizini):
+    """Ana tablo + günlükten her kargonun güncel mevcut_durum'u."""
+    parcalar = []
+    for dosya in (KARGOLAR_ANA_DOSYASI, KARGOLAR_GUNLUK_DOSYASI):
+        yol = os.path.join(veri_dizini, dosya)
+        if os.path.exists(yol):
+            parcalar.append(pd.read_csv(yol, dtype={'takip_no': str}, usecols=ANA_KOLONLARI))
+    if not parcalar:
+        return pd.Series(dtype=object)
+    ana = pd.concat(parcalar, ignore_index=True)
+    ana['takip_no'] = ana['takip_no'].astype(str).str.strip()
+    return ana.drop_duplicates(subset='takip_no', keep='last').set_index('takip_no')['mevcut_durum']
+
+
+def bakim_yap(veri_dizini=None, arsiv_yasi_gun=ARSIV_YASI_GUN, simdi=None, ilerleme=None):
+    """kargo_loglari.csv'deki olayları aylık bölümlere dağıtır ve eski teslimatları arşivler.
+
+    Arşivlenen kargo: mevcut_durum'u "Teslim Edildi" olan ve son olayı arsiv_yasi_gun'den eski olan.
+    Sadece değişen bölümler yeniden yazılır. Uygulama kapalıyken çalıştırılmalıdır; çok yazıcılı
+    modda açık terminal varsa eklemeleri bakım süresince yazma kilidinde bekler.
+    Özet sözlüğü döndürür.
+    """
+    veri_dizini = veri_dizini or DATA_DIR
+    yazici = GrupYazici(veri_dizini, [os.path.join(veri_dizini, LOGLAR_DOSYASI)])
+    try:
+        with yazici.yeniden_yazim():
+            return _bakim(veri_dizini, arsiv_yasi_gun, simdi, ilerleme)
+    finally:
+        yazici.kapat()
+
+
+def _bakim(veri_dizini, arsiv_yasi_gun, simdi, ilerleme):
+    ilerleme = ilerleme or (lambda mesaj: None)
+    simdi = pd.Timestamp(simdi or datetime.now())
+    canli_yol = os.path.join(veri_dizini, LOGLAR_DOSYASI)
+    bolum_dizini = os.path.join(veri_dizini, BOLUM_DIZINI)
+    os.makedirs(bolum_dizini, exist_ok=True)
+
+    ilerleme("Sıcak bölümler okunuyor...")
+    dosyalar = sicak_bolumler(veri_dizini)
+    parcalar = [_log_dosyasi_oku(yol, ham_tarih=True) for yol in dosyalar]
+    kaynaklar = [np.full(len(df), _bolum_ay_kodu(yol)) for df, yol in zip(parcalar, dosyalar)]
+    if os.path.exists(canli_yol):
+        canli = _log_dosyasi_oku(canli_yol, ham_tarih=True)
+        parcalar.append(canli)
+        kaynaklar.append(np.full(len(canli), -1))   # -1: henüz bölümlenmemiş (canlı dosya)
+    if not parcalar:
+        return {'arsivlenen_kargo': 0, 'arsivlenen_satir': 0, 'yazilan_bolum': 0, 'sicak_satir': 0}
+    loglar = pd.concat(parcalar, ignore_index=True)
+    kaynak = np.concatenate(kaynaklar)
+
+    # 1. Arşivlenecek kargolar: teslim edilmiş ve son olayı eşikten eski
+    ilerleme("Arşivlenecek kargolar belirleniyor...")
+    son_tarih = loglar.groupby('takip_no', sort=False)['tarih'].transform('max')
+    mevcut_durum = loglar['takip_no'].map(_mevcut_durumlar(veri_dizini))
+    arsivlenecek = (
+        (mevcut_durum == TESLIM_DURUMU) & (son_tarih < simdi - pd.Timedelta(days=arsiv_yasi_gun))
+    ).to_numpy(dtype=bool)
+    if arsivlenecek.any():
+        ilerleme("Arşiv bölümleri yazılıyor...")
+        # Bir kargonun tüm logları teslim ayının bölümüne gider (tek bölümden okunabilsin)
+        LogArsivi(veri_dizini).ekle(loglar[arsivlenecek], ay_kodlari(son_tarih[arsivlenecek]))
+
+    # 2. Sıcak bölümler: her olay kendi ayının bölümünde; sadece değişen bölümler yazılır.
+    # Tarihi çözülemeyen satırlar bulundukları dosyada, ham metinleriyle kalır.
+    ilerleme("Sıcak bölümler yazılıyor...")
+    ay = ay_kodlari(loglar['tarih'])
+    hedef = np.where(ay > 0, ay, kaynak)
+    kalan = ~arsivlenecek
+    degisen = set(np.unique(hedef[kalan & (kaynak == -1) & (hedef > 0)]))
+    degisen |= set(np.unique(kaynak[arsivlenecek & (kaynak > 0)]))
+    yazilan = 0
+    for ay_kodu in sorted(degisen):
+        yol = os.path.join(bolum_dizini, bolum_dosya_adi(int(ay_kodu)))
+        bolum = loglar[kalan & (hedef == ay_kodu)].sort_values(by='tarih', kind='stable')
+        if bolum.empty:
+            for eski in (yol, yol + ".snap"):
+                if os.path.exists(eski):
+                    os.remove(eski)
+            continue
+        _log_tablosu_yaz(bolum, yol)
+        yazilan += 1
+
+    # 3. Canlı dosyada sadece tarihi çözülemeyen satırlar kalır
+    if os.path.exists(canli_yol):
+        _log_tablosu_yaz(loglar[kalan & (hedef == -1)], canli_yol)
+
+    return {
+        'arsivlenen_kargo': int(loglar.loc[arsivlenecek, 'takip_no'].nunique()),
+        'arsivlenen_satir': int(arsivlenecek.sum()),
+        'yazilan_bolum': yazilan,
+        'sicak_satir': int((~arsivlenecek).sum()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kargo loglarını aylık bölümlere ayırır ve eski teslimatları arşivler")
+    parser.add_argument("--veri-dizini", default=None)
+    parser.add_argument("--yas-gun", type=int, default=ARSIV_YASI_GUN,
+                        help="Teslim edildikten bu kadar gün sonra kargo arşivlenir")
+    args = parser.parse_args(argv)
+    ozet = bakim_yap(args.veri_dizini, args.yas_gun, ilerleme=print)
+    print(json.dumps(ozet, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,305 @@
+import os
+import sys
+import time
+import struct
+import shutil
+import argparse
+import tempfile
+import threading
+import multiprocessing
+
+try:
+    import fcntl
+except ImportError:   # Windows
+    fcntl = None
+    import msvcrt
+
+# Aynı data/ dizinini paylaşan operatör terminalleri (süreçler) için çok yazıcılı mod.
+# KARGO_COKLU_YAZICI=1 ile CSV motoru eklemelerini bu modülün GrupYazici'sı üzerinden yapar.
+COKLU_YAZICI_VARSAYILAN = os.environ.get("KARGO_COKLU_YAZICI", "0") == "1"
+YAZMA_KILIDI_DOSYASI = ".kargo_yazma.kilit"
+FSYNC_KILIDI_DOSYASI = ".kargo_fsync.kilit"
+# Günlük dosyalarının diske kalıcı yazıldığı (fsync edilmiş) bayt konumları
+KALICI_KONUM_DOSYASI = ".kargo_kalici_konum"
+STRES_KONUMU = "Stres Testi Şube"
+STRES_DURUMU = "Kabul Edildi"
+# Stres testinde süreçlerin başlamasını/bitmesini bekleme sınırı (saniye)
+STRES_ZAMAN_ASIMI = 600
+
+
+# --- Süreçler Arası Danışma Kilidi ---
+class DosyaKilidi:
+    """Dosya tabanlı danışma (advisory) kilidi: POSIX'te flock, Windows'ta msvcrt.locking.
+
+    Aynı süreç içindeki iş parçacıkları da bir threading.Lock ile sıraya girer
+    (flock aynı süreçteki ikinci açılışı da bekletir; süreç içi sıra ayrıca garanti edilir).
+    Windows'ta paylaşımlı kilit yoktur, paylaşımlı istek de özel kilit alır.
+    """
+
+    def __init__(self, yol):
+        self.yol = yol
+        self._surec_ici = threading.Lock()
+        self._fd = None
+
+    def kilitle(self, paylasimli=False):
+        self._surec_ici.acquire()
+        try:
+            if self._fd is None:
+                self._fd = os.open(self.yol, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_SH if paylasimli else fcntl.LOCK_EX)
+            else:
+                while True:
+                    try:
+                        os.lseek(self._fd, 0, os.SEEK_SET)
+                        msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK 10 saniye dener; kilit hâlâ doluysa beklemeye devam edilir
+                        continue
+        except BaseException:
+            self._surec_ici.release()
+            raise
+
+    def birak(self):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            self._surec_ici.release()
+
+    def __enter__(self):
+        self.kilitle()
+        return self
+
+    def __exit__(self, *exc):
+        self.birak()
+
+    def paylasimli(self):
+        """Okuyucular için paylaşımlı kilit bağlamı (with kilit.paylasimli(): ...)."""
+        return _PaylasimliKilit(self)
+
+    def kapat(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class _PaylasimliKilit:
+    def __init__(self, kilit):
+        self.kilit = kilit
+
+    def __enter__(self):
+        self.kilit.kilitle(paylasimli=True)
+        return self.kilit
+
+    def __exit__(self, *exc):
+        self.kilit.birak()
+
+
+# --- Grup Halinde Kalıcı Yazma (Group Commit) ---
+class GrupYazici:
+    """Paylaşılan, sadece sonuna eklenen günlük dosyalarına çok süreçli güvenli yazma.
+
+    Her ekleme yazma kilidi altında tek seferde yapılır (satırlar iç içe geçmez, kayıp olmaz).
+    Kalıcılık için fsync kilidini alan ilk süreç o ana kadar tüm terminallerin yazdıklarını
+    tek bir fsync ile diske indirir ve kalıcı konumları paylaşılan dosyaya yazar; kilidi
+    bekleyenlerin eklemeleri bu fsync'in kapsamındaysa tekrar fsync yapmazlar. Terminal
+    sayısı arttıkça bir fsync'in kapsadığı olay sayısı da artar.
+    """
+
+    def __init__(self, veri_dizini, dosyalar):
+        self.dosyalar = list(dosyalar)
+        self.yazma_kilidi = DosyaKilidi(os.path.join(veri_dizini, YAZMA_KILIDI_DOSYASI))
+        self.fsync_kilidi = DosyaKilidi(os.path.join(veri_dizini, FSYNC_KILIDI_DOSYASI))
+        self.kalici_yolu = os.path.join(veri_dizini, KALICI_KONUM_DOSYASI)
+        self._kalici_bicimi = "<" + "q" * len(self.dosyalar)
+        self.ekleme_sayisi = 0
+        self.fsync_sayisi = 0
+
+    def _boyutlar(self):
+        return tuple(os.path.getsize(yol) if os.path.exists(yol) else 0 for yol in self.dosyalar)
+
+    def _kalici_oku(self):
+        try:
+            with open(self.kalici_yolu, 'rb') as f:
+                veri = f.read(struct.calcsize(self._kalici_bicimi))
+            return struct.unpack(self._kalici_bicimi, veri)
+        except (OSError, struct.error):
+            return (-1,) * len(self.dosyalar)
+
+    def _kalici_yaz(self, boyutlar):
+        # Sadece fsync kilidi altında yazılır; kaybolması yalnızca fazladan bir fsync'e yol açar
+        with open(self.kalici_yolu, 'wb') as f:
+            f.write(struct.pack(self._kalici_bicimi, *boyutlar))
+
+    def ekle(self, yazim):
+        """yazim() geri çağırımını yazma kilidi altında çalıştırır, dönüşte veriler diske kalıcıdır."""
+        with self.yazma_kilidi:
+            sonuc = yazim()
+            hedef = self._boyutlar()
+        self.ekleme_sayisi += 1
+        self._kalici_yap(hedef)
+        return sonuc
+
+    def _kalici_yap(self, hedef):
+        with self.fsync_kilidi:
+            if all(kalici >= boyut for kalici, boyut in zip(self._kalici_oku(), hedef)):
+                # Başka bir terminalin fsync'i bu eklemeyi de kapsadı
+                return
+            # Boyut fsync'ten önce okunur: o ana kadar tamamlanan tüm eklemeler bu fsync'e girer
+            boyutlar = self._boyutlar()
+            for yol in self.dosyalar:
+                if os.path.exists(yol):
+                    fd = os.open(yol, os.O_RDWR)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+            self.fsync_sayisi += 1
+            self._kalici_yaz(boyutlar)
+
+    def yeniden_yazim(self):
+        """Günlükleri kısaltan/yeniden yazan işlemler (sıkıştırma, bakım) için iki kilidi birden tutan bağlam.
+
+        Çıkışta kalıcı konumlar sıfırlanır; bekleyenler bir sonraki fsync'te yeniden hesaplar.
+        """
+        return _YenidenYazim(self)
+
+    def kapat(self):
+        self.yazma_kilidi.kapat()
+        self.fsync_kilidi.kapat()
+
+
+class _YenidenYazim:
+    def __init__(self, yazici):
+        self.yazici = yazici
+
+    def __enter__(self):
+        self.yazici.yazma_kilidi.kilitle()
+        self.yazici.fsync_kilidi.kilitle()
+        return self.yazici
+
+    def __exit__(self, *exc):
+        try:
+            if os.path.exists(self.yazici.kalici_yolu):
+                os.remove(self.yazici.kalici_yolu)
+        finally:
+            self.yazici.fsync_kilidi.birak()
+            self.yazici.yazma_kilidi.birak()
+
+
+# --- Stres Testi: N süreç aynı dizine add_log yapar ---
+def _stres_sureci(veri_dizini, surec_no, olay_sayisi, engel, sonuclar):
+    from kargoCsvDepo import CsvDepolamaMotoru
+    import pandas as pd
+
+    try:
+        motor = CsvDepolamaMotoru(veri_dizini, anlik_goruntu=False, coklu_yazici=True)
+        motor.load_data()
+        engel.wait(STRES_ZAMAN_ASIMI)
+        for i in range(olay_sayisi):
+            motor.add_log(stres_takip_no(surec_no, i), pd.Timestamp.now(), STRES_KONUMU, STRES_DURUMU)
+        sonuclar.put((surec_no, motor.grup_yazici.fsync_sayisi, None))
+        motor.kapat()
+    except Exception as e:
+        engel.abort()
+        sonuclar.put((surec_no, 0, f"{type(e).__name__}: {e}"))
+
+
+def stres_takip_no(surec_no, sira):
+    return f"9{surec_no:03d}{sira:06d}"
+
+
+def stres_surecleri(veri_dizini, surec_sayisi, olay_sayisi):
+    """surec_sayisi süreç veri_dizini'ne aynı anda olay_sayisi'ar add_log yapar.
+
+    (toplam süre sn, toplam fsync sayısı) döndürür; bir süreç hata verirse RuntimeError fırlatır.
+    Süreç no'nun i. olayının takip numarası stres_takip_no(no, i)'dir.
+    """
+    # macOS/Windows ile aynı davranış için süreçler 'spawn' ile başlatılır
+    baglam = multiprocessing.get_context("spawn")
+    engel = baglam.Barrier(surec_sayisi + 1)
+    sonuclar = baglam.Queue()
+    surecler = [
+        baglam.Process(target=_stres_sureci, args=(veri_dizini, no, olay_sayisi, engel, sonuclar))
+        for no in range(surec_sayisi)
+    ]
+    for surec in surecler:
+        surec.start()
+    bas = None
+    try:
+        engel.wait(STRES_ZAMAN_ASIMI)
+        bas = time.perf_counter()
+    except threading.BrokenBarrierError:
+        # Bir süreç yüklemede hata verdi; hatası aşağıda raporlanır
+        pass
+    raporlar = [sonuclar.get(timeout=STRES_ZAMAN_ASIMI) for _ in surecler]
+    toplam_sure = time.perf_counter() - bas if bas is not None else 0.0
+    for surec in surecler:
+        surec.join()
+    hatalar = [rapor[2] for rapor in raporlar if rapor[2]]
+    if hatalar:
+        raise RuntimeError(f"Stres süreci başarısız: {hatalar[0]}")
+    return toplam_sure, sum(rapor[1] for rapor in raporlar)
+
+
+def stres_testi(surec_sayisi, olay_sayisi, kaynak_dizin=None):
+    """surec_sayisi süreç aynı data/ kopyasına olay_sayisi'ar add_log yapar; kayıp olay sayısını da döndürür."""
+    import pandas as pd
+    from kargoDepolama import LOGLAR_DOSYASI, KARGOLAR_ANA_DOSYASI, KARGOLAR_GUNLUK_DOSYASI
+
+    gecici = tempfile.mkdtemp(prefix="kargo_stres_")
+    veri_dizini = os.path.join(gecici, "data")
+    try:
+        if kaynak_dizin:
+            shutil.copytree(kaynak_dizin, veri_dizini)
+        else:
+            os.makedirs(veri_dizini)
+        toplam_sure, fsync_sayisi = stres_surecleri(veri_dizini, surec_sayisi, olay_sayisi)
+
+        beklenen = {stres_takip_no(no, i) for no in range(surec_sayisi) for i in range(olay_sayisi)}
+        loglar = pd.read_csv(os.path.join(veri_dizini, LOGLAR_DOSYASI), dtype=str)
+        yazilan = loglar.loc[loglar['konum'] == STRES_KONUMU, 'takip_no']
+        ana = pd.read_csv(os.path.join(veri_dizini, KARGOLAR_ANA_DOSYASI), dtype=str)['takip_no']
+        gunluk_yolu = os.path.join(veri_dizini, KARGOLAR_GUNLUK_DOSYASI)
+        if os.path.exists(gunluk_yolu):
+            ana = pd.concat([ana, pd.read_csv(gunluk_yolu, dtype=str)['takip_no']])
+        olay = surec_sayisi * olay_sayisi
+        return {
+            'surec': surec_sayisi,
+            'olay': olay,
+            'sure_sn': round(toplam_sure, 3),
+            'olay_per_sn': round(olay / toplam_sure, 1),
+            'fsync': fsync_sayisi,
+            'kayip_log': len(beklenen - set(yazilan)),
+            'cift_log': int(len(yazilan) - yazilan.nunique()),
+            'kayip_ana_kayit': len(beklenen - set(ana)),
+        }
+    finally:
+        shutil.rmtree(gecici, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çok yazıcılı mod stres testi: N süreç aynı veri dizinine add_log yapar")
+    parser.add_argument("--surec", type=int, nargs="+", default=[1, 2, 4, 8], help="Denenecek süreç sayıları")
+    parser.add_argument("--olay", type=int, default=500, help="Süreç başına add_log sayısı")
+    parser.add_argument("--veri-dizini", default=None, help="Kopyası üzerinde çalışılacak data/ (varsayılan: boş)")
+    args = parser.parse_args(argv)
+
+    kayip = False
+    print(f"{'süreç':>6} {'olay':>8} {'süre (sn)':>10} {'olay/sn':>10} {'fsync':>7} {'olay/fsync':>11} {'kayıp':>6}")
+    for surec_sayisi in args.surec:
+        sonuc = stres_testi(surec_sayisi, args.olay, args.veri_dizini)
+        kayip_sayisi = sonuc['kayip_log'] + sonuc['cift_log'] + sonuc['kayip_ana_kayit']
+        kayip = kayip or kayip_sayisi > 0
+        print(f"{sonuc['surec']:>6} {sonuc['olay']:>8} {sonuc['sure_sn']:>10} {sonuc['olay_per_sn']:>10} "
+              f"{sonuc['fsync']:>7} {sonuc['olay'] / max(sonuc['fsync'], 1):>11.1f} {kayip_sayisi:>6}")
+    return 1 if kayip else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,1072 @@
+import sys
+import os
+import io
+import csv
+import json
+import bisect
+from contextlib import nullcontext
+import pandas as pd
+import numpy as np
+
+from kargoDepolama import (
+    DepolamaMotoru, LOGLAR_DOSYASI, KULLANICILAR_DOSYASI, KARGOLAR_ANA_DOSYASI,
+    KARGOLAR_GUNLUK_DOSYASI, LOG_KOLONLARI, KULLANICI_KOLONLARI, ANA_KOLONLARI,
+    TARIH_FORMATI, VARSAYILAN_KULLANICILAR, tarihleri_coz, tarih_metinleri, bos_log_tablosu
+)
+from kargoTarih import TARIH_HATA_KOLONLARI, tarih_hata_tablosu
+from kargoKompakt import KompaktSema, TakipNoKodlayici, kategorileri_genislet
+from kargoArsiv import LogArsivi, sicak_bolumler
+from kargoOlcum import olcum
+from kargoCokluYazici import GrupYazici, COKLU_YAZICI_VARSAYILAN
+
+# Günlük bu kadar satıra ulaşınca kargolar_ana.csv yeniden yazılır ve günlük boşaltılır
+GUNLUK_SIKISTIRMA_ESIGI = 500
+# Bellekteki log tamponu bu boyuta ulaşınca ana DataFrame ile birleştirilir
+LOG_TAMPON_ESIGI = 10000
+# Yeni kargoların ana tablo satırları bu sayıya ulaşınca kargolar_ana_df ile birleştirilir
+ANA_TAMPON_ESIGI = 1000
+# Bundan büyük toplu eklemelerde takip indeksi kargo bazında güncellenmez,
+# ilk sorguda tek geçişte yeniden kurulur
+TOPLU_INDEKS_ESIGI = 50000
+# Bundan küçük log grupları (ör. başka terminalden okunan birkaç satır) kargo_df'e
+# concat edilmez, add_log gibi tampona eklenir
+TAMPON_GRUP_ESIGI = 1000
+# KARGO_KOMPAKT=1 ile CSV motoru bellekte kompakt şemayı kullanır (bkz. kargoKompakt)
+KOMPAKT_VARSAYILAN = os.environ.get("KARGO_KOMPAKT", "0") == "1"
+# KARGO_KUMELI=1 ile kargo_df (takip_no, tarih) sırasında tutulur; kargonun geçmişi bitişik bir dilimdir
+KUMELI_VARSAYILAN = os.environ.get("KARGO_KUMELI", "0") == "1"
+
+
+def _satir_sonu_eksik(path):
+    """Dosya yeni satır karakteriyle bitmiyorsa True (ekleme önceki satıra yapışmasın diye)."""
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) not in (b'\n', b'\r')
+
+
+def csv_satir_ekle(path, satirlar, kolonlar):
+    """Satırları dosyanın sonuna ekler; dosyanın geri kalanına dokunmaz."""
+    yeni_dosya = not os.path.exists(path) or os.path.getsize(path) == 0
+    satir_sonu_eksik = not yeni_dosya and _satir_sonu_eksik(path)
+
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        baslangic = f.tell() if olcum.etkin else 0
+        if satir_sonu_eksik:
+            f.write(os.linesep)
+        writer = csv.writer(f, lineterminator=os.linesep)
+        if yeni_dosya:
+            writer.writerow(kolonlar)
+        writer.writerows(satirlar)
+        if olcum.etkin:
+            olcum.bayt_yazildi(f.tell() - baslangic)
+
+
+def csv_df_ekle(path, df):
+    """DataFrame'i dosyanın sonuna ekler (toplu yazım; başlık sadece yeni dosyaya yazılır)."""
+    if 'tarih' in df.columns and pd.api.types.is_datetime64_any_dtype(df['tarih']):
+        df = df.assign(tarih=tarih_metinleri(df['tarih']))
+    kolonlar = [df[kolon].to_numpy(dtype=object, na_value='') for kolon in df.columns]
+    csv_satir_ekle(path, zip(*kolonlar), list(df.columns))
+
+
+def _tarihi_coz(df, is_datetime):
+    """Boş tablonun tarih kolonunu da datetime64 yapar; object kalırsa eklenen loglarla birleşince
+    tarih hesapları (ETA, pano, doğrulama) bozulur."""
+    if is_datetime and 'tarih' in df.columns:
+        df['tarih'] = tarihleri_coz(df['tarih'])
+    return df
+
+
+def check_and_load(path, cols, is_datetime=False, hatalar=None):
+    """CSV dosyasını yükler; dosya yoksa boş tablo ile oluşturur.
+
+    hatalar listesi verilirse çözülemeyen tarihler (TARIH_HATA_KOLONLARI) listeye eklenir.
+    """
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Dosya yoksa, boş bir DataFrame oluştur ve dosyayı yaz.
+        df = pd.DataFrame(columns=cols)
+        try:
+            df.to_csv(path, index=False)
+        except Exception as e:
+            raise IOError(f"Dosya oluşturulamadı veya yazılamadı (İzin Hatası): {path} -> {e}")
+        return _tarihi_coz(df, is_datetime)
+    else:
+        # Dosya varsa, yükle.
+        try:
+            # Kimlik kolonları doğrudan metin okunur (karışık tip uyarısı ve tip tahmini olmaz)
+            df = pd.read_csv(path, dtype={col: str for col in ['takip_no', 'kullanici_adi', 'sifre']})
+            # KRİTİK: ID ve giriş alanlarını stringe zorla (eşleşme sorunlarını önler)
+            for col in ['takip_no', 'kullanici_adi', 'sifre']:
+                if col in df.columns:
+                    df[col] = df[col].astype(str).str.strip()
+            if df.empty and len(cols) > 0:
+                 df = pd.DataFrame(columns=cols)
+
+            if is_datetime and 'tarih' in df.columns and df.empty:
+                return _tarihi_coz(df, is_datetime)
+            if is_datetime and 'tarih' in df.columns:
+                # Her satır kendi biçimiyle (ISO / TR) çözülür; çözülemeyenler NaT olur ve raporlanır
+                dosya_hatalari = []
+                df['tarih'] = tarihleri_coz(df['tarih'], dosya_hatalari)
+                if dosya_hatalari and hatalar is not None:
+                    # Başlık satırı 1. satırdır
+                    hatalar.append(tarih_hata_tablosu(os.path.basename(path), dosya_hatalari, 2))
+
+            return df
+        except Exception as e:
+            # Format veya İçerik Hatası
+            raise IOError(f"Dosya okunamadı veya format hatası var: {path} -> {e}")
+
+
+# --- İkili Anlık Görüntü (Snapshot) Önbelleği ---
+# Her CSV'nin yanına, çözülmüş DataFrame'in ikili kopyası yazılır. CSV'nin boyutu ve
+# değişiklik zamanı görüntüdekiyle aynıysa yavaş CSV okuma/tarih çözme adımı atlanır.
+ANLIK_GORUNTU_UZANTISI = ".snap"
+# 2: tarihler satır bazında çözülür; eski görüntülerde yanlışlıkla NaT olmuş tarihler olabilir
+# 3: boş log dosyalarının tarih kolonu da datetime64'tür (eski görüntülerde object)
+# 4: pickle yerine JSON başlık + .npy kolonları; görüntü paylaşılan data/ dizinindedir ve
+#    yüklenmesi kod çalıştıramamalıdır (diziler allow_pickle=False ile okunur)
+ANLIK_GORUNTU_SURUMU = 4
+# Dosya düzeni: sihir, başlık uzunluğu (uint32), JSON başlık, kolonların .npy dizileri sırayla
+ANLIK_GORUNTU_SIHRI = b'KARGOSNP'
+
+
+def _dosya_imzasi(path):
+    bilgi = os.stat(path)
+    return bilgi.st_size, bilgi.st_mtime_ns
+
+
+def _metin_dizisi(degerler):
+    """Metin listesini sabit genişlikli unicode diziye çevirir (.npy'de pickle'sız saklanabilir)."""
+    return np.array(list(degerler), dtype=str) if len(degerler) else np.empty(0, dtype='U1')
+
+
+def _kolonu_ayir(seri):
+    """Kolonu (başlık bilgisi, .npy dizileri) ikilisine çevirir; saklanamayan kolon için None.
+
+    Metin kolonları kod + tekil metin dizisi, kategorikler kod + kategori dizisi olarak saklanır
+    (kod -1: boş değer); tarihler int64, sayılar olduğu gibi yazılır.
+    """
+    tip = seri.dtype
+    if isinstance(tip, pd.CategoricalDtype):
+        kategoriler = tip.categories
+        if not all(isinstance(k, str) for k in kategoriler):
+            return None
+        bilgi = {'tur': 'kategorik', 'sirali': bool(tip.ordered), 'kategori_tipi': str(kategoriler.dtype)}
+        return bilgi, [seri.cat.codes.to_numpy(), _metin_dizisi(kategoriler)]
+    if pd.api.types.is_datetime64_dtype(tip):
+        return {'tur': 'tarih', 'tip': str(tip)}, [seri.to_numpy().view(np.int64)]
+    if pd.api.types.is_string_dtype(tip):
+        kodlar, tekiller = pd.factorize(seri)
+        if not all(isinstance(t, str) for t in tekiller):
+            return None
+        return {'tur': 'metin', 'tip': str(tip)}, [kodlar, _metin_dizisi(tekiller)]
+    if tip.kind in 'iufb':
+        return {'tur': 'sayi'}, [seri.to_numpy()]
+    return None
+
+
+def _kolonu_kur(bilgi, diziler):
+    tur = bilgi['tur']
+    if tur == 'kategorik':
+        return pd.Categorical.from_codes(
+            diziler[0], categories=pd.Index(diziler[1].astype(object), dtype=bilgi['kategori_tipi']),
+            ordered=bilgi['sirali']
+        )
+    if tur == 'tarih':
+        return diziler[0].view(bilgi['tip'])
+    if tur == 'metin':
+        # Kod -1 dizinin sonundaki boş değere düşer
+        degerler = np.append(diziler[1].astype(object), np.nan)[diziler[0]]
+        return degerler if bilgi['tip'] == 'object' else pd.array(degerler, dtype=bilgi['tip'])
+    return diziler[0]
+
+
+def anlik_goruntu_oku(path, tur='duz', hatalar=None):
+    """CSV değişmediyse görüntüdeki (DataFrame, ek) ikilisini, aksi halde None döndürür.
+
+    Görüntü yazılırken kaydedilen tarih hataları hatalar listesine eklenir.
+    """
+    goruntu_yolu = path + ANLIK_GORUNTU_UZANTISI
+    if not os.path.exists(path) or not os.path.exists(goruntu_yolu):
+        return None
+    try:
+        with open(goruntu_yolu, 'rb') as f:
+            if f.read(len(ANLIK_GORUNTU_SIHRI)) != ANLIK_GORUNTU_SIHRI:
+                return None
+            meta = json.loads(f.read(int.from_bytes(f.read(4), 'little')).decode('utf-8'))
+            if (meta.get('surum') != ANLIK_GORUNTU_SURUMU or meta.get('tur') != tur
+                    or meta.get('imza') != list(_dosya_imzasi(path))):
+                return None
+            kolonlar = {}
+            for ad, bilgi, dizi_sayisi in meta['kolonlar']:
+                diziler = [np.lib.format.read_array(f, allow_pickle=False) for _ in range(dizi_sayisi)]
+                kolonlar[ad] = _kolonu_kur(bilgi, diziler)
+        df = pd.DataFrame(kolonlar, columns=[kolon[0] for kolon in meta['kolonlar']])
+        if hatalar is not None and meta.get('tarih_hatalari') is not None:
+            hatalar.append(pd.DataFrame(meta['tarih_hatalari'], columns=TARIH_HATA_KOLONLARI))
+        ek = TakipNoKodlayici(meta['ek']) if meta.get('ek') is not None else None
+        return df, ek
+    except Exception:
+        # Bozuk/eski görüntü: yavaş yoldan okunup yeniden yazılır
+        return None
+
+
+def anlik_goruntu_yaz(path, df, imza, tur='duz', ek=None, tarih_hatalari=None):
+    """DataFrame'i CSV'nin okunduğu andaki imzasıyla birlikte ikili olarak saklar.
+
+    tur, aynı CSV'nin farklı bellek şemalarındaki (düz / kompakt) görüntülerini ayırır;
+    ek, şemanın takip_no kodlayıcısıdır (yan tablosu saklanır). tarih_hatalari, görüntüden
+    yüklemede de raporlanabilsin diye saklanır. Saklanamayan bir kolon varsa görüntü yazılmaz.
+    """
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        return
+    ayrilmis = [_kolonu_ayir(df[kolon]) for kolon in df.columns]
+    if any(parca is None for parca in ayrilmis):
+        return
+    meta = {
+        'surum': ANLIK_GORUNTU_SURUMU, 'tur': tur, 'imza': list(imza),
+        'kolonlar': [[str(kolon), bilgi, len(diziler)] for kolon, (bilgi, diziler) in zip(df.columns, ayrilmis)],
+        'ek': ek.yan_tablo() if ek is not None else None,
+        'tarih_hatalari': None if tarih_hatalari is None else {
+            kolon: [None if pd.isna(deger) else deger for deger in tarih_hatalari[kolon].tolist()]
+            for kolon in TARIH_HATA_KOLONLARI
+        },
+    }
+    baslik = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+    goruntu_yolu = path + ANLIK_GORUNTU_UZANTISI
+    # Aynı dizini paylaşan terminaller aynı görüntüyü aynı anda yazabilir; geçici dosya süreç başınadır
+    gecici = f"{goruntu_yolu}.{os.getpid()}.tmp"
+    try:
+        with open(gecici, 'wb') as f:
+            f.write(ANLIK_GORUNTU_SIHRI)
+            f.write(len(baslik).to_bytes(4, 'little'))
+            f.write(baslik)
+            for _, diziler in ayrilmis:
+                for dizi in diziler:
+                    np.lib.format.write_array(f, np.ascontiguousarray(dizi), allow_pickle=False)
+            olcum.bayt_yazildi(f.tell())
+        os.replace(gecici, goruntu_yolu)
+    except OSError:
+        # Salt okunur dizin vb.: önbellek olmadan devam edilir
+        if os.path.exists(gecici):
+            os.remove(gecici)
+
+
+def _konumlara_grupla(takip_degerleri):
+    """Satırları takip_no'ya göre gruplar (factorize + stable argsort; groupby'dan hızlı).
+
+    (anahtarlar, sira, sinirlar) döndürür: i. anahtarın satır konumları sira[sinirlar[i]:sinirlar[i + 1]].
+    """
+    kodlar, anahtarlar = pd.factorize(takip_degerleri)
+    sira = np.argsort(kodlar, kind='stable')
+    sinirlar = np.searchsorted(kodlar[sira], np.arange(len(anahtarlar) + 1))
+    return anahtarlar, sira, sinirlar
+
+
+class TakipIndeksi:
+    """takip_no -> kargo_df satır konumları eşlemesi (O(1) log sorgusu için)."""
+
+    def __init__(self):
+        self._gruplar = {}   # takip_no -> grup numarası
+        self._sira = np.empty(0, dtype=np.int64)      # takip_no'ya göre gruplanmış satır konumları
+        self._sinirlar = np.zeros(1, dtype=np.int64)  # grup başlangıçları
+        self._ekler = {}     # sonradan eklenen konumlar (add_log ve küçük toplu eklemeler)
+
+    def olustur(self, takip_serisi):
+        """İndeksi tek bir vektörel geçişle sıfırdan kurar."""
+        anahtarlar, self._sira, self._sinirlar = _konumlara_grupla(takip_serisi.to_numpy())
+        self._gruplar = dict(zip(anahtarlar, range(len(anahtarlar))))
+        self._ekler = {}
+
+    def ekle(self, takip_no, konum, tarih=None):
+        """Tampona eklenen bir logun konumunu kaydeder (tarih sadece kümeli indekste kullanılır)."""
+        self._ekler.setdefault(takip_no, []).append(konum)
+
+    def toplu_ekle(self, takip_serisi, baslangic):
+        """Konumları baslangic'tan itibaren ardışık olan bir log grubunu indekse ekler."""
+        anahtarlar, sira, sinirlar = _konumlara_grupla(takip_serisi.to_numpy())
+        sira = (sira + baslangic).tolist()
+        for i, takip_no in enumerate(anahtarlar):
+            self._ekler.setdefault(takip_no, []).extend(sira[sinirlar[i]:sinirlar[i + 1]])
+
+    def konumlar(self, takip_no):
+        """Kargoya ait satır konumlarını döndürür."""
+        grup = self._gruplar.get(takip_no)
+        ana = None if grup is None else self._sira[self._sinirlar[grup]:self._sinirlar[grup + 1]]
+        ek = self._ekler.get(takip_no)
+        if ek is None:
+            return ana if ana is not None else np.empty(0, dtype=np.int64)
+        if ana is None:
+            return np.asarray(ek, dtype=np.int64)
+        return np.concatenate([ana, ek])
+
+    def konumlar_coklu(self, takip_nolari):
+        """Birçok kargonun satır konumlarını tek seferde toplar.
+
+        (konumlar, sahipler) döndürür: sahipler[i], konumlar[i]'nin takip_nolari içindeki sırasıdır.
+        """
+        gruplar = np.array([self._gruplar.get(t, -1) for t in takip_nolari], dtype=np.int64)
+        bulunan = np.flatnonzero(gruplar >= 0)
+        baslar = self._sinirlar[gruplar[bulunan]]
+        uzunluklar = self._sinirlar[gruplar[bulunan] + 1] - baslar
+        # Ardışık aralıkların [bas, bas + uzunluk) birleşimi, Python döngüsü olmadan
+        kaymalar = np.repeat(baslar - (np.cumsum(uzunluklar) - uzunluklar), uzunluklar)
+        konumlar = [self._sira[np.arange(uzunluklar.sum()) + kaymalar]]
+        sahipler = [np.repeat(bulunan, uzunluklar)]
+        if self._ekler:
+            for i, takip_no in enumerate(takip_nolari):
+                ek = self._ekler.get(takip_no)
+                if ek:
+                    konumlar.append(np.asarray(ek, dtype=np.int64))
+                    sahipler.append(np.full(len(ek), i, dtype=np.int64))
+        return np.concatenate(konumlar), np.concatenate(sahipler)
+
+    def __len__(self):
+        return len(self._gruplar.keys() | self._ekler.keys())
+
+    def bellek_kullanimi(self):
+        """İndeksin yaklaşık bellek kullanımı (bayt)."""
+        toplam = sys.getsizeof(self._gruplar) + self._sira.nbytes + self._sinirlar.nbytes
+        toplam += sum(sys.getsizeof(anahtar) for anahtar in self._gruplar)
+        toplam += sys.getsizeof(self._ekler)
+        for anahtar, liste in self._ekler.items():
+            toplam += sys.getsizeof(anahtar) + sys.getsizeof(liste) + 28 * len(liste)
+        return toplam
+
+
+def _zamanlar(tarih_serisi):
+    """Tarih kolonunun int64 nanosaniyeleri (NaT en küçük değer olur; kümeli sıralama anahtarı)."""
+    return tarih_serisi.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+def _zaman(tarih):
+    return np.iinfo(np.int64).min if pd.isna(tarih) else pd.Timestamp(tarih).value
+
+
+def kumeli_sira(df):
+    """Satırları (takip_no, tarih) sırasına dizen permütasyon."""
+    kodlar, _ = pd.factorize(df['takip_no'], sort=True)
+    return np.lexsort((_zamanlar(df['tarih']), kodlar))
+
+
+def kumele(df):
+    """Log tablosunu (takip_no, tarih) sırasına dizer; her kargonun geçmişi bitişik bir dilim olur."""
+    if df.empty:
+        return df
+    return df.take(kumeli_sira(df)).reset_index(drop=True)
+
+
+def kumeli_birlestirme_sirasi(eski, yeni):
+    """Kümeli eski tablo ile yeni satırların birleşimini (concat sırası) kümeli yapan permütasyon.
+
+    Eski tablo yeniden sıralanmaz: yeni satırlar kendi aralarında dizilir ve her birinin yeri
+    kargosunun dilimi içinde ikili aramayla bulunur, sonra tek geçişte araya yerleştirilir.
+    """
+    n = len(eski)
+    ic_sira = kumeli_sira(yeni)
+    anahtarlar = eski['takip_no'].to_numpy()
+    yeni_anahtarlar = yeni['takip_no'].to_numpy()[ic_sira]
+    yeni_zamanlar = _zamanlar(yeni['tarih'])[ic_sira]
+    yerler = np.searchsorted(anahtarlar, yeni_anahtarlar, side='left')
+    sonlar = np.searchsorted(anahtarlar, yeni_anahtarlar, side='right')
+    zamanlar = _zamanlar(eski['tarih'])
+    for i in np.flatnonzero(sonlar > yerler):
+        bas = yerler[i]
+        yerler[i] = bas + np.searchsorted(zamanlar[bas:sonlar[i]], yeni_zamanlar[i], side='right')
+    return np.insert(np.arange(n), yerler, n + ic_sira)
+
+
+class KumeliIndeks(TakipIndeksi):
+    """(takip_no, tarih) sırasındaki kargo_df için indeks: kargonun logları bitişik bir dilimdir.
+
+    Satır başına konum dizisi ve takip_no sözlüğü tutulmaz; sadece tekil takip numaraları ile
+    dilim sınırları vardır ve kargo searchsorted ile bulunur. Tampondaki loglar kargo başına
+    tarih sırasıyla (küçük, sıralı bir ek olarak) tutulur; tampon birleşince indeks yenilenir.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._anahtarlar = np.empty(0, dtype=object)  # sıralı tekil takip_no'lar
+        self._ekler = {}     # takip_no -> [(tarih ns, konum), ...] tarih sıralı
+
+    def olustur(self, takip_serisi):
+        """Kümeli kolondan dilim sınırlarını çıkarır (sıralama yapılmaz)."""
+        degerler = takip_serisi.to_numpy()
+        baslar = np.flatnonzero(degerler[1:] != degerler[:-1]) + 1
+        baslar = np.concatenate([[0], baslar]).astype(np.int64) if len(degerler) else baslar
+        self._anahtarlar = degerler[baslar]
+        self._sinirlar = np.append(baslar, len(degerler))
+        self._ekler = {}
+
+    def ekle(self, takip_no, konum, tarih=None):
+        bisect.insort(self._ekler.setdefault(takip_no, []), (_zaman(tarih), konum))
+
+    def _gruplar_bul(self, takip_nolari):
+        """Her anahtarın dilim numarası (bulunamazsa -1)."""
+        gruplar = np.full(len(takip_nolari), -1, dtype=np.int64)
+        bilinen = [i for i, takip_no in enumerate(takip_nolari) if takip_no is not None]
+        if not bilinen or not len(self._anahtarlar):
+            return gruplar
+        anahtarlar = np.asarray([takip_nolari[i] for i in bilinen], dtype=self._anahtarlar.dtype)
+        yerler = np.searchsorted(self._anahtarlar, anahtarlar)
+        esit = self._anahtarlar[np.minimum(yerler, len(self._anahtarlar) - 1)] == anahtarlar
+        gruplar[np.asarray(bilinen)[esit]] = yerler[esit]
+        return gruplar
+
+    def _ek_konumlari(self, takip_no):
+        return [konum for _, konum in self._ekler.get(takip_no, ())]
+
+    def _grup(self, takip_no):
+        grup = int(np.searchsorted(self._anahtarlar, takip_no))
+        return grup if grup < len(self._anahtarlar) and self._anahtarlar[grup] == takip_no else -1
+
+    def konumlar(self, takip_no):
+        grup = self._grup(takip_no)
+        ana = np.arange(self._sinirlar[grup], self._sinirlar[grup + 1]) if grup >= 0 else np.empty(0, dtype=np.int64)
+        ek = self._ek_konumlari(takip_no)
+        return np.concatenate([ana, np.asarray(ek, dtype=np.int64)]) if ek else ana
+
+    def konumlar_coklu(self, takip_nolari):
+        gruplar = self._gruplar_bul(takip_nolari)
+        bulunan = np.flatnonzero(gruplar >= 0)
+        baslar = self._sinirlar[gruplar[bulunan]]
+        uzunluklar = self._sinirlar[gruplar[bulunan] + 1] - baslar
+        konumlar = [np.arange(uzunluklar.sum()) + np.repeat(baslar - (np.cumsum(uzunluklar) - uzunluklar), uzunluklar)]
+        sahipler = [np.repeat(bulunan, uzunluklar)]
+        if self._ekler:
+            for i, takip_no in enumerate(takip_nolari):
+                ek = self._ek_konumlari(takip_no)
+                if ek:
+                    konumlar.append(np.asarray(ek, dtype=np.int64))
+                    sahipler.append(np.full(len(ek), i, dtype=np.int64))
+        return np.concatenate(konumlar), np.concatenate(sahipler)
+
+    def __len__(self):
+        yeni = sum(1 for takip_no in self._ekler if self._grup(takip_no) < 0)
+        return len(self._anahtarlar) + yeni
+
+    def bellek_kullanimi(self):
+        toplam = self._anahtarlar.nbytes + self._sinirlar.nbytes
+        if self._anahtarlar.dtype == object:
+            toplam += sum(sys.getsizeof(anahtar) for anahtar in self._anahtarlar)
+        toplam += sys.getsizeof(self._ekler)
+        for anahtar, liste in self._ekler.items():
+            toplam += sys.getsizeof(anahtar) + sys.getsizeof(liste) + 100 * len(liste)
+        return toplam
+
+
+# --- CSV Tabanlı Depolama Motoru (3 Tabloyu Yönetir) ---
+class CsvDepolamaMotoru(DepolamaMotoru):
+    ad = 'csv'
+
+    def __init__(self, veri_dizini=None, anlik_goruntu=True, kompakt=None, coklu_yazici=None, kumeli=None):
+        super().__init__(veri_dizini)
+        self.anlik_goruntu = anlik_goruntu
+        if kompakt is None:
+            kompakt = KOMPAKT_VARSAYILAN
+        # Kompakt şemada kargo_df['takip_no'] int64 koddur; metne takip_no_metinleri ile çevrilir
+        self._sema = KompaktSema() if kompakt else None
+        self.csv_loglari = self.dosya_yolu(LOGLAR_DOSYASI)
+        self.csv_kullanicilar = self.dosya_yolu(KULLANICILAR_DOSYASI)
+        self.csv_kargolar_ana = self.dosya_yolu(KARGOLAR_ANA_DOSYASI)
+        self.csv_kargolar_gunluk = self.dosya_yolu(KARGOLAR_GUNLUK_DOSYASI)
+
+        self._kargo_df = None
+        self._log_tamponu = []     # Henüz kargo_df ile birleştirilmemiş yeni loglar
+        self._log_dizileri = (None, None)  # (kargo_df, [tarih, konum, durum] dizileri); get_logs için
+        self._kullanicilar_df = None
+        self._kargolar_ana_df = None
+        self._ana_tamponu = []     # Henüz kargolar_ana_df ile birleştirilmemiş yeni kargo satırları
+        self._gunluk_satir_sayisi = 0
+        if kumeli is None:
+            kumeli = KUMELI_VARSAYILAN
+        # Kümeli düzende loglar (takip_no, tarih) sırasındadır; yeni loglar araya yerleştirilerek birleşir
+        self.kumeli = kumeli
+        self._takip_indeksi = KumeliIndeks() if kumeli else TakipIndeksi()
+        self._indeks_guncel = True
+        self._ana_konumlari = {}   # takip_no -> kargolar_ana_df satır etiketi
+        # Bakımda arşivlenen eski teslimatlar; get_logs ıskalarsa buraya bakılır
+        self.arsiv = LogArsivi(self.veri_dizini)
+        # Çok yazıcılı mod: birden fazla terminal aynı data/ dizinine yazar (bkz. kargoCokluYazici).
+        # Eklemeler kilit altında yapılır, grup halinde fsync edilir; ana dosya diskten birleştirilerek sıkıştırılır
+        if coklu_yazici is None:
+            coklu_yazici = COKLU_YAZICI_VARSAYILAN
+        self.grup_yazici = (
+            GrupYazici(self.veri_dizini, [self.csv_loglari, self.csv_kargolar_gunluk]) if coklu_yazici else None
+        )
+        # Artımlı yeniden yükleme: kargo_loglari.csv'nin belleğe alınmış bayt konumu ve dosya kimliği.
+        # Başka süreçlerin eklediği satırlar bu konumdan itibaren okunur (bkz. yeni_loglari_oku)
+        self._log_konumu = 0
+        self._log_kimligi = None
+        self._harici_loglar = []
+        self._tam_yukleme_gerekli = False
+        # Yüklenen log dosyalarında çözülemeyen tarihler (bkz. tarih_hatalari)
+        self._tarih_hatalari = []
+
+    @property
+    def kargo_df(self):
+        """Log tablosunu döndürür; tamponda bekleyen yeni loglar önce birleştirilir."""
+        self._tamponu_birlestir()
+        return self._kargo_df
+
+    @kargo_df.setter
+    def kargo_df(self, df):
+        self._kargo_df = df
+        self._log_tamponu = []
+
+    @property
+    def kullanicilar_df(self):
+        return self._kullanicilar_df
+
+    @property
+    def kargolar_ana_df(self):
+        """Ana kargo tablosunu döndürür; tamponda bekleyen yeni kargolar önce birleştirilir."""
+        self._ana_tamponunu_birlestir()
+        return self._kargolar_ana_df
+
+    def _indeksi_hazirla(self):
+        """Büyük bir toplu eklemeden sonra takip indeksini tek geçişte yeniden kurar."""
+        if not self._indeks_guncel:
+            self._takip_indeksi.olustur(self.kargo_df['takip_no'])
+            self._indeks_guncel = True
+
+    def _tamponu_birlestir(self):
+        """Tampondaki logları tek bir concat ile kargo_df'e ekler."""
+        if self._log_tamponu:
+            yeni_loglar = pd.DataFrame(self._log_tamponu, columns=LOG_KOLONLARI)
+            self._kargo_df = self._loglari_birlestir(yeni_loglar)
+            self._log_tamponu = []
+
+    def _loglari_birlestir(self, yeni_loglar):
+        """Metin kolonlu yeni logları (kompakt şemadaysa dönüştürerek) kargo_df'e ekler.
+
+        Kümeli düzende satırlar (takip_no, tarih) sırasındaki yerlerine girer; konumlar
+        kaydığından takip indeksi bayat işaretlenir.
+        """
+        if self._sema is None:
+            birlesik = pd.concat([self._kargo_df, yeni_loglar], ignore_index=True)
+        else:
+            yeni_loglar = self._sema.log_df(yeni_loglar)
+            birlesik = self._sema.birlestir(self._kargo_df, yeni_loglar)
+        if not self.kumeli:
+            return birlesik
+        self._indeks_guncel = False
+        return birlesik.take(kumeli_birlestirme_sirasi(self._kargo_df, yeni_loglar)).reset_index(drop=True)
+
+    def _ana_tamponunu_birlestir(self):
+        """Tampondaki yeni kargo satırlarını tek bir concat ile kargolar_ana_df'e ekler."""
+        if self._ana_tamponu:
+            yeni_ana = pd.DataFrame(self._ana_tamponu, columns=ANA_KOLONLARI)
+            self._ana_tamponu = []
+            self._ana_kayitlari_ekle(yeni_ana)
+
+    def _ana_durumu_yaz(self, etiket, durum):
+        """Ana tablo satırının durumunu yazar; satır tampondaysa tablo birleştirilmeden tamponda güncellenir."""
+        taban = len(self._kargolar_ana_df)
+        if etiket >= taban:
+            self._ana_tamponu[etiket - taban][3] = durum
+            return
+        self._durum_kategorilerini_hazirla([durum])
+        self._kargolar_ana_df.at[etiket, 'mevcut_durum'] = durum
+
+    def _ana_kayitlari_ekle(self, yeni_ana):
+        if self._sema is None:
+            self._kargolar_ana_df = pd.concat([self._kargolar_ana_df, yeni_ana], ignore_index=True)
+        else:
+            self._kargolar_ana_df = self._sema.birlestir(self._kargolar_ana_df, self._sema.ana_df(yeni_ana))
+
+    def _durum_kategorilerini_hazirla(self, durumlar):
+        """Kompakt şemada, ana tabloya yazılacak durumların kategori olarak tanımlı olmasını sağlar."""
+        if self._sema is not None:
+            self._kargolar_ana_df['mevcut_durum'] = kategorileri_genislet(
+                self._kargolar_ana_df['mevcut_durum'], durumlar
+            )
+
+    def _takip_anahtari(self, takip_no, kaydet=True):
+        """İndeks anahtarı: düz şemada takip_no'nun kendisi, kompakt şemada int64 kodu."""
+        if self._sema is None:
+            return takip_no
+        return self._sema.kodlayici.kodla(takip_no, kaydet)
+
+    def takip_no_metinleri(self, seri):
+        if self._sema is None:
+            return super().takip_no_metinleri(seri)
+        return self._sema.takip_no_metinleri(seri.to_numpy())
+
+    def _csv_yukle(self, path, cols, is_datetime=False, donustur=None, tur='duz', ek=None):
+        """CSV'yi, değişmemişse ikili anlık görüntüden, değilse yavaş yoldan yükler.
+
+        donustur, okunan tabloyu bellek şemasına çevirir; (DataFrame, ek) döndürür.
+        Çözülemeyen tarihler self._tarih_hatalari'na eklenir.
+        """
+        hatalar = self._tarih_hatalari if is_datetime else None
+        if self.anlik_goruntu:
+            goruntu = anlik_goruntu_oku(path, tur, hatalar)
+            if goruntu is not None:
+                return goruntu
+
+        # İmza okumadan önce alınır: okuma sırasında dosya değişirse görüntü bir sonraki açılışta geçersiz sayılır
+        imza = _dosya_imzasi(path) if os.path.exists(path) else None
+        dosya_hatalari = []
+        df = check_and_load(path, cols, is_datetime, dosya_hatalari)
+        if hatalar is not None:
+            hatalar.extend(dosya_hatalari)
+        if is_datetime and not df.empty and 'tarih' in df.columns:
+            df = df.sort_values(by='tarih', ascending=True, ignore_index=True)
+        if donustur is not None:
+            df = donustur(df)
+        if self.anlik_goruntu and imza is not None:
+            anlik_goruntu_yaz(path, df, imza, tur, ek, dosya_hatalari[0] if dosya_hatalari else None)
+        return df, ek
+
+    def _loglari_yukle(self):
+        """Sıcak aylık bölümleri ve canlı kargo_loglari.csv'yi (her biri kendi anlık görüntüsüyle) yükler.
+
+        Arşiv bölümleri yüklenmez.
+        """
+        yollar = sicak_bolumler(self.veri_dizini) + [self.csv_loglari]
+        if self._sema is None:
+            parcalar = self._bos_bolumleri_at(
+                [self._csv_yukle(yol, LOG_KOLONLARI, is_datetime=True)[0] for yol in yollar]
+            )
+            loglar = pd.concat(parcalar, ignore_index=True) if len(parcalar) > 1 else parcalar[0]
+        else:
+            # Her bölümün yan tablo kodları ilk bölümün kodlayıcısına taşınır
+            parcalar, kodlayici = [], None
+            for yol in yollar:
+                sema = KompaktSema()
+                df, bolum_kodlayici = self._csv_yukle(
+                    yol, LOG_KOLONLARI, is_datetime=True,
+                    donustur=sema.log_df, tur='kompakt', ek=sema.kodlayici
+                )
+                if kodlayici is None:
+                    kodlayici = bolum_kodlayici
+                elif len(bolum_kodlayici):
+                    df = df.assign(takip_no=kodlayici.aktar(df['takip_no'].to_numpy(), bolum_kodlayici))
+                parcalar.append(df)
+            self._sema = KompaktSema(kodlayici)
+            parcalar = self._bos_bolumleri_at(parcalar)
+            loglar = KompaktSema.birlestir_coklu(parcalar) if len(parcalar) > 1 else parcalar[0]
+        # Bölümler kendi içinde sıralıdır; canlı dosyaya geriye tarihli olay eklendiyse tüm tablo sıralanır
+        if len(parcalar) > 1 and not loglar['tarih'].is_monotonic_increasing:
+            loglar = loglar.sort_values(by='tarih', kind='stable', ignore_index=True)
+        return loglar
+
+    @staticmethod
+    def _bos_bolumleri_at(parcalar):
+        # Boş dosyadan okunan tablonun tarih kolonu object tiptedir; concat'e girerse tüm kolonu bozar
+        dolu = [df for df in parcalar if len(df)]
+        return dolu or parcalar[-1:]
+
+    def load_data(self, ilerleme=None):
+        """Üç CSV dosyasını da yükler ve dosyaların varlığını kontrol eder."""
+        # Çok yazıcılı modda dosyalar paylaşımlı kilit altında okunur (yarım eklenmiş satır görülmez)
+        with self._okuma_kilidi():
+            self._tablolari_yukle(ilerleme or (lambda mesaj: None))
+        if self._gunluk_satir_sayisi >= GUNLUK_SIKISTIRMA_ESIGI:
+            self._ana_tabloyu_sikistir()
+
+    def _okuma_kilidi(self):
+        if self.grup_yazici is None:
+            return nullcontext()
+        # İlk açılışta eksik dosyaları oluşturan terminal özel kilit alır (yarım dosya okunmasın)
+        yollar = (self.csv_loglari, self.csv_kullanicilar, self.csv_kargolar_ana)
+        if not all(os.path.exists(yol) and os.path.getsize(yol) > 0 for yol in yollar):
+            return self.grup_yazici.yazma_kilidi
+        return self.grup_yazici.yazma_kilidi.paylasimli()
+
+    def _dosyalara_yaz(self, yazim):
+        """Dosya eklemelerini yapar; çok yazıcılı modda kilit altında ve kalıcı (fsync) olarak."""
+        if self.grup_yazici is None:
+            return yazim()
+        return self.grup_yazici.ekle(yazim)
+
+    def _tablolari_yukle(self, ilerleme):
+        # 1. Kargo Logları (Kargo_Loglari): sadece sıcak bölümler
+        ilerleme("Kargo logları yükleniyor...")
+        self._tarih_hatalari = []
+        loglar = self._loglari_yukle()
+        if self.kumeli:
+            ilerleme("Loglar kargo bazında kümeleniyor...")
+            loglar = kumele(loglar)
+        self.kargo_df = loglar
+        self._log_konumunu_kaydet()
+        self._harici_loglar = []
+        self._tam_yukleme_gerekli = False
+        self.arsiv = LogArsivi(self.veri_dizini)
+        ilerleme("Takip indeksi oluşturuluyor...")
+        self._takip_indeksi.olustur(self._kargo_df['takip_no'])
+        self._indeks_guncel = True
+
+        # 2. Kullanıcılar (Kullanicilar)
+        ilerleme("Kullanıcılar yükleniyor...")
+        self._kullanicilar_df, _ = self._csv_yukle(
+            self.csv_kullanicilar, KULLANICI_KOLONLARI
+        )
+        # Varsayılan kullanıcıları kontrol et ve ekle
+        if self._kullanicilar_df.empty or len(self._kullanicilar_df) == 0:
+            self._kullanicilar_df = pd.DataFrame(VARSAYILAN_KULLANICILAR)
+            self._kullanicilar_df.to_csv(self.csv_kullanicilar, index=False)
+
+
+        # 3. Kargolar Ana Bilgi (Kargolar)
+        ilerleme("Ana kargo tablosu yükleniyor...")
+        if self._sema is None:
+            self._kargolar_ana_df, _ = self._csv_yukle(
+                self.csv_kargolar_ana, ANA_KOLONLARI
+            )
+        else:
+            self._kargolar_ana_df, _ = self._csv_yukle(
+                self.csv_kargolar_ana, ANA_KOLONLARI, donustur=self._sema.ana_df, tur='kompakt'
+            )
+        self._ana_tamponu = []
+        # Son sıkıştırmadan beri günlüğe yazılan durum değişikliklerini uygula
+        self._gunluk_satir_sayisi = 0
+        if os.path.exists(self.csv_kargolar_gunluk):
+            gunluk_df = check_and_load(self.csv_kargolar_gunluk, ANA_KOLONLARI)
+            self._gunluk_satir_sayisi = len(gunluk_df)
+            self._gunlugu_uygula(gunluk_df)
+        self._ana_konumlari = dict(zip(self._kargolar_ana_df['takip_no'], self._kargolar_ana_df.index))
+        olcum.satir_tarandi(len(self._kargo_df) + len(self._kullanicilar_df) + len(self._kargolar_ana_df))
+
+    def add_logs_bulk(self, loglar):
+        """Bir log grubunu vektörel olarak ekler; her dosyaya tek bir yazım yapılır."""
+        if loglar.empty:
+            return
+        loglar = loglar[LOG_KOLONLARI].reset_index(drop=True)
+        son_durumlar = self._loglari_bellege_ekle(loglar)
+
+        # 3. Değişen ana kayıtlar günlüğe tek seferde eklenir; günlük eşiği aşılacaksa
+        # günlüğe yazmak yerine ana dosya doğrudan bir kez yeniden yazılır (çok yazıcılı modda
+        # diğer terminallerin kayıtları da günlükte olduğundan önce günlüğe yazılır)
+        if self.grup_yazici is None and self._gunluk_satir_sayisi + len(son_durumlar) >= GUNLUK_SIKISTIRMA_ESIGI:
+            if self._log_dosyasina_ekle(lambda: csv_df_ekle(self.csv_loglari, loglar)):
+                self._durumlari_uygula(son_durumlar)
+            self._ana_tabloyu_sikistir()
+            return
+        degisen = self.kargolar_ana_df.loc[
+            self._ana_etiketleri(son_durumlar['takip_no']).to_numpy(), ANA_KOLONLARI
+        ]
+
+        def yaz():
+            if self._log_dosyasina_ekle(lambda: csv_df_ekle(self.csv_loglari, loglar)):
+                self._durumlari_uygula(son_durumlar)
+            csv_df_ekle(self.csv_kargolar_gunluk, degisen)
+
+        self._dosyalara_yaz(yaz)
+        self._gunluk_satir_sayisi += len(degisen)
+        if self._gunluk_satir_sayisi >= GUNLUK_SIKISTIRMA_ESIGI:
+            self._ana_tabloyu_sikistir()
+
+    def _loglari_bellege_ekle(self, loglar):
+        """Log grubunu kargo_df'e, takip indeksine ve ana tablo durumlarına işler (dosyaya yazmaz).
+
+        Her kargonun grup içindeki son olayını döndürür.
+        """
+        # 1. Kargo Logları: küçük gruplar tampona, büyükleri tek concat ve indeks güncellemesi
+        if len(loglar) < TAMPON_GRUP_ESIGI:
+            baslangic = len(self._kargo_df) + len(self._log_tamponu)
+            for i, (takip_no, tarih) in enumerate(zip(loglar['takip_no'], loglar['tarih'])):
+                self._takip_indeksi.ekle(self._takip_anahtari(takip_no), baslangic + i, tarih)
+            self._log_tamponu.extend(loglar.itertuples(index=False, name=None))
+            if len(self._log_tamponu) >= LOG_TAMPON_ESIGI:
+                self._tamponu_birlestir()
+        else:
+            self._tamponu_birlestir()
+            baslangic = len(self._kargo_df)
+            self._kargo_df = self._loglari_birlestir(loglar)
+            if self._indeks_guncel and len(loglar) < TOPLU_INDEKS_ESIGI:
+                self._takip_indeksi.toplu_ekle(self._kargo_df['takip_no'].iloc[baslangic:], baslangic)
+            else:
+                self._indeks_guncel = False
+
+        # 2. Ana Kargo Durumları: her kargonun grup içindeki son durumu geçerlidir
+        self._ana_tamponunu_birlestir()
+        son_durumlar = (
+            loglar.sort_values(by='tarih', kind='stable')
+            .drop_duplicates(subset='takip_no', keep='last')
+        )
+        etiketler = self._ana_etiketleri(son_durumlar['takip_no'])
+        mevcut = etiketler.notna().to_numpy()
+        self._durum_kategorilerini_hazirla(son_durumlar['durum'])
+        self._kargolar_ana_df.loc[etiketler[mevcut].astype('int64'), 'mevcut_durum'] = (
+            son_durumlar.loc[mevcut, 'durum'].to_numpy()
+        )
+        yeni_ana = pd.DataFrame({
+            'takip_no': son_durumlar.loc[~mevcut, 'takip_no'].to_numpy(),
+            'gonderici_ad': 'Bilinmiyor',
+            'alici_ad': 'Bilinmiyor',
+            'mevcut_durum': son_durumlar.loc[~mevcut, 'durum'].to_numpy(),
+        })
+        if not yeni_ana.empty:
+            baslangic = len(self._kargolar_ana_df)
+            self._ana_kayitlari_ekle(yeni_ana)
+            self._ana_konumlari.update(zip(yeni_ana['takip_no'], range(baslangic, baslangic + len(yeni_ana))))
+        return son_durumlar
+
+    def ana_kayitlari(self, takip_nolar):
+        """Ana tablo satırları takip_no -> etiket sözlüğünden okunur (tablo taranmaz)."""
+        etiketler = [self._ana_konumlari.get(takip_no) for takip_no in dict.fromkeys(takip_nolar)]
+        return self.kargolar_ana_df.loc[[e for e in etiketler if e is not None], ANA_KOLONLARI].reset_index(drop=True)
+
+    def _ana_etiketleri(self, takip_nolar):
+        """takip_no -> ana tablo etiketi (yoksa NaN); Series.map(dict) tüm sözlüğü dönüştürdüğü için
+        maliyet sözlük boyutuyla değil, sorgulanan numara sayısıyla orantılı olsun diye tek tek bakılır."""
+        konumlar = self._ana_konumlari
+        return pd.Series([konumlar.get(takip_no) for takip_no in takip_nolar], index=takip_nolar.index, dtype='float64')
+
+    def _durumlari_uygula(self, son_durumlar):
+        """Grubun son durumlarını, araya işlenen daha eski harici satırların üzerine yeniden yazar."""
+        self.kargolar_ana_df.loc[
+            self._ana_etiketleri(son_durumlar['takip_no']).to_numpy(), 'mevcut_durum'
+        ] = son_durumlar['durum'].to_numpy()
+
+    # --- Artımlı Yeniden Yükleme (başka süreçlerin eklediği loglar) ---
+    def _log_konumunu_kaydet(self):
+        bilgi = os.stat(self.csv_loglari)
+        self._log_konumu = bilgi.st_size
+        self._log_kimligi = (bilgi.st_dev, bilgi.st_ino)
+
+    def _log_dosyasina_ekle(self, yazim):
+        """Kendi eklememizi yapar; son okumadan beri başkalarının eklediği satırlar önce belleğe alınır.
+
+        Böylece okunan konum hep dosya sonunu gösterir ve kendi satırlarımız tekrar okunmaz
+        (çok yazıcılı modda bu adım yazma kilidi altındadır). Araya harici satır girdiyse True döner.
+        """
+        harici = self._harici_eklemeleri_al()
+        yazim()
+        self._log_konumunu_kaydet()
+        return harici > 0
+
+    def _harici_eklemeleri_al(self):
+        """Okunan konumdan sonraki tamamlanmış satırları çözüp belleğe işler; maliyet yeni veriyle orantılıdır."""
+        try:
+            bilgi = os.stat(self.csv_loglari)
+        except FileNotFoundError:
+            return 0
+        if (bilgi.st_dev, bilgi.st_ino) != self._log_kimligi or bilgi.st_size < self._log_konumu:
+            # Dosya yeniden yazılmış (bakım, elle düzenleme): artımlı okunamaz
+            self._tam_yukleme_gerekli = True
+            return 0
+        if bilgi.st_size == self._log_konumu:
+            return 0
+        with open(self.csv_loglari, 'rb') as f:
+            f.seek(self._log_konumu)
+            veri = f.read(bilgi.st_size - self._log_konumu)
+        # Yazımı süren son satır bir sonraki okumaya kalır
+        son = veri.rfind(b'\n')
+        if son < 0:
+            return 0
+        veri = veri[:son + 1]
+        self._log_konumu += len(veri)
+        loglar = pd.read_csv(io.BytesIO(veri), header=None, names=LOG_KOLONLARI, dtype=str)
+        # Yükleme anında boş olan dosyanın başlık satırı da bu aralıktadır
+        loglar = loglar[loglar['takip_no'] != 'takip_no'].reset_index(drop=True)
+        if loglar.empty:
+            return 0
+        loglar['takip_no'] = loglar['takip_no'].str.strip()
+        hatalar = []
+        loglar['tarih'] = tarihleri_coz(loglar['tarih'], hatalar)
+        if hatalar:
+            # Satır numarası bilinmez (okuma bayt konumundan yapılır); ham değer yeterli ipucudur
+            self._tarih_hatalari.append(tarih_hata_tablosu(LOGLAR_DOSYASI, hatalar))
+        olcum.satir_tarandi(len(loglar))
+        self._loglari_bellege_ekle(loglar)
+        self._harici_loglar.append(loglar)
+        return len(loglar)
+
+    def yeni_loglari_oku(self):
+        self._harici_eklemeleri_al()
+        if self._tam_yukleme_gerekli:
+            return None
+        loglar, self._harici_loglar = self._harici_loglar, []
+        if not loglar:
+            return bos_log_tablosu()
+        return pd.concat(loglar, ignore_index=True) if len(loglar) > 1 else loglar[0]
+
+    def degisiklik_dosyalari(self):
+        return [self.csv_loglari]
+
+    def tarih_hatalari(self):
+        if not self._tarih_hatalari:
+            return super().tarih_hatalari()
+        return pd.concat(self._tarih_hatalari, ignore_index=True)
+
+    def get_user_credentials(self, user, password):
+        """Kullanıcıyı ve rolünü CSV'den doğrular."""
+        user_row = self._kullanicilar_df[
+            (self._kullanicilar_df['kullanici_adi'] == user) &
+            (self._kullanicilar_df['sifre'] == password)
+        ]
+        olcum.satir_tarandi(len(self._kullanicilar_df))
+        if not user_row.empty:
+            return user_row.iloc[0]['rol']
+        return None
+
+    def get_logs(self, takip_no):
+        """Belirli bir takip numarasına ait logları çeker (takip indeksi, sonra arşiv üzerinden)."""
+        self._indeksi_hazirla()
+        anahtar = self._takip_anahtari(takip_no, kaydet=False)
+        konumlar = self._takip_indeksi.konumlar(anahtar) if anahtar is not None else np.empty(0, dtype=np.int64)
+        # Arşivlenmiş kargo (yeniden açıldıysa eski olayları da) arşivden okunur
+        arsiv = self.arsiv.loglar_coklu([takip_no]) if self.arsiv.iceriyor(takip_no) else None
+        olcum.satir_tarandi(len(konumlar) + (len(arsiv) if arsiv is not None else 0))
+        if len(konumlar) == 0 and (arsiv is None or arsiv.empty):
+            return None
+        # Tampondaki (henüz birleştirilmemiş) loglar kargo_df'in sonuna eklenecek konumlardadır
+        taban = len(self._kargo_df)
+        eski = konumlar[konumlar < taban]
+        kolonlar = [dizi.take(eski) for dizi in self._kolon_dizileri()]
+        loglar = [
+            {'takip_no': takip_no, 'tarih': tarih, 'konum': konum, 'durum': durum}
+            for tarih, konum, durum in zip(*kolonlar)
+        ]
+        loglar += [dict(zip(LOG_KOLONLARI, self._log_tamponu[k - taban])) for k in konumlar[konumlar >= taban]]
+        if arsiv is not None and not arsiv.empty:
+            loglar = arsiv.to_dict('records') + loglar
+        if any(onceki['tarih'] > sonraki['tarih'] for onceki, sonraki in zip(loglar, loglar[1:])):
+            loglar.sort(key=lambda log: log['tarih'])
+        return loglar
+
+    def _kolon_dizileri(self):
+        """kargo_df'in tarih/konum/durum dizileri; tablo değişene kadar tekrar kullanılır (kolon erişimi sorgudan pahalıdır)."""
+        df, diziler = self._log_dizileri
+        if df is not self._kargo_df:
+            diziler = [self._kargo_df[kolon].array for kolon in ('tarih', 'konum', 'durum')]
+            self._log_dizileri = (self._kargo_df, diziler)
+        return diziler
+
+    def get_logs_many(self, takip_nolar):
+        """Birçok kargonun loglarını indeks üzerinden tek bir take ile çeker."""
+        # Kümeli düzende birleştirme konumları kaydırır; indeks birleştirmeden sonra hazırlanır
+        self._tamponu_birlestir()
+        self._indeksi_hazirla()
+        nolar = list(dict.fromkeys(takip_nolar))
+        anahtarlar = [self._takip_anahtari(takip_no, kaydet=False) for takip_no in nolar]
+        konumlar, sahipler = self._takip_indeksi.konumlar_coklu(anahtarlar)
+        loglar = pd.DataFrame({
+            'takip_no': np.asarray(nolar, dtype=object)[sahipler],
+            'tarih': self._kargo_df['tarih'].array.take(konumlar),
+            'konum': self._kargo_df['konum'].array.take(konumlar),
+            'durum': self._kargo_df['durum'].array.take(konumlar),
+        })
+        arsiv = self.arsiv.loglar_coklu(nolar) if len(self.arsiv) else None
+        olcum.satir_tarandi(len(konumlar) + (len(arsiv) if arsiv is not None else 0))
+        arsivli = arsiv is not None and not arsiv.empty
+        if arsivli:
+            sira_no = dict(zip(nolar, range(len(nolar))))
+            loglar = pd.concat([loglar, arsiv[LOG_KOLONLARI]], ignore_index=True)
+            sahipler = np.concatenate([sahipler, arsiv['takip_no'].map(sira_no).to_numpy(dtype=np.int64)])
+        if self.kumeli and not arsivli:
+            # Tampon birleştiği için dilimler zaten istek sırasında ve kendi içinde tarih sıralıdır
+            return loglar
+        # İstek sırası, kargo içinde tarih sırası
+        sira = np.lexsort((loglar['tarih'].to_numpy(), sahipler))
+        return loglar.iloc[sira].reset_index(drop=True)
+
+    def indeks_bilgisi(self):
+        self._indeksi_hazirla()
+        return len(self._takip_indeksi), self._takip_indeksi.bellek_kullanimi()
+
+    def _gunlugu_uygula(self, gunluk_df):
+        """Günlükteki kayıtları kargolar_ana_df'e uygular (aynı kargo için son kayıt geçerlidir)."""
+        if gunluk_df.empty:
+            return
+        gunluk_df = gunluk_df.drop_duplicates(subset='takip_no', keep='last')
+        mevcut = gunluk_df['takip_no'].isin(self._kargolar_ana_df['takip_no'])
+
+        # Var olan kargolarda sadece durum değişir
+        yeni_durumlar = gunluk_df[mevcut].set_index('takip_no')['mevcut_durum']
+        self._durum_kategorilerini_hazirla(yeni_durumlar)
+        eslesen = self._kargolar_ana_df['takip_no'].isin(yeni_durumlar.index)
+        self._kargolar_ana_df.loc[eslesen, 'mevcut_durum'] = (
+            self._kargolar_ana_df.loc[eslesen, 'takip_no'].map(yeni_durumlar)
+        )
+
+        # Günlükte ilk kez görülen kargolar ana tabloya eklenir
+        if (~mevcut).any():
+            self._ana_kayitlari_ekle(gunluk_df[~mevcut][ANA_KOLONLARI])
+
+    def _ana_tabloyu_sikistir(self):
+        """kargolar_ana.csv'yi yeniden yazar ve günlüğü boşaltır.
+
+        Tek yazıcıda bellekteki tablo yazılır. Çok yazıcılı modda bellekte diğer terminallerin
+        kayıtları olmadığından, iki kilit altında diskteki ana dosya ile günlük birleştirilir.
+        """
+        if self.grup_yazici is None:
+            self._ana_dosyasini_yaz(self.kargolar_ana_df)
+        else:
+            with self.grup_yazici.yeniden_yazim():
+                ana_df = check_and_load(self.csv_kargolar_ana, ANA_KOLONLARI)
+                if os.path.exists(self.csv_kargolar_gunluk):
+                    gunluk_df = check_and_load(self.csv_kargolar_gunluk, ANA_KOLONLARI)
+                    # Kargonun ilk görüldüğü sıra korunur, değerler en son kayıttan alınır
+                    ana_df = (
+                        pd.concat([ana_df, gunluk_df], ignore_index=True)
+                        .groupby('takip_no', sort=False, as_index=False).last()[ANA_KOLONLARI]
+                    )
+                self._ana_dosyasini_yaz(ana_df, kalici=True)
+        self._gunluk_satir_sayisi = 0
+
+    def _ana_dosyasini_yaz(self, ana_df, kalici=False):
+        gecici = self.csv_kargolar_ana + ".tmp"
+        ana_df.to_csv(gecici, index=False)
+        olcum.bayt_yazildi(os.path.getsize(gecici) if olcum.etkin else 0)
+        if kalici:
+            # Günlük silinmeden önce yeni ana dosya diske inmiş olmalı
+            fd = os.open(gecici, os.O_RDWR)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        os.replace(gecici, self.csv_kargolar_ana)
+        if os.path.exists(self.csv_kargolar_gunluk):
+            os.remove(self.csv_kargolar_gunluk)
+
+    def add_log(self, takip_no, tarih, konum, durum):
+        """Operasyon personeli log ekleme."""
+        # 1. Kargo Logunu Güncelle (dosyaya sadece yeni satır eklenir, bkz. 3)
+        self._takip_indeksi.ekle(self._takip_anahtari(takip_no), len(self._kargo_df) + len(self._log_tamponu), tarih)
+        self._log_tamponu.append((takip_no, tarih, konum, durum))
+        if len(self._log_tamponu) >= LOG_TAMPON_ESIGI:
+            self._tamponu_birlestir()
+
+        # 2. Ana Kargo Durumunu Güncelle (Kargolar tablosu simülasyonu)
+        etiket = self._ana_konumlari.get(takip_no)
+        if etiket is not None:
+            self._ana_durumu_yaz(etiket, durum)
+            taban = len(self._kargolar_ana_df)
+            if etiket >= taban:
+                ana_satir = list(self._ana_tamponu[etiket - taban])
+            else:
+                ana_satir = self._kargolar_ana_df.loc[etiket, ANA_KOLONLARI].tolist()
+        else:
+             # Yeni bir kargo ilk kez sisteme giriyorsa (Basit Ana Kargo kaydı oluştur); satır
+             # tampona eklenir, tablo kopyalanmaz
+             ana_satir = [takip_no, 'Bilinmiyor', 'Bilinmiyor', durum]
+             self._ana_konumlari[takip_no] = len(self._kargolar_ana_df) + len(self._ana_tamponu)
+             self._ana_tamponu.append(list(ana_satir))
+             if len(self._ana_tamponu) >= ANA_TAMPON_ESIGI:
+                 self._ana_tamponunu_birlestir()
+
+        # 3. Log satırı ve durum değişikliği dosyaların sonuna eklenir (çok yazıcılı modda tek kilit
+        # altında); günlük büyüyünce ana dosya bir kez yeniden yazılır
+        def yaz():
+            if self._log_dosyasina_ekle(lambda: csv_satir_ekle(
+                self.csv_loglari, [(takip_no, tarih.strftime(TARIH_FORMATI), konum, durum)], LOG_KOLONLARI
+            )):
+                # Araya giren (daha eski) harici satırlar bu kargonun durumunu ezmiş olabilir
+                self._ana_durumu_yaz(self._ana_konumlari[takip_no], durum)
+            csv_satir_ekle(self.csv_kargolar_gunluk, [ana_satir], ANA_KOLONLARI)
+
+        self._dosyalara_yaz(yaz)
+        self._gunluk_satir_sayisi += 1
+        if self._gunluk_satir_sayisi >= GUNLUK_SIKISTIRMA_ESIGI:
+            self._ana_tabloyu_sikistir()
+        return True
+
+    def kapat(self):
+        if self.grup_yazici is not None:
+            self.grup_yazici.kapat()
@@ -0,0 +1,182 @@
+import sys
+import os
+from abc import ABC, abstractmethod
+import pandas as pd
+# Tarih çözümleme kargoTarih'tedir; eski içe aktarmalar bozulmasın diye buradan da verilir
+from kargoTarih import TARIH_FORMATI, TARIH_HATA_KOLONLARI, tarihleri_coz, tarih_metinleri
+
+# ===============================
+# PyInstaller uyumlu dosya yolu
+# ===============================
+def resource_path(relative_path):
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+DATA_DIR = resource_path("data")
+
+# Veri dizini içindeki dosya adları
+LOGLAR_DOSYASI = "kargo_loglari.csv"
+KULLANICILAR_DOSYASI = "kullanicilar.csv"
+KARGOLAR_ANA_DOSYASI = "kargolar_ana.csv"
+# Ana kargo tablosundaki durum değişikliklerinin eklendiği küçük günlük dosyası
+KARGOLAR_GUNLUK_DOSYASI = "kargolar_ana_gunluk.csv"
+
+CSV_LOGLARI = os.path.join(DATA_DIR, LOGLAR_DOSYASI)
+CSV_KULLANICILAR = os.path.join(DATA_DIR, KULLANICILAR_DOSYASI)
+CSV_KARGOLAR_ANA = os.path.join(DATA_DIR, KARGOLAR_ANA_DOSYASI)
+CSV_KARGOLAR_GUNLUK = os.path.join(DATA_DIR, KARGOLAR_GUNLUK_DOSYASI)
+
+LOG_KOLONLARI = ['takip_no', 'tarih', 'konum', 'durum']
+KULLANICI_KOLONLARI = ['kullanici_adi', 'sifre', 'rol']
+ANA_KOLONLARI = ['takip_no', 'gonderici_ad', 'alici_ad', 'mevcut_durum']
+
+def bos_log_tablosu():
+    """LOG_KOLONLARI biçiminde boş tablo; tarih kolonu datetime64'tür (eklenen loglarla birleşince tip bozulmasın)."""
+    return pd.DataFrame({
+        'takip_no': pd.Series(dtype=object), 'tarih': pd.Series(dtype='datetime64[ns]'),
+        'konum': pd.Series(dtype=object), 'durum': pd.Series(dtype=object),
+    }, columns=LOG_KOLONLARI)
+
+
+# Operasyon personelinin girebileceği kargo durumları (sabit durum sözlüğü)
+DURUMLAR = [
+    "Kabul Edildi", "Transfer Sürecinde", "Merkeze Ulaştı",
+    "Dağıtıma Çıktı", "Teslim Edildi", "Adreste Bulunamadı"
+]
+
+# Kullanıcı tablosu boşsa oluşturulan hesaplar
+VARSAYILAN_KULLANICILAR = {
+    'kullanici_adi': ['lojisfk', 'yonetici'],
+    'sifre': ['1234', '4321'],
+    'rol': ['Personel', 'Yonetici']
+}
+
+
+# --- Depolama Motoru Arayüzü ---
+class DepolamaMotoru(ABC):
+    """CargoDatabase'in kullandığı depolama arka ucu (CSV, SQLite ...)."""
+
+    ad = None
+
+    def __init__(self, veri_dizini=None):
+        self.veri_dizini = veri_dizini or DATA_DIR
+
+    def dosya_yolu(self, dosya_adi):
+        return os.path.join(self.veri_dizini, dosya_adi)
+
+    @property
+    @abstractmethod
+    def kargo_df(self):
+        """Tüm log tablosu (takip_no, tarih, konum, durum)."""
+
+    @property
+    @abstractmethod
+    def kullanicilar_df(self):
+        """Kullanıcı tablosu (kullanici_adi, sifre, rol)."""
+
+    @property
+    @abstractmethod
+    def kargolar_ana_df(self):
+        """Ana kargo tablosu (takip_no, gonderici_ad, alici_ad, mevcut_durum)."""
+
+    @abstractmethod
+    def load_data(self, ilerleme=None):
+        """Tabloları yükler / hazırlar. Hata durumunda IOError fırlatır.
+
+        ilerleme verilirse her aşamanın başında aşama metniyle çağrılır.
+        """
+
+    @abstractmethod
+    def get_user_credentials(self, user, password):
+        """Kullanıcının rolünü, bulunamazsa None döndürür."""
+
+    @abstractmethod
+    def get_logs(self, takip_no):
+        """Kargonun loglarını tarih sırasıyla dict listesi olarak, yoksa None döndürür."""
+
+    @abstractmethod
+    def add_log(self, takip_no, tarih, konum, durum):
+        """Yeni logu kaydeder ve ana kargo durumunu günceller."""
+
+    def add_logs_bulk(self, loglar):
+        """Log tablosu biçimindeki (LOG_KOLONLARI) olayları tek seferde kaydeder."""
+        for takip_no, tarih, konum, durum in loglar[LOG_KOLONLARI].itertuples(index=False, name=None):
+            self.add_log(takip_no, tarih, konum, durum)
+
+    def get_logs_many(self, takip_nolar):
+        """Birçok kargonun loglarını tek DataFrame'de (LOG_KOLONLARI) döndürür.
+
+        Satırlar istek sırasına, kargo içinde tarihe göre sıralıdır; bulunamayan kargonun satırı olmaz.
+        """
+        parcalar = [pd.DataFrame(self.get_logs(takip_no) or [], columns=LOG_KOLONLARI)
+                    for takip_no in dict.fromkeys(takip_nolar)]
+        if not parcalar:
+            return bos_log_tablosu()
+        return pd.concat(parcalar, ignore_index=True)
+
+    def log_parcalari(self, baslangic=None, bitis=None, parca_boyutu=100000):
+        """[baslangic, bitis) aralığındaki tarihli logları dilimler halinde üretir (dışa aktarım için).
+
+        Her dilim (taranan, toplam, loglar) demetidir; loglar LOG_KOLONLARI biçimindedir (takip_no
+        metin), taranan/toplam ilerleme içindir. Tablo kopyalanmaz: tarih sıralı tabloda aralık ikili
+        aramayla daraltılır, değilse (ör. kümeli düzen) dilimler tek tek süzülür. Tarihsiz loglar atlanır.
+        """
+        df = self.kargo_df
+        tarih = df['tarih']
+        bas, son = 0, len(df)
+        # Tarih sıralı tabloda tarihsiz loglar sondadır; aralık tarihli önek içinde aranır
+        tarihli = int(tarih.notna().sum())
+        if tarih.iloc[:tarihli].is_monotonic_increasing and tarih.iloc[tarihli:].isna().all():
+            tarih, son = tarih.iloc[:tarihli], tarihli
+            if baslangic is not None:
+                bas = int(tarih.searchsorted(pd.Timestamp(baslangic)))
+            if bitis is not None:
+                son = int(tarih.searchsorted(pd.Timestamp(bitis)))
+        for i in range(bas, son, parca_boyutu):
+            parca = df.iloc[i:min(i + parca_boyutu, son)]
+            maske = parca['tarih'].notna()
+            if baslangic is not None:
+                maske &= parca['tarih'] >= baslangic
+            if bitis is not None:
+                maske &= parca['tarih'] < bitis
+            parca = parca[maske.to_numpy()]
+            yield (min(i + parca_boyutu, son) - bas, son - bas,
+                   parca[LOG_KOLONLARI].assign(takip_no=self.takip_no_metinleri(parca['takip_no'])))
+
+    def ana_kayitlari(self, takip_nolar):
+        """Verilen kargoların ana tablo satırları (ANA_KOLONLARI), istek sırasıyla; bulunamayanlar atlanır."""
+        nolar = pd.Series(list(dict.fromkeys(takip_nolar)), dtype=object)
+        ana = self.kargolar_ana_df
+        ana = ana.assign(takip_no=ana['takip_no'].astype(object))
+        return nolar.to_frame('takip_no').merge(ana[ANA_KOLONLARI], on='takip_no')
+
+    def takip_no_metinleri(self, seri):
+        """kargo_df['takip_no'] değerlerini metin takip numaralarına çevirir (kompakt şemada kod çözülür)."""
+        return seri.to_numpy(dtype=object)
+
+    def indeks_bilgisi(self):
+        """(indekslenen kargo sayısı, bellek kullanımı bayt); bellek içi indeks yoksa (0, 0)."""
+        return 0, 0
+
+    def yeni_loglari_oku(self):
+        """Başka süreçlerin (terminal, içe aktarım) son okumadan beri eklediği logları belleğe işler.
+
+        Eklenen logları (LOG_KOLONLARI, takip_no metin) döndürür; veri dosyaları yeniden
+        yazıldıysa (ör. bakım) None döner ve tam yükleme gerekir.
+        """
+        return bos_log_tablosu()
+
+    def degisiklik_dosyalari(self):
+        """Harici eklemelerde değişen, izlenecek dosyaların yolları."""
+        return []
+
+    def tarih_hatalari(self):
+        """Son yüklemeden beri çözülemeyen (boş olmayan) tarihler (TARIH_HATA_KOLONLARI).
+
+        Bu satırlar tarihsiz (NaT) yüklenir; ham metin dosyada korunur.
+        """
+        return pd.DataFrame(columns=TARIH_HATA_KOLONLARI)
+
+    def kapat(self):
+        """Açık kaynakları serbest bırakır."""
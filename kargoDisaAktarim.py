@@ -0,0 +1,97 @@
+import os
+from datetime import datetime, timedelta
+import pandas as pd
+
+from kargoTarih import tarih_metinleri
+
+# Bellekte aynı anda tutulan en fazla log sayısı (dilim boyutu)
+AKTARIM_PARCA_BOYUTU = int(os.environ.get("KARGO_AKTARIM_PARCA", "100000"))
+AKTARIM_BICIMLERI = ('csv', 'jsonl')
+# to_json dilimin tamamını tek metinde kurar; JSON Lines bu kadar satırlık alt dilimlerle yazılır
+JSON_ALT_DILIM = 10000
+AKTARIM_KOLONLARI = ['takip_no', 'tarih', 'konum', 'durum', 'gonderici_ad', 'alici_ad', 'mevcut_durum']
+
+_SINIR_FORMATLARI = [('%Y-%m-%d %H:%M', False), ('%Y-%m-%d', True), ('%d.%m.%Y %H:%M', False), ('%d.%m.%Y', True)]
+
+
+def tarih_siniri(metin, bitis=False):
+    """Komut satırı / arayüz tarih sınırını Timestamp'e çevirir; boşsa None.
+
+    Sadece gün verilen bitiş o günü kapsar (aralık sonu dışlayıcıdır, ertesi gün döner).
+    """
+    if metin is None or not str(metin).strip():
+        return None
+    for format, gun in _SINIR_FORMATLARI:
+        try:
+            tarih = datetime.strptime(str(metin).strip(), format)
+        except ValueError:
+            continue
+        if bitis and gun:
+            tarih += timedelta(days=1)
+        return pd.Timestamp(tarih)
+    raise ValueError(f"Tarih anlaşılamadı: {metin} (ör. 2024-05-01 veya 01.05.2024 14:30)")
+
+
+def aktarim_bicimi(yol, bicim=None):
+    """Verilmemişse biçim dosya uzantısından çıkarılır (.jsonl/.json -> jsonl, diğerleri csv)."""
+    if bicim is None:
+        bicim = 'jsonl' if os.path.splitext(yol)[1].lower() in ('.jsonl', '.json') else 'csv'
+    if bicim not in AKTARIM_BICIMLERI:
+        raise ValueError(f"Desteklenmeyen dışa aktarım biçimi: {bicim}")
+    return bicim
+
+
+def aktarim_parcalari(db, baslangic=None, bitis=None, konumlar=None, durumlar=None,
+                      parca_boyutu=AKTARIM_PARCA_BOYUTU):
+    """Süzülmüş logları kargonun ana kaydıyla birleştirip dilim dilim üretir: (taranan, toplam, tablo).
+
+    Birleştirme dilim başına yapılır (dilimdeki kargoların ana kayıtları); birleşik tablonun
+    tamamı hiçbir zaman bellekte oluşmaz.
+    """
+    for taranan, toplam, loglar in db.log_parcalari(baslangic, bitis, parca_boyutu):
+        if konumlar:
+            loglar = loglar[loglar['konum'].isin(konumlar).to_numpy()]
+        if durumlar:
+            loglar = loglar[loglar['durum'].isin(durumlar).to_numpy()]
+        if loglar.empty:
+            yield taranan, toplam, pd.DataFrame(columns=AKTARIM_KOLONLARI)
+            continue
+        loglar = loglar.assign(takip_no=loglar['takip_no'].astype(object))
+        ana = db.ana_kayitlari(pd.unique(loglar['takip_no'].to_numpy()))
+        ana = ana.assign(takip_no=ana['takip_no'].astype(object))
+        tablo = loglar.merge(ana, on='takip_no', how='left')
+        yield taranan, toplam, tablo.reindex(columns=AKTARIM_KOLONLARI)
+
+
+def disa_aktar(db, yol, bicim=None, baslangic=None, bitis=None, konumlar=None, durumlar=None,
+               parca_boyutu=AKTARIM_PARCA_BOYUTU, ilerleme=None):
+    """Tarih aralığı ve filtrelerdeki olayları mevcut durumlarıyla birlikte CSV ya da JSON Lines yazar.
+
+    Dosya önce geçici adla yazılır, bitince yerine taşınır (yarım dosya bırakılmaz).
+    ilerleme((yazılan, taranan, toplam)) her dilimden sonra çağrılır. Yazılan satır sayısını döndürür.
+    """
+    bicim = aktarim_bicimi(yol, bicim)
+    gecici = yol + '.tmp'
+    yazilan = 0
+    try:
+        with open(gecici, 'w', encoding='utf-8', newline='') as f:
+            if bicim == 'csv':
+                f.write(','.join(AKTARIM_KOLONLARI) + '\n')
+            for taranan, toplam, tablo in aktarim_parcalari(db, baslangic, bitis, konumlar, durumlar, parca_boyutu):
+                if not tablo.empty:
+                    tablo = tablo.assign(tarih=tarih_metinleri(tablo['tarih']))
+                    if bicim == 'csv':
+                        tablo.to_csv(f, header=False, index=False, lineterminator='\n')
+                    else:
+                        for i in range(0, len(tablo), JSON_ALT_DILIM):
+                            f.write(tablo.iloc[i:i + JSON_ALT_DILIM].to_json(
+                                orient='records', lines=True, force_ascii=False))
+                    yazilan += len(tablo)
+                if ilerleme:
+                    ilerleme((yazilan, taranan, toplam))
+        os.replace(gecici, yol)
+    except BaseException:
+        if os.path.exists(gecici):
+            os.remove(gecici)
+        raise
+    return yazilan
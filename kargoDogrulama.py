@@ -0,0 +1,266 @@
+import os
+import re
+import sys
+import time
+import argparse
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import DURUMLAR, bos_log_tablosu
+
+# CargoDatabase'e giren olayların doğrulanması: takip_no biçimi, durum sözlüğü,
+# tekrar taramalar ve durum geçişleri. Tüm kontroller grup üzerinde vektörel geçişlerdir.
+DOGRULAMA_VARSAYILAN = os.environ.get("KARGO_DOGRULAMA", "1") == "1"
+# Geçerli takip numarası (tam eşleşme); varsayılan: veri üreticideki gibi 10 hane
+TAKIP_NO_DESENI = os.environ.get("KARGO_TAKIP_NO_DESENI", r"[1-9][0-9]{9}")
+_TAKIP_NO_DESENI = re.compile(TAKIP_NO_DESENI)
+# Aynı kargo, aynı konum ve durumla bu kadar dakika içinde tekrar okutulursa tekrar taramadır
+TEKRAR_TARAMA_DK = int(os.environ.get("KARGO_TEKRAR_TARAMA_DK", "30"))
+_TEKRAR_PENCERESI = pd.Timedelta(minutes=TEKRAR_TARAMA_DK)
+
+KARANTINA_DOSYASI = "karantina.csv"
+# Yüklemede bulunan hatalı satırlar (her yüklemede yeniden yazılır; satırlar tabloda kalır)
+YUKLEME_KARANTINA_DOSYASI = "karantina_yukleme.csv"
+KARANTINA_KOLONLARI = ['zaman', 'kaynak', 'satir', 'takip_no', 'tarih', 'konum', 'durum', 'neden']
+
+NEDEN_TAKIP_NO = "geçersiz takip no"
+NEDEN_DURUM = "bilinmeyen durum"
+NEDEN_TEKRAR = "tekrar tarama"
+NEDEN_GECIS = "geçersiz geçiş"
+
+# Önceki durum -> izin verilen sonraki durumlar (None: kargonun ilk olayı)
+GECERLI_GECISLER = {
+    None: {"Kabul Edildi"},
+    "Kabul Edildi": {"Transfer Sürecinde", "Merkeze Ulaştı"},
+    "Transfer Sürecinde": {"Transfer Sürecinde", "Merkeze Ulaştı"},
+    "Merkeze Ulaştı": {"Transfer Sürecinde", "Dağıtıma Çıktı"},
+    "Dağıtıma Çıktı": {"Teslim Edildi", "Adreste Bulunamadı"},
+    "Adreste Bulunamadı": {"Dağıtıma Çıktı", "Merkeze Ulaştı"},
+    "Teslim Edildi": set(),
+}
+# Durum kodu: DURUMLAR içindeki sıra; _ILK önceki olayı olmayan kargo içindir
+_ILK = len(DURUMLAR)
+_GECIS_MATRISI = np.zeros((len(DURUMLAR) + 1, len(DURUMLAR)), dtype=bool)
+for _onceki, _sonrakiler in GECERLI_GECISLER.items():
+    for _sonraki in _sonrakiler:
+        _GECIS_MATRISI[_ILK if _onceki is None else DURUMLAR.index(_onceki), DURUMLAR.index(_sonraki)] = True
+_DURUM_ADLARI = np.array(DURUMLAR + ["(ilk olay)"], dtype=object)
+_DURUM_INDEKSI = pd.Index(DURUMLAR)
+
+
+def sonraki_durumlar(durum):
+    """Verilen durumdan sonra girilebilecek durumlar (DURUMLAR sırasıyla)."""
+    return [d for d in DURUMLAR if d in GECERLI_GECISLER.get(durum, set())]
+
+
+def _durum_kodlari(seri):
+    """Durum -> DURUMLAR içindeki sıra; sözlük dışı durumlar -1."""
+    return _DURUM_INDEKSI.get_indexer(seri.astype(object)).astype(np.int64)
+
+
+def _ns(tarihler):
+    return np.asarray(tarihler, dtype='datetime64[ns]').view(np.int64)
+
+
+# --- Tek Olay (add_log) ---
+def bicim_nedeni(takip_no, durum):
+    """Kargonun geçmişine bakmadan bilinen red nedeni (takip_no biçimi, durum sözlüğü); geçerliyse None."""
+    if not _TAKIP_NO_DESENI.fullmatch(str(takip_no)):
+        return NEDEN_TAKIP_NO
+    if durum not in DURUMLAR:
+        return NEDEN_DURUM
+    return None
+
+
+def olay_nedeni(takip_no, tarih, konum, durum, son_log=None):
+    """Tek olayın red nedeni, geçerliyse None. son_log kargonun kayıtlı en yeni logudur (dict)."""
+    neden = bicim_nedeni(takip_no, durum)
+    if neden is not None:
+        return neden
+    onceki = son_log['durum'] if son_log is not None else None
+    if (onceki == durum and son_log['konum'] == konum and not pd.isna(son_log['tarih'])
+            and tarih - son_log['tarih'] <= _TEKRAR_PENCERESI):
+        return NEDEN_TEKRAR
+    if onceki not in GECERLI_GECISLER:
+        # Sözlük dışı eski bir durumdan sonra her sözlük durumu kabul edilir
+        return None
+    if durum not in GECERLI_GECISLER[onceki]:
+        return f"{NEDEN_GECIS}: {onceki or _DURUM_ADLARI[_ILK]} -> {durum}"
+    return None
+
+
+# --- Vektörel Doğrulama ---
+def ayir(olaylar, onceki=None, tekrar_dk=TEKRAR_TARAMA_DK):
+    """Olayları (LOG_KOLONLARI) geçerli ve reddedilen olarak ikiye ayırır: (gecerli, reddedilen).
+
+    onceki, aynı kargoların kayıtlı logları (LOG_KOLONLARI, takip_no metin); geçişler ve tekrarlar
+    bu geçmişe göre de denetlenir, kayıtlı loglar reddedilmez. reddedilen, olayların indeksini
+    koruyup 'neden' kolonu ekler. Geçiş denetimi reddedilenler çıkarılarak tekrarlanır: bir
+    hatalı olay, ardından gelen doğru olayı da geçersiz göstermesin.
+    """
+    n = len(olaylar)
+    neden = np.full(n, None, dtype=object)
+    if not n:
+        return olaylar, olaylar.iloc[:0].assign(neden=pd.Series(dtype=object))
+
+    # 1. Biçim ve sözlük: her tekil değer bir kez denetlenir
+    takip_kodlari, takip_tekiller = pd.factorize(olaylar['takip_no'].astype(object), use_na_sentinel=False)
+    bicim_uygun = pd.Series(takip_tekiller.astype(str)).str.fullmatch(TAKIP_NO_DESENI).to_numpy(dtype=bool)
+    neden[~bicim_uygun[takip_kodlari]] = NEDEN_TAKIP_NO
+    durum_kodlari = _durum_kodlari(olaylar['durum'])
+    neden[(durum_kodlari < 0) & (neden == None)] = NEDEN_DURUM  # noqa: E711
+
+    # 2. Tekrar ve geçiş: kargo, tarih sırasında bir önceki olayla karşılaştırılır
+    tarih = _ns(olaylar['tarih'].to_numpy())
+    aday = (neden == None) & (tarih != np.iinfo(np.int64).min)  # noqa: E711
+    if onceki is not None and not onceki.empty:
+        onceki = onceki[onceki['tarih'].notna().to_numpy()]
+    else:
+        onceki = bos_log_tablosu()
+    m = len(onceki)
+    kargo, _ = pd.factorize(np.concatenate([
+        onceki['takip_no'].to_numpy(dtype=object), olaylar['takip_no'].astype(object).to_numpy()
+    ]))
+    konum, _ = pd.factorize(np.concatenate([
+        onceki['konum'].to_numpy(dtype=object), olaylar['konum'].to_numpy(dtype=object)
+    ]))
+    durum = np.concatenate([
+        _durum_kodlari(onceki['durum']), durum_kodlari
+    ])
+    tum_tarih = np.concatenate([_ns(onceki['tarih'].to_numpy()), tarih])
+    yeni = np.arange(m + n) >= m
+    # Aynı anda kayıtlı olay öne, yeni olaylar geliş sırasıyla
+    sira = np.lexsort((np.arange(m + n), yeni, tum_tarih, kargo))
+    sira = sira[np.concatenate([np.ones(m, dtype=bool), aday])[sira]]
+    gecis_nedeni = np.full(m + n, None, dtype=object)
+    pencere = tekrar_dk * 60 * 10 ** 9
+    # Olaylar sırayla işlenmiş gibi: her geçişte kargo başına sadece ilk hatalı olay reddedilir
+    # (sonrakiler, reddedilen çıkınca yeni öncüllerine göre tekrar denetlenir). Sonraki geçişler
+    # sadece hatalı olayı kalan kargolarda yapılır.
+    while len(sira):
+        onceki_konum = np.concatenate([[-1], sira[:-1]])
+        ayni_kargo = np.concatenate([[False], kargo[sira[1:]] == kargo[sira[:-1]]])
+        onceki_durum = np.where(ayni_kargo, durum[onceki_konum], _ILK)
+        tekrar = (ayni_kargo & (durum[sira] == durum[onceki_konum]) & (konum[sira] == konum[onceki_konum])
+                  & (tum_tarih[sira] - tum_tarih[onceki_konum] <= pencere))
+        # Sözlük dışı eski durumlardan (-1) sonra her geçiş kabul edilir
+        gecersiz = (onceki_durum >= 0) & ~_GECIS_MATRISI[np.maximum(onceki_durum, 0), durum[sira]]
+        hatali = np.flatnonzero((tekrar | gecersiz) & yeni[sira])
+        if not len(hatali):
+            break
+        _, ilkler = np.unique(kargo[sira[hatali]], return_index=True)
+        hatali = hatali[ilkler]
+        hatalilar = sira[hatali]
+        gecis_nedeni[hatalilar] = np.where(
+            tekrar[hatali], NEDEN_TEKRAR,
+            NEDEN_GECIS + ": " + _DURUM_ADLARI[onceki_durum[hatali]] + " -> " + _DURUM_ADLARI[durum[hatalilar]]
+        )
+        kalan = np.ones(len(sira), dtype=bool)
+        kalan[hatali] = False
+        sira = sira[kalan & np.isin(kargo[sira], kargo[hatalilar])]
+    neden[aday] = gecis_nedeni[m:][aday]
+
+    gecersiz = neden != None  # noqa: E711
+    reddedilen = olaylar[gecersiz].assign(neden=neden[gecersiz])
+    return olaylar[~gecersiz], reddedilen
+
+
+def karantina_tablosu(reddedilen, kaynak, satir_kaymasi=None):
+    """Reddedilen olayları KARANTINA_KOLONLARI biçimine çevirir (satir: indeks + kayma, dosya satırı)."""
+    satir = reddedilen.index.to_numpy() + satir_kaymasi if satir_kaymasi is not None else pd.NA
+    return pd.DataFrame({
+        'zaman': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'kaynak': kaynak,
+        'satir': satir,
+        'takip_no': reddedilen['takip_no'].to_numpy(dtype=object),
+        'tarih': reddedilen['tarih'].dt.strftime('%Y-%m-%d %H:%M').to_numpy(dtype=object),
+        'konum': reddedilen['konum'].to_numpy(dtype=object),
+        'durum': reddedilen['durum'].to_numpy(dtype=object),
+        'neden': reddedilen['neden'].to_numpy(dtype=object),
+    }, columns=KARANTINA_KOLONLARI)
+
+
+def karantinaya_ekle(yol, tablo):
+    """Karantina tablosunu dosyanın sonuna ekler (dosya yoksa başlıkla oluşturur)."""
+    if tablo.empty:
+        return
+    yeni = not os.path.exists(yol)
+    try:
+        with open(yol, 'a', encoding='utf-8', newline='') as f:
+            tablo.to_csv(f, header=yeni, index=False, lineterminator='\n')
+    except OSError as e:
+        raise IOError(f"Karantina dosyası yazılamadı: {yol} ({e})")
+
+
+def karantina_yaz(yol, tablo):
+    """Karantina tablosunu dosyaya baştan yazar (yükleme raporu); tablo boşsa dosya silinir."""
+    try:
+        if tablo.empty:
+            if os.path.exists(yol):
+                os.remove(yol)
+            return
+        gecici = yol + '.tmp'
+        tablo.to_csv(gecici, index=False, lineterminator='\n')
+        os.replace(gecici, yol)
+    except OSError as e:
+        raise IOError(f"Karantina dosyası yazılamadı: {yol} ({e})")
+
+
+# --- Kıyaslama ---
+def kirli_olaylar(olay_sayisi, kirli_orani=0.05, tohum=0):
+    """Veri üreticinin olaylarına kirli_orani kadar hata (biçim, durum, tekrar, geçiş) katar."""
+    from kargoVeriUretici import olay_tablosu
+
+    rng = np.random.default_rng(tohum)
+    olaylar = olay_tablosu(olay_sayisi, rng)
+    secilen = rng.random(len(olaylar)) < kirli_orani
+    tur = rng.integers(0, 4, len(olaylar))
+    olaylar.loc[secilen & (tur == 0), 'takip_no'] = "abc"
+    olaylar.loc[secilen & (tur == 1), 'durum'] = "Teslim Edilid"
+    olaylar.loc[secilen & (tur == 3), 'durum'] = "Teslim Edildi"
+    # Tekrar taramalar: seçilen olayların birkaç dakika sonraki kopyaları
+    kopyalar = olaylar[secilen & (tur == 2)]
+    kopyalar = kopyalar.assign(tarih=kopyalar['tarih'] + pd.Timedelta(minutes=2))
+    olaylar = pd.concat([olaylar, kopyalar], ignore_index=True)
+    return olaylar.iloc[np.argsort(_ns(olaylar['tarih'].to_numpy()), kind='stable')].reset_index(drop=True)
+
+
+def kiyasla(olay_sayisi, kirli_orani=0.05, tohum=0, onceki_orani=0.5, tekrar=3):
+    """ayir() çıkışını ölçer: olayların ilk onceki_orani'ı kayıtlı geçmiş, kalanı yeni grup sayılır."""
+    olaylar = kirli_olaylar(olay_sayisi, kirli_orani, tohum)
+    bolme = int(len(olaylar) * onceki_orani)
+    onceki, grup = olaylar.iloc[:bolme], olaylar.iloc[bolme:]
+    onceki = ayir(onceki)[0]
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        gecerli, reddedilen = ayir(grup, onceki)
+        sureler.append(time.perf_counter() - baslangic)
+    sure = float(np.median(sureler))
+    return {
+        'olay': len(grup),
+        'gecmis': len(onceki),
+        'reddedilen': int(len(reddedilen)),
+        'nedenler': {str(k): int(v) for k, v in
+                     reddedilen['neden'].str.split(':').str[0].value_counts().items()},
+        'sure_sn': round(sure, 4),
+        'olay_per_sn': int(len(grup) / sure) if sure else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Olay doğrulamasının çıkış (olay/sn) kıyaslaması")
+    parser.add_argument("--olay", type=int, nargs="*", default=[100_000, 1_000_000])
+    parser.add_argument("--kirli", type=float, default=0.05, help="Hatalı olay oranı")
+    parser.add_argument("--tohum", type=int, default=0)
+    args = parser.parse_args(argv)
+    for olay_sayisi in args.olay:
+        sonuc = kiyasla(olay_sayisi, args.kirli, args.tohum)
+        print(f"{sonuc['olay']:>10} olay ({sonuc['gecmis']} geçmiş): {sonuc['sure_sn']:.3f} sn, "
+              f"{sonuc['olay_per_sn']} olay/sn, {sonuc['reddedilen']} red {sonuc['nedenler']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+
+TESLIM_DURUMU = "Teslim Edildi"
+
+# Süreler (dakika) logaritmik aralıklı kutularda sayılır: 1 dk .. 120 gün, kutu genişliği ~%5
+KUTU_KENARLARI = np.concatenate(([0.0], np.geomspace(1, 120 * 24 * 60, 240), [np.inf]))
+KUTU_SAYISI = len(KUTU_KENARLARI) - 1
+# Bir (konum, durum) için bundan az örnek varsa sadece duruma, o da yoksa tüm veriye göre tahmin edilir
+MIN_ORNEK = 5
+# Güven bandı: alt ve üst yüzdelikler
+ALT_YUZDELIK = 0.10
+UST_YUZDELIK = 0.90
+
+
+def _kutular(sure_dk):
+    """Dakika cinsinden süreleri kutu numaralarına çevirir."""
+    return np.clip(np.searchsorted(KUTU_KENARLARI, sure_dk, side='right') - 1, 0, KUTU_SAYISI - 1)
+
+
+def _yuzdelikler(sayilar, oranlar):
+    """Kutu sayımlarından yüzdelikleri (kutu içinde doğrusal ara değerle) hesaplar."""
+    kumulatif = np.cumsum(sayilar)
+    toplam = kumulatif[-1]
+    sonuc = []
+    for oran in oranlar:
+        hedef = oran * toplam
+        kutu = int(np.searchsorted(kumulatif, hedef, side='left'))
+        onceki = kumulatif[kutu - 1] if kutu else 0
+        pay = (hedef - onceki) / sayilar[kutu] if sayilar[kutu] else 0.0
+        sol, sag = KUTU_KENARLARI[kutu], KUTU_KENARLARI[kutu + 1]
+        if not np.isfinite(sag):
+            sag = sol
+        sonuc.append(sol + pay * (sag - sol))
+    return sonuc
+
+
+def teslim_sureleri(loglar_df):
+    """Her log satırından kargonun ilk "Teslim Edildi" anına kalan süre (dk); teslim edilmemişse NaN.
+
+    Vektörel: tüm log tablosu tek bir groupby ile işlenir.
+    """
+    teslim = (loglar_df['durum'] == TESLIM_DURUMU).to_numpy(dtype=bool)
+    tarih = loglar_df['tarih']
+    if not pd.api.types.is_datetime64_any_dtype(tarih):
+        # Boş tablodan türemiş object kolon (Timestamp / None karışık) olabilir
+        tarih = pd.to_datetime(tarih, errors='coerce')
+    teslim_zamani = tarih.where(teslim).groupby(loglar_df['takip_no'], observed=True, sort=False).transform('min')
+    sure = (teslim_zamani - tarih) / pd.Timedelta(minutes=1)
+    # Teslim satırının kendisi ve teslimden sonraki olaylar örnek değildir
+    return sure.where(~teslim & (sure >= 0))
+
+
+# --- Veriye Dayalı ETA Modeli ---
+class EtaModeli:
+    """(konum, durum) -> "Teslim Edildi"ye kalan süre dağılımı.
+
+    Dağılımlar kutu sayımları olarak tutulur; yeni teslimatlar sayımlara eklenir,
+    yüzdelikler sadece değişen anahtar için ve sorgu anında yeniden hesaplanır.
+    """
+
+    def __init__(self):
+        self._sayimlar = {}   # (konum, durum) / ('*', durum) / ('*', '*') -> kutu sayımları
+        self._ozetler = {}    # anahtar -> (ornek, alt, medyan, ust) dakika; değişince silinir
+
+    def _ekle(self, anahtar, kutular):
+        sayim = self._sayimlar.get(anahtar)
+        if sayim is None:
+            sayim = self._sayimlar[anahtar] = np.zeros(KUTU_SAYISI, dtype=np.int64)
+        np.add.at(sayim, kutular, 1)
+        self._ozetler.pop(anahtar, None)
+
+    def olustur(self, loglar_df):
+        """Modeli tüm log tablosundan vektörel olarak kurar."""
+        self._sayimlar = {}
+        self._ozetler = {}
+        if loglar_df.empty:
+            return
+        sure = teslim_sureleri(loglar_df)
+        ornek = sure.notna().to_numpy()
+        if not ornek.any():
+            return
+        kutular = _kutular(sure.to_numpy()[ornek])
+        konum_kod, konumlar = pd.factorize(loglar_df['konum'][ornek])
+        durum_kod, durumlar = pd.factorize(loglar_df['durum'][ornek])
+
+        # (konum, durum) çiftleri tek tamsayı koda indirgenir; sayımlar tek bincount ile çıkarılır
+        cift_kod, ciftler = pd.factorize(konum_kod * len(durumlar) + durum_kod)
+        gruplar = (
+            (cift_kod, [(konumlar[c // len(durumlar)], durumlar[c % len(durumlar)]) for c in ciftler]),
+            (durum_kod, [('*', d) for d in durumlar]),
+        )
+        for kodlar, anahtarlar in gruplar:
+            sayimlar = np.bincount(
+                kodlar * KUTU_SAYISI + kutular, minlength=len(anahtarlar) * KUTU_SAYISI
+            ).reshape(len(anahtarlar), KUTU_SAYISI)
+            for anahtar, sayim in zip(anahtarlar, sayimlar):
+                self._sayimlar[anahtar] = sayim.astype(np.int64)
+        self._sayimlar[('*', '*')] = np.bincount(kutular, minlength=KUTU_SAYISI).astype(np.int64)
+
+    def teslimat_ekle(self, loglar, yeni_teslim_sayisi=1):
+        """Yeni teslim edilen bir kargonun (tarih sıralı) loglarını modele ekler.
+
+        yeni_teslim_sayisi, loglar içindeki yeni eklenmiş "Teslim Edildi" olaylarının sayısıdır;
+        kargonun bunlardan başka teslim olayı varsa daha önce sayılmıştır, örnekler çoğaltılmaz.
+        """
+        teslimler = [i for i, log in enumerate(loglar) if log['durum'] == TESLIM_DURUMU]
+        if not teslimler or len(teslimler) > yeni_teslim_sayisi:
+            return
+        ilk = teslimler[0]
+        teslim_zamani = loglar[ilk]['tarih']
+        for log in loglar[:ilk]:
+            if pd.isna(log['tarih']):
+                continue
+            kutu = _kutular(np.array([(teslim_zamani - log['tarih']) / pd.Timedelta(minutes=1)]))
+            self._ekle((log['konum'], log['durum']), kutu)
+            self._ekle(('*', log['durum']), kutu)
+            self._ekle(('*', '*'), kutu)
+
+    def ozet(self, anahtar):
+        """(örnek sayısı, alt, medyan, üst) dakika; veri yoksa None."""
+        ozet = self._ozetler.get(anahtar)
+        if ozet is None:
+            sayim = self._sayimlar.get(anahtar)
+            if sayim is None or not sayim.any():
+                return None
+            alt, medyan, ust = _yuzdelikler(sayim, (ALT_YUZDELIK, 0.5, UST_YUZDELIK))
+            ozet = self._ozetler[anahtar] = (int(sayim.sum()), alt, medyan, ust)
+        return ozet
+
+    def _en_iyi_ozet(self, konum, durum):
+        """Yeterli örneği olan en özel anahtarın özeti ve kaynağı."""
+        for anahtar, kaynak in (((konum, durum), 'konum+durum'), (('*', durum), 'durum'), (('*', '*'), 'genel')):
+            ozet = self.ozet(anahtar)
+            if ozet is not None and (ozet[0] >= MIN_ORNEK or kaynak == 'genel'):
+                return ozet, kaynak
+        return None, None
+
+    def tahmin(self, konum, durum, son_tarih):
+        """Son olaydan tahmini teslim anı ve güven bandı; model boşsa None.
+
+        Dönüş: {'tahmini', 'alt', 'ust' (Timestamp), 'ornek', 'kaynak'}
+        """
+        ozet, kaynak = self._en_iyi_ozet(konum, durum)
+        if ozet is None:
+            return None
+        ornek, alt, medyan, ust = ozet
+        return {
+            'tahmini': son_tarih + pd.Timedelta(minutes=round(medyan)),
+            'alt': son_tarih + pd.Timedelta(minutes=round(alt)),
+            'ust': son_tarih + pd.Timedelta(minutes=round(ust)),
+            'ornek': ornek,
+            'kaynak': kaynak,
+        }
+
+    def ozet_tablosu(self):
+        """Tüm anahtarların özetleri: konum, durum, ornek, alt_dk, medyan_dk, ust_dk."""
+        satirlar = []
+        for anahtar in self._sayimlar:
+            ozet = self.ozet(anahtar)
+            if ozet is not None:
+                satirlar.append((anahtar[0], anahtar[1]) + ozet)
+        return pd.DataFrame(satirlar, columns=['konum', 'durum', 'ornek', 'alt_dk', 'medyan_dk', 'ust_dk'])
+
+    def acik_kargolari_puanla(self, loglar_df):
+        """Son durumu "Teslim Edildi" olmayan tüm kargoları tek geçişte puanlar.
+
+        (takip_no kolonu loglar_df'teki gibidir; kompakt şemada kod olabilir.)
+        """
+        if loglar_df.empty:
+            return self.puanla(loglar_df)
+        son = (
+            loglar_df.sort_values(by='tarih', kind='stable')
+            .drop_duplicates(subset='takip_no', keep='last')
+        )
+        return self.puanla(son[(son['durum'] != TESLIM_DURUMU).to_numpy(dtype=bool)])
+
+    def puanla(self, son_olaylar):
+        """Kargoların son olaylarını (takip_no, tarih, konum, durum) vektörel olarak puanlar.
+
+        Dönüş: takip_no, konum, durum, son_tarih, tahmini_teslim, alt, ust, ornek, kaynak.
+        Teslim edilmiş kargoda tahmini_teslim teslim anıdır, bant boştur.
+        """
+        kolonlar = ['takip_no', 'konum', 'durum', 'son_tarih', 'tahmini_teslim', 'alt', 'ust', 'ornek', 'kaynak']
+        sonuc = pd.DataFrame({
+            'takip_no': son_olaylar['takip_no'].to_numpy(),
+            'konum': son_olaylar['konum'].to_numpy(dtype=object),
+            'durum': son_olaylar['durum'].to_numpy(dtype=object),
+            'son_tarih': pd.to_datetime(son_olaylar['tarih']).to_numpy(),
+        })
+        if sonuc.empty:
+            return pd.DataFrame(columns=kolonlar)
+
+        ozetler = self.ozet_tablosu()
+        ozetler = ozetler[(ozetler['ornek'] >= MIN_ORNEK) | (ozetler['durum'] == '*')]
+        alt = pd.Series(np.nan, index=sonuc.index)
+        medyan = alt.copy()
+        ust = alt.copy()
+        ornek = pd.Series(0, index=sonuc.index)
+        kaynak = pd.Series(None, index=sonuc.index, dtype=object)
+        teslim = (sonuc['durum'] == TESLIM_DURUMU).to_numpy()
+        # Önce en özel eşleşme (konum+durum), eksik kalanlar durum ve genel özetle doldurulur
+        for anahtar_kolonlari, secim, ad in (
+            (['konum', 'durum'], ozetler['konum'] != '*', 'konum+durum'),
+            (['durum'], (ozetler['konum'] == '*') & (ozetler['durum'] != '*'), 'durum'),
+        ):
+            eslesen = sonuc[anahtar_kolonlari].merge(
+                ozetler[secim], on=anahtar_kolonlari, how='left'
+            ).set_index(sonuc.index)
+            bos = medyan.isna() & eslesen['medyan_dk'].notna() & ~teslim
+            alt[bos], medyan[bos], ust[bos] = eslesen['alt_dk'][bos], eslesen['medyan_dk'][bos], eslesen['ust_dk'][bos]
+            ornek[bos] = eslesen['ornek'][bos]
+            kaynak[bos] = ad
+        genel = self.ozet(('*', '*'))
+        if genel is not None:
+            bos = medyan.isna() & ~teslim
+            ornek[bos], alt[bos], medyan[bos], ust[bos] = genel
+            kaynak[bos] = 'genel'
+        medyan[teslim] = 0
+        kaynak[teslim] = 'teslim edildi'
+
+        sonuc['tahmini_teslim'] = sonuc['son_tarih'] + pd.to_timedelta(medyan.round(), unit='m')
+        sonuc['alt'] = sonuc['son_tarih'] + pd.to_timedelta(alt.round(), unit='m')
+        sonuc['ust'] = sonuc['son_tarih'] + pd.to_timedelta(ust.round(), unit='m')
+        sonuc['ornek'] = ornek.to_numpy()
+        sonuc['kaynak'] = kaynak.to_numpy()
+        return sonuc[kolonlar]
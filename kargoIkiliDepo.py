@@ -0,0 +1,672 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import (
+    DepolamaMotoru, LOGLAR_DOSYASI, KULLANICILAR_DOSYASI, KARGOLAR_ANA_DOSYASI,
+    KARGOLAR_GUNLUK_DOSYASI, LOG_KOLONLARI, KULLANICI_KOLONLARI, ANA_KOLONLARI,
+    DURUMLAR, VARSAYILAN_KULLANICILAR, bos_log_tablosu
+)
+from kargoTarih import TARIH_YOK, dakikalardan_tarihler
+from kargoKompakt import TakipNoKodlayici
+from kargoCsvDepo import check_and_load, csv_satir_ekle, csv_df_ekle, GUNLUK_SIKISTIRMA_ESIGI, ANA_TAMPON_ESIGI
+from kargoOlcum import olcum
+
+# İkili deponun dosyaları veri dizini altındaki bu klasördedir; CSV dosyalarına dokunulmaz
+IKILI_DIZINI = "ikili"
+KAYIT_DOSYASI = "kargo_loglari.bin"
+INDEKS_DOSYASI = "kargo_indeksi.bin"
+SOZLUK_DOSYASI = "sozluk.json"
+
+# Sabit genişlikli log kaydı (16 bayt): takip_no kodu (bkz. TakipNoKodlayici), epoch dakikası,
+# konum ve durum sözlük kodları (-1: boş)
+KAYIT_TIPI = np.dtype([('takip_no', '<i8'), ('dakika', '<i4'), ('konum', '<i2'), ('durum', '<i2')])
+KAYIT_BASLIGI = b'KARGOLOG' + (1).to_bytes(8, 'little')
+# Tarihsiz kaydın dakikası
+TARIHSIZ = np.iinfo(np.int32).min
+# İndeks dosyası int64 dizisidir: [sihir, anahtar sayısı, kapsanan kayıt sayısı, sürüm],
+# sıralı anahtarlar, sınırlar (anahtar i -> konumlar[s[i]:s[i + 1]]) ve kayıt numaraları
+INDEKS_SIHRI = int.from_bytes(b'KARGOIDX', 'little')
+INDEKS_SURUMU = 1
+_INDEKS_BASLIK = 4
+# İndeks dosyasına katılmamış (sonradan eklenen) kayıtlar bu sayıya ulaşınca indeks yeniden yazılır
+INDEKS_BIRLESTIRME_ESIGI = int(os.environ.get("KARGO_IKILI_INDEKS_ESIGI", "50000"))
+_DAKIKA_NS = 60 * 10 ** 9
+
+
+def _dakikalar(tarih_serisi):
+    """Tarih kolonunu kayıt dakikalarına çevirir (NaT -> TARIHSIZ)."""
+    dakikalar = tarih_serisi.to_numpy(dtype='datetime64[m]').view(np.int64)
+    return np.where(dakikalar == TARIH_YOK, TARIHSIZ, dakikalar).astype(np.int32)
+
+
+def _dakika_siniri(tarih):
+    """Aralık sınırının dakikası; dakika hassasiyetindeki kayıtlar için yukarı yuvarlanır."""
+    return -(-pd.Timestamp(tarih).value // _DAKIKA_NS)
+
+
+def _tarihler(dakikalar):
+    dakikalar = np.asarray(dakikalar, dtype=np.int64)
+    return dakikalardan_tarihler(np.where(dakikalar == TARIHSIZ, TARIH_YOK, dakikalar))
+
+
+def _siralama_anahtari(dakikalar):
+    # Tarihsiz kayıtlar kargonun geçmişinde sona gelir (CSV motorundaki gibi)
+    return np.where(dakikalar == TARIHSIZ, np.iinfo(np.int32).max, dakikalar)
+
+
+# --- İkili Depolama Motoru ---
+class IkiliDepolamaMotoru(DepolamaMotoru):
+    """Logları bellek eşlemeli (mmap) sabit genişlikli kayıt dosyasında tutar.
+
+    Log tablosu belleğe okunmaz: açılışta kayıt ve indeks dosyaları eşlenir, get_logs ikili
+    aramayla kargonun kayıt numaralarını bulup sadece o kayıtların sayfalarını okur. Bellek
+    kullanımı geçmişin boyutunu değil sorgulanan kargoları izler. Konum/durum metinleri
+    sozluk.json'da kodlanır; ana tablo ve kullanıcılar CSV motorundaki gibi CSV + günlüktür.
+    add_log kaydı dosya sonuna ekler. Tek yazıcı içindir; diğer süreçlerin eklemeleri
+    yeni_loglari_oku ile okunur.
+    """
+
+    ad = 'ikili'
+
+    def __init__(self, veri_dizini=None):
+        super().__init__(veri_dizini)
+        self.ikili_dizini = self.dosya_yolu(IKILI_DIZINI)
+        self.kayit_yolu = os.path.join(self.ikili_dizini, KAYIT_DOSYASI)
+        self.indeks_yolu = os.path.join(self.ikili_dizini, INDEKS_DOSYASI)
+        self.sozluk_yolu = os.path.join(self.ikili_dizini, SOZLUK_DOSYASI)
+        self.csv_kullanicilar = os.path.join(self.ikili_dizini, KULLANICILAR_DOSYASI)
+        self.csv_kargolar_ana = os.path.join(self.ikili_dizini, KARGOLAR_ANA_DOSYASI)
+        self.csv_kargolar_gunluk = os.path.join(self.ikili_dizini, KARGOLAR_GUNLUK_DOSYASI)
+
+        self._kodlayici = TakipNoKodlayici()
+        self._sozluk = {'konum': [], 'durum': []}   # kod -> metin
+        self._sozluk_kodlari = {'konum': {}, 'durum': {}}
+        self._sozluk_imzasi = None
+
+        self._kayitlar = None        # eşlenmiş kayıtlar (KAYIT_TIPI); eklemeden sonra yeniden eşlenir
+        self._kayit_sayisi = 0
+        self._esleme_bayat = False
+        self._kayit_kimligi = None
+        self._anahtarlar = np.empty(0, dtype=np.int64)
+        self._sinirlar = np.zeros(1, dtype=np.int64)
+        self._indeks_konumlari = np.empty(0, dtype=np.int64)
+        self._kapsanan = 0           # indeks dosyasının kapsadığı kayıt sayısı
+        self._ek_indeks = {}         # takip kodu -> [kayıt no]; kapsanan kayıtlardan sonrakiler
+        self._ek_kayit_sayisi = 0
+        self._harici_loglar = []
+        self._tam_yukleme_gerekli = False
+
+        self._kullanicilar_df = None
+        self._kargolar_ana_df = None
+        self._ana_tamponu = []       # Henüz kargolar_ana_df ile birleştirilmemiş yeni kargo satırları
+        self._ana_konumlari = {}     # takip_no -> kargolar_ana_df satır etiketi
+        self._gunluk_satir_sayisi = 0
+        # CSV aktarımında tarihi çözülemeyen satırlar (kayıtlara tarihsiz yazılır)
+        self._tarih_hatalari = None
+
+    # --- Yükleme ---
+    def load_data(self, ilerleme=None):
+        """Kayıt ve indeks dosyalarını eşler (okumaz); ilk açılışta CSV verisini bir kez aktarır."""
+        ilerleme = ilerleme or (lambda mesaj: None)
+        os.makedirs(self.ikili_dizini, exist_ok=True)
+        if not os.path.exists(self.kayit_yolu):
+            if os.path.exists(self.dosya_yolu(LOGLAR_DOSYASI)) or os.path.exists(self.dosya_yolu(KARGOLAR_ANA_DOSYASI)):
+                ilerleme("CSV verisi ikili depoya aktarılıyor...")
+                self.csv_den_aktar(self.veri_dizini)
+            else:
+                self._sozlugu_yaz({'konum': [], 'durum': list(DURUMLAR)}, TakipNoKodlayici())
+                self._kayit_dosyasini_yaz(np.empty(0, dtype=KAYIT_TIPI))
+
+        ilerleme("Kargo logları eşleniyor...")
+        self._sozlugu_oku()
+        self._kayitlari_esle()
+        ilerleme("Takip indeksi açılıyor...")
+        self._indeksi_ac()
+        self._harici_loglar = []
+        self._tam_yukleme_gerekli = False
+
+        ilerleme("Kullanıcılar yükleniyor...")
+        self._kullanicilar_df = check_and_load(self.csv_kullanicilar, KULLANICI_KOLONLARI)
+        if self._kullanicilar_df.empty:
+            self._kullanicilar_df = pd.DataFrame(VARSAYILAN_KULLANICILAR)
+            self._kullanicilar_df.to_csv(self.csv_kullanicilar, index=False)
+
+        # Ana tablo ilk gerektiğinde (ekleme, yönetici paneli, arama) yüklenir; takip sorgusu kullanmaz
+        self._kargolar_ana_df = None
+        self._ana_tamponu = []
+        self._ana_konumlari = {}
+        olcum.satir_tarandi(self._ek_kayit_sayisi + len(self._kullanicilar_df))
+
+    def csv_den_aktar(self, veri_dizini):
+        """data/*.csv dosyalarını (arşiv ve günlük dahil) ikili depoya yazar."""
+        # CSV okuma/tarih çözme kuralları CSV motoruyla aynı kalsın diye onu kullanırız
+        from kargoCsvDepo import CsvDepolamaMotoru
+        csv_motoru = CsvDepolamaMotoru(veri_dizini, kompakt=False)
+        csv_motoru.load_data()
+        hatalar = [csv_motoru.tarih_hatalari()]
+        loglar = pd.concat([csv_motoru.arsiv.tum_loglar(hatalar), csv_motoru.kargo_df], ignore_index=True)
+        loglar = loglar.sort_values(by='tarih', kind='stable', ignore_index=True)
+        self._tarih_hatalari = pd.concat(hatalar, ignore_index=True)
+
+        kodlayici = TakipNoKodlayici()
+        sozluk = {'konum': [], 'durum': list(DURUMLAR)}
+        kayitlar = self._kayitlari_kodla(loglar, kodlayici, sozluk)
+        self._sozlugu_yaz(sozluk, kodlayici)
+        csv_motoru.kullanicilar_df[KULLANICI_KOLONLARI].to_csv(self.csv_kullanicilar, index=False)
+        csv_motoru.kargolar_ana_df.drop_duplicates(subset='takip_no', keep='last')[ANA_KOLONLARI].to_csv(
+            self.csv_kargolar_ana, index=False
+        )
+        if os.path.exists(self.csv_kargolar_gunluk):
+            os.remove(self.csv_kargolar_gunluk)
+        csv_motoru.kapat()
+        # Kayıt dosyası en son yazılır: varlığı aktarımın tamamlandığını gösterir
+        self._indeks_dosyasini_yaz(kayitlar['takip_no'])
+        self._kayit_dosyasini_yaz(kayitlar)
+
+    # --- Sözlük ---
+    def _sozlugu_oku(self):
+        with open(self.sozluk_yolu, encoding='utf-8') as f:
+            sozluk = json.load(f)
+        self._sozluk = {kolon: list(sozluk[kolon]) for kolon in ('konum', 'durum')}
+        self._sozluk_kodlari = {
+            kolon: {metin: kod for kod, metin in enumerate(metinler)} for kolon, metinler in self._sozluk.items()
+        }
+        self._kodlayici = TakipNoKodlayici(sozluk.get('takip_no', []))
+        bilgi = os.stat(self.sozluk_yolu)
+        self._sozluk_imzasi = (bilgi.st_size, bilgi.st_mtime_ns)
+
+    def _sozlugu_tazele(self):
+        """Başka bir süreç sözlüğe yeni metin eklediyse yeniden okur."""
+        bilgi = os.stat(self.sozluk_yolu)
+        if (bilgi.st_size, bilgi.st_mtime_ns) != self._sozluk_imzasi:
+            self._sozlugu_oku()
+
+    def _sozlugu_yaz(self, sozluk, kodlayici):
+        gecici = self.sozluk_yolu + ".tmp"
+        with open(gecici, 'w', encoding='utf-8') as f:
+            json.dump({
+                'konum': sozluk['konum'], 'durum': sozluk['durum'], 'takip_no': kodlayici.yan_tablo()
+            }, f, ensure_ascii=False)
+            olcum.bayt_yazildi(f.tell())
+        os.replace(gecici, self.sozluk_yolu)
+        bilgi = os.stat(self.sozluk_yolu)
+        self._sozluk_imzasi = (bilgi.st_size, bilgi.st_mtime_ns)
+
+    @staticmethod
+    def _metin_kodlari(seri, metinler):
+        """Metin kolonunu sözlük kodlarına çevirir; yeni metinler sözlüğün sonuna eklenir (boş: -1)."""
+        kodlar, tekiller = pd.factorize(pd.Series(seri, dtype=object))
+        sozluk_kodlari = {metin: kod for kod, metin in enumerate(metinler)}
+        for metin in tekiller:
+            if metin not in sozluk_kodlari:
+                sozluk_kodlari[metin] = len(metinler)
+                metinler.append(metin)
+        if len(metinler) > np.iinfo(np.int16).max:
+            raise ValueError(f"İkili depo sözlüğü doldu ({len(metinler)} farklı değer)")
+        tekil_kodlar = np.array([sozluk_kodlari[metin] for metin in tekiller], dtype=np.int16)
+        return np.where(kodlar < 0, -1, tekil_kodlar[kodlar] if len(tekil_kodlar) else -1).astype(np.int16)
+
+    def _kayitlari_kodla(self, loglar, kodlayici, sozluk):
+        """LOG_KOLONLARI tablosunu kayıt dizisine çevirir (sözlük ve yan tablo yerinde genişler)."""
+        kayitlar = np.empty(len(loglar), dtype=KAYIT_TIPI)
+        kayitlar['takip_no'] = kodlayici.kodla_seri(loglar['takip_no'])
+        kayitlar['dakika'] = _dakikalar(loglar['tarih'])
+        kayitlar['konum'] = self._metin_kodlari(loglar['konum'], sozluk['konum'])
+        kayitlar['durum'] = self._metin_kodlari(loglar['durum'], sozluk['durum'])
+        return kayitlar
+
+    def _metinler(self, kolon, kodlar):
+        """Sözlük kodlarını metinlere çevirir (-1 -> None); dizinin sonundaki None boş kodun karşılığıdır."""
+        return np.array(self._sozluk[kolon] + [None], dtype=object)[kodlar]
+
+    # --- Kayıt Dosyası ---
+    def _kayit_dosyasini_yaz(self, kayitlar):
+        gecici = self.kayit_yolu + ".tmp"
+        with open(gecici, 'wb') as f:
+            f.write(KAYIT_BASLIGI)
+            f.write(kayitlar.tobytes())
+            olcum.bayt_yazildi(f.tell())
+        os.replace(gecici, self.kayit_yolu)
+
+    def _kayitlari_esle(self):
+        with open(self.kayit_yolu, 'rb') as f:
+            if f.read(len(KAYIT_BASLIGI)) != KAYIT_BASLIGI:
+                raise IOError(f"İkili log dosyası tanınmadı: {self.kayit_yolu}")
+        bilgi = os.stat(self.kayit_yolu)
+        self._kayit_kimligi = (bilgi.st_dev, bilgi.st_ino)
+        # Yarım kalmış son kayıt (ör. yazım sırasında kapanma) sayılmaz
+        self._kayit_sayisi = (bilgi.st_size - len(KAYIT_BASLIGI)) // KAYIT_TIPI.itemsize
+        self._esleme_bayat = True
+
+    def _kayitlari_al(self):
+        """Eşlenmiş kayıt dizisi; eklemelerden sonra ilk erişimde dosya yeniden eşlenir."""
+        if self._esleme_bayat:
+            if self._kayit_sayisi == 0:
+                self._kayitlar = np.empty(0, dtype=KAYIT_TIPI)
+            else:
+                self._kayitlar = np.memmap(
+                    self.kayit_yolu, dtype=KAYIT_TIPI, mode='r',
+                    offset=len(KAYIT_BASLIGI), shape=(self._kayit_sayisi,)
+                )
+            self._esleme_bayat = False
+        return self._kayitlar
+
+    def _kayit_ekle(self, kayitlar):
+        """Kayıtları dosyanın sonuna ekler; önce başka süreçlerin eklediği kayıtlar işlenir."""
+        self._harici_kayitlari_al()
+        with open(self.kayit_yolu, 'r+b') as f:
+            # Yarım kalmış kayıt varsa kesilir ki yeni kayıtlar hizalı kalsın
+            f.truncate(len(KAYIT_BASLIGI) + self._kayit_sayisi * KAYIT_TIPI.itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(kayitlar.tobytes())
+        olcum.bayt_yazildi(kayitlar.nbytes)
+        baslangic = self._kayit_sayisi
+        self._kayit_sayisi += len(kayitlar)
+        self._esleme_bayat = True
+        self._ek_indekse_ekle(kayitlar['takip_no'], baslangic)
+
+    # --- Takip İndeksi ---
+    def _indeks_dosyasini_yaz(self, takip_kodlari):
+        """Kayıtların takip kodlarından indeks dosyasını kurar (kargo içinde kayıt sırası korunur)."""
+        takip_kodlari = np.asarray(takip_kodlari, dtype=np.int64)
+        sira = np.argsort(takip_kodlari, kind='stable')
+        anahtarlar, ilkler = np.unique(takip_kodlari[sira], return_index=True)
+        sinirlar = np.append(ilkler, len(sira)).astype(np.int64)
+        baslik = np.array([INDEKS_SIHRI, len(anahtarlar), len(sira), INDEKS_SURUMU], dtype=np.int64)
+        # Windows'ta eşlenmiş dosyanın yerine yazılamaz; eski eşleme önce bırakılır
+        self._indeksi_birak()
+        gecici = self.indeks_yolu + ".tmp"
+        with open(gecici, 'wb') as f:
+            for dizi in (baslik, anahtarlar, sinirlar, sira.astype(np.int64)):
+                f.write(dizi.astype('<i8').tobytes())
+            olcum.bayt_yazildi(f.tell())
+        os.replace(gecici, self.indeks_yolu)
+
+    def _indeksi_birak(self):
+        self._anahtarlar = np.empty(0, dtype=np.int64)
+        self._sinirlar = np.zeros(1, dtype=np.int64)
+        self._indeks_konumlari = np.empty(0, dtype=np.int64)
+        self._kapsanan = 0
+
+    def _indeksi_esle(self):
+        """İndeks dosyasını eşler; dosya yoksa, bozuksa ya da kayıt dosyasıyla uyuşmuyorsa False."""
+        if not os.path.exists(self.indeks_yolu):
+            return False
+        dizi = np.asarray(np.memmap(self.indeks_yolu, dtype='<i8', mode='r'))
+        if len(dizi) < _INDEKS_BASLIK or dizi[0] != INDEKS_SIHRI or dizi[3] != INDEKS_SURUMU:
+            return False
+        anahtar_sayisi, kapsanan = int(dizi[1]), int(dizi[2])
+        if kapsanan > self._kayit_sayisi or len(dizi) != _INDEKS_BASLIK + 2 * anahtar_sayisi + 1 + kapsanan:
+            return False
+        sinir_basi = _INDEKS_BASLIK + anahtar_sayisi
+        self._anahtarlar = dizi[_INDEKS_BASLIK:sinir_basi]
+        self._sinirlar = dizi[sinir_basi:sinir_basi + anahtar_sayisi + 1]
+        self._indeks_konumlari = dizi[sinir_basi + anahtar_sayisi + 1:]
+        self._kapsanan = kapsanan
+        return True
+
+    def _indeksi_ac(self):
+        """İndeksi eşler; kapsanmayan son kayıtlar bellekteki ek indekse alınır, çoksa indeks yeniden yazılır."""
+        self._ek_indeks = {}
+        self._ek_kayit_sayisi = 0
+        if not self._indeksi_esle() or self._kayit_sayisi - self._kapsanan >= INDEKS_BIRLESTIRME_ESIGI:
+            self._indeksi_yeniden_yaz()
+            return
+        if self._kapsanan < self._kayit_sayisi:
+            self._ek_indekse_ekle(self._kayitlari_al()['takip_no'][self._kapsanan:], self._kapsanan)
+
+    def _indeksi_yeniden_yaz(self):
+        self._indeks_dosyasini_yaz(self._kayitlari_al()['takip_no'])
+        olcum.satir_tarandi(self._kayit_sayisi)
+        self._ek_indeks = {}
+        self._ek_kayit_sayisi = 0
+        if not self._indeksi_esle():
+            raise IOError(f"İkili indeks dosyası yazılamadı: {self.indeks_yolu}")
+
+    def _ek_indekse_ekle(self, takip_kodlari, baslangic):
+        """baslangic'tan itibaren eklenen kayıtları ek indekse işler; eşik aşılırsa indeks dosyası yeniden yazılır."""
+        self._ek_kayit_sayisi += len(takip_kodlari)
+        if self._ek_kayit_sayisi >= INDEKS_BIRLESTIRME_ESIGI:
+            self._indeksi_yeniden_yaz()
+            return
+        if len(takip_kodlari) == 1:
+            self._ek_indeks.setdefault(int(takip_kodlari[0]), []).append(baslangic)
+            return
+        sira = np.argsort(takip_kodlari, kind='stable')
+        anahtarlar, ilkler = np.unique(takip_kodlari[sira], return_index=True)
+        for kod, konumlar in zip(anahtarlar.tolist(), np.split(sira + baslangic, ilkler[1:])):
+            self._ek_indeks.setdefault(kod, []).extend(konumlar.tolist())
+
+    def _kayit_numaralari(self, kodlar):
+        """Her takip kodu için (istek sırası, kayıt numarası) dizileri; kargo içinde kayıt sırasıyla."""
+        kodlar = np.asarray(kodlar, dtype=np.int64)
+        yer = np.searchsorted(self._anahtarlar, kodlar)
+        if len(self._anahtarlar):
+            bulunan = self._anahtarlar[np.minimum(yer, len(self._anahtarlar) - 1)] == kodlar
+        else:
+            bulunan = np.zeros(len(kodlar), dtype=bool)
+        bas = self._sinirlar[yer[bulunan]]
+        adet = self._sinirlar[yer[bulunan] + 1] - bas
+        toplam = int(adet.sum())
+        ic = np.arange(toplam) - np.repeat(np.cumsum(adet) - adet, adet)
+        siralar = [np.repeat(np.flatnonzero(bulunan), adet)]
+        numaralar = [self._indeks_konumlari[np.repeat(bas, adet) + ic]]
+        if self._ek_indeks:
+            for sira, kod in enumerate(kodlar.tolist()):
+                ek = self._ek_indeks.get(kod)
+                if ek:
+                    siralar.append(np.full(len(ek), sira, dtype=np.int64))
+                    numaralar.append(np.array(ek, dtype=np.int64))
+        return np.concatenate(siralar), np.concatenate(numaralar)
+
+    def _takip_kodlari(self, takip_nolar):
+        return self._kodlayici.kodla_seri(pd.Series(takip_nolar, dtype=object), kaydet=False)
+
+    # --- Tablolar ---
+    @property
+    def kargo_df(self):
+        """Tüm log tablosu; her erişimde eşlenmiş kayıtlardan çözülür (bellekte tutulmaz).
+
+        takip_no kompakt şemadaki gibi int64 koddur (takip_no_metinleri ile çevrilir).
+        """
+        kayitlar = self._kayitlari_al()
+        olcum.satir_tarandi(len(kayitlar))
+        return pd.DataFrame({
+            'takip_no': np.array(kayitlar['takip_no']),
+            'tarih': _tarihler(kayitlar['dakika']),
+            'konum': pd.Categorical.from_codes(kayitlar['konum'], categories=pd.Index(self._sozluk['konum'], dtype=object)),
+            'durum': pd.Categorical.from_codes(kayitlar['durum'], categories=pd.Index(self._sozluk['durum'], dtype=object)),
+        })
+
+    @property
+    def kullanicilar_df(self):
+        return self._kullanicilar_df
+
+    @property
+    def kargolar_ana_df(self):
+        return self._ana_tablosu()
+
+    def takip_no_metinleri(self, seri):
+        # Ana tablodaki takip_no zaten metindir; sadece kayıtlardan gelen kodlar çözülür
+        if not pd.api.types.is_integer_dtype(seri.dtype):
+            return super().takip_no_metinleri(seri)
+        return self._kodlayici.coz_seri(seri.to_numpy())
+
+    def indeks_bilgisi(self):
+        """Eşlenen indeks dosyası ve bellekteki ek indeksin boyutu (dosya sayfaları erişildikçe belleğe gelir)."""
+        ek = np.fromiter(self._ek_indeks.keys(), dtype=np.int64, count=len(self._ek_indeks))
+        yeni = int((~np.isin(ek, self._anahtarlar)).sum()) if len(ek) else 0
+        bayt = os.path.getsize(self.indeks_yolu) if os.path.exists(self.indeks_yolu) else 0
+        return len(self._anahtarlar) + yeni, bayt + self._ek_kayit_sayisi * 8
+
+    def _log_tablosu(self, kayitlar, takip_nolar=None):
+        """Kayıtları LOG_KOLONLARI tablosuna (takip_no / konum / durum metin) çevirir."""
+        return pd.DataFrame({
+            'takip_no': self._kodlayici.coz_seri(kayitlar['takip_no']) if takip_nolar is None else takip_nolar,
+            'tarih': _tarihler(kayitlar['dakika']),
+            'konum': self._metinler('konum', kayitlar['konum']),
+            'durum': self._metinler('durum', kayitlar['durum']),
+        }, columns=LOG_KOLONLARI)
+
+    # --- Sorgular ---
+    def get_user_credentials(self, user, password):
+        user_row = self._kullanicilar_df[
+            (self._kullanicilar_df['kullanici_adi'] == user) &
+            (self._kullanicilar_df['sifre'] == password)
+        ]
+        olcum.satir_tarandi(len(self._kullanicilar_df))
+        if not user_row.empty:
+            return user_row.iloc[0]['rol']
+        return None
+
+    def get_logs(self, takip_no):
+        """Kargonun kayıtlarını indeksten bulur; dosyadan sadece bu kayıtların sayfaları okunur."""
+        kod = self._kodlayici.kodla(str(takip_no), kaydet=False)
+        if kod is None:
+            return None
+        i = int(np.searchsorted(self._anahtarlar, kod))
+        if i < len(self._anahtarlar) and self._anahtarlar[i] == kod:
+            numaralar = self._indeks_konumlari[self._sinirlar[i]:self._sinirlar[i + 1]]
+        else:
+            numaralar = np.empty(0, dtype=np.int64)
+        ek = self._ek_indeks.get(kod)
+        if ek:
+            numaralar = np.concatenate([numaralar, np.array(ek, dtype=np.int64)])
+        olcum.satir_tarandi(len(numaralar))
+        if len(numaralar) == 0:
+            return None
+        kayitlar = self._kayitlari_al()[numaralar]
+        anahtar = _siralama_anahtari(kayitlar['dakika'])
+        if (anahtar[1:] < anahtar[:-1]).any():
+            kayitlar = kayitlar[np.argsort(anahtar, kind='stable')]
+        konumlar = self._metinler('konum', kayitlar['konum'])
+        durumlar = self._metinler('durum', kayitlar['durum'])
+        return [
+            {'takip_no': takip_no, 'tarih': pd.Timestamp(tarih), 'konum': konum, 'durum': durum}
+            for tarih, konum, durum in zip(_tarihler(kayitlar['dakika']), konumlar, durumlar)
+        ]
+
+    def get_logs_many(self, takip_nolar):
+        """Birçok kargonun kayıt numaralarını tek geçişte bulur, kayıtları tek bir take ile okur."""
+        nolar = np.array(list(dict.fromkeys(takip_nolar)), dtype=object)
+        if not len(nolar):
+            return bos_log_tablosu()
+        siralar, numaralar = self._kayit_numaralari(self._takip_kodlari(nolar))
+        olcum.satir_tarandi(len(numaralar))
+        kayitlar = self._kayitlari_al()[numaralar]
+        duzen = np.lexsort((_siralama_anahtari(kayitlar['dakika']), siralar))
+        return self._log_tablosu(kayitlar[duzen], nolar[siralar[duzen]])
+
+    def ana_kayitlari(self, takip_nolar):
+        """Ana tablo satırları takip_no -> etiket sözlüğünden okunur (tablo taranmaz)."""
+        ana_df = self._ana_tablosu()
+        etiketler = [self._ana_konumlari.get(takip_no) for takip_no in dict.fromkeys(takip_nolar)]
+        return ana_df.loc[[e for e in etiketler if e is not None], ANA_KOLONLARI].reset_index(drop=True)
+
+    def log_parcalari(self, baslangic=None, bitis=None, parca_boyutu=100000):
+        """Kayıt dosyasını dilim dilim tarar; aynı anda sadece bir dilimin sayfaları bellektedir."""
+        kayitlar = self._kayitlari_al()
+        toplam = len(kayitlar)
+        alt = _dakika_siniri(baslangic) if baslangic is not None else None
+        ust = _dakika_siniri(bitis) if bitis is not None else None
+        for i in range(0, toplam, parca_boyutu):
+            parca = kayitlar[i:i + parca_boyutu]
+            dakikalar = parca['dakika']
+            maske = dakikalar != TARIHSIZ
+            if alt is not None:
+                maske &= dakikalar >= alt
+            if ust is not None:
+                maske &= dakikalar < ust
+            olcum.satir_tarandi(len(parca))
+            yield min(i + parca_boyutu, toplam), toplam, self._log_tablosu(parca[maske])
+
+    # --- Artımlı Yeniden Yükleme (başka süreçlerin eklediği kayıtlar) ---
+    def _harici_kayitlari_al(self):
+        """Bilinen kayıt sayısından sonra dosyaya eklenmiş kayıtları indekse ve ana tabloya işler."""
+        try:
+            bilgi = os.stat(self.kayit_yolu)
+        except FileNotFoundError:
+            self._tam_yukleme_gerekli = True
+            return 0
+        sayi = (bilgi.st_size - len(KAYIT_BASLIGI)) // KAYIT_TIPI.itemsize
+        if (bilgi.st_dev, bilgi.st_ino) != self._kayit_kimligi or sayi < self._kayit_sayisi:
+            # Dosya yeniden yazılmış (ör. yeniden aktarım): artımlı okunamaz
+            self._tam_yukleme_gerekli = True
+            return 0
+        if sayi == self._kayit_sayisi:
+            return 0
+        baslangic = self._kayit_sayisi
+        self._kayit_sayisi = sayi
+        self._esleme_bayat = True
+        kayitlar = np.array(self._kayitlari_al()[baslangic:])
+        self._sozlugu_tazele()
+        self._ek_indekse_ekle(kayitlar['takip_no'], baslangic)
+        loglar = self._log_tablosu(kayitlar)
+        olcum.satir_tarandi(len(loglar))
+        self._durumlari_isle(loglar)
+        self._harici_loglar.append(loglar)
+        return len(loglar)
+
+    def yeni_loglari_oku(self):
+        self._harici_kayitlari_al()
+        if self._tam_yukleme_gerekli:
+            return None
+        loglar, self._harici_loglar = self._harici_loglar, []
+        if not loglar:
+            return bos_log_tablosu()
+        return pd.concat(loglar, ignore_index=True) if len(loglar) > 1 else loglar[0]
+
+    def degisiklik_dosyalari(self):
+        return [self.kayit_yolu]
+
+    def tarih_hatalari(self):
+        if self._tarih_hatalari is None:
+            return super().tarih_hatalari()
+        return self._tarih_hatalari
+
+    # --- Ekleme ---
+    def _sozlukle_kodla(self, loglar):
+        """Yeni logları kodlar; sözlüğe ya da yan tabloya metin eklendiyse sözlük dosyası önce yazılır
+        (kayıt, dosyada karşılığı olmayan bir kod taşımasın)."""
+        self._sozlugu_tazele()
+        boyutlar = (len(self._sozluk['konum']), len(self._sozluk['durum']), len(self._kodlayici))
+        kayitlar = self._kayitlari_kodla(loglar, self._kodlayici, self._sozluk)
+        if (len(self._sozluk['konum']), len(self._sozluk['durum']), len(self._kodlayici)) != boyutlar:
+            self._sozluk_kodlari = {
+                kolon: {metin: kod for kod, metin in enumerate(metinler)} for kolon, metinler in self._sozluk.items()
+            }
+            self._sozlugu_yaz(self._sozluk, self._kodlayici)
+        return kayitlar
+
+    def _kayit(self, takip_no, tarih, konum, durum):
+        """Tek bir logun kaydı; metinler sözlükte varsa DataFrame kurulmadan kodlanır."""
+        kod = self._kodlayici.kodla(takip_no, kaydet=False)
+        konum_kodu = self._sozluk_kodlari['konum'].get(konum, -1 if konum is None else None)
+        durum_kodu = self._sozluk_kodlari['durum'].get(durum, -1 if durum is None else None)
+        if kod is None or konum_kodu is None or durum_kodu is None:
+            return self._sozlukle_kodla(pd.DataFrame([(takip_no, tarih, konum, durum)], columns=LOG_KOLONLARI))
+        dakika = TARIHSIZ if tarih is None or pd.isna(tarih) else pd.Timestamp(tarih).value // _DAKIKA_NS
+        return np.array([(kod, dakika, konum_kodu, durum_kodu)], dtype=KAYIT_TIPI)
+
+    def add_log(self, takip_no, tarih, konum, durum):
+        """Kaydı dosya sonuna ekler ve ana kargo durumunu günceller."""
+        self._kayit_ekle(self._kayit(takip_no, tarih, konum, durum))
+
+        self._ana_tablosunu_yukle()
+        etiket = self._ana_konumlari.get(takip_no)
+        taban = len(self._kargolar_ana_df)
+        if etiket is not None and etiket >= taban:
+            # Satır henüz tamponda: tablo birleştirilmeden tamponda güncellenir
+            self._ana_tamponu[etiket - taban][3] = durum
+            ana_satir = list(self._ana_tamponu[etiket - taban])
+        elif etiket is not None:
+            self._kargolar_ana_df.at[etiket, 'mevcut_durum'] = durum
+            # Satırı .loc ile almak (Series kurulumu) eklemenin kendisinden pahalıdır
+            ana_satir = [self._kargolar_ana_df.at[etiket, kolon] for kolon in ANA_KOLONLARI]
+        else:
+            # Yeni bir kargo ilk kez sisteme giriyorsa basit ana kargo kaydı tampona eklenir (tablo kopyalanmaz)
+            ana_satir = [takip_no, 'Bilinmiyor', 'Bilinmiyor', durum]
+            self._ana_konumlari[takip_no] = taban + len(self._ana_tamponu)
+            self._ana_tamponu.append(list(ana_satir))
+            if len(self._ana_tamponu) >= ANA_TAMPON_ESIGI:
+                self._ana_tamponunu_birlestir()
+        csv_satir_ekle(self.csv_kargolar_gunluk, [ana_satir], ANA_KOLONLARI)
+        self._gunluk_satir_sayisi += 1
+        if self._gunluk_satir_sayisi >= GUNLUK_SIKISTIRMA_ESIGI:
+            self._ana_tabloyu_sikistir()
+        return True
+
+    def add_logs_bulk(self, loglar):
+        """Log grubunu tek yazımla ekler; büyük gruplardan sonra indeks dosyası bir kez yeniden yazılır."""
+        if loglar.empty:
+            return
+        loglar = loglar[LOG_KOLONLARI].reset_index(drop=True)
+        self._kayit_ekle(self._sozlukle_kodla(loglar))
+        son_durumlar = self._durumlari_isle(loglar)
+        if self._gunluk_satir_sayisi + len(son_durumlar) >= GUNLUK_SIKISTIRMA_ESIGI:
+            self._ana_tabloyu_sikistir()
+            return
+        etiketler = [self._ana_konumlari[takip_no] for takip_no in son_durumlar['takip_no']]
+        csv_df_ekle(self.csv_kargolar_gunluk, self._kargolar_ana_df.loc[etiketler, ANA_KOLONLARI])
+        self._gunluk_satir_sayisi += len(etiketler)
+
+    # --- Ana Tablo ---
+    def _ana_tablosu(self):
+        """Ana tabloyu gerekirse yükler; tamponda bekleyen yeni kargolar önce birleştirilir."""
+        self._ana_tablosunu_yukle()
+        self._ana_tamponunu_birlestir()
+        return self._kargolar_ana_df
+
+    def _ana_tablosunu_yukle(self):
+        """Ana tabloyu gerekirse CSV'den ve günlükten yükler."""
+        if self._kargolar_ana_df is not None:
+            return self._kargolar_ana_df
+        ana_df = check_and_load(self.csv_kargolar_ana, ANA_KOLONLARI)
+        self._gunluk_satir_sayisi = 0
+        if os.path.exists(self.csv_kargolar_gunluk):
+            gunluk_df = check_and_load(self.csv_kargolar_gunluk, ANA_KOLONLARI)
+            self._gunluk_satir_sayisi = len(gunluk_df)
+            if not gunluk_df.empty:
+                # Kargonun ilk görüldüğü sıra korunur, değerler en son kayıttan alınır
+                ana_df = (
+                    pd.concat([ana_df, gunluk_df], ignore_index=True)
+                    .groupby('takip_no', sort=False, as_index=False).last()[ANA_KOLONLARI]
+                )
+        self._kargolar_ana_df = ana_df
+        self._ana_tamponu = []
+        self._ana_konumlari = dict(zip(ana_df['takip_no'], ana_df.index))
+        olcum.satir_tarandi(len(ana_df))
+        if self._gunluk_satir_sayisi >= GUNLUK_SIKISTIRMA_ESIGI:
+            self._ana_tabloyu_sikistir()
+        return ana_df
+
+    def _ana_tamponunu_birlestir(self):
+        """Tampondaki yeni kargo satırlarını tek bir concat ile kargolar_ana_df'e ekler."""
+        if self._ana_tamponu:
+            yeni_ana = pd.DataFrame(self._ana_tamponu, columns=ANA_KOLONLARI)
+            self._ana_tamponu = []
+            self._kargolar_ana_df = pd.concat([self._kargolar_ana_df, yeni_ana], ignore_index=True)
+
+    def _ana_kayitlari_ekle(self, yeni_ana):
+        baslangic = len(self._kargolar_ana_df)
+        self._kargolar_ana_df = pd.concat([self._kargolar_ana_df, yeni_ana], ignore_index=True)
+        self._ana_konumlari.update(zip(yeni_ana['takip_no'], range(baslangic, baslangic + len(yeni_ana))))
+
+    def _durumlari_isle(self, loglar):
+        """Her kargonun gruptaki son olayını ana tabloya işler (yeni kargolar eklenir); son olayları döndürür."""
+        self._ana_tablosu()
+        son_durumlar = (
+            loglar.sort_values(by='tarih', kind='stable')
+            .drop_duplicates(subset='takip_no', keep='last')
+        )
+        etiketler = [self._ana_konumlari.get(takip_no) for takip_no in son_durumlar['takip_no']]
+        mevcut = np.array([etiket is not None for etiket in etiketler], dtype=bool)
+        self._kargolar_ana_df.loc[[e for e in etiketler if e is not None], 'mevcut_durum'] = (
+            son_durumlar.loc[mevcut, 'durum'].to_numpy()
+        )
+        if not mevcut.all():
+            self._ana_kayitlari_ekle(pd.DataFrame({
+                'takip_no': son_durumlar.loc[~mevcut, 'takip_no'].to_numpy(),
+                'gonderici_ad': 'Bilinmiyor',
+                'alici_ad': 'Bilinmiyor',
+                'mevcut_durum': son_durumlar.loc[~mevcut, 'durum'].to_numpy(),
+            }))
+        return son_durumlar
+
+    def _ana_tabloyu_sikistir(self):
+        """Ana tabloyu yeniden yazar ve günlüğü boşaltır."""
+        gecici = self.csv_kargolar_ana + ".tmp"
+        self._ana_tablosu().to_csv(gecici, index=False)
+        olcum.bayt_yazildi(os.path.getsize(gecici) if olcum.etkin else 0)
+        os.replace(gecici, self.csv_kargolar_ana)
+        if os.path.exists(self.csv_kargolar_gunluk):
+            os.remove(self.csv_kargolar_gunluk)
+        self._gunluk_satir_sayisi = 0
+
+    def kapat(self):
+        # Eşlemeler bırakılır; dosyalar başka bir motorla yeniden açılabilir
+        self._kayitlar = None
+        self._esleme_bayat = True
+        self._indeksi_birak()
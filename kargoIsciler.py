@@ -0,0 +1,100 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class IsSinyalleri(QObject):
+    """Arka plan işinin sonucunu arayüz iş parçacığına taşıyan sinyaller."""
+
+    bitti = pyqtSignal(object)
+    hata = pyqtSignal(str)
+    ilerleme = pyqtSignal(object)
+    # Sonuç ya da hatadan sonra her durumda yayınlanır
+    tamamlandi = pyqtSignal()
+
+
+class Is(QRunnable):
+    """Bir fonksiyonu QThreadPool'da çalıştırır; sonucu sinyallerle bildirir.
+
+    ilerleme_kullan=True ise fonksiyona, ilerleme sinyalini yayınlayan bir
+    `ilerleme` geri çağırımı anahtar kelime argümanı olarak verilir.
+    """
+
+    def __init__(self, fn, *args, ilerleme_kullan=False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.ilerleme_kullan = ilerleme_kullan
+        self.sinyaller = IsSinyalleri()
+
+    def run(self):
+        try:
+            if self.ilerleme_kullan:
+                self.kwargs['ilerleme'] = self.sinyaller.ilerleme.emit
+            sonuc = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.sinyaller.hata.emit(str(e))
+        else:
+            self.sinyaller.bitti.emit(sonuc)
+        finally:
+            self.sinyaller.tamamlandi.emit()
+
+
+# --- Arka Plan İş Yöneticisi ---
+class IsYoneticisi(QObject):
+    """Okuma/sorgu işleri için paralel, yazma işleri için tek iş parçacıklı havuz.
+
+    Yazma havuzunda tek iş parçacığı olduğundan yazmalar kuyruğa giriş sırasıyla
+    diske ulaşır; arayüz bu sırada yeni kayıt almaya devam eder.
+    """
+
+    bekleyen_yazma_degisti = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.okuma_havuzu = QThreadPool(self)
+        self.yazma_havuzu = QThreadPool(self)
+        self.yazma_havuzu.setMaxThreadCount(1)
+        # Kuyruktaki işlerin sinyal nesneleri, sinyaller teslim edilene kadar canlı tutulur
+        self._aktif = set()
+        self._bekleyen_yazma = 0
+
+    def _baslat(self, havuz, fn, args, kwargs, bitti, hata, ilerleme, tamamlandi=None):
+        is_ = Is(fn, *args, ilerleme_kullan=ilerleme is not None, **kwargs)
+        sinyaller = is_.sinyaller
+        if bitti is not None:
+            sinyaller.bitti.connect(bitti)
+        if hata is not None:
+            sinyaller.hata.connect(hata)
+        if ilerleme is not None:
+            sinyaller.ilerleme.connect(ilerleme)
+        if tamamlandi is not None:
+            sinyaller.tamamlandi.connect(tamamlandi)
+        self._aktif.add(sinyaller)
+        sinyaller.tamamlandi.connect(lambda: self._aktif.discard(sinyaller))
+        havuz.start(is_)
+        return sinyaller
+
+    def calistir(self, fn, *args, bitti=None, hata=None, ilerleme=None, **kwargs):
+        """Yükleme ve sorgu gibi okuma işlerini paralel havuzda çalıştırır."""
+        return self._baslat(self.okuma_havuzu, fn, args, kwargs, bitti, hata, ilerleme)
+
+    def yaz(self, fn, *args, bitti=None, hata=None, ilerleme=None, **kwargs):
+        """Kalıcı yazma işini sıralı yazma kuyruğuna ekler."""
+        self._bekleyen_yazma += 1
+        self.bekleyen_yazma_degisti.emit(self._bekleyen_yazma)
+        return self._baslat(
+            self.yazma_havuzu, fn, args, kwargs, bitti, hata, ilerleme, self._yazma_tamamlandi
+        )
+
+    def _yazma_tamamlandi(self):
+        self._bekleyen_yazma -= 1
+        self.bekleyen_yazma_degisti.emit(self._bekleyen_yazma)
+
+    @property
+    def bekleyen_yazma(self):
+        return self._bekleyen_yazma
+
+    def bekle(self):
+        """Kuyruktaki tüm işler bitene kadar bekler (uygulama kapanırken)."""
+        self.yazma_havuzu.waitForDone()
+        self.okuma_havuzu.waitForDone()
@@ -0,0 +1,324 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import DURUMLAR
+from kargoVeritabani import CargoDatabase, motor_olustur
+from kargoVeriUretici import veri_uret
+from kargoEta import TESLIM_DURUMU
+from kargoDogrulama import sonraki_durumlar
+
+# Sentetik veri üzerinde CargoDatabase kıyaslamaları; sonuçlar koşular arasında
+# karşılaştırılabilsin diye JSON olarak saklanır
+KIYASLAMA_DIZINI = "kiyaslama_sonuclari"
+VARSAYILAN_OLCEKLER = [10_000, 100_000, 1_000_000]
+SORGU_SAYISI = 2000
+EKLEME_SAYISI = 500
+# Bulunamayan numara sorgularının oranı
+ISKALAMA_ORANI = 0.1
+# Yeni/eski süre oranı bunu aşan ölçümler gerileme sayılır
+GERILEME_ESIGI = 1.2
+GURULTU_SINIRI_SN = 0.005
+# Soğuk başlangıç ölçümleri ayrı süreçlerde bu kadar tekrarlanır (medyan alınır)
+SOGUK_BASLANGIC_TEKRAR = 3
+PAKET_DIZINI = os.path.dirname(os.path.abspath(__file__))
+# Pencereyi açıp (argv[2] == 'yuklendi' ise veri yüklenene kadar bekleyip) hemen çıkan betik
+_PENCERE_BETIGI = """
+import os, sys, time
+from PyQt6.QtWidgets import QApplication
+from kargoVeritabani import CargoDatabase
+from kargoTakip import CargoTrackingApp, LIGHT_STYLE_SHEET
+uygulama = QApplication(sys.argv)
+uygulama.setStyleSheet(LIGHT_STYLE_SHEET)
+pencere = CargoTrackingApp(CargoDatabase(veri_dizini=sys.argv[1], yukle=False))
+pencere.show()
+uygulama.processEvents()
+if sys.argv[2] == 'yuklendi':
+    while not pencere.tabs.isEnabled():
+        uygulama.processEvents()
+        time.sleep(0.002)
+    pencere.isler.bekle()
+os._exit(0)
+"""
+
+
+def _dagilim(sureler):
+    """Çağrı başına süre dağılımı (mikrosaniye)."""
+    us = np.asarray(sureler) * 1e6
+    return {
+        'adet': int(len(us)),
+        'ortalama_us': round(float(us.mean()), 2),
+        'p50_us': round(float(np.percentile(us, 50)), 2),
+        'p99_us': round(float(np.percentile(us, 99)), 2),
+    }
+
+
+def _cagri_sureleri(fn, argumanlar):
+    sureler = []
+    for arguman in argumanlar:
+        baslangic = time.perf_counter()
+        fn(*arguman)
+        sureler.append(time.perf_counter() - baslangic)
+    return sureler
+
+
+def _veritabani(veri_dizini, motor, kompakt):
+    if motor == 'csv':
+        from kargoCsvDepo import CsvDepolamaMotoru
+        return CargoDatabase(CsvDepolamaMotoru(veri_dizini, kompakt=kompakt), yukle=False)
+    return CargoDatabase(motor_olustur(motor, veri_dizini), yukle=False)
+
+
+def _yukle(veri_dizini, motor, kompakt):
+    db = _veritabani(veri_dizini, motor, kompakt)
+    baslangic = time.perf_counter()
+    db.load_data()
+    return db, time.perf_counter() - baslangic
+
+
+def _yonetici_paneli_olc(db):
+    """update_manager_panel'in işini (veri çekme + tabloları doldurma) offscreen Qt ile ölçer."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from kargoTakip import CargoTrackingApp
+
+    uygulama = QApplication.instance() or QApplication(sys.argv)
+    pencere = CargoTrackingApp(db)
+    # Pencere açılışta veriyi arka planda yükler; ölçümden önce bitmesi beklenir
+    while not pencere.tabs.isEnabled():
+        uygulama.processEvents()
+        time.sleep(0.005)
+    baslangic = time.perf_counter()
+    veriler = pencere.fetch_manager_data()
+    veri_suresi = time.perf_counter() - baslangic
+    baslangic = time.perf_counter()
+    pencere.fill_manager_panel(veriler)
+    uygulama.processEvents()
+    doldurma_suresi = time.perf_counter() - baslangic
+    pencere.isler.bekle()
+    pencere.deleteLater()
+    uygulama.processEvents()
+    return {'veri_sn': round(veri_suresi, 4), 'doldurma_sn': round(doldurma_suresi, 4)}
+
+
+def _surec_suresi(komut, ortam, tekrar=SOGUK_BASLANGIC_TEKRAR):
+    """Komutun yeni bir Python sürecinde baştan sona süresinin medyanı (saniye)."""
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        subprocess.run(komut, env=ortam, cwd=PAKET_DIZINI, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        sureler.append(time.perf_counter() - baslangic)
+    return round(float(np.median(sureler)), 4)
+
+
+def soguk_baslangic_olc(veri_dizini, motor='csv', kompakt=False, takip_no=None, arayuz=True):
+    """Komut satırı (kargoKomut) ve pencere açılışının süreç başlangıcından itibaren süreleri."""
+    ortam = dict(os.environ, KARGO_DEPOLAMA=motor, KARGO_KOMPAKT="1" if kompakt else "0",
+                 QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    komut = [sys.executable, "kargoKomut.py", "--veri-dizini", veri_dizini]
+    sonuc = {
+        'cli_yardim_sn': _surec_suresi(komut + ["--help"], ortam),
+        'cli_stats_sn': _surec_suresi(komut + ["stats"], ortam),
+    }
+    if takip_no is not None:
+        sonuc['cli_track_sn'] = _surec_suresi(komut + ["track", takip_no], ortam)
+    if arayuz:
+        betik = [sys.executable, "-c", _PENCERE_BETIGI, veri_dizini]
+        sonuc['pencere_acilis_sn'] = _surec_suresi(betik + ["acilis"], ortam)
+        sonuc['pencere_yuklendi_sn'] = _surec_suresi(betik + ["yuklendi"], ortam)
+    return sonuc
+
+
+def olcek_kiyasla(veri_dizini, motor='csv', kompakt=False, sorgu_sayisi=SORGU_SAYISI,
+                  ekleme_sayisi=EKLEME_SAYISI, arayuz=True, tohum=0):
+    """Tek bir veri dizini üzerinde tüm ölçümleri yapar (dizindeki veri add_log ile değişir)."""
+    rng = np.random.default_rng(tohum)
+    sonuc = {}
+
+    # 1. load_data: ilk açılış (anlık görüntü / SQLite aktarımı yok) ve tekrar açılış
+    db, sure = _yukle(veri_dizini, motor, kompakt)
+    sonuc['load_data_ilk_sn'] = round(sure, 4)
+    db.kapat()
+    db, sure = _yukle(veri_dizini, motor, kompakt)
+    sonuc['load_data_tekrar_sn'] = round(sure, 4)
+    kargo_df = db.kargo_df
+    sonuc['log_satiri'] = int(len(kargo_df))
+    sonuc['tarihsiz_satir'] = int(kargo_df['tarih'].isna().sum())
+    sonuc['kargo_df_mb'] = round(kargo_df.memory_usage(deep=True).sum() / 2 ** 20, 1)
+
+    # 2. get_logs: var olan numaralar + bir miktar bulunamayan numara
+    takip_nolari = db.kargolar_ana_df['takip_no'].astype(str).to_numpy()
+    secilen = rng.choice(takip_nolari, sorgu_sayisi).tolist()
+    iskalama = int(sorgu_sayisi * ISKALAMA_ORANI)
+    secilen[:iskalama] = [f"YOK{i}" for i in range(iskalama)]
+    rng.shuffle(secilen)
+    db.get_logs(secilen[0])
+    sonuc['get_logs'] = _dagilim(_cagri_sureleri(db.get_logs, [(t,) for t in secilen]))
+
+    # 3. calculate_eta: ilk çağrı ETA modelini kurar; sonraki çağrılar sadece tahmindir
+    log_listeleri = [loglar for loglar in (db.get_logs(t) for t in secilen[:sorgu_sayisi // 4]) if loglar]
+    if log_listeleri:
+        # Teslim edilmiş (ya da son tarihi çözülemeyen) kargoda model kurulmaz; ilk ölçüm açık bir kargoyla yapılır
+        ilk = next((l for l in log_listeleri if l[-1]['durum'] != TESLIM_DURUMU and pd.notna(l[-1]['tarih'])),
+                   log_listeleri[0])
+        baslangic = time.perf_counter()
+        db.calculate_eta(ilk)
+        sonuc['calculate_eta_ilk_sn'] = round(time.perf_counter() - baslangic, 4)
+        sonuc['calculate_eta'] = _dagilim(_cagri_sureleri(db.calculate_eta, [(l,) for l in log_listeleri]))
+
+    # 4. add_log: açık kargolara durum akışına uygun yeni durumlar (doğrulama ve dosyaya ekleme dahil)
+    ana = db.kargolar_ana_df
+    acik = ana[(ana['mevcut_durum'] != TESLIM_DURUMU).to_numpy(dtype=bool)]
+    mevcut = dict(zip(acik['takip_no'].astype(str), acik['mevcut_durum'].astype(object)))
+    eklenecek = []
+    for i, t in enumerate(rng.choice(np.asarray(list(mevcut), dtype=object), ekleme_sayisi)):
+        sonrakiler = sonraki_durumlar(mevcut[t]) or [DURUMLAR[0]]
+        # Aynı durumu tekrarlamayan ilk geçiş seçilir (Transfer -> Transfer tekrar tarama sayılabilir)
+        durum = next((d for d in sonrakiler if d != mevcut[t] and d != TESLIM_DURUMU), sonrakiler[0])
+        mevcut[t] = durum
+        eklenecek.append((t, f"Kıyaslama Şube {i % 10}", durum))
+    sonuc['add_log'] = _dagilim(_cagri_sureleri(db.add_log, eklenecek))
+
+    # 5. Yönetici paneli (offscreen Qt)
+    if arayuz:
+        try:
+            sonuc['update_manager_panel'] = _yonetici_paneli_olc(db)
+        except ImportError as e:
+            arayuz = False
+            sonuc['update_manager_panel'] = {'atlandi': f"PyQt6 yok: {e}"}
+    db.kapat()
+
+    # 6. Soğuk başlangıç: yeni süreçte komut satırı ve pencere (anlık görüntüler artık hazır)
+    sonuc['soguk_baslangic'] = soguk_baslangic_olc(veri_dizini, motor, kompakt, str(takip_nolari[0]), arayuz)
+    return sonuc
+
+
+def kiyasla(olcekler=VARSAYILAN_OLCEKLER, motor='csv', kompakt=False, tohum=0, sorgu_sayisi=SORGU_SAYISI,
+            ekleme_sayisi=EKLEME_SAYISI, arayuz=True, veri_dizini=None, ilerleme=None):
+    """Her ölçek için sentetik veri üretip (veya veri_dizini'nin kopyasında) kıyaslama yapar."""
+    ilerleme = ilerleme or (lambda mesaj: None)
+    rapor = {
+        'zaman': datetime.now().isoformat(timespec='seconds'),
+        'ortam': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'islemci_sayisi': os.cpu_count(),
+        },
+        'ayarlar': {
+            'motor': motor, 'kompakt': kompakt, 'tohum': tohum,
+            'sorgu_sayisi': sorgu_sayisi, 'ekleme_sayisi': ekleme_sayisi,
+        },
+        'olcekler': {},
+    }
+    kaynaklar = [('veri_dizini', None)] if veri_dizini else [(str(olcek), olcek) for olcek in olcekler]
+    for ad, olcek in kaynaklar:
+        gecici = tempfile.mkdtemp(prefix="kargo_kiyaslama_")
+        hedef = os.path.join(gecici, "data")
+        try:
+            if olcek is None:
+                ilerleme(f"{veri_dizini} kopyalanıyor...")
+                shutil.copytree(veri_dizini, hedef)
+                sonuc = {}
+            else:
+                ilerleme(f"{olcek} olaylık veri üretiliyor...")
+                baslangic = time.perf_counter()
+                ozet = veri_uret(hedef, olcek, tohum)
+                sonuc = {'uretim_sn': round(time.perf_counter() - baslangic, 2), 'kargo': ozet['kargo']}
+            ilerleme(f"{ad}: ölçülüyor...")
+            sonuc.update(olcek_kiyasla(hedef, motor, kompakt, sorgu_sayisi, ekleme_sayisi, arayuz, tohum))
+            rapor['olcekler'][ad] = sonuc
+        finally:
+            shutil.rmtree(gecici, ignore_errors=True)
+    return rapor
+
+
+# --- Koşuların Karşılaştırılması ---
+def _sure_olcumleri(sonuc, on_ek=""):
+    """İç içe sonuç sözlüğünden karşılaştırılacak süreleri düz sözlük olarak çıkarır.
+
+    Çağrı başına sürelerde gürültüsü az olan p50 kullanılır; birkaç milisaniyelik
+    tek seferlik ölçümler karşılaştırılmaz.
+    """
+    olcumler = {}
+    for anahtar, deger in sonuc.items():
+        ad = on_ek + anahtar
+        if isinstance(deger, dict):
+            olcumler.update(_sure_olcumleri(deger, ad + "."))
+        elif not isinstance(deger, (int, float)) or anahtar == 'uretim_sn':
+            continue
+        elif anahtar == 'p50_us' or (anahtar.endswith('_sn') and deger >= GURULTU_SINIRI_SN):
+            olcumler[ad] = deger
+    return olcumler
+
+
+def karsilastir(eski, yeni, esik=GERILEME_ESIGI):
+    """İki raporun ortak ölçümlerini karşılaştırır: [(ölçek, ölçüm, eski, yeni, oran, gerileme_mi)]."""
+    satirlar = []
+    for olcek, yeni_sonuc in yeni['olcekler'].items():
+        eski_sonuc = eski['olcekler'].get(olcek)
+        if eski_sonuc is None:
+            continue
+        eski_olcumler = _sure_olcumleri(eski_sonuc)
+        for ad, deger in _sure_olcumleri(yeni_sonuc).items():
+            onceki = eski_olcumler.get(ad)
+            if not onceki:
+                continue
+            oran = deger / onceki
+            satirlar.append((olcek, ad, onceki, deger, oran, oran > esik))
+    return satirlar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CargoDatabase kıyaslama paketi")
+    parser.add_argument("--olcek", type=int, nargs="*", default=VARSAYILAN_OLCEKLER,
+                        help="Üretilecek olay sayıları (ör. 10000 100000 10000000)")
+    parser.add_argument("--veri-dizini", default=None, help="Sentetik veri yerine bu dizinin kopyasını ölç")
+    parser.add_argument("--motor", default="csv", choices=["csv", "sqlite", "ikili"])
+    parser.add_argument("--kompakt", action="store_true", help="CSV motorunda kompakt bellek şeması")
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--sorgu", type=int, default=SORGU_SAYISI)
+    parser.add_argument("--ekleme", type=int, default=EKLEME_SAYISI)
+    parser.add_argument("--arayuzsuz", action="store_true", help="Yönetici paneli ölçümünü atla")
+    parser.add_argument("--cikti", default=None, help="Sonuç JSON dosyası")
+    parser.add_argument("--karsilastir", default=None, help="Önceki bir sonuç JSON'uyla karşılaştır")
+    parser.add_argument("--esik", type=float, default=GERILEME_ESIGI)
+    args = parser.parse_args(argv)
+
+    rapor = kiyasla(args.olcek, args.motor, args.kompakt, args.tohum, args.sorgu, args.ekleme,
+                    not args.arayuzsuz, args.veri_dizini, ilerleme=print)
+    cikti = args.cikti or os.path.join(
+        KIYASLAMA_DIZINI, f"kiyaslama_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(cikti) or ".", exist_ok=True)
+    with open(cikti, "w", encoding="utf-8") as f:
+        json.dump(rapor, f, ensure_ascii=False, indent=2)
+    print(json.dumps(rapor['olcekler'], ensure_ascii=False, indent=2))
+    print(f"Sonuçlar yazıldı: {cikti}")
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            eski = json.load(f)
+        satirlar = karsilastir(eski, rapor, args.esik)
+        gerileme = False
+        for olcek, ad, onceki, deger, oran, geriledi in satirlar:
+            gerileme |= geriledi
+            isaret = "  <-- GERİLEME" if geriledi else ""
+            print(f"{olcek:>10} {ad:<40} {onceki:>12.4g} -> {deger:>12.4g}  x{oran:.2f}{isaret}")
+        return 1 if gerileme else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import re
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import DURUMLAR
+
+# Baştaki sıfırı olmayan ve int64'e sığan numaralar doğrudan sayı olarak saklanır
+SAYISAL_TAKIP_NO = r'[1-9][0-9]{0,17}'
+_SAYISAL_TAKIP_NO = re.compile(SAYISAL_TAKIP_NO)
+
+
+class TakipNoKodlayici:
+    """takip_no metinlerini int64 koda çevirir.
+
+    Sayısal numaralar kendi değerleriyle saklanır; sayısal olmayan eski numaralar
+    (ör. 'abc' veya '0123') yan tabloda tutulur ve negatif kod alır (-1, -2, ...).
+    """
+
+    def __init__(self, metinler=()):
+        self._metinler = []   # yan tablo: -(kod + 1) -> metin
+        self._kodlar = {}     # metin -> negatif kod
+        for metin in metinler:
+            self._yan_tablo_kodu(metin, True)
+
+    def __len__(self):
+        return len(self._metinler)
+
+    def _yan_tablo_kodu(self, takip_no, kaydet):
+        kod = self._kodlar.get(takip_no)
+        if kod is None and kaydet:
+            self._metinler.append(takip_no)
+            kod = -len(self._metinler)
+            self._kodlar[takip_no] = kod
+        return kod
+
+    def kodla(self, takip_no, kaydet=True):
+        """Tek bir numarayı kodlar; kaydet=False iken bilinmeyen eski numara için None döner."""
+        if _SAYISAL_TAKIP_NO.fullmatch(takip_no):
+            return int(takip_no)
+        return self._yan_tablo_kodu(takip_no, kaydet)
+
+    def kodla_seri(self, seri, kaydet=True):
+        """Bir takip_no kolonunu vektörel olarak int64 kod dizisine çevirir.
+
+        kaydet=False iken bilinmeyen eski numaralar 0 olur (0 hiçbir numaranın kodu değildir).
+        """
+        metinler = seri.astype(str)
+        sayisal = metinler.str.fullmatch(SAYISAL_TAKIP_NO).to_numpy(dtype=bool)
+        kodlar = np.empty(len(metinler), dtype=np.int64)
+        kodlar[sayisal] = metinler[sayisal].astype(np.int64).to_numpy()
+        if not sayisal.all():
+            # Sayısal olmayanlar için her farklı değer bir kez yan tabloya bakılır
+            tekil_kodlar, tekiller = pd.factorize(metinler[~sayisal])
+            yan_kodlar = np.array([self._yan_tablo_kodu(t, kaydet) or 0 for t in tekiller], dtype=np.int64)
+            kodlar[~sayisal] = yan_kodlar[tekil_kodlar]
+        return kodlar
+
+    def aktar(self, kodlar, kaynak):
+        """Başka bir kodlayıcının ürettiği kodları bu kodlayıcıya taşır (sadece yan tablo kodları değişir)."""
+        kodlar = np.asarray(kodlar, dtype=np.int64)
+        negatif = kodlar < 0
+        if not negatif.any():
+            return kodlar
+        kodlar = kodlar.copy()
+        kodlar[negatif] = self.kodla_seri(pd.Series(kaynak.coz_seri(kodlar[negatif]), dtype=object))
+        return kodlar
+
+    def yan_tablo(self):
+        """Yan tablodaki metinler kod sırasıyla (-1, -2, ...); kalıcı saklama içindir."""
+        return list(self._metinler)
+
+    def coz(self, kod):
+        kod = int(kod)
+        return str(kod) if kod >= 0 else self._metinler[-kod - 1]
+
+    def coz_seri(self, kodlar):
+        """Kod dizisini takip_no metinlerine geri çevirir."""
+        kodlar = np.asarray(kodlar, dtype=np.int64)
+        metinler = kodlar.astype(str).astype(object)
+        negatif = kodlar < 0
+        if negatif.any():
+            metinler[negatif] = np.asarray(self._metinler, dtype=object)[-kodlar[negatif] - 1]
+        return metinler
+
+
+def kategoriye_cevir(seri, temel_kategoriler=()):
+    """Seriyi kategorik yapar; temel kategoriler (ör. durum sözlüğü) sabit sırada ilk gelir."""
+    if isinstance(seri.dtype, pd.CategoricalDtype):
+        return kategorileri_genislet(seri, temel_kategoriler)
+    temel = set(temel_kategoriler)
+    ekstra = pd.unique(seri.dropna().astype(str))
+    kategoriler = list(temel_kategoriler) + [d for d in ekstra if d not in temel]
+    return pd.Series(pd.Categorical(seri, categories=kategoriler), index=seri.index, name=seri.name)
+
+
+def kategorileri_genislet(seri, degerler):
+    """Kategorik seriye henüz tanımlı olmayan değerleri kategori olarak ekler."""
+    mevcut = set(seri.cat.categories)
+    eksik = [d for d in pd.unique(pd.Series(list(degerler), dtype=object).dropna()) if d not in mevcut]
+    return seri.cat.add_categories(eksik) if eksik else seri
+
+
+class KompaktSema:
+    """kargo_df / kargolar_ana_df için kompakt bellek şeması.
+
+    - takip_no (loglar): int64 kod (TakipNoKodlayici)
+    - durum / mevcut_durum: sabit durum sözlüğüyle kategorik
+    - konum: kategorik
+    - tarih: datetime64
+    """
+
+    LOG_KATEGORILERI = {'durum': DURUMLAR, 'konum': ()}
+    ANA_KATEGORILERI = {'mevcut_durum': DURUMLAR}
+
+    def __init__(self, kodlayici=None):
+        self.kodlayici = kodlayici or TakipNoKodlayici()
+
+    def log_df(self, df):
+        """Metin kolonlu log tablosunu kompakt şemaya çevirir."""
+        df = df.copy()
+        if df['takip_no'].dtype != np.int64:
+            df['takip_no'] = self.kodlayici.kodla_seri(df['takip_no'])
+        for kolon, temel in self.LOG_KATEGORILERI.items():
+            df[kolon] = kategoriye_cevir(df[kolon], temel)
+        return df
+
+    def ana_df(self, df):
+        df = df.copy()
+        for kolon, temel in self.ANA_KATEGORILERI.items():
+            df[kolon] = kategoriye_cevir(df[kolon], temel)
+        return df
+
+    @staticmethod
+    def birlestir(eski, yeni):
+        """İki kompakt tabloyu kategorik kolonları koruyarak birleştirir."""
+        eski = eski.copy(deep=False)
+        yeni = yeni.copy(deep=False)
+        for kolon in eski.columns:
+            if isinstance(eski[kolon].dtype, pd.CategoricalDtype):
+                eski[kolon] = kategorileri_genislet(eski[kolon], yeni[kolon].astype(object))
+                yeni[kolon] = pd.Categorical(yeni[kolon].astype(object), categories=eski[kolon].cat.categories)
+        return pd.concat([eski, yeni], ignore_index=True)
+
+    @staticmethod
+    def birlestir_coklu(tablolar):
+        """Birçok kompakt tabloyu (ör. aylık bölümler) kategorileri bir kez birleştirerek tek concat'te ekler."""
+        tablolar = [tablo.copy(deep=False) for tablo in tablolar]
+        for kolon in tablolar[0].columns:
+            if not isinstance(tablolar[0][kolon].dtype, pd.CategoricalDtype):
+                continue
+            kategoriler = list(tablolar[0][kolon].cat.categories)
+            mevcut = set(kategoriler)
+            for tablo in tablolar[1:]:
+                for kategori in tablo[kolon].cat.categories:
+                    if kategori not in mevcut:
+                        mevcut.add(kategori)
+                        kategoriler.append(kategori)
+            for tablo in tablolar:
+                tablo[kolon] = tablo[kolon].cat.set_categories(kategoriler)
+        return pd.concat(tablolar, ignore_index=True)
+
+    def takip_no_metinleri(self, kodlar):
+        return self.kodlayici.coz_seri(kodlar)
@@ -0,0 +1,201 @@
+import sys
+import json
+import argparse
+
+# Komut satırı arayüzü: Qt yüklenmez; pandas ve depolama motorları da argümanlar
+# çözüldükten sonra (--help ve hatalı kullanımda hiç) yüklenir.
+#
+#   python kargoKomut.py track 1000002558
+#   python kargoKomut.py add 1000002558 "Ankara Şube" "Dağıtımda"
+#   python kargoKomut.py import tarama.csv
+#   python kargoKomut.py stats --json
+#   python kargoKomut.py export rapor.csv --baslangic 2024-05-01 --bitis 2024-05-31 --konum "Ankara Şube"
+
+
+def _veritabani(args):
+    from kargoVeritabani import CargoDatabase
+    return CargoDatabase(args.motor, args.veri_dizini)
+
+
+def _yazdir(args, veri, metin):
+    if args.json:
+        print(json.dumps(veri, ensure_ascii=False, indent=2, default=str))
+    else:
+        print(metin)
+
+
+def takip_et(args):
+    """track: takip numaralarının durumunu, ETA'sını ve geçmişini yazdırır."""
+    db = _veritabani(args)
+    try:
+        sonuclar = {takip_no: db.takip_sonucu(takip_no) for takip_no in args.takip_no}
+    finally:
+        db.kapat()
+    satirlar = []
+    for takip_no, sonuc in sonuclar.items():
+        if sonuc is None:
+            satirlar.append(f"{takip_no}: kayıt bulunamadı")
+            continue
+        satirlar.append(f"{takip_no}: {sonuc['mevcut_durum']} ({sonuc['konum']})")
+        satirlar.append(f"  Tahmini teslimat: {sonuc['tahmini_teslim']}")
+        aralik = sonuc['tahmin_araligi']
+        if aralik:
+            satirlar.append(f"  %80 aralık: {aralik['alt']} – {aralik['ust']} ({aralik['ornek']} örnek)")
+        for log in sonuc['loglar']:
+            satirlar.append(f"  {log['tarih'] or '-':<16}  {log['konum']:<30}  {log['durum']}")
+    _yazdir(args, sonuclar, "\n".join(satirlar))
+    # Betiklerde kullanılabilsin diye bulunamayan numara varsa 1 ile çıkılır
+    return 0 if all(sonuclar.values()) else 1
+
+
+def log_ekle(args):
+    """add: operasyon personeli gibi tek bir durum kaydı ekler."""
+    from kargoDepolama import DURUMLAR
+    if args.durum not in DURUMLAR:
+        raise SystemExit(f"Geçersiz durum: {args.durum} (geçerli durumlar: {', '.join(DURUMLAR)})")
+    db = _veritabani(args)
+    try:
+        db.add_log(args.takip_no, args.konum, args.durum)
+    finally:
+        db.kapat()
+    _yazdir(args, {'takip_no': args.takip_no, 'konum': args.konum, 'durum': args.durum},
+            f"Kargo {args.takip_no} güncellendi: {args.durum} ({args.konum})")
+    return 0
+
+
+def ice_aktar(args):
+    """import: tarayıcı döküm CSV'sini toplu olarak ekler."""
+    db = _veritabani(args)
+    try:
+        onceki = len(db.tarih_hatalari())
+        onceki_karantina = len(db.dogrulama_hatalari())
+        adet = db.tarayici_dosyasi_aktar(
+            args.dosya, ilerleme=None if args.json else lambda toplam: print(f"{toplam} olay...", file=sys.stderr)
+        )
+        atlanan = db.tarih_hatalari().iloc[onceki:]
+        karantina = db.dogrulama_hatalari().iloc[onceki_karantina:]
+    finally:
+        db.kapat()
+    metin = f"{adet} tarama olayı kaydedildi."
+    if len(atlanan):
+        metin += f" Tarihi çözülemeyen {len(atlanan)} olay atlandı:\n" + "\n".join(
+            f"  satır {satir}: {deger}" for satir, deger in zip(atlanan['satir'], atlanan['deger'])
+        )
+    if len(karantina):
+        metin += f"\nDoğrulamadan geçemeyen {len(karantina)} olay karantinaya alındı:\n" + "\n".join(
+            f"  {neden:<40} {adet_}" for neden, adet_ in karantina['neden'].value_counts().items()
+        )
+    _yazdir(args, {'dosya': args.dosya, 'olay': adet, 'atlanan': atlanan.to_dict('records'),
+                   'karantina': karantina.to_dict('records')}, metin)
+    return 0
+
+
+def istatistik(args):
+    """stats: kargo/log sayıları, durum dağılımı, indeks ve önbellek bilgisi."""
+    db = _veritabani(args)
+    try:
+        kargo_df = db.kargo_df
+        ana_df = db.kargolar_ana_df
+        kargo_sayisi, indeks_bayt = db.indeks_bilgisi()
+        tarih_hatalari = db.tarih_hatalari()
+        karantina = db.dogrulama_hatalari()
+        ozet = {
+            'motor': type(db.motor).__name__,
+            'veri_dizini': db.motor.veri_dizini,
+            'kargo': int(len(ana_df)),
+            'log': int(len(kargo_df)),
+            'tarihsiz_log': int(kargo_df['tarih'].isna().sum()),
+            'cozulemeyen_tarih': tarih_hatalari.to_dict('records'),
+            'ilk_tarih': kargo_df['tarih'].min(),
+            'son_tarih': kargo_df['tarih'].max(),
+            'durumlar': {str(durum): int(adet) for durum, adet in ana_df['mevcut_durum'].value_counts().items()},
+            'indeks': {'kargo': int(kargo_sayisi), 'bayt': int(indeks_bayt)},
+            'karantina': {str(neden): int(adet) for neden, adet in karantina['neden'].value_counts().items()},
+        }
+    finally:
+        db.kapat()
+    satirlar = [
+        f"Motor: {ozet['motor']} ({ozet['veri_dizini']})",
+        f"Kargo: {ozet['kargo']}, log: {ozet['log']} (tarihsiz: {ozet['tarihsiz_log']})",
+        f"Tarih aralığı: {ozet['ilk_tarih']} – {ozet['son_tarih']}",
+        f"Takip indeksi: {kargo_sayisi} kargo, {indeks_bayt / (1024 * 1024):.2f} MB",
+        "Mevcut durumlar:",
+    ] + [f"  {durum:<25} {adet}" for durum, adet in ozet['durumlar'].items()]
+    if len(tarih_hatalari):
+        satirlar.append(f"Çözülemeyen tarihler ({len(tarih_hatalari)}):")
+        satirlar += [f"  {hata['kaynak']}:{hata['satir']}  {hata['deger']}"
+                     for hata in ozet['cozulemeyen_tarih'][:20]]
+    if len(karantina):
+        satirlar.append(f"Doğrulamadan geçemeyen loglar ({len(karantina)}):")
+        satirlar += [f"  {neden:<40} {adet}" for neden, adet in ozet['karantina'].items()]
+    _yazdir(args, ozet, "\n".join(satirlar))
+    return 0
+
+
+def disa_aktar(args):
+    """export: tarih aralığındaki olayları mevcut durumlarıyla CSV / JSON Lines dosyasına yazar."""
+    from kargoDisaAktarim import disa_aktar as aktar, tarih_siniri, AKTARIM_PARCA_BOYUTU
+    baslangic = tarih_siniri(args.baslangic)
+    bitis = tarih_siniri(args.bitis, bitis=True)
+
+    def ilerleme(durum):
+        yazilan, taranan, toplam = durum
+        print(f"{taranan}/{toplam} log tarandı, {yazilan} satır yazıldı...", file=sys.stderr)
+
+    db = _veritabani(args)
+    try:
+        adet = aktar(db, args.dosya, args.bicim, baslangic, bitis, args.konum, args.durum,
+                     parca_boyutu=args.parca or AKTARIM_PARCA_BOYUTU, ilerleme=None if args.json else ilerleme)
+    finally:
+        db.kapat()
+    _yazdir(args, {'dosya': args.dosya, 'satir': adet}, f"{adet} olay {args.dosya} dosyasına yazıldı.")
+    return 0
+
+
+def parser_olustur():
+    parser = argparse.ArgumentParser(description="Kargo takip komut satırı arayüzü (Qt gerektirmez)")
+    parser.add_argument("--motor", default=None, help="Depolama motoru (csv / sqlite / ikili)")
+    parser.add_argument("--veri-dizini", default=None)
+    parser.add_argument("--json", action="store_true", help="Çıktıyı JSON olarak yazdır")
+    komutlar = parser.add_subparsers(dest="komut", required=True)
+
+    track = komutlar.add_parser("track", help="Kargo durumunu ve geçmişini göster")
+    track.add_argument("takip_no", nargs="+")
+    track.set_defaults(fn=takip_et)
+
+    add = komutlar.add_parser("add", help="Kargoya yeni durum kaydı ekle")
+    add.add_argument("takip_no")
+    add.add_argument("konum")
+    add.add_argument("durum")
+    add.set_defaults(fn=log_ekle)
+
+    ice = komutlar.add_parser("import", help="Tarayıcı döküm CSV'sini (takip_no, konum, durum[, tarih]) aktar")
+    ice.add_argument("dosya")
+    ice.set_defaults(fn=ice_aktar)
+
+    export = komutlar.add_parser("export", help="Olayları mevcut durumlarıyla CSV / JSON Lines olarak dışa aktar")
+    export.add_argument("dosya", help="Çıktı dosyası (.csv, .jsonl)")
+    export.add_argument("--baslangic", help="Bu andan itibaren (2024-05-01 veya 01.05.2024 14:30)")
+    export.add_argument("--bitis", help="Bu ana kadar (sadece gün verilirse o gün dahil)")
+    export.add_argument("--konum", action="append", help="Sadece bu şube/konum (tekrarlanabilir)")
+    export.add_argument("--durum", action="append", help="Sadece bu durum (tekrarlanabilir)")
+    export.add_argument("--bicim", choices=["csv", "jsonl"], help="Varsayılan: dosya uzantısından")
+    export.add_argument("--parca", type=int, default=None, help="Dilim boyutu (log)")
+    export.set_defaults(fn=disa_aktar)
+
+    stats = komutlar.add_parser("stats", help="Kargo/log sayıları ve durum dağılımı")
+    stats.set_defaults(fn=istatistik)
+    return parser
+
+
+def main(argv=None):
+    args = parser_olustur().parse_args(argv)
+    try:
+        return args.fn(args)
+    except (IOError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
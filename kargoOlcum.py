@@ -0,0 +1,187 @@
+import os
+import time
+import threading
+from bisect import bisect_left
+from functools import wraps
+
+# KARGO_OLCUM=1 ile ölçüm açık başlar; yönetici panelinden de açılıp kapatılabilir
+OLCUM_VARSAYILAN = os.environ.get("KARGO_OLCUM", "0") == "1"
+# Gecikme histogramı kova üst sınırları (saniye); sonuncusunun üstü +Inf kovasıdır
+SURE_KOVALARI = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+PROMETHEUS_DOSYASI = "kargo_metrikleri.prom"
+# ozet() satırlarının kolonları
+OZET_KOLONLARI = [
+    'islem', 'adet', 'ortalama_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'en_buyuk_ms', 'satir_taranan', 'bayt_yazilan'
+]
+METRIK_ON_EKI = "kargo"
+
+
+class Histogram:
+    """Sabit kovalı gecikme histogramı (Prometheus 'histogram' tipiyle aynı yapı)."""
+
+    def __init__(self, kovalar=SURE_KOVALARI):
+        self.kovalar = kovalar
+        self.sayimlar = [0] * (len(kovalar) + 1)
+        self.adet = 0
+        self.toplam = 0.0
+        self.en_buyuk = 0.0
+
+    def gozlemle(self, sure):
+        self.sayimlar[bisect_left(self.kovalar, sure)] += 1
+        self.adet += 1
+        self.toplam += sure
+        if sure > self.en_buyuk:
+            self.en_buyuk = sure
+
+    def yuzdelik(self, oran):
+        """Yüzdeliği, düştüğü kovanın içinde doğrusal ara değerle tahmin eder (saniye)."""
+        if not self.adet:
+            return 0.0
+        hedef = oran * self.adet
+        birikimli = 0
+        for i, sayim in enumerate(self.sayimlar):
+            if sayim and birikimli + sayim >= hedef:
+                alt = self.kovalar[i - 1] if i else 0.0
+                ust = self.kovalar[i] if i < len(self.kovalar) else self.en_buyuk
+                return min(alt + (ust - alt) * (hedef - birikimli) / sayim, self.en_buyuk)
+            birikimli += sayim
+        return self.en_buyuk
+
+
+def _kova_etiketleri(histogram):
+    return [repr(sinir) for sinir in histogram.kovalar] + ["+Inf"]
+
+
+# --- Ölçüm Kaydı ---
+class OlcumKaydi:
+    """İşlem başına gecikme histogramı, taranan satır ve yazılan bayt sayaçları.
+
+    Kapalıyken ölçülen her çağrıya sadece bir bayrak kontrolü eklenir. Satır ve bayt
+    sayaçları o an iş parçacığında çalışan (en içteki) ölçülen işleme yazılır.
+    """
+
+    def __init__(self, etkin=OLCUM_VARSAYILAN):
+        self.etkin = etkin
+        self._kilit = threading.Lock()
+        self._yerel = threading.local()
+        self._histogramlar = {}
+        self._satirlar = {}
+        self._baytlar = {}
+
+    def olc(self, ad):
+        """Fonksiyonun süresini `ad` işlemi olarak kaydeden dekoratör."""
+        def dekorator(fn):
+            @wraps(fn)
+            def sarici(*args, **kwargs):
+                if not self.etkin:
+                    return fn(*args, **kwargs)
+                onceki = getattr(self._yerel, 'islem', None)
+                self._yerel.islem = ad
+                bas = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._yerel.islem = onceki
+                    self.gozlemle(ad, time.perf_counter() - bas)
+            return sarici
+        return dekorator
+
+    def baslat(self):
+        """İş parçacıkları arasında süren (ör. arka planda çekilip arayüzde doldurulan) işlemin başlangıcı.
+
+        Ölçüm kapalıysa None döner; bitir() bu durumda bir şey yapmaz.
+        """
+        return time.perf_counter() if self.etkin else None
+
+    def bitir(self, ad, baslangic):
+        if baslangic is not None:
+            self.gozlemle(ad, time.perf_counter() - baslangic)
+
+    def gozlemle(self, ad, sure):
+        with self._kilit:
+            histogram = self._histogramlar.get(ad)
+            if histogram is None:
+                histogram = self._histogramlar[ad] = Histogram()
+            histogram.gozlemle(sure)
+
+    def _sayac_ekle(self, sayaclar, adet):
+        ad = getattr(self._yerel, 'islem', None) or 'diger'
+        with self._kilit:
+            sayaclar[ad] = sayaclar.get(ad, 0) + adet
+
+    def satir_tarandi(self, adet):
+        if self.etkin:
+            self._sayac_ekle(self._satirlar, int(adet))
+
+    def bayt_yazildi(self, adet):
+        if self.etkin and adet > 0:
+            self._sayac_ekle(self._baytlar, int(adet))
+
+    def sifirla(self):
+        with self._kilit:
+            self._histogramlar.clear()
+            self._satirlar.clear()
+            self._baytlar.clear()
+
+    def ozet(self):
+        """Yönetici paneli için işlem başına özet satırları (süreler milisaniye)."""
+        with self._kilit:
+            adlar = sorted(set(self._histogramlar) | set(self._satirlar) | set(self._baytlar))
+            satirlar = []
+            for ad in adlar:
+                histogram = self._histogramlar.get(ad) or Histogram()
+                satirlar.append({
+                    'islem': ad,
+                    'adet': histogram.adet,
+                    'ortalama_ms': round(histogram.toplam / histogram.adet * 1000, 3) if histogram.adet else 0.0,
+                    'p50_ms': round(histogram.yuzdelik(0.50) * 1000, 3),
+                    'p95_ms': round(histogram.yuzdelik(0.95) * 1000, 3),
+                    'p99_ms': round(histogram.yuzdelik(0.99) * 1000, 3),
+                    'en_buyuk_ms': round(histogram.en_buyuk * 1000, 3),
+                    'satir_taranan': self._satirlar.get(ad, 0),
+                    'bayt_yazilan': self._baytlar.get(ad, 0),
+                })
+        return satirlar
+
+    def prometheus_metni(self):
+        """Tüm ölçümleri Prometheus metin biçiminde (exposition format 0.0.4) döndürür."""
+        sure = f"{METRIK_ON_EKI}_islem_suresi_saniye"
+        satir = f"{METRIK_ON_EKI}_taranan_satir_toplam"
+        bayt = f"{METRIK_ON_EKI}_yazilan_bayt_toplam"
+        metin = [
+            f"# HELP {sure} İşlem gecikmesi (saniye).",
+            f"# TYPE {sure} histogram",
+        ]
+        with self._kilit:
+            for ad in sorted(self._histogramlar):
+                histogram = self._histogramlar[ad]
+                birikimli = 0
+                for sinir, sayim in zip(_kova_etiketleri(histogram), histogram.sayimlar):
+                    birikimli += sayim
+                    metin.append(f'{sure}_bucket{{islem="{ad}",le="{sinir}"}} {birikimli}')
+                metin.append(f'{sure}_sum{{islem="{ad}"}} {histogram.toplam!r}')
+                metin.append(f'{sure}_count{{islem="{ad}"}} {histogram.adet}')
+            for metrik, yardim, sayaclar in (
+                (satir, "İşlemlerin taradığı satır sayısı.", self._satirlar),
+                (bayt, "İşlemlerin diske yazdığı bayt sayısı.", self._baytlar),
+            ):
+                metin.append(f"# HELP {metrik} {yardim}")
+                metin.append(f"# TYPE {metrik} counter")
+                for ad in sorted(sayaclar):
+                    metin.append(f'{metrik}{{islem="{ad}"}} {sayaclar[ad]}')
+        return "\n".join(metin) + "\n"
+
+    def prometheus_yaz(self, yol):
+        """Prometheus metnini dosyaya atomik olarak yazar (node_exporter textfile toplayıcısı için)."""
+        gecici = yol + ".tmp"
+        with open(gecici, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_metni())
+        os.replace(gecici, yol)
+        return yol
+
+
+# Uygulama genelinde tek kayıt; CargoDatabase, motorlar ve arayüz buraya yazar
+olcum = OlcumKaydi()
@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+
+# Önbellekte "kargo yok" sonucunu None'dan (kayıt yok) ayırmak için
+_YOK = object()
+
+
+class LRUOnbellek:
+    """Boyutu sınırlı, en uzun süre kullanılmayanı atan (LRU) önbellek.
+
+    isabet / iskalama / tahliye sayaçları boyut ayarı için tutulur.
+    """
+
+    def __init__(self, kapasite):
+        self.kapasite = kapasite
+        self._veri = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iskalama = 0
+        self.tahliye = 0
+
+    def __len__(self):
+        return len(self._veri)
+
+    def al(self, anahtar, varsayilan=None):
+        """Değeri döndürür ve en yeni kullanılan yapar; yoksa varsayilan."""
+        with self._kilit:
+            deger = self._veri.get(anahtar, _YOK)
+            if deger is _YOK:
+                self.iskalama += 1
+                return varsayilan
+            self._veri.move_to_end(anahtar)
+            self.isabet += 1
+            return deger
+
+    def koy(self, anahtar, deger):
+        if self.kapasite <= 0:
+            return
+        with self._kilit:
+            self._veri[anahtar] = deger
+            self._veri.move_to_end(anahtar)
+            while len(self._veri) > self.kapasite:
+                self._veri.popitem(last=False)
+                self.tahliye += 1
+
+    def sil(self, anahtar):
+        with self._kilit:
+            self._veri.pop(anahtar, None)
+
+    def toplu_sil(self, anahtarlar):
+        """Verilen anahtarlardan önbellekte olanları siler (toplu eklemelerden sonra)."""
+        with self._kilit:
+            if not self._veri:
+                return
+            anahtarlar = set(anahtarlar)
+            # Küçük olan küme üzerinden dolaşılır
+            if len(anahtarlar) > len(self._veri):
+                silinecek = [a for a in self._veri if a in anahtarlar]
+            else:
+                silinecek = [a for a in anahtarlar if a in self._veri]
+            for anahtar in silinecek:
+                del self._veri[anahtar]
+
+    def temizle(self):
+        with self._kilit:
+            self._veri.clear()
+
+    def istatistik(self):
+        toplam = self.isabet + self.iskalama
+        return {
+            'boyut': len(self._veri),
+            'kapasite': self.kapasite,
+            'isabet': self.isabet,
+            'iskalama': self.iskalama,
+            'tahliye': self.tahliye,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+        }
@@ -0,0 +1,226 @@
+import os
+import heapq
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+from kargoEta import TESLIM_DURUMU
+
+# Konum bazında taramalar bu kadar saatlik kovada tutulur (en yeni olayın saatine göre)
+PANO_SAAT_PENCERESI = int(os.environ.get("KARGO_PANO_SAAT", "24"))
+# Bu kadar saattir yeni hareket almayan, teslim edilmemiş kargolar "takılı" sayılır
+TAKILI_KARGO_SAATI = int(os.environ.get("KARGO_TAKILI_SAAT", "48"))
+# Panoda listelenen en eski takılı kargo sayısı
+TAKILI_LISTE_BOYUTU = 200
+# Yığındaki geçersiz (güncellenmiş / teslim edilmiş) kayıtlar bu kadar birikince yığın yeniden kurulur
+YIGIN_SIKISTIRMA_ESIGI = 10000
+
+DURUM_KOLONLARI = ['durum', 'kargo']
+KONUM_KOLONLARI = ['konum', 'son_saat', 'pencere']
+TAKILI_KOLONLARI = ['takip_no', 'mevcut_durum', 'son_guncelleme', 'bekleme_saat']
+
+
+def _dakikalar(tarihler):
+    return np.asarray(tarihler, dtype='datetime64[m]').view(np.int64)
+
+
+def _tarihli(loglar):
+    """tarih kolonu datetime64 olmayan (ör. boş tablodan türemiş object) tabloyu dönüştürür."""
+    if pd.api.types.is_datetime64_any_dtype(loglar['tarih']):
+        return loglar
+    return loglar.assign(tarih=pd.to_datetime(loglar['tarih'], errors='coerce'))
+
+
+# --- Operasyon Panosu Toplamları ---
+class OperasyonPanosu:
+    """Yönetici panosunun toplamları: durum sayıları, konum başına saatlik taramalar, takılı kargolar.
+
+    Tablolardan bir kez vektörel olarak kurulur; sonra her olay sayaçları O(1), takılı kargo
+    yığınını O(log n) günceller. Yığında silme yapılmaz: kargo her güncellendiğinde yeni kayıt
+    eklenir, eskisi okunurken atlanır.
+    """
+
+    def __init__(self, saat_penceresi=PANO_SAAT_PENCERESI):
+        self.saat_penceresi = saat_penceresi
+        self._durumlar = {}            # takip_no -> mevcut durum
+        self._durum_sayilari = Counter()
+        self._son_guncellemeler = {}   # takip_no -> son olayın epoch dakikası
+        self._yigin = []               # (son güncelleme dakikası, takip_no); en eski en üstte
+        self._saatler = {}             # epoch saati -> Counter(konum -> tarama)
+        self._son_saat = None
+
+    def olustur(self, loglar_df, ana_df, metinlere=None):
+        """Toplamları log ve ana kargo tablolarından kurar.
+
+        metinlere, log tablosunun takip_no kolonunu metne çevirir (kompakt şemada int64 kodlar için);
+        ana tablonun takip_no kolonu her şemada metindir, olduğu gibi okunur.
+        """
+        metinlere = metinlere or (lambda seri: seri.to_numpy(dtype=object))
+        loglar_df = _tarihli(loglar_df)
+        self._durumlar = dict(zip(
+            ana_df['takip_no'].to_numpy(dtype=object), ana_df['mevcut_durum'].to_numpy(dtype=object)
+        ))
+        self._durum_sayilari = Counter(self._durumlar.values())
+
+        # Kargo başına son olay anı
+        son = loglar_df.groupby('takip_no', sort=False, observed=True)['tarih'].max().dropna()
+        dakikalar = _dakikalar(son.to_numpy())
+        nolar = np.asarray(metinlere(pd.Series(son.index)), dtype=object)
+        self._son_guncellemeler = dict(zip(nolar, dakikalar.tolist()))
+        # Dakikaya göre sıralı liste geçerli bir min-yığındır (heapify gerekmez)
+        sira = np.argsort(dakikalar, kind='stable')
+        self._yigin = [
+            (dakika, takip_no) for dakika, takip_no in zip(dakikalar[sira].tolist(), nolar[sira])
+            if self._durumlar.get(takip_no) != TESLIM_DURUMU
+        ]
+
+        # Son saat_penceresi saatin konum başına tarama sayıları
+        self._saatler = {}
+        tarih = loglar_df['tarih'].to_numpy()
+        gecerli = ~np.isnat(tarih)
+        if not gecerli.any():
+            self._son_saat = None
+            return
+        saat = _dakikalar(tarih) // 60
+        self._son_saat = int(saat[gecerli].max())
+        pencerede = gecerli & (saat > self._son_saat - self.saat_penceresi)
+        sayimlar = pd.DataFrame({
+            'saat': saat[pencerede], 'konum': np.asarray(loglar_df['konum'].to_numpy()[pencerede], dtype=object)
+        }).groupby(['saat', 'konum'], sort=False).size()
+        for (saat_no, konum), adet in sayimlar.items():
+            self._saatler.setdefault(int(saat_no), Counter())[konum] += int(adet)
+
+    def olay_ekle(self, takip_no, tarih, konum, durum):
+        """Tek bir olayı toplamlara işler (add_log sırası: son eklenen durum geçerlidir)."""
+        self._durum_degistir(takip_no, durum)
+        if pd.isna(tarih):
+            return
+        dakika = pd.Timestamp(tarih).value // (60 * 10 ** 9)
+        self._taramayi_say(dakika // 60, konum, 1)
+        self._guncellendi(takip_no, dakika)
+
+    def olaylari_ekle(self, loglar):
+        """Bir olay grubunu işler; her kargonun grup içindeki (tarihçe) son olayı durumunu belirler."""
+        if loglar.empty:
+            return
+        loglar = _tarihli(loglar)
+        tarih = loglar['tarih'].to_numpy()
+        gecerli = ~np.isnat(tarih)
+        if gecerli.any():
+            saat = _dakikalar(tarih) // 60
+            sayimlar = pd.DataFrame({
+                'saat': saat[gecerli], 'konum': loglar['konum'].to_numpy(dtype=object)[gecerli]
+            }).groupby(['saat', 'konum'], sort=False).size()
+            for (saat_no, konum), adet in sayimlar.items():
+                self._taramayi_say(int(saat_no), konum, int(adet))
+        son = loglar.sort_values(by='tarih', kind='stable').drop_duplicates(subset='takip_no', keep='last')
+        en_yeni = loglar.groupby('takip_no', sort=False)['tarih'].max()
+        for takip_no, durum in zip(son['takip_no'], son['durum']):
+            self._durum_degistir(takip_no, durum)
+            tarih = en_yeni[takip_no]
+            if not pd.isna(tarih):
+                self._guncellendi(takip_no, tarih.value // (60 * 10 ** 9))
+
+    def _durum_degistir(self, takip_no, durum):
+        eski = self._durumlar.get(takip_no)
+        if eski is not None:
+            self._durum_sayilari[eski] -= 1
+            if not self._durum_sayilari[eski]:
+                del self._durum_sayilari[eski]
+        self._durumlar[takip_no] = durum
+        self._durum_sayilari[durum] += 1
+        # Teslimden sonra tekrar açılan kargo yığına geri girer
+        if eski == TESLIM_DURUMU and durum != TESLIM_DURUMU and takip_no in self._son_guncellemeler:
+            self._yigina_ekle(self._son_guncellemeler[takip_no], takip_no)
+
+    def _guncellendi(self, takip_no, dakika):
+        eski = self._son_guncellemeler.get(takip_no)
+        if eski is not None and eski >= dakika:
+            return
+        self._son_guncellemeler[takip_no] = dakika
+        if self._durumlar.get(takip_no) != TESLIM_DURUMU:
+            self._yigina_ekle(dakika, takip_no)
+
+    def _yigina_ekle(self, dakika, takip_no):
+        heapq.heappush(self._yigin, (dakika, takip_no))
+        if len(self._yigin) > 2 * len(self._son_guncellemeler) + YIGIN_SIKISTIRMA_ESIGI:
+            # Geçersiz kayıtları at; amortize maliyet olay başına O(1)
+            self._yigin = [kayit for kayit in self._yigin if self._gecerli(kayit)]
+            heapq.heapify(self._yigin)
+
+    def _gecerli(self, kayit):
+        dakika, takip_no = kayit
+        return self._son_guncellemeler.get(takip_no) == dakika and self._durumlar.get(takip_no) != TESLIM_DURUMU
+
+    def _taramayi_say(self, saat, konum, adet):
+        if self._son_saat is None or saat > self._son_saat:
+            self._son_saat = saat
+            # Pencereden çıkan kovalar atılır (saat ilerledikçe bir kez)
+            for eski in [s for s in self._saatler if s <= saat - self.saat_penceresi]:
+                del self._saatler[eski]
+        elif saat <= self._son_saat - self.saat_penceresi:
+            return
+        self._saatler.setdefault(saat, Counter())[konum] += adet
+
+    # --- Sorgular ---
+    def durum_sayilari(self):
+        """Mevcut durum başına kargo sayısı (DURUM_KOLONLARI), çoktan aza."""
+        return pd.DataFrame(self._durum_sayilari.most_common(), columns=DURUM_KOLONLARI)
+
+    def konum_taramalari(self):
+        """Konum başına son saatteki ve pencere boyunca tarama sayısı (KONUM_KOLONLARI)."""
+        if self._son_saat is None:
+            return pd.DataFrame(columns=KONUM_KOLONLARI)
+        pencere = Counter()
+        for sayim in self._saatler.values():
+            pencere.update(sayim)
+        son_saat = self._saatler.get(self._son_saat, Counter())
+        return pd.DataFrame(
+            [(konum, son_saat.get(konum, 0), adet) for konum, adet in pencere.most_common()],
+            columns=KONUM_KOLONLARI
+        )
+
+    def son_saat(self):
+        """Saatlik kovaların en yenisinin başlangıcı (Timestamp); olay yoksa None."""
+        return None if self._son_saat is None else pd.Timestamp(self._son_saat * 60, unit='m')
+
+    def takili_kargolar(self, esik_saat=TAKILI_KARGO_SAATI, simdi=None, limit=TAKILI_LISTE_BOYUTU):
+        """esik_saat'tir güncellenmeyen açık kargolar: (sayı, en eski limit kargo tablosu).
+
+        Yığın ağacında sadece eşikten eski düğümlere inilir; maliyet takılı kargo sayısıyla orantılıdır.
+        """
+        simdi = pd.Timestamp(simdi) if simdi is not None else pd.Timestamp.now()
+        simdi_dakika = simdi.value // (60 * 10 ** 9)
+        esik = simdi_dakika - esik_saat * 60
+        takililar = set()
+        yigin = self._yigin
+        bekleyen = [0] if yigin else []
+        while bekleyen:
+            i = bekleyen.pop()
+            kayit = yigin[i]
+            if kayit[0] >= esik:
+                continue
+            if self._gecerli(kayit):
+                takililar.add(kayit)
+            bekleyen.extend(j for j in (2 * i + 1, 2 * i + 2) if j < len(yigin))
+        en_eskiler = heapq.nsmallest(limit, takililar)
+        tablo = pd.DataFrame({
+            'takip_no': [takip_no for _, takip_no in en_eskiler],
+            'mevcut_durum': [self._durumlar.get(takip_no) for _, takip_no in en_eskiler],
+            'son_guncelleme': pd.to_datetime([dakika for dakika, _ in en_eskiler], unit='m'),
+            'bekleme_saat': [(simdi_dakika - dakika) // 60 for dakika, _ in en_eskiler],
+        }, columns=TAKILI_KOLONLARI)
+        return len(takililar), tablo
+
+    def ozet(self, esik_saat=TAKILI_KARGO_SAATI, simdi=None):
+        """Panonun tüm bölümleri tek sözlükte (arayüz ve komut satırı için)."""
+        takili_sayisi, takililar = self.takili_kargolar(esik_saat, simdi)
+        return {
+            'durumlar': self.durum_sayilari(),
+            'konumlar': self.konum_taramalari(),
+            'son_saat': self.son_saat(),
+            'saat_penceresi': self.saat_penceresi,
+            'esik_saat': esik_saat,
+            'takili_sayisi': takili_sayisi,
+            'takililar': takililar,
+        }
@@ -0,0 +1,248 @@
+import sys
+import json
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+from kargoVeritabani import CargoDatabase
+
+# Qt'siz HTTP takip servisi: CargoDatabase bir kez yüklenir, engelleyici işler executor'da çalışır
+VARSAYILAN_HOST = "127.0.0.1"
+VARSAYILAN_PORT = 8080
+# Toplu sorguda tek istekte kabul edilen en fazla takip numarası
+TOPLU_SORGU_SINIRI = 1000
+# İstek gövdesi için üst sınır (bayt)
+GOVDE_SINIRI = 1024 * 1024
+
+DURUM_METINLERI = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error"
+}
+
+
+class HttpHatasi(Exception):
+    def __init__(self, durum, mesaj):
+        super().__init__(mesaj)
+        self.durum = durum
+        self.mesaj = mesaj
+
+
+# --- HTTP Takip Servisi ---
+class TakipServisi:
+    """/track/<takip_no> ve toplu POST /track uç noktalarını sunan asyncio HTTP sunucusu."""
+
+    def __init__(self, db, is_parcacigi=4):
+        self.db = db
+        self.executor = ThreadPoolExecutor(max_workers=is_parcacigi, thread_name_prefix="kargo-servis")
+        self.sunucu = None
+
+    async def baslat(self, host=VARSAYILAN_HOST, port=VARSAYILAN_PORT):
+        self.sunucu = await asyncio.start_server(self._baglanti, host, port)
+        return self.sunucu.sockets[0].getsockname()[:2]
+
+    async def kapat(self):
+        if self.sunucu is not None:
+            self.sunucu.close()
+            await self.sunucu.wait_closed()
+        self.executor.shutdown(wait=True)
+
+    async def _calistir(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def _toplu_sonuc(self, takip_nolar):
+        return {takip_no: self.db.takip_sonucu(takip_no) for takip_no in takip_nolar}
+
+    async def _yanitla(self, yontem, yol, govde):
+        """(durum, yanıt sözlüğü) döndürür."""
+        yol = urlsplit(yol).path
+        if yol.startswith("/track/"):
+            if yontem != "GET":
+                raise HttpHatasi(405, "Bu adres sadece GET kabul eder.")
+            takip_no = unquote(yol[len("/track/"):]).strip()
+            if not takip_no:
+                raise HttpHatasi(400, "Takip numarası boş olamaz.")
+            sonuc = await self._calistir(self.db.takip_sonucu, takip_no)
+            if sonuc is None:
+                raise HttpHatasi(404, f'"{takip_no}" numaralı kargo kaydı bulunamadı.')
+            return 200, sonuc
+
+        if yol == "/track":
+            if yontem != "POST":
+                raise HttpHatasi(405, "Toplu sorgu POST ile yapılır.")
+            try:
+                istek = json.loads(govde or b"{}")
+                takip_nolar = [str(t).strip() for t in istek["takip_nolar"]]
+            except (ValueError, KeyError, TypeError):
+                raise HttpHatasi(400, 'Gövde {"takip_nolar": [...]} biçiminde olmalıdır.')
+            if len(takip_nolar) > TOPLU_SORGU_SINIRI:
+                raise HttpHatasi(400, f"Tek istekte en fazla {TOPLU_SORGU_SINIRI} takip numarası sorgulanabilir.")
+            return 200, {"sonuclar": await self._calistir(self._toplu_sonuc, takip_nolar)}
+
+        raise HttpHatasi(404, "Bilinmeyen adres.")
+
+    async def _baglanti(self, reader, writer):
+        """Bir TCP bağlantısındaki (keep-alive) istekleri sırayla işler."""
+        try:
+            while True:
+                try:
+                    baslik_blogu = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                satirlar = baslik_blogu.decode("latin-1").split("\r\n")
+                try:
+                    yontem, yol, surum = satirlar[0].split(" ", 2)
+                except ValueError:
+                    await self._yaz(writer, 400, {"hata": "Geçersiz istek satırı."}, False)
+                    break
+                basliklar = {}
+                for satir in satirlar[1:]:
+                    if ":" in satir:
+                        ad, deger = satir.split(":", 1)
+                        basliklar[ad.strip().lower()] = deger.strip()
+
+                baglanti = basliklar.get("connection", "").lower()
+                acik_kalsin = baglanti == "keep-alive" if surum == "HTTP/1.0" else baglanti != "close"
+
+                govde = b""
+                try:
+                    uzunluk = int(basliklar.get("content-length", 0) or 0)
+                except ValueError:
+                    uzunluk = -1
+                if uzunluk < 0:
+                    # Gövdenin nerede bittiği bilinmez; bağlantı kapatılır
+                    await self._yaz(writer, 400, {"hata": "Geçersiz Content-Length başlığı."}, False)
+                    break
+                if uzunluk > GOVDE_SINIRI:
+                    await self._yaz(writer, 413, {"hata": "İstek gövdesi çok büyük."}, False)
+                    break
+                if uzunluk:
+                    govde = await reader.readexactly(uzunluk)
+
+                try:
+                    durum, yanit = await self._yanitla(yontem, yol, govde)
+                except HttpHatasi as e:
+                    durum, yanit = e.durum, {"hata": e.mesaj}
+                except Exception as e:
+                    durum, yanit = 500, {"hata": str(e)}
+                await self._yaz(writer, durum, yanit, acik_kalsin)
+                if not acik_kalsin:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _yaz(writer, durum, yanit, acik_kalsin):
+        govde = json.dumps(yanit, ensure_ascii=False).encode("utf-8")
+        basliklar = (
+            f"HTTP/1.1 {durum} {DURUM_METINLERI.get(durum, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(govde)}\r\n"
+            f"Connection: {'keep-alive' if acik_kalsin else 'close'}\r\n\r\n"
+        )
+        writer.write(basliklar.encode("latin-1") + govde)
+        await writer.drain()
+
+
+async def sun(db, host=VARSAYILAN_HOST, port=VARSAYILAN_PORT):
+    servis = TakipServisi(db)
+    host, port = await servis.baslat(host, port)
+    print(f"Kargo takip servisi http://{host}:{port} adresinde çalışıyor (Ctrl+C ile durdurun)")
+    try:
+        await servis.sunucu.serve_forever()
+    finally:
+        await servis.kapat()
+
+
+# --- Eşzamanlı Yük İstemcisi ---
+async def _yuk_istemcisi(host, port, takip_nolar, istek_sayisi, sureler, durumlar):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(istek_sayisi):
+            takip_no = takip_nolar[i % len(takip_nolar)]
+            baslangic = time.perf_counter()
+            writer.write(f"GET /track/{takip_no} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            await writer.drain()
+            baslik_blogu = await reader.readuntil(b"\r\n\r\n")
+            satirlar = baslik_blogu.decode("latin-1").split("\r\n")
+            uzunluk = 0
+            for satir in satirlar[1:]:
+                if satir.lower().startswith("content-length:"):
+                    uzunluk = int(satir.split(":", 1)[1])
+            await reader.readexactly(uzunluk)
+            sureler.append(time.perf_counter() - baslangic)
+            durum = int(satirlar[0].split(" ")[1])
+            durumlar[durum] = durumlar.get(durum, 0) + 1
+    finally:
+        writer.close()
+
+
+async def yuk_testi(host, port, takip_nolar, istemci=50, istek=200):
+    """istemci adet keep-alive bağlantıdan istek'er GET /track/<no> gönderir; özet döndürür.
+
+    Numara listesi boşsa ya da istemci/istek sayısı pozitif değilse ValueError fırlatır.
+    """
+    if not takip_nolar:
+        raise ValueError("Yük testi için en az bir takip numarası gerekir.")
+    if istemci < 1 or istek < 1:
+        raise ValueError("İstemci ve istek sayısı en az 1 olmalıdır.")
+    sureler, durumlar = [], {}
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(
+        _yuk_istemcisi(host, port, takip_nolar, istek, sureler, durumlar) for _ in range(istemci)
+    ))
+    gecen = time.perf_counter() - baslangic
+    sureler.sort()
+    return {
+        "istek": len(sureler),
+        "sure_sn": round(gecen, 3),
+        "istek_per_sn": round(len(sureler) / gecen, 1),
+        "p50_ms": round(sureler[len(sureler) // 2] * 1000, 2),
+        "p99_ms": round(sureler[int(len(sureler) * 0.99) - 1] * 1000, 2),
+        "durumlar": durumlar,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kargo takip HTTP servisi")
+    parser.add_argument("--host", default=VARSAYILAN_HOST)
+    parser.add_argument("--port", type=int, default=VARSAYILAN_PORT)
+    parser.add_argument("--motor", default=None, help="Depolama motoru (csv / sqlite / ikili)")
+    parser.add_argument("--veri-dizini", default=None)
+    parser.add_argument("--yuk-testi", action="store_true",
+                        help="Servisi başlatmak yerine çalışan bir servise eşzamanlı yük gönderir")
+    parser.add_argument("--istemci", type=int, default=50)
+    parser.add_argument("--istek", type=int, default=200, help="İstemci başına istek sayısı")
+    parser.add_argument("--takip-no", nargs="*", default=None,
+                        help="Yük testinde sorgulanacak numaralar (varsayılan: ana tablodaki kargolar)")
+    args = parser.parse_args(argv)
+
+    if args.yuk_testi:
+        takip_nolar = args.takip_no
+        if not takip_nolar:
+            db = CargoDatabase(args.motor, args.veri_dizini)
+            takip_nolar = db.kargolar_ana_df['takip_no'].astype(str).tolist()
+            db.kapat()
+        try:
+            ozet = asyncio.run(yuk_testi(args.host, args.port, takip_nolar, args.istemci, args.istek))
+        except ValueError as e:
+            print(f"Hata: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(ozet, ensure_ascii=False, indent=2))
+        return 0
+
+    db = CargoDatabase(args.motor, args.veri_dizini)
+    try:
+        asyncio.run(sun(db, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.kapat()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,369 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import (
+    DepolamaMotoru, LOGLAR_DOSYASI, KARGOLAR_ANA_DOSYASI, LOG_KOLONLARI,
+    KULLANICI_KOLONLARI, ANA_KOLONLARI, VARSAYILAN_KULLANICILAR
+)
+from kargoOlcum import olcum
+
+SQLITE_DOSYASI = "kargo.db"
+# SQLite'ta tarih metin olarak saklanır; bu format sözlük sırasıyla kronolojik sıralanır
+SQLITE_TARIH_FORMATI = '%Y-%m-%d %H:%M:%S'
+
+SEMA = """
+CREATE TABLE IF NOT EXISTS kargo_loglari (
+    takip_no TEXT NOT NULL,
+    tarih    TEXT,
+    konum    TEXT,
+    durum    TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_loglar_takip_tarih ON kargo_loglari (takip_no, tarih);
+CREATE INDEX IF NOT EXISTS idx_loglar_tarih ON kargo_loglari (tarih);
+
+CREATE TABLE IF NOT EXISTS kullanicilar (
+    kullanici_adi TEXT NOT NULL,
+    sifre         TEXT,
+    rol           TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_kullanicilar_ad ON kullanicilar (kullanici_adi);
+
+CREATE TABLE IF NOT EXISTS kargolar_ana (
+    takip_no     TEXT PRIMARY KEY,
+    gonderici_ad TEXT,
+    alici_ad     TEXT,
+    mevcut_durum TEXT
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    anahtar TEXT PRIMARY KEY,
+    deger   TEXT
+);
+"""
+
+
+def _tarih_metni(tarih):
+    if tarih is None or pd.isna(tarih):
+        return None
+    return tarih.strftime(SQLITE_TARIH_FORMATI)
+
+
+def _tarih_metinleri(seri):
+    """Tarih kolonunu SQLITE_TARIH_FORMATI metinlerine çevirir (vektörel); tarihsizler None olur."""
+    degerler = seri.to_numpy(dtype='datetime64[s]')
+    if not len(degerler):
+        return np.empty(0, dtype=object)
+    metinler = np.char.replace(np.datetime_as_string(degerler, unit='s'), 'T', ' ').astype(object)
+    metinler[np.isnat(degerler)] = None
+    return metinler
+
+
+def _yuk_baytlari(satirlar):
+    """Eklenen satırların metin alanlarının UTF-8 bayt toplamı (sayfa/WAL ek yükü hariç)."""
+    return sum(len(str(deger).encode('utf-8')) for satir in satirlar for deger in satir if deger is not None)
+
+
+# --- SQLite Tabanlı Depolama Motoru ---
+class SqliteDepolamaMotoru(DepolamaMotoru):
+    """Tabloları WAL modunda tek bir SQLite dosyasında, indeksli sorgularla yönetir."""
+
+    ad = 'sqlite'
+
+    def __init__(self, veri_dizini=None, db_dosyasi=None):
+        super().__init__(veri_dizini)
+        self.db_yolu = db_dosyasi or self.dosya_yolu(SQLITE_DOSYASI)
+        self._baglanti = None
+        self._kilit = threading.RLock()
+        # Artımlı yeniden yükleme: okunmuş en büyük log rowid'i; aradaki başka bağlantıların satırları
+        self._son_rowid = 0
+        self._harici_satirlar = []
+        # CSV aktarımında tarihi çözülemeyen satırlar (tabloya tarihsiz yazılır)
+        self._tarih_hatalari = None
+
+    def load_data(self, ilerleme=None):
+        """Veritabanını açar, şemayı kurar ve gerekirse CSV verisini bir kez aktarır."""
+        ilerleme = ilerleme or (lambda mesaj: None)
+        ilerleme("Veritabanı açılıyor...")
+        try:
+            os.makedirs(os.path.dirname(self.db_yolu), exist_ok=True)
+            self._baglanti = sqlite3.connect(self.db_yolu, check_same_thread=False)
+            self._baglanti.execute("PRAGMA journal_mode=WAL")
+            self._baglanti.execute("PRAGMA synchronous=NORMAL")
+            self._baglanti.executescript(SEMA)
+        except sqlite3.Error as e:
+            raise IOError(f"Veritabanı açılamadı: {self.db_yolu} -> {e}")
+
+        if self._meta_oku('csv_aktarimi') is None:
+            csv_var = any(
+                os.path.exists(self.dosya_yolu(dosya)) for dosya in (LOGLAR_DOSYASI, KARGOLAR_ANA_DOSYASI)
+            )
+            if csv_var:
+                ilerleme("CSV verisi veritabanına aktarılıyor...")
+                self.csv_den_aktar(self.veri_dizini)
+            else:
+                self._meta_yaz('csv_aktarimi', 'yok')
+
+        # Varsayılan kullanıcıları kontrol et ve ekle
+        with self._kilit, self._baglanti:
+            kullanici_sayisi = self._baglanti.execute("SELECT COUNT(*) FROM kullanicilar").fetchone()[0]
+            if kullanici_sayisi == 0:
+                self._baglanti.executemany(
+                    "INSERT INTO kullanicilar (kullanici_adi, sifre, rol) VALUES (?, ?, ?)",
+                    zip(*(VARSAYILAN_KULLANICILAR[kolon] for kolon in KULLANICI_KOLONLARI))
+                )
+        self._son_rowid = self._en_buyuk_rowid()
+        self._harici_satirlar = []
+
+    def _en_buyuk_rowid(self):
+        with self._kilit:
+            return self._baglanti.execute("SELECT COALESCE(MAX(rowid), 0) FROM kargo_loglari").fetchone()[0]
+
+    def _harici_satirlari_al(self, ilk_kendi_rowid, son_kendi_rowid):
+        """Kendi eklediğimiz [ilk, son] rowid aralığından önce başka bağlantıların eklediği satırları bekletir.
+
+        Aynı işlem (transaction) içinde çağrılır; eklemelerimiz ardışık rowid alır.
+        """
+        if ilk_kendi_rowid - 1 > self._son_rowid:
+            self._harici_satirlar += self._baglanti.execute(
+                "SELECT takip_no, tarih, konum, durum FROM kargo_loglari WHERE rowid > ? AND rowid < ? ORDER BY rowid",
+                (self._son_rowid, ilk_kendi_rowid)
+            ).fetchall()
+        self._son_rowid = son_kendi_rowid
+
+    def yeni_loglari_oku(self):
+        with self._kilit:
+            en_buyuk = self._en_buyuk_rowid()
+            if en_buyuk < self._son_rowid:
+                # Tablo yeniden dolduruldu (ör. CSV'den yeniden aktarım)
+                return None
+            satirlar = self._harici_satirlar + self._baglanti.execute(
+                "SELECT takip_no, tarih, konum, durum FROM kargo_loglari WHERE rowid > ? ORDER BY rowid",
+                (self._son_rowid,)
+            ).fetchall()
+            self._harici_satirlar = []
+            self._son_rowid = en_buyuk
+        olcum.satir_tarandi(len(satirlar))
+        loglar = pd.DataFrame(satirlar, columns=LOG_KOLONLARI)
+        loglar['tarih'] = pd.to_datetime(loglar['tarih'])
+        return loglar
+
+    def degisiklik_dosyalari(self):
+        # WAL modunda başka bağlantıların işlemleri önce -wal dosyasına yazılır
+        return [self.db_yolu, self.db_yolu + "-wal"]
+
+    def csv_den_aktar(self, veri_dizini):
+        """data/*.csv dosyalarını (günlük dahil) tek bir işlemde SQLite'a aktarır."""
+        # CSV okuma/tarih çözme kuralları CSV motoruyla aynı kalsın diye onu kullanırız
+        from kargoCsvDepo import CsvDepolamaMotoru
+        csv_motoru = CsvDepolamaMotoru(veri_dizini, kompakt=False)
+        csv_motoru.load_data()
+
+        # Arşivlenmiş eski teslimatlar da aktarılır (SQLite'ta loglar indeksle sorgulanır)
+        hatalar = [csv_motoru.tarih_hatalari()]
+        loglar = pd.concat([csv_motoru.kargo_df, csv_motoru.arsiv.tum_loglar(hatalar)], ignore_index=True)
+        log_satirlari = zip(
+            loglar['takip_no'], _tarih_metinleri(loglar['tarih']), loglar['konum'], loglar['durum']
+        )
+        self._tarih_hatalari = pd.concat(hatalar, ignore_index=True)
+        ana = csv_motoru.kargolar_ana_df.drop_duplicates(subset='takip_no', keep='last')
+
+        with self._kilit, self._baglanti:
+            self._baglanti.execute("DELETE FROM kargo_loglari")
+            self._baglanti.execute("DELETE FROM kullanicilar")
+            self._baglanti.execute("DELETE FROM kargolar_ana")
+            self._baglanti.executemany(
+                "INSERT INTO kargo_loglari (takip_no, tarih, konum, durum) VALUES (?, ?, ?, ?)",
+                log_satirlari
+            )
+            self._baglanti.executemany(
+                "INSERT INTO kullanicilar (kullanici_adi, sifre, rol) VALUES (?, ?, ?)",
+                csv_motoru.kullanicilar_df[KULLANICI_KOLONLARI].itertuples(index=False, name=None)
+            )
+            self._baglanti.executemany(
+                "INSERT INTO kargolar_ana (takip_no, gonderici_ad, alici_ad, mevcut_durum) VALUES (?, ?, ?, ?)",
+                ana[ANA_KOLONLARI].itertuples(index=False, name=None)
+            )
+            self._baglanti.execute(
+                "INSERT OR REPLACE INTO meta (anahtar, deger) VALUES ('csv_aktarimi', ?)",
+                (datetime.now().strftime(SQLITE_TARIH_FORMATI),)
+            )
+            self._son_rowid = self._en_buyuk_rowid()
+            self._harici_satirlar = []
+
+    def tarih_hatalari(self):
+        if self._tarih_hatalari is None:
+            return super().tarih_hatalari()
+        return self._tarih_hatalari
+
+    def _meta_oku(self, anahtar):
+        with self._kilit:
+            satir = self._baglanti.execute("SELECT deger FROM meta WHERE anahtar = ?", (anahtar,)).fetchone()
+        return satir[0] if satir else None
+
+    def _meta_yaz(self, anahtar, deger):
+        with self._kilit, self._baglanti:
+            self._baglanti.execute("INSERT OR REPLACE INTO meta (anahtar, deger) VALUES (?, ?)", (anahtar, deger))
+
+    def _sorgu_df(self, sql, parse_dates=None):
+        with self._kilit:
+            return pd.read_sql_query(sql, self._baglanti, parse_dates=parse_dates)
+
+    @property
+    def kargo_df(self):
+        return self._sorgu_df(
+            "SELECT takip_no, tarih, konum, durum FROM kargo_loglari ORDER BY tarih", parse_dates=['tarih']
+        )
+
+    @property
+    def kullanicilar_df(self):
+        return self._sorgu_df("SELECT kullanici_adi, sifre, rol FROM kullanicilar ORDER BY rowid")
+
+    @property
+    def kargolar_ana_df(self):
+        return self._sorgu_df(
+            "SELECT takip_no, gonderici_ad, alici_ad, mevcut_durum FROM kargolar_ana ORDER BY rowid"
+        )
+
+    def get_user_credentials(self, user, password):
+        with self._kilit:
+            satir = self._baglanti.execute(
+                "SELECT rol FROM kullanicilar WHERE kullanici_adi = ? AND sifre = ? LIMIT 1", (user, password)
+            ).fetchone()
+        olcum.satir_tarandi(1 if satir else 0)
+        return satir[0] if satir else None
+
+    def get_logs(self, takip_no):
+        with self._kilit:
+            satirlar = self._baglanti.execute(
+                "SELECT takip_no, tarih, konum, durum FROM kargo_loglari WHERE takip_no = ? ORDER BY tarih",
+                (takip_no,)
+            ).fetchall()
+        olcum.satir_tarandi(len(satirlar))
+        if not satirlar:
+            return None
+        loglar = [dict(zip(LOG_KOLONLARI, satir)) for satir in satirlar]
+        for log in loglar:
+            log['tarih'] = pd.Timestamp(log['tarih']) if log['tarih'] else pd.NaT
+        return loglar
+
+    def _nolarla_sorgula(self, takip_nolar, sql, parse_dates=None):
+        """Takip numaralarını geçici tabloya (sira, takip_no) yazıp sql'i tek sorguda çalıştırır."""
+        nolar = list(dict.fromkeys(takip_nolar))
+        # Geçici tablo yazımı da bir işlemdir; blok sonunda kapatılır ki okuma anlık görüntüsü açık kalmasın
+        with self._kilit, self._baglanti:
+            self._baglanti.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS sorgu_nolari (sira INTEGER, takip_no TEXT PRIMARY KEY)"
+            )
+            self._baglanti.execute("DELETE FROM sorgu_nolari")
+            self._baglanti.executemany(
+                "INSERT INTO sorgu_nolari (sira, takip_no) VALUES (?, ?)", enumerate(nolar)
+            )
+            sonuc = pd.read_sql_query(sql, self._baglanti, parse_dates=parse_dates)
+            self._baglanti.execute("DELETE FROM sorgu_nolari")
+        olcum.satir_tarandi(len(sonuc))
+        return sonuc
+
+    def get_logs_many(self, takip_nolar):
+        """Takip numaralarını geçici tabloya yazıp loglarla tek bir JOIN sorgusunda eşleştirir."""
+        return self._nolarla_sorgula(
+            takip_nolar,
+            "SELECT l.takip_no, l.tarih, l.konum, l.durum FROM sorgu_nolari s "
+            "JOIN kargo_loglari l ON l.takip_no = s.takip_no ORDER BY s.sira, l.tarih",
+            parse_dates=['tarih']
+        )
+
+    def ana_kayitlari(self, takip_nolar):
+        return self._nolarla_sorgula(
+            takip_nolar,
+            "SELECT a.takip_no, a.gonderici_ad, a.alici_ad, a.mevcut_durum FROM sorgu_nolari s "
+            "JOIN kargolar_ana a ON a.takip_no = s.takip_no ORDER BY s.sira"
+        )
+
+    def log_parcalari(self, baslangic=None, bitis=None, parca_boyutu=100000):
+        """Aralığı (tarih, rowid) anahtarıyla sayfalar: her sayfa tarih indeksinde ayrı bir sorgudur,
+        sayfalar arasında açık imleç tutulmaz (yazmalar araya girebilir)."""
+        kosullar, parametreler = ["tarih IS NOT NULL"], []
+        if baslangic is not None:
+            kosullar.append("tarih >= ?")
+            parametreler.append(_tarih_metni(pd.Timestamp(baslangic)))
+        if bitis is not None:
+            kosullar.append("tarih < ?")
+            parametreler.append(_tarih_metni(pd.Timestamp(bitis)))
+        kosul = " AND ".join(kosullar)
+        with self._kilit:
+            toplam = self._baglanti.execute(
+                f"SELECT COUNT(*) FROM kargo_loglari WHERE {kosul}", parametreler
+            ).fetchone()[0]
+        taranan, son_anahtar = 0, None
+        while True:
+            sayfa_kosulu, sayfa_parametreleri = kosul, list(parametreler)
+            if son_anahtar is not None:
+                sayfa_kosulu += " AND (tarih, rowid) > (?, ?)"
+                sayfa_parametreleri += son_anahtar
+            with self._kilit:
+                satirlar = self._baglanti.execute(
+                    f"SELECT rowid, takip_no, tarih, konum, durum FROM kargo_loglari WHERE {sayfa_kosulu} "
+                    "ORDER BY tarih, rowid LIMIT ?", sayfa_parametreleri + [parca_boyutu]
+                ).fetchall()
+            if not satirlar:
+                return
+            olcum.satir_tarandi(len(satirlar))
+            son_anahtar = [satirlar[-1][2], satirlar[-1][0]]
+            taranan += len(satirlar)
+            loglar = pd.DataFrame([satir[1:] for satir in satirlar], columns=LOG_KOLONLARI)
+            loglar['tarih'] = pd.to_datetime(loglar['tarih'], format=SQLITE_TARIH_FORMATI)
+            yield taranan, max(toplam, taranan), loglar
+
+    def add_log(self, takip_no, tarih, konum, durum):
+        satir = (takip_no, _tarih_metni(tarih), konum, durum)
+        with self._kilit, self._baglanti:
+            rowid = self._baglanti.execute(
+                "INSERT INTO kargo_loglari (takip_no, tarih, konum, durum) VALUES (?, ?, ?, ?)", satir
+            ).lastrowid
+            self._harici_satirlari_al(rowid, rowid)
+            # Yeni bir kargo ilk kez sisteme giriyorsa basit ana kargo kaydı oluşturulur
+            self._baglanti.execute(
+                "INSERT INTO kargolar_ana (takip_no, gonderici_ad, alici_ad, mevcut_durum) "
+                "VALUES (?, 'Bilinmiyor', 'Bilinmiyor', ?) "
+                "ON CONFLICT(takip_no) DO UPDATE SET mevcut_durum = excluded.mevcut_durum",
+                (takip_no, durum)
+            )
+        if olcum.etkin:
+            olcum.bayt_yazildi(_yuk_baytlari([satir, (takip_no, durum)]))
+        return True
+
+    def add_logs_bulk(self, loglar):
+        """Log grubunu tek bir işlemde (transaction) ekler."""
+        if loglar.empty:
+            return
+        son_durumlar = (
+            loglar.sort_values(by='tarih', kind='stable')
+            .drop_duplicates(subset='takip_no', keep='last')
+        )
+        satirlar = list(zip(loglar['takip_no'], map(_tarih_metni, loglar['tarih']), loglar['konum'], loglar['durum']))
+        with self._kilit, self._baglanti:
+            self._baglanti.executemany(
+                "INSERT INTO kargo_loglari (takip_no, tarih, konum, durum) VALUES (?, ?, ?, ?)", satirlar
+            )
+            son_rowid = self._en_buyuk_rowid()
+            self._harici_satirlari_al(son_rowid - len(satirlar) + 1, son_rowid)
+            self._baglanti.executemany(
+                "INSERT INTO kargolar_ana (takip_no, gonderici_ad, alici_ad, mevcut_durum) "
+                "VALUES (?, 'Bilinmiyor', 'Bilinmiyor', ?) "
+                "ON CONFLICT(takip_no) DO UPDATE SET mevcut_durum = excluded.mevcut_durum",
+                zip(son_durumlar['takip_no'], son_durumlar['durum'])
+            )
+        if olcum.etkin:
+            olcum.bayt_yazildi(
+                _yuk_baytlari(satirlar) + _yuk_baytlari(zip(son_durumlar['takip_no'], son_durumlar['durum']))
+            )
+
+    def kapat(self):
+        with self._kilit:
+            if self._baglanti is not None:
+                self._baglanti.close()
+                self._baglanti = None
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex
+
+from kargoTarih import tarih_metni
+
+
+def hucre_metni(deger):
+    """Tablo hücresinde gösterilecek metin (tarihler TARIH_FORMATI ile)."""
+    if deger is None or (not isinstance(deger, str) and pd.isna(deger)):
+        return ""
+    if isinstance(deger, pd.Timestamp):
+        # Kaydırmada aynı hücreler tekrar tekrar çizilir; dakika metinleri önbellektedir
+        return tarih_metni(deger)
+    return str(deger)
+
+
+# --- DataFrame Tablo Modeli ---
+class DataFrameModeli(QAbstractTableModel):
+    """DataFrame kolonlarını doğrudan okuyan model; sadece görünen hücreler metne çevrilir.
+
+    QTableWidget'taki gibi hücre başına nesne oluşturulmaz, bu yüzden yüz binlerce satır
+    anında açılır.
+    """
+
+    def __init__(self, kolonlar, parent=None):
+        super().__init__(parent)
+        # [(DataFrame kolonu, başlık), ...]
+        self._kolonlar = [kolon for kolon, _ in kolonlar]
+        self._basliklar = [baslik for _, baslik in kolonlar]
+        self._df = pd.DataFrame(columns=self._kolonlar)
+        self._diziler = [self._df[kolon].array for kolon in self._kolonlar]
+
+    def veriyi_ayarla(self, df):
+        """Modeli yeni tabloyla değiştirir (kopyalamaz, kolon dizilerine referans tutar)."""
+        self.beginResetModel()
+        self._df = df
+        self._diziler = [df[kolon].array for kolon in self._kolonlar]
+        self.endResetModel()
+
+    def kolon_serisi(self, kolon_no):
+        """Sıralama/filtreleme için kolonun tamamı (vektörel işlemler proxy modelde yapılır)."""
+        return self._df[self._kolonlar[kolon_no]]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._kolonlar)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return hucre_metni(self._diziler[index.column()][index.row()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._basliklar[section]
+        return str(section + 1)
+
+
+# --- Sıralama / Filtreleme Proxy Modeli ---
+class DataFrameProxyModeli(QAbstractProxyModel):
+    """DataFrameModeli üzerinde vektörel sıralama ve filtreleme.
+
+    QSortFilterProxyModel her karşılaştırmada Python'daki data()'yı çağırdığından büyük
+    tablolarda yavaştır; burada sıralama ve filtre pandas/numpy ile tek seferde hesaplanıp
+    bir satır permütasyonu olarak tutulur.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._satirlar = np.arange(0)   # proxy satırı -> kaynak satırı
+        self._ters = None               # kaynak satırı -> proxy satırı (gerektiğinde hesaplanır)
+        self._siralama = None           # (kolon_no, Qt.SortOrder)
+        self._filtre = ""
+        self._filtre_kolonlari = None   # None: tüm kolonlar
+
+    def setSourceModel(self, model):
+        eski = self.sourceModel()
+        if eski is not None:
+            eski.modelAboutToBeReset.disconnect(self.beginResetModel)
+            eski.modelReset.disconnect(self._kaynak_sifirlandi)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._kaynak_sifirlandi)
+        self._hesapla()
+        self.endResetModel()
+
+    def _kaynak_sifirlandi(self):
+        self._hesapla()
+        self.endResetModel()
+
+    def _hesapla(self):
+        """Filtre ve sıralamayı uygulayarak satır permütasyonunu yeniden kurar."""
+        kaynak = self.sourceModel()
+        satirlar = np.arange(kaynak.rowCount())
+        if self._filtre and len(satirlar):
+            kolonlar = self._filtre_kolonlari
+            if kolonlar is None:
+                kolonlar = range(kaynak.columnCount())
+            maske = np.zeros(len(satirlar), dtype=bool)
+            for kolon_no in kolonlar:
+                metinler = kaynak.kolon_serisi(kolon_no).astype(object).astype(str)
+                maske |= metinler.str.contains(self._filtre, case=False, regex=False).to_numpy(dtype=bool)
+            satirlar = satirlar[maske]
+        if self._siralama is not None and len(satirlar):
+            kolon_no, sira = self._siralama
+            seri = kaynak.kolon_serisi(kolon_no)
+            if isinstance(seri.dtype, pd.CategoricalDtype):
+                seri = seri.astype(object)
+            # factorize(sort=True) karışık/eksik değerlerde de sıralı tamsayı kod verir (NaN -> -1)
+            kodlar, _ = pd.factorize(seri.iloc[satirlar], sort=True)
+            if sira == Qt.SortOrder.DescendingOrder:
+                kodlar = -kodlar
+            satirlar = satirlar[np.argsort(kodlar, kind='stable')]
+        self._satirlar = satirlar
+        self._ters = None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.beginResetModel()
+        self._siralama = None if column < 0 else (column, order)
+        self._hesapla()
+        self.endResetModel()
+
+    def filtrele(self, metin, kolonlar=None):
+        """Verilen kolonlarda (büyük/küçük harf duyarsız) metni içeren satırları gösterir."""
+        self.beginResetModel()
+        self._filtre = metin.strip()
+        self._filtre_kolonlari = kolonlar
+        self._hesapla()
+        self.endResetModel()
+
+    def kaynak_satiri(self, satir):
+        return int(self._satirlar[satir])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._satirlar)
+
+    def columnCount(self, parent=QModelIndex()):
+        kaynak = self.sourceModel()
+        return 0 if parent.isValid() or kaynak is None else kaynak.columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._satirlar)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self.kaynak_satiri(proxy_index.row()), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._ters is None:
+            self._ters = np.full(self.sourceModel().rowCount(), -1, dtype=np.int64)
+            self._ters[self._satirlar] = np.arange(len(self._satirlar))
+        satir = int(self._ters[source_index.row()])
+        if satir < 0:
+            return QModelIndex()
+        return self.createIndex(satir, source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(section + 1)
@@ -1,177 +1,58 @@
+import os
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QLabel, QTabWidget, QMessageBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QFormLayout, QGridLayout, QFrame, QSizePolicy
+    QTableView, QHeaderView, QComboBox, QFormLayout, QGridLayout, QFrame, QSizePolicy,
+    QFileDialog, QProgressBar, QDialog, QPlainTextEdit, QCheckBox, QSpinBox, QDateEdit
 )
-from PyQt6.QtCore import Qt
-from datetime import datetime, timedelta
+from PyQt6.QtCore import Qt, QTimer, QFileSystemWatcher, QDate
 import pandas as pd
-import os
-
-# ===============================
-# PyInstaller uyumlu dosya yolu
-# ===============================
-def resource_path(relative_path):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.join(os.path.abspath("."), relative_path)
-
-DATA_DIR = resource_path("data")
-
-CSV_LOGLARI = os.path.join(DATA_DIR, "kargo_loglari.csv")
-CSV_KULLANICILAR = os.path.join(DATA_DIR, "kullanicilar.csv")
-CSV_KARGOLAR_ANA = os.path.join(DATA_DIR, "kargolar_ana.csv")
-
-
-# --- 1. CSV Tabanlı Veritabanı Sınıfı (3 Tabloyu Yönetir) ---
-class CargoDatabase:
-    def __init__(self):
-        self.kargo_df = None       
-        self.kullanicilar_df = None
-        self.kargolar_ana_df = None
-        
-        self.load_data()
-    
-    def load_data(self):
-        """Üç CSV dosyasını da yükler ve dosyaların varlığını kontrol eder."""
-        
-        def check_and_load(path, cols, is_datetime=False):
-            if not os.path.exists(path):
-                os.makedirs(os.path.dirname(path), exist_ok=True)
-                # Dosya yoksa, boş bir DataFrame oluştur ve dosyayı yaz.
-                df = pd.DataFrame(columns=cols)
-                try:
-                    df.to_csv(path, index=False)
-                except Exception as e:
-                    raise IOError(f"Dosya oluşturulamadı veya yazılamadı (İzin Hatası): {path} -> {e}")
-                return df
-            else:
-                # Dosya varsa, yükle.
-                try:
-                    df = pd.read_csv(path)
-                    # KRİTİK: ID ve giriş alanlarını stringe zorla (eşleşme sorunlarını önler)
-                    for col in ['takip_no', 'kullanici_adi', 'sifre']:
-                        if col in df.columns:
-                            df[col] = df[col].astype(str).str.strip()
-                    if df.empty and len(cols) > 0:
-                         df = pd.DataFrame(columns=cols)
-
-                    if is_datetime and 'tarih' in df.columns and not df.empty:
-                        # Tarih formatlarını akıllı şekilde çöz (ISO + TR), uyarı üretmez
-                        try:
-                            # ISO format: 2025-12-15 18:30
-                            df['tarih'] = pd.to_datetime(
-                                df['tarih'],
-                                format='%Y-%m-%d %H:%M',
-                                errors='raise'
-                            )
-                        except Exception:
-                            # TR formatları: 15.12.2025 18:30 / 15/12/2025 18:30
-                            df['tarih'] = pd.to_datetime(
-                                df['tarih'],
-                                dayfirst=True,
-                                errors='coerce'
-                            )
-                        
-                    return df
-                except Exception as e:
-                    # Format veya İçerik Hatası
-                    raise IOError(f"Dosya okunamadı veya format hatası var: {path} -> {e}")
-
-        try:
-            # 1. Kargo Logları (Kargo_Loglari)
-            self.kargo_df = check_and_load(
-                CSV_LOGLARI, ['takip_no', 'tarih', 'konum', 'durum'], is_datetime=True
-            )
-            if not self.kargo_df.empty and 'tarih' in self.kargo_df.columns:
-                self.kargo_df = self.kargo_df.sort_values(by='tarih', ascending=True)
-
-            # 2. Kullanıcılar (Kullanicilar)
-            self.kullanicilar_df = check_and_load(
-                CSV_KULLANICILAR, ['kullanici_adi', 'sifre', 'rol']
-            )
-            # Varsayılan kullanıcıları kontrol et ve ekle
-            if self.kullanicilar_df.empty or len(self.kullanicilar_df) == 0:
-                self.kullanicilar_df = pd.DataFrame({
-                    'kullanici_adi': ['lojisfk', 'yonetici'],
-                    'sifre': ['1234', '4321'],
-                    'rol': ['Personel', 'Yonetici']
-                })
-                self.kullanicilar_df.to_csv(CSV_KULLANICILAR, index=False)
-
-
-            # 3. Kargolar Ana Bilgi (Kargolar)
-            self.kargolar_ana_df = check_and_load(
-                CSV_KARGOLAR_ANA, ['takip_no', 'gonderici_ad', 'alici_ad', 'mevcut_durum']
-            )
-
-        except Exception as e:
-            QMessageBox.critical(None, "KRİTİK BAŞLANGIÇ HATASI", str(e))
-            sys.exit(1)
 
-
-    def get_user_credentials(self, user, password):
-        """Kullanıcıyı ve rolünü CSV'den doğrular."""
-        user_row = self.kullanicilar_df[
-            (self.kullanicilar_df['kullanici_adi'] == user) &
-            (self.kullanicilar_df['sifre'] == password)
-        ]
-        if not user_row.empty:
-            return user_row.iloc[0]['rol']
-        return None
-    
-    def get_logs(self, takip_no):
-        """Belirli bir takip numarasına ait logları çeker."""
-        logs = self.kargo_df[self.kargo_df['takip_no'] == takip_no]
-        if logs.empty:
-            return None
-        return logs.sort_values(by='tarih').to_dict('records')
-
-    def add_log(self, takip_no, konum, durum):
-        """Operasyon personeli log ekleme."""
-        yeni_log = pd.DataFrame([{
-            "takip_no": takip_no,
-            "tarih": datetime.now(),
-            "konum": konum,
-            "durum": durum
-        }])
-        
-        # 1. Kargo Loglarını Güncelle ve Kaydet
-        self.kargo_df = pd.concat([self.kargo_df, yeni_log], ignore_index=True)
-        self.kargo_df.to_csv(CSV_LOGLARI, index=False, date_format='%Y-%m-%d %H:%M')
-        
-        # 2. Ana Kargo Durumunu Güncelle (Kargolar tablosu simülasyonu)
-        if takip_no in self.kargolar_ana_df['takip_no'].values:
-            self.kargolar_ana_df.loc[self.kargolar_ana_df['takip_no'] == takip_no, 'mevcut_durum'] = durum
-        else:
-             # Yeni bir kargo ilk kez sisteme giriyorsa (Basit Ana Kargo kaydı oluştur)
-             yeni_ana = pd.DataFrame([{'takip_no': takip_no, 'gonderici_ad': 'Bilinmiyor', 'alici_ad': 'Bilinmiyor', 'mevcut_durum': durum}])
-             self.kargolar_ana_df = pd.concat([self.kargolar_ana_df, yeni_ana], ignore_index=True)
-
-        self.kargolar_ana_df.to_csv(CSV_KARGOLAR_ANA, index=False)
-        return True
-
-    def calculate_eta(self, loglar):
-        """Tahmini teslim tarihi hesaplama (F-006)."""
-        if not loglar:
-             return "-"
-        son_log_dt = loglar[-1]['tarih']
-        if isinstance(son_log_dt, str):
-            son_log_dt = datetime.strptime(son_log_dt, '%Y-%m-%d %H:%M')
-        
-        tahmini_teslim = son_log_dt + timedelta(days=1) 
-        return tahmini_teslim.strftime('%d/%m/%Y %H:%M')
+from kargoVeritabani import CargoDatabase
+from kargoDepolama import DURUMLAR
+from kargoTabloModeli import DataFrameModeli, DataFrameProxyModeli
+from kargoIsciler import IsYoneticisi
+from kargoOlcum import olcum, PROMETHEUS_DOSYASI, OZET_KOLONLARI
+from kargoPano import TAKILI_KARGO_SAATI
+from kargoDisaAktarim import disa_aktar, tarih_siniri
+from kargoDogrulama import KARANTINA_DOSYASI, YUKLEME_KARANTINA_DOSYASI, bicim_nedeni
+
+# Başka süreçlerin (terminal, içe aktarım) eklediği loglar için dosya izleyicisinin
+# kaçırdığı değişikliklere karşı yedek yoklama aralığı (saniye; 0 kapatır)
+YENILEME_ARALIGI_SN = int(os.environ.get("KARGO_YENILEME_SN", "5"))
+# Art arda gelen dosya değişikliği bildirimleri tek okumada birleştirilir
+DEGISIKLIK_GECIKMESI_MS = 300
+# Yönetici panosu görünürken bu aralıkla yenilenir (takılı kargolar zamanla değişir)
+PANO_YENILEME_SN = 30
+# Ana kargo aramasında yazma bitene kadar beklenen süre; her tuşta ayrı sorgu gönderilmez
+ARAMA_GECIKMESI_MS = 150
 
 # --- 2. Ana Uygulama Sınıfı ---
 
 class CargoTrackingApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, db=None):
         super().__init__()
         self.setWindowTitle("LojisFk Kargo Takip Sistemi Prototipi")
         self.resize(1000, 750) 
         
-        self.db = CargoDatabase()
+        try:
+            # Tablolar pencere açıldıktan sonra arka planda yüklenir (bkz. start_loading);
+            # db verilirse (ör. kıyaslama) o veritabanı kullanılır
+            self.db = db if db is not None else CargoDatabase(yukle=False)
+        except Exception as e:
+            QMessageBox.critical(None, "KRİTİK BAŞLANGIÇ HATASI", str(e))
+            sys.exit(1)
+        
+        # Disk yazmaları, yükleme ve ağır sorgular arka plan iş parçacıklarında çalışır
+        self.isler = IsYoneticisi(self)
+        self.yukleme_cubugu = QProgressBar()
+        self.yukleme_cubugu.setRange(0, 0)
+        self.yukleme_cubugu.setMaximumWidth(200)
+        self.bekleyen_label = QLabel("")
+        self.statusBar().addPermanentWidget(self.bekleyen_label)
+        self.statusBar().addPermanentWidget(self.yukleme_cubugu)
+        self.isler.bekleyen_yazma_degisti.connect(self.update_bekleyen_label)
         
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -182,18 +63,153 @@ class CargoTrackingApp(QMainWindow):
         self.layout.addWidget(self.tabs)
         
         self.current_user_role = None 
+        # Müşteri ekranında gösterilen kargo; harici log gelince sessizce yenilenir
+        self.gosterilen_takip_no = None
+        self._yenileme_suruyor = False
+        # Yönetici panosunda "takılı" sayılan hareketsizlik süresi (saat)
+        self.takili_esik_saat = TAKILI_KARGO_SAATI
         
         self.customer_tab = self.create_customer_tab()
         self.tabs.addTab(self.customer_tab, "📦 Kargo Takip (Müşteri)")
         
         self.personnel_login_widget = self.create_login_form()
-        self.manager_panel_widget = self.create_manager_panel()
-        self.personnel_form_widget = self.create_data_entry_form()
+        # Yönetici paneli ve veri giriş formu ilk gerektiklerinde kurulur
+        # (bkz. yonetici_paneli / veri_giris_formu); çoğu oturumda hiç açılmazlar
+        self.manager_panel_widget = None
+        self.personnel_form_widget = None
         
         self.personnel_tab = self.create_personnel_tab()
         self.tabs.addTab(self.personnel_tab, "👨‍💼 Operasyon Paneli")
         
         self.tabs.currentChanged.connect(self.check_personnel_access)
+        self.start_loading()
+
+    def start_loading(self):
+        """Veritabanını arka planda yükler; bitene kadar sekmeler devre dışıdır."""
+        self.tabs.setEnabled(False)
+        self.yukleme_cubugu.show()
+        self.isler.calistir(
+            self.db.load_data,
+            bitti=self.handle_loading_finished,
+            hata=self.handle_loading_error,
+            ilerleme=self.statusBar().showMessage
+        )
+
+    def handle_loading_finished(self, _):
+        self.yukleme_cubugu.hide()
+        self.tabs.setEnabled(True)
+        hatali = len(self.db.motor.tarih_hatalari())
+        if hatali:
+            self.statusBar().showMessage(f"Veriler yüklendi; {hatali} satırın tarihi çözülemedi (bkz. Yönetici Paneli).", 10000)
+        else:
+            self.statusBar().showMessage("Veriler yüklendi.", 5000)
+        self.degisiklikleri_izle()
+
+    # --- Harici Değişiklikleri İzleme ---
+    def degisiklikleri_izle(self):
+        """Veri dosyalarını izler; değişince sadece yeni eklenen loglar okunur (bkz. yeni_loglari_yukle)."""
+        if getattr(self, 'dosya_izleyici', None) is not None:
+            return
+        self.izlenen_dosyalar = self.db.motor.degisiklik_dosyalari()
+        self.dosya_izleyici = QFileSystemWatcher(self)
+        # Dizin izlenerek sonradan oluşan (ör. -wal) ya da yerine yazılan dosyalar yeniden eklenir
+        self.dosya_izleyici.addPath(self.db.motor.veri_dizini)
+        self._izlenen_dosyalari_ekle()
+        self.dosya_izleyici.fileChanged.connect(self.handle_dosya_degisti)
+        self.dosya_izleyici.directoryChanged.connect(self.handle_dosya_degisti)
+
+        self.degisiklik_zamanlayici = QTimer(self)
+        self.degisiklik_zamanlayici.setSingleShot(True)
+        self.degisiklik_zamanlayici.setInterval(DEGISIKLIK_GECIKMESI_MS)
+        self.degisiklik_zamanlayici.timeout.connect(self.yeni_verileri_kontrol_et)
+        # inotify olmayan (ör. ağ diski) ortamlar için yedek yoklama
+        if YENILEME_ARALIGI_SN > 0:
+            self.yoklama_zamanlayici = QTimer(self)
+            self.yoklama_zamanlayici.timeout.connect(self.yeni_verileri_kontrol_et)
+            self.yoklama_zamanlayici.start(YENILEME_ARALIGI_SN * 1000)
+
+    def _izlenen_dosyalari_ekle(self):
+        izlenen = set(self.dosya_izleyici.files())
+        for yol in self.izlenen_dosyalar:
+            if yol not in izlenen and os.path.exists(yol):
+                self.dosya_izleyici.addPath(yol)
+
+    def handle_dosya_degisti(self, _yol):
+        self._izlenen_dosyalari_ekle()
+        self.degisiklik_zamanlayici.start()
+
+    def yeni_verileri_kontrol_et(self):
+        """Harici eklemeleri arka planda okur; bir okuma sürerken yenisi başlatılmaz."""
+        if self._yenileme_suruyor or not self.tabs.isEnabled():
+            return
+        self._yenileme_suruyor = True
+        self.isler.calistir(
+            self.db.yeni_loglari_yukle,
+            bitti=self.handle_yeni_veriler,
+            hata=self.handle_yenileme_hatasi
+        )
+
+    def handle_yeni_veriler(self, etkilenenler):
+        """Açık müşteri ve yönetici görünümlerini, etkilendilerse mesaj kutusu açmadan yeniler."""
+        self._yenileme_suruyor = False
+        if etkilenenler is not None and not etkilenenler:
+            return
+        takip_no = self.gosterilen_takip_no
+        if takip_no is not None and (etkilenenler is None or takip_no in etkilenenler):
+            self.isler.calistir(
+                self.db.takip_sonucu, takip_no,
+                bitti=lambda sonuc: self.show_customer_result(takip_no, sonuc, sessiz=True),
+                hata=lambda mesaj: self.statusBar().showMessage(f"Kargo {takip_no} yenilenemedi: {mesaj}", 5000)
+            )
+        if self.manager_panel_widget is not None and self.manager_panel_widget.isVisible():
+            if etkilenenler is None:
+                self.update_manager_panel()
+            else:
+                # Tüm panel yerine pano toplamları ve sadece etkilenen kargoların tahminleri yenilenir
+                self.update_pano()
+                self.update_eta_satirlari(etkilenenler)
+        if etkilenenler is None:
+            self.statusBar().showMessage("Veri dosyaları değişti; tablolar yeniden yüklendi.", 5000)
+        else:
+            self.statusBar().showMessage(f"{len(etkilenenler)} kargoda yeni hareket alındı.", 5000)
+
+    def handle_yenileme_hatasi(self, mesaj):
+        self._yenileme_suruyor = False
+        self.statusBar().showMessage(f"Yeni kayıtlar okunamadı: {mesaj}", 5000)
+
+    def handle_loading_error(self, mesaj):
+        QMessageBox.critical(self, "KRİTİK BAŞLANGIÇ HATASI", mesaj)
+        QApplication.exit(1)
+
+    def update_bekleyen_label(self, adet):
+        self.bekleyen_label.setText(f"Kaydedilmeyi bekleyen: {adet}" if adet else "")
+
+    def closeEvent(self, event):
+        """Kapanışta kuyruktaki yazmaların diske ulaşmasını bekler."""
+        if self.isler.bekleyen_yazma:
+            self.statusBar().showMessage("Bekleyen kayıtlar diske yazılıyor...")
+            QApplication.processEvents()
+        self.isler.bekle()
+        self.db.kapat()
+        event.accept()
+
+    def create_table_view(self, kolonlar):
+        """DataFrame modeli + sıralama/filtre proxy'si bağlanmış sanal tablo oluşturur."""
+        model = DataFrameModeli(kolonlar, self)
+        proxy = DataFrameProxyModeli(self)
+        proxy.setSourceModel(model)
+
+        table = QTableView()
+        table.setModel(proxy)
+        table.setSortingEnabled(True)
+        # Başlangıçta dosya sırası korunur; başlığa tıklanınca sıralanır
+        table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        table.setCornerButtonEnabled(False)
+        table.verticalHeader().setVisible(False)
+        # Satır yükseklikleri tek tek ölçülmesin (büyük tablolarda açılışı yavaşlatır)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        return table, model, proxy
         
     # --- 4. Operasyon Personeli Sekmesi için Container ---
     def create_personnel_tab(self):
@@ -201,33 +217,49 @@ class CargoTrackingApp(QMainWindow):
         self.personnel_main_layout = QVBoxLayout(tab)
         
         self.personnel_main_layout.addWidget(self.personnel_login_widget)
-        self.personnel_main_layout.addWidget(self.manager_panel_widget)
-        self.personnel_main_layout.addWidget(self.personnel_form_widget)
-        
-        self.manager_panel_widget.hide() 
-        self.personnel_form_widget.hide() 
-        
         self.personnel_main_layout.addStretch()
         return tab
 
+    def _personel_widgeti_ekle(self, widget):
+        # Sondaki esnek boşluğun önüne eklenir
+        self.personnel_main_layout.insertWidget(self.personnel_main_layout.count() - 1, widget)
+        widget.hide()
+        return widget
+
+    def yonetici_paneli(self):
+        """Yönetici panelini ilk çağrıda kurar."""
+        if self.manager_panel_widget is None:
+            self.manager_panel_widget = self._personel_widgeti_ekle(self.create_manager_panel())
+        return self.manager_panel_widget
+
+    def veri_giris_formu(self):
+        """Personel veri giriş formunu ilk çağrıda kurar."""
+        if self.personnel_form_widget is None:
+            self.personnel_form_widget = self._personel_widgeti_ekle(self.create_data_entry_form())
+        return self.personnel_form_widget
+
+    def _personel_widgetlarini_gizle(self):
+        for widget in (self.manager_panel_widget, self.personnel_form_widget):
+            if widget is not None:
+                widget.hide()
+
     # --- Personel Erişim Kontrolü ---
     def check_personnel_access(self, index):
         """Sekme değiştiğinde personel sekmesini kontrol eder ve rolüne göre yönlendirir."""
-        if self.tabs.tabText(index) == "👨‍💼 Veri Girişi (Personel)":
+        if index == self.tabs.indexOf(self.personnel_tab):
             if self.current_user_role is None:
-                self.personnel_form_widget.hide()
-                self.manager_panel_widget.hide() 
+                self._personel_widgetlarini_gizle()
                 self.personnel_login_widget.show()
             
             elif self.current_user_role == 'Personel':
                 self.personnel_login_widget.hide()
-                self.manager_panel_widget.hide()
-                self.personnel_form_widget.show()
+                self._personel_widgetlarini_gizle()
+                self.veri_giris_formu().show()
                 
             elif self.current_user_role == 'Yonetici':
                 self.personnel_login_widget.hide()
-                self.personnel_form_widget.hide()
-                self.manager_panel_widget.show()
+                self._personel_widgetlarini_gizle()
+                self.yonetici_paneli().show()
                 self.update_manager_panel()
 
     def handle_back_to_login(self):
@@ -236,8 +268,7 @@ class CargoTrackingApp(QMainWindow):
         self.current_user_role = None
 
         # Tüm personel/yönetici widgetlarını gizle
-        self.manager_panel_widget.hide()
-        self.personnel_form_widget.hide()
+        self._personel_widgetlarini_gizle()
 
         # Login ekranını göster
         self.personnel_login_widget.show()
@@ -269,9 +300,16 @@ class CargoTrackingApp(QMainWindow):
         self.sorgula_button.clicked.connect(self.handle_customer_sorgula)
         self.sorgula_button.setFixedWidth(150)
 
+        # Çok sayıda numarayı (yapıştırılan liste ya da dosya) tek seferde sorgulama
+        self.toplu_sorgu_button = QPushButton("Toplu Sorgu")
+        self.toplu_sorgu_button.clicked.connect(self.open_bulk_query_dialog)
+        self.toplu_sorgu_button.setFixedWidth(120)
+        self.toplu_sorgu_dialog = None
+
         input_h_layout.addStretch() 
         input_h_layout.addWidget(self.customer_takip_input)
         input_h_layout.addWidget(self.sorgula_button)
+        input_h_layout.addWidget(self.toplu_sorgu_button)
         input_h_layout.addStretch() 
         
         results_frame = QFrame()
@@ -288,17 +326,14 @@ class CargoTrackingApp(QMainWindow):
         history_header = QLabel("<h3>Hareket Geçmişi Detayı</h3>")
         history_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.table_widget = QTableWidget()
-        self.table_widget.setCornerButtonEnabled(False)
-        self.table_widget.verticalHeader().setVisible(False)
+        self.table_widget, self.gecmis_modeli, self.gecmis_proxy = self.create_table_view(
+            [('tarih', "Tarih/Saat"), ('konum', "Konum"), ('durum', "Durum")]
+        )
         self.table_widget.setMinimumHeight(350)
         self.table_widget.setSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
         )
-        self.table_widget.setColumnCount(3)
-        self.table_widget.setHorizontalHeaderLabels(["Tarih/Saat", "Konum", "Durum"])
-        self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch) 
 
         results_v_layout.addWidget(self.anlik_durum_label)
         results_v_layout.addWidget(self.eta_label)
@@ -326,9 +361,30 @@ class CargoTrackingApp(QMainWindow):
             self.clear_customer_display()
             return
             
-        logs = self.db.get_logs(takip_no)
-        
-        if logs is None or not logs:
+        self.sorgula_button.setEnabled(False)
+        # Tıklamadan sonucun ekrana basılmasına kadar (arka plan işi dahil) ölçülür
+        baslangic = olcum.baslat()
+        self.isler.calistir(
+            self.db.takip_sonucu, takip_no,
+            bitti=lambda sonuc: self.show_customer_result(takip_no, sonuc, baslangic),
+            hata=self.handle_query_error
+        )
+
+    def handle_query_error(self, mesaj):
+        self.sorgula_button.setEnabled(True)
+        QMessageBox.critical(self, "Hata", f"Sorgulama yapılamadı: {mesaj}")
+
+    def show_customer_result(self, takip_no, sonuc, baslangic=None, sessiz=False):
+        """Arka planda hazırlanan (önbellekten gelebilen) takip sonucunu müşteri ekranında gösterir.
+
+        sessiz=True (harici değişiklik sonrası yenileme) iken mesaj kutusu açılmaz.
+        """
+        self.sorgula_button.setEnabled(True)
+        if sonuc is None:
+            olcum.bitir('handle_customer_sorgula', baslangic)
+            if sessiz:
+                self.clear_customer_display()
+                return
             QMessageBox.critical(self, "Hata", f'"{takip_no}" numaralı kargo kaydı bulunamadı veya numara geçersizdir. (F-005 Hatası)')
             self.clear_customer_display()
             
@@ -336,36 +392,128 @@ class CargoTrackingApp(QMainWindow):
             self.anlik_durum_label.setText("<h4>Sorgulama Hatası:</h4> Kargo Bulunamadı.")
             return
 
-        son_log = logs[-1]
-        
-        durum_renk = "#28a745" if son_log['durum'] == "Teslim Edildi" else "#007bff"
+        durum_renk = "#28a745" if sonuc['mevcut_durum'] == "Teslim Edildi" else "#007bff"
         
         self.anlik_durum_label.setStyleSheet(f"color: {durum_renk};")
-        self.anlik_durum_label.setText(f"<h4>Anlık Durum:</h4> <b>{son_log['durum']}</b> ({son_log['konum']})")
-        
-        eta = self.db.calculate_eta(logs)
-        self.eta_label.setText(f"<h4>Tahmini Teslimat:</h4> <span style='color: #00aaff;'>{eta}</span>")
-        
-        df = pd.DataFrame(logs)
-        df = df.sort_values(by='tarih', ascending=False)
-        self.table_widget.setRowCount(len(df))
+        self.anlik_durum_label.setText(f"<h4>Anlık Durum:</h4> <b>{sonuc['mevcut_durum']}</b> ({sonuc['konum']})")
         
-        df['tarih'] = pd.to_datetime(df['tarih'], errors='coerce')
-        df['tarih_str'] = df['tarih'].dt.strftime('%Y-%m-%d %H:%M')
+        aralik = sonuc['tahmin_araligi']
+        aralik_metni = (
+            f" <small>(%80 aralık: {aralik['alt']} – {aralik['ust']}, {aralik['ornek']} örnek)</small>"
+            if aralik else ""
+        )
+        self.eta_label.setText(
+            f"<h4>Tahmini Teslimat:</h4> <span style='color: #00aaff;'>{sonuc['tahmini_teslim']}</span>{aralik_metni}"
+        )
         
-        for i, row in enumerate(df.itertuples()):
-            self.table_widget.setItem(i, 0, QTableWidgetItem(row.tarih_str))
-            self.table_widget.setItem(i, 1, QTableWidgetItem(row.konum))
-            self.table_widget.setItem(i, 2, QTableWidgetItem(row.durum))
+        # Loglar tarih sırasıyla gelir; en yeni üstte olsun diye sıralanmadan ters çevrilir.
+        # Tarihler önbellekte zaten metin; başlığa tıklanınca 'YYYY-MM-DD HH:MM' metin sırası kronolojiktir
+        self.gecmis_modeli.veriyi_ayarla(pd.DataFrame(sonuc['loglar'][::-1]))
+        self.gosterilen_takip_no = takip_no
+        # Bilgi kutusunun açık kaldığı süre ölçüme katılmaz
+        olcum.bitir('handle_customer_sorgula', baslangic)
+        if sessiz:
+            return
             
         QMessageBox.information(self, "Başarılı", f"Kargo {takip_no} bilgileri başarıyla yüklendi.")
 
     def clear_customer_display(self):
+        self.gosterilen_takip_no = None
         self.anlik_durum_label.setStyleSheet("color: #f0f0f0;") 
         self.anlik_durum_label.setText("<h4>Anlık Durum:</h4> Henüz sorgulama yapılmadı.")
         self.eta_label.setText("<h4>Tahmini Teslimat:</h4> -")
-        self.table_widget.setRowCount(0)
-        
+        self.gecmis_modeli.veriyi_ayarla(pd.DataFrame(columns=['tarih', 'konum', 'durum']))
+        
+    # --- Toplu Sorgu Penceresi ---
+    def open_bulk_query_dialog(self):
+        if self.toplu_sorgu_dialog is None:
+            self.toplu_sorgu_dialog = self.create_bulk_query_dialog()
+        self.toplu_sorgu_dialog.show()
+        self.toplu_sorgu_dialog.raise_()
+
+    def create_bulk_query_dialog(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Toplu Kargo Sorgulama")
+        dialog.resize(950, 600)
+        v_layout = QVBoxLayout(dialog)
+
+        v_layout.addWidget(QLabel("Takip numaralarını yapıştırın (satır, boşluk, virgül veya noktalı virgülle ayrılmış) ya da dosyadan yükleyin."))
+        self.toplu_no_input = QPlainTextEdit()
+        self.toplu_no_input.setMaximumHeight(120)
+        v_layout.addWidget(self.toplu_no_input)
+
+        button_layout = QHBoxLayout()
+        dosya_button = QPushButton("Dosyadan Yükle")
+        dosya_button.clicked.connect(self.handle_bulk_query_file)
+        self.toplu_sorgula_button = QPushButton("Toplu Sorgula")
+        self.toplu_sorgula_button.clicked.connect(self.handle_bulk_query)
+        self.toplu_ozet_label = QLabel("")
+        self.toplu_ozet_label.setStyleSheet("color: #3b4a6b;")
+        button_layout.addWidget(dosya_button)
+        button_layout.addWidget(self.toplu_sorgula_button)
+        button_layout.addWidget(self.toplu_ozet_label)
+        button_layout.addStretch()
+        v_layout.addLayout(button_layout)
+
+        self.toplu_table, self.toplu_modeli, self.toplu_proxy = self.create_table_view(
+            [('takip_no', "Takip No"), ('bulundu', "Bulundu"), ('mevcut_durum', "Mevcut Durum"),
+             ('konum', "Konum"), ('son_tarih', "Son Olay"), ('olay_sayisi', "Olay Sayısı"),
+             ('tahmini_teslim', "Tahmini Teslim"), ('kaynak', "Dayanak")]
+        )
+        v_layout.addWidget(self.toplu_table)
+        return dialog
+
+    def handle_bulk_query_file(self):
+        """Numara listesini dosyadan okur (takip_no kolonlu CSV ya da düz metin)."""
+        yol, _ = QFileDialog.getOpenFileName(
+            self.toplu_sorgu_dialog, "Numara Dosyası Seç", "", "Metin/CSV Dosyaları (*.csv *.txt);;Tüm Dosyalar (*)"
+        )
+        if not yol:
+            return
+        try:
+            with open(yol, encoding='utf-8') as f:
+                ilk_satir = f.readline()
+            if yol.lower().endswith('.csv') and 'takip_no' in ilk_satir.split(','):
+                nolar = pd.read_csv(yol, usecols=['takip_no'], dtype=str)['takip_no'].dropna().tolist()
+            else:
+                with open(yol, encoding='utf-8') as f:
+                    nolar = CargoDatabase.takip_no_listesi_coz(f.read())
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self.toplu_sorgu_dialog, "Hata", f"Dosya okunamadı: {e}")
+            return
+        self.toplu_no_input.setPlainText("\n".join(nolar))
+
+    def handle_bulk_query(self):
+        nolar = CargoDatabase.takip_no_listesi_coz(self.toplu_no_input.toPlainText())
+        if not nolar:
+            QMessageBox.warning(self.toplu_sorgu_dialog, "Uyarı", "Lütfen en az bir takip numarası giriniz.")
+            return
+
+        self.toplu_sorgula_button.setEnabled(False)
+        self.toplu_ozet_label.setText(f"{len(nolar)} numara sorgulanıyor...")
+        self.isler.calistir(
+            self.fetch_bulk_query, nolar,
+            bitti=self.show_bulk_query_result,
+            hata=self.handle_bulk_query_error
+        )
+
+    def fetch_bulk_query(self, nolar):
+        # Loglar tek geçişte çekilir; durum/ETA özeti aynı loglardan çıkarılır
+        loglar = self.db.get_logs_many(nolar)
+        return self.db.get_status_many(nolar, loglar)
+
+    def show_bulk_query_result(self, sonuc):
+        self.toplu_sorgula_button.setEnabled(True)
+        bulunan = int(sonuc['bulundu'].sum())
+        sonuc = sonuc.assign(bulundu=sonuc['bulundu'].map({True: "Evet", False: "Hayır"}))
+        self.toplu_modeli.veriyi_ayarla(sonuc)
+        self.toplu_ozet_label.setText(f"{len(sonuc)} numara: {bulunan} bulundu, {len(sonuc) - bulunan} bulunamadı")
+
+    def handle_bulk_query_error(self, mesaj):
+        self.toplu_sorgula_button.setEnabled(True)
+        self.toplu_ozet_label.setText("")
+        QMessageBox.critical(self.toplu_sorgu_dialog, "Hata", f"Toplu sorgu yapılamadı: {mesaj}")
+
     def create_login_form(self):
         login_widget = QWidget()
         login_layout = QGridLayout(login_widget)
@@ -449,12 +597,9 @@ class CargoTrackingApp(QMainWindow):
         user_frame_layout = QVBoxLayout(user_frame)
         
         user_frame_layout.addWidget(QLabel("<h3>Kullanıcı Hesapları</h3>"))
-        self.user_table = QTableWidget()
-        self.user_table.setCornerButtonEnabled(False)
-        self.user_table.verticalHeader().setVisible(False)
-        self.user_table.setColumnCount(3)
-        self.user_table.setHorizontalHeaderLabels(["Kullanıcı Adı", "Şifre (Simülasyon)", "Rol"])
-        self.user_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.user_table, self.kullanici_modeli, self.kullanici_proxy = self.create_table_view(
+            [('kullanici_adi', "Kullanıcı Adı"), ('sifre', "Şifre (Simülasyon)"), ('rol', "Rol")]
+        )
         user_frame_layout.addWidget(self.user_table)
         self.user_table.setMinimumWidth(1000)
         self.user_table.setMinimumHeight(200)
@@ -466,12 +611,37 @@ class CargoTrackingApp(QMainWindow):
         kargo_frame_layout = QVBoxLayout(kargo_frame)
         
         kargo_frame_layout.addWidget(QLabel("<h3>Ana Kargo Bilgileri</h3>"))
-        self.kargo_ana_table = QTableWidget()
-        self.kargo_ana_table.setCornerButtonEnabled(False)
-        self.kargo_ana_table.verticalHeader().setVisible(False)
-        self.kargo_ana_table.setColumnCount(4)
-        self.kargo_ana_table.setHorizontalHeaderLabels(["Takip No", "Gönderici", "Alıcı", "Mevcut Durum"])
-        self.kargo_ana_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.indeks_bilgi_label = QLabel("Takip İndeksi: -")
+        self.indeks_bilgi_label.setStyleSheet("color: #3b4a6b;")
+        kargo_frame_layout.addWidget(self.indeks_bilgi_label)
+        self.onbellek_bilgi_label = QLabel("Sonuç Önbelleği: -")
+        self.onbellek_bilgi_label.setStyleSheet("color: #3b4a6b;")
+        kargo_frame_layout.addWidget(self.onbellek_bilgi_label)
+        self.tarih_hata_label = QLabel("Çözülemeyen Tarihler: -")
+        self.tarih_hata_label.setStyleSheet("color: #3b4a6b;")
+        kargo_frame_layout.addWidget(self.tarih_hata_label)
+        self.karantina_label = QLabel("Karantina: -")
+        self.karantina_label.setStyleSheet("color: #3b4a6b;")
+        kargo_frame_layout.addWidget(self.karantina_label)
+        # Yazarken arama: önek indeksinde çalışır (bkz. kargoArama), tablo taranmaz
+        self.kargo_filtre_input = QLineEdit()
+        self.kargo_filtre_input.setPlaceholderText("Takip no, gönderici veya alıcı adıyla ara (ör. şahin ay)")
+        kargo_frame_layout.addWidget(self.kargo_filtre_input)
+        self.kargo_arama_label = QLabel("")
+        self.kargo_arama_label.setStyleSheet("color: #3b4a6b;")
+        kargo_frame_layout.addWidget(self.kargo_arama_label)
+        self.kargo_ana_table, self.kargo_ana_modeli, self.kargo_ana_proxy = self.create_table_view(
+            [('takip_no', "Takip No"), ('gonderici_ad', "Gönderici"),
+             ('alici_ad', "Alıcı"), ('mevcut_durum', "Mevcut Durum")]
+        )
+        self.df_kargo_ana = None
+        self.df_eta = None
+        self.arama_zamanlayici = QTimer(self)
+        self.arama_zamanlayici.setSingleShot(True)
+        self.arama_zamanlayici.setInterval(ARAMA_GECIKMESI_MS)
+        self.arama_zamanlayici.timeout.connect(self.handle_kargo_ara)
+        self.kargo_filtre_input.textChanged.connect(lambda _: self.arama_zamanlayici.start())
+        self.kargo_filtre_input.returnPressed.connect(self.handle_kargo_ara)
         kargo_frame_layout.addWidget(self.kargo_ana_table)
         self.kargo_ana_table.setMinimumWidth(900)
         self.kargo_ana_table.setMinimumHeight(300)
@@ -481,33 +651,362 @@ class CargoTrackingApp(QMainWindow):
         center_h_layout = QHBoxLayout()
         center_h_layout.addWidget(user_frame)
         
+        # Açık Kargoların Tahmini Teslimleri (ETA modeli, tek geçişte puanlanır)
+        eta_frame = QFrame()
+        eta_frame.setObjectName("ManagerFrame")
+        eta_frame_layout = QVBoxLayout(eta_frame)
+        eta_frame_layout.addWidget(QLabel("<h3>Açık Kargoların Tahmini Teslimleri</h3>"))
+        self.eta_table, self.eta_modeli, self.eta_proxy = self.create_table_view(
+            [('takip_no', "Takip No"), ('konum', "Son Konum"), ('durum', "Son Durum"),
+             ('son_tarih', "Son Olay"), ('tahmini_teslim', "Tahmini Teslim"),
+             ('alt', "En Erken (%10)"), ('ust', "En Geç (%90)"), ('kaynak', "Dayanak")]
+        )
+        eta_frame_layout.addWidget(self.eta_table)
+        self.eta_table.setMinimumWidth(900)
+        self.eta_table.setMinimumHeight(300)
+        self.eta_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
         center_h_layout2 = QHBoxLayout()
         center_h_layout2.addWidget(kargo_frame)
 
+        center_h_layout3 = QHBoxLayout()
+        center_h_layout3.addWidget(eta_frame)
+
+        center_h_layout4 = QHBoxLayout()
+        center_h_layout4.addWidget(self.create_performance_frame())
+
+        center_h_layout0 = QHBoxLayout()
+        center_h_layout0.addWidget(self.create_pano_frame())
+
+        center_h_layout5 = QHBoxLayout()
+        center_h_layout5.addWidget(self.create_aktarim_frame())
+
+        v_layout.addLayout(center_h_layout0)
         v_layout.addLayout(center_h_layout)
         v_layout.addLayout(center_h_layout2)
+        v_layout.addLayout(center_h_layout3)
+        v_layout.addLayout(center_h_layout4)
+        v_layout.addLayout(center_h_layout5)
         return panel
 
+    def create_pano_frame(self):
+        """Operasyon panosu: durum sayıları, konum başına saatlik taramalar, takılı kargolar."""
+        pano_frame = QFrame()
+        pano_frame.setObjectName("ManagerFrame")
+        pano_frame_layout = QVBoxLayout(pano_frame)
+        pano_frame_layout.addWidget(QLabel("<h3>Operasyon Panosu</h3>"))
+
+        kontrol_layout = QHBoxLayout()
+        kontrol_layout.addWidget(QLabel("Takılı kargo eşiği (saat):"))
+        self.takili_esik_kutusu = QSpinBox()
+        self.takili_esik_kutusu.setRange(1, 24 * 90)
+        self.takili_esik_kutusu.setValue(self.takili_esik_saat)
+        self.takili_esik_kutusu.valueChanged.connect(self.handle_takili_esik_degisti)
+        kontrol_layout.addWidget(self.takili_esik_kutusu)
+        self.pano_ozet_label = QLabel("")
+        self.pano_ozet_label.setStyleSheet("color: #3b4a6b;")
+        kontrol_layout.addWidget(self.pano_ozet_label)
+        kontrol_layout.addStretch()
+        pano_frame_layout.addLayout(kontrol_layout)
+
+        self.pano_durum_table, self.pano_durum_modeli, _ = self.create_table_view(
+            [('durum', "Mevcut Durum"), ('kargo', "Kargo")]
+        )
+        self.pano_konum_table, self.pano_konum_modeli, _ = self.create_table_view(
+            [('konum', "Konum"), ('son_saat', "Son Saat"), ('pencere', "Pencere")]
+        )
+        self.pano_takili_table, self.pano_takili_modeli, _ = self.create_table_view(
+            [('takip_no', "Takip No"), ('mevcut_durum', "Mevcut Durum"),
+             ('son_guncelleme', "Son Hareket"), ('bekleme_saat', "Bekleme (saat)")]
+        )
+        tablolar_layout = QHBoxLayout()
+        for table, genislik in ((self.pano_durum_table, 250), (self.pano_konum_table, 350),
+                                (self.pano_takili_table, 450)):
+            table.setMinimumWidth(genislik)
+            table.setMinimumHeight(220)
+            tablolar_layout.addWidget(table)
+        pano_frame_layout.addLayout(tablolar_layout)
+
+        # Panel görünürken pano düzenli yenilenir; toplamlar artımlı olduğundan maliyeti milisaniyelerdir
+        self.pano_zamanlayici = QTimer(self)
+        self.pano_zamanlayici.timeout.connect(self.update_pano)
+        self.pano_zamanlayici.start(PANO_YENILEME_SN * 1000)
+        return pano_frame
+
+    def handle_takili_esik_degisti(self, saat):
+        self.takili_esik_saat = saat
+        self.update_pano()
+
+    def update_pano(self):
+        """Sadece pano toplamlarını arka planda çekip gösterir (tablolar yeniden yüklenmez)."""
+        if self.manager_panel_widget is None or not self.manager_panel_widget.isVisible():
+            return
+        self.isler.calistir(
+            self.db.pano_ozeti, self.takili_esik_saat,
+            bitti=self.fill_pano,
+            hata=lambda mesaj: self.statusBar().showMessage(f"Pano yenilenemedi: {mesaj}", 5000)
+        )
+
+    def fill_pano(self, pano):
+        self.pano_durum_modeli.veriyi_ayarla(pano['durumlar'])
+        self.pano_konum_modeli.veriyi_ayarla(pano['konumlar'])
+        self.pano_takili_modeli.veriyi_ayarla(pano['takililar'])
+        son_saat = pano['son_saat'].strftime('%d/%m/%Y %H:00') if pano['son_saat'] is not None else "-"
+        self.pano_ozet_label.setText(
+            f"Toplam {int(pano['durumlar']['kargo'].sum())} kargo · "
+            f"{pano['esik_saat']}+ saattir hareketsiz: {pano['takili_sayisi']} · "
+            f"Son saat: {son_saat} (pencere {pano['saat_penceresi']} saat)"
+        )
+
+    def update_eta_satirlari(self, takip_nolar):
+        """Tahmin tablosunda sadece verilen kargoların satırlarını yeniden puanlar (tablo taranmaz)."""
+        if self.df_eta is None:
+            return
+        takip_nolar = list(takip_nolar)
+        self.isler.calistir(
+            self.db.acik_kargo_tahminleri, takip_nolar,
+            bitti=lambda yeniler: self.fill_eta_satirlari(takip_nolar, yeniler),
+            hata=lambda mesaj: self.statusBar().showMessage(f"Tahminler yenilenemedi: {mesaj}", 5000)
+        )
+
+    def fill_eta_satirlari(self, takip_nolar, yeniler):
+        if self.df_eta is None:
+            return
+        # Teslim edilen kargolar tablodan düşer, yeni açılanlar eklenir
+        kalan = self.df_eta[~self.df_eta['takip_no'].isin(takip_nolar)]
+        self.df_eta = pd.concat([kalan, yeniler], ignore_index=True) if not yeniler.empty else kalan.reset_index(drop=True)
+        self.eta_modeli.veriyi_ayarla(self.df_eta)
+
+    def handle_kargo_ara(self):
+        """Arama kutusundaki metinle ana kargo tablosunu daraltır; boş metin tüm tabloyu geri getirir."""
+        self.arama_zamanlayici.stop()
+        metin = self.kargo_filtre_input.text().strip()
+        if not metin:
+            self.kargo_arama_label.setText("")
+            if self.df_kargo_ana is not None:
+                self.kargo_ana_modeli.veriyi_ayarla(self.df_kargo_ana)
+            return
+        self.isler.calistir(
+            self.db.kargo_ara, metin,
+            bitti=lambda sonuc: self.fill_kargo_arama(metin, sonuc),
+            hata=lambda mesaj: self.statusBar().showMessage(f"Arama yapılamadı: {mesaj}", 5000)
+        )
+
+    def fill_kargo_arama(self, metin, sonuc):
+        # Yazma sürerken geç gelen eski sorgu sonuçları gösterilmez
+        if metin != self.kargo_filtre_input.text().strip():
+            return
+        df, toplam = sonuc
+        self.kargo_ana_modeli.veriyi_ayarla(df)
+        gosterilen = f" (ilk {len(df)} gösteriliyor)" if toplam > len(df) else ""
+        self.kargo_arama_label.setText(f"'{metin}': {toplam} kargo{gosterilen}")
+
+    def create_performance_frame(self):
+        """Performans: işlem başına gecikme yüzdelikleri, taranan satır ve yazılan bayt."""
+        perf_frame = QFrame()
+        perf_frame.setObjectName("ManagerFrame")
+        perf_frame_layout = QVBoxLayout(perf_frame)
+        perf_frame_layout.addWidget(QLabel("<h3>Performans</h3>"))
+
+        kontrol_layout = QHBoxLayout()
+        self.olcum_kutusu = QCheckBox("Ölçüm açık")
+        self.olcum_kutusu.setChecked(olcum.etkin)
+        self.olcum_kutusu.toggled.connect(self.handle_olcum_toggled)
+        kontrol_layout.addWidget(self.olcum_kutusu)
+        yenile_button = QPushButton("Yenile")
+        yenile_button.clicked.connect(self.update_manager_panel)
+        kontrol_layout.addWidget(yenile_button)
+        sifirla_button = QPushButton("Sıfırla")
+        sifirla_button.clicked.connect(self.handle_olcum_sifirla)
+        kontrol_layout.addWidget(sifirla_button)
+        prometheus_button = QPushButton("Prometheus Dosyasına Yaz")
+        prometheus_button.clicked.connect(self.handle_prometheus_yaz)
+        kontrol_layout.addWidget(prometheus_button)
+        kontrol_layout.addStretch()
+        perf_frame_layout.addLayout(kontrol_layout)
+
+        self.perf_table, self.perf_modeli, self.perf_proxy = self.create_table_view(
+            [('islem', "İşlem"), ('adet', "Çağrı"), ('ortalama_ms', "Ort. (ms)"),
+             ('p50_ms', "p50 (ms)"), ('p95_ms', "p95 (ms)"), ('p99_ms', "p99 (ms)"),
+             ('en_buyuk_ms', "En Büyük (ms)"), ('satir_taranan', "Taranan Satır"),
+             ('bayt_yazilan', "Yazılan Bayt")]
+        )
+        perf_frame_layout.addWidget(self.perf_table)
+        self.perf_table.setMinimumWidth(900)
+        self.perf_table.setMinimumHeight(200)
+        self.perf_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        return perf_frame
+
+    def handle_olcum_toggled(self, acik):
+        olcum.etkin = acik
+        self.statusBar().showMessage("Performans ölçümü açıldı." if acik else "Performans ölçümü kapatıldı.", 5000)
+
+    def handle_olcum_sifirla(self):
+        olcum.sifirla()
+        self.perf_modeli.veriyi_ayarla(pd.DataFrame(olcum.ozet(), columns=OZET_KOLONLARI))
+
+    def handle_prometheus_yaz(self):
+        yol, _ = QFileDialog.getSaveFileName(
+            self, "Prometheus Dosyası", self.db.motor.dosya_yolu(PROMETHEUS_DOSYASI),
+            "Prometheus Metin Dosyaları (*.prom)"
+        )
+        if not yol:
+            return
+        try:
+            olcum.prometheus_yaz(yol)
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", f"Prometheus dosyası yazılamadı: {e}")
+            return
+        self.statusBar().showMessage(f"Ölçümler yazıldı: {yol}", 5000)
+
+    def create_aktarim_frame(self):
+        """Rapor dışa aktarımı: tarih aralığı, şube ve durum filtresiyle olaylar CSV / JSON Lines olarak."""
+        aktarim_frame = QFrame()
+        aktarim_frame.setObjectName("ManagerFrame")
+        aktarim_frame_layout = QVBoxLayout(aktarim_frame)
+        aktarim_frame_layout.addWidget(QLabel("<h3>Rapor Dışa Aktarımı</h3>"))
+
+        kontrol_layout = QHBoxLayout()
+        bugun = QDate.currentDate()
+        self.aktarim_baslangic_input = QDateEdit(bugun.addDays(-7))
+        self.aktarim_bitis_input = QDateEdit(bugun)
+        for kutu, etiket in ((self.aktarim_baslangic_input, "Başlangıç:"), (self.aktarim_bitis_input, "Bitiş:")):
+            kutu.setCalendarPopup(True)
+            kutu.setDisplayFormat("dd.MM.yyyy")
+            kontrol_layout.addWidget(QLabel(etiket))
+            kontrol_layout.addWidget(kutu)
+        self.aktarim_konum_input = QLineEdit()
+        self.aktarim_konum_input.setPlaceholderText("Şube / konum (virgülle ayırın, boş: tümü)")
+        kontrol_layout.addWidget(self.aktarim_konum_input)
+        self.aktarim_durum_combo = QComboBox()
+        self.aktarim_durum_combo.addItems(["Tüm Durumlar"] + DURUMLAR)
+        kontrol_layout.addWidget(self.aktarim_durum_combo)
+        self.aktarim_button = QPushButton("Dışa Aktar")
+        self.aktarim_button.clicked.connect(self.handle_disa_aktar)
+        kontrol_layout.addWidget(self.aktarim_button)
+        aktarim_frame_layout.addLayout(kontrol_layout)
+
+        self.aktarim_cubugu = QProgressBar()
+        self.aktarim_cubugu.setVisible(False)
+        aktarim_frame_layout.addWidget(self.aktarim_cubugu)
+        self.aktarim_durum_label = QLabel("")
+        self.aktarim_durum_label.setStyleSheet("color: #3b4a6b;")
+        aktarim_frame_layout.addWidget(self.aktarim_durum_label)
+        return aktarim_frame
+
+    def handle_disa_aktar(self):
+        """Seçilen aralıktaki olayları arka planda, dilim dilim dosyaya yazar (bkz. kargoDisaAktarim)."""
+        yol, _ = QFileDialog.getSaveFileName(
+            self, "Raporu Kaydet", "", "CSV Dosyaları (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not yol:
+            return
+        baslangic = tarih_siniri(self.aktarim_baslangic_input.date().toString("yyyy-MM-dd"))
+        bitis = tarih_siniri(self.aktarim_bitis_input.date().toString("yyyy-MM-dd"), bitis=True)
+        konumlar = [konum.strip() for konum in self.aktarim_konum_input.text().split(",") if konum.strip()]
+        durumlar = [self.aktarim_durum_combo.currentText()] if self.aktarim_durum_combo.currentIndex() > 0 else None
+
+        self.aktarim_button.setEnabled(False)
+        # QProgressBar int32 sınırlıdır; on milyonlarca log için binde oran gösterilir
+        self.aktarim_cubugu.setRange(0, 1000)
+        self.aktarim_cubugu.setValue(0)
+        self.aktarim_cubugu.setVisible(True)
+        self.aktarim_durum_label.setText("Dışa aktarım başladı...")
+        self.isler.calistir(
+            disa_aktar, self.db, yol, None, baslangic, bitis, konumlar or None, durumlar,
+            ilerleme=self.aktarim_ilerledi,
+            bitti=lambda adet: self.handle_aktarim_finished(yol, adet),
+            hata=self.handle_aktarim_error
+        )
+
+    def aktarim_ilerledi(self, durum):
+        yazilan, taranan, toplam = durum
+        self.aktarim_cubugu.setValue(int(1000 * taranan / toplam) if toplam else 1000)
+        self.aktarim_durum_label.setText(f"{taranan}/{toplam} log tarandı, {yazilan} satır yazıldı...")
+
+    def handle_aktarim_finished(self, yol, adet):
+        self.aktarim_button.setEnabled(True)
+        self.aktarim_cubugu.setVisible(False)
+        self.aktarim_durum_label.setText(f"Son aktarım: {adet} olay -> {yol}")
+        self.statusBar().showMessage(f"Rapor yazıldı: {yol}", 5000)
+
+    def handle_aktarim_error(self, mesaj):
+        self.aktarim_button.setEnabled(True)
+        self.aktarim_cubugu.setVisible(False)
+        self.aktarim_durum_label.setText("")
+        QMessageBox.critical(self, "Hata", f"Rapor dışa aktarılamadı: {mesaj}")
+
     def update_manager_panel(self):
-        """Yönetici Paneli verilerini CSV'den yükler."""
-        # Kullanıcı Tablosu
-        if self.db.kullanicilar_df is not None:
-            df_user = self.db.kullanicilar_df
-            self.user_table.setRowCount(len(df_user))
-            for i, row in enumerate(df_user.itertuples()):
-                self.user_table.setItem(i, 0, QTableWidgetItem(str(row.kullanici_adi)))
-                self.user_table.setItem(i, 1, QTableWidgetItem(str(row.sifre)))
-                self.user_table.setItem(i, 2, QTableWidgetItem(str(row.rol)))
-
-        # Kargo Ana Tablosu
-        if self.db.kargolar_ana_df is not None:
-            df_kargo_ana = self.db.kargolar_ana_df
-            self.kargo_ana_table.setRowCount(len(df_kargo_ana))
-            for i, row in enumerate(df_kargo_ana.itertuples()):
-                self.kargo_ana_table.setItem(i, 0, QTableWidgetItem(str(row.takip_no)))
-                self.kargo_ana_table.setItem(i, 1, QTableWidgetItem(str(row.gonderici_ad)))
-                self.kargo_ana_table.setItem(i, 2, QTableWidgetItem(str(row.alici_ad)))
-                self.kargo_ana_table.setItem(i, 3, QTableWidgetItem(str(row.mevcut_durum)))
+        """Yönetici Paneli verilerini arka planda çekip tablolara bağlar."""
+        baslangic = olcum.baslat()
+
+        def doldur(veriler):
+            self.fill_manager_panel(veriler)
+            olcum.bitir('update_manager_panel', baslangic)
+
+        self.isler.calistir(
+            self.fetch_manager_data,
+            bitti=doldur,
+            hata=lambda mesaj: QMessageBox.critical(self, "Hata", f"Yönetici paneli yüklenemedi: {mesaj}")
+        )
+
+    def fetch_manager_data(self):
+        # SQLite motorunda bu tablolar sorguyla üretilir; arayüz iş parçacığında çalışmamalı
+        return (
+            self.db.kullanicilar_df, self.db.kargolar_ana_df,
+            self.db.indeks_bilgisi(), self.db.onbellek_istatistigi(),
+            self.db.acik_kargo_tahminleri(), olcum.ozet(), self.db.tarih_hatalari(),
+            self.db.pano_ozeti(self.takili_esik_saat), self.db.dogrulama_hatalari()
+        )
+
+    def fill_manager_panel(self, veriler):
+        (df_user, df_kargo_ana, (kargo_sayisi, indeks_bayt), onbellek, df_eta, performans,
+         tarih_hatalari, pano, karantina) = veriler
+        self.yonetici_paneli()
+        self.fill_pano(pano)
+        # Tablolar modele referansla bağlanır; hücreler sadece görüntülenirken metne çevrilir
+        if df_user is not None:
+            self.kullanici_modeli.veriyi_ayarla(df_user)
+
+        if df_kargo_ana is not None:
+            self.df_kargo_ana = df_kargo_ana
+            if self.kargo_filtre_input.text().strip():
+                self.handle_kargo_ara()
+            else:
+                self.kargo_ana_modeli.veriyi_ayarla(df_kargo_ana)
+
+        self.df_eta = df_eta
+        self.eta_modeli.veriyi_ayarla(df_eta)
+        self.perf_modeli.veriyi_ayarla(pd.DataFrame(performans, columns=OZET_KOLONLARI))
+
+        # Takip indeksinin boyutu (makine kapasitesi planlaması için)
+        self.indeks_bilgi_label.setText(
+            f"Takip İndeksi: {kargo_sayisi} kargo, {indeks_bayt / (1024 * 1024):.2f} MB"
+        )
+        # Önbellek boyutunu (KARGO_ONBELLEK_BOYUTU) ayarlamak için sayaçlar
+        self.onbellek_bilgi_label.setText(
+            f"Sonuç Önbelleği: {onbellek['boyut']}/{onbellek['kapasite']} kayıt, "
+            f"isabet {onbellek['isabet']}, ıskalama {onbellek['iskalama']}, "
+            f"tahliye {onbellek['tahliye']} (isabet oranı %{onbellek['isabet_orani'] * 100:.1f})"
+        )
+        # Hiçbir tarih biçimine uymayan satırlar tarihsiz yüklenir; ilk örnek düzeltme için gösterilir
+        if tarih_hatalari.empty:
+            self.tarih_hata_label.setText("Çözülemeyen Tarihler: yok")
+        else:
+            ilk = tarih_hatalari.iloc[0]
+            satir = f":{ilk['satir']}" if not pd.isna(ilk['satir']) else ""
+            self.tarih_hata_label.setText(
+                f"Çözülemeyen Tarihler: {len(tarih_hatalari)} satır (ör. {ilk['kaynak']}{satir} → '{ilk['deger']}')"
+            )
+        # Doğrulamadan geçemeyen loglar: neden başına sayılar (ayrıntı karantina dosyalarında)
+        if karantina.empty:
+            self.karantina_label.setText("Karantina: yok")
+        else:
+            nedenler = karantina['neden'].str.split(':').str[0].value_counts()
+            self.karantina_label.setText(
+                f"Karantina: {len(karantina)} log (" + ", ".join(f"{neden}: {adet}" for neden, adet in nedenler.items())
+                + f") → {KARANTINA_DOSYASI}, {YUKLEME_KARANTINA_DOSYASI}"
+            )
 
     def create_data_entry_form(self):
         form_widget = QWidget()
@@ -539,17 +1038,22 @@ class CargoTrackingApp(QMainWindow):
         form_layout.addRow(QLabel("Yeni Konum:"), self.personnel_konum_input)
         
         self.personnel_durum_combo = QComboBox()
-        self.personnel_durum_combo.addItems([
-            "Kabul Edildi", "Transfer Sürecinde", "Merkeze Ulaştı", 
-            "Dağıtıma Çıktı", "Teslim Edildi", "Adreste Bulunamadı"
-        ])
+        self.personnel_durum_combo.addItems(DURUMLAR)
         form_layout.addRow(QLabel("Yeni Durum:"), self.personnel_durum_combo)
         
         self.guncelle_button = QPushButton("Durumu Kaydet (Veri Girişi)")
         self.guncelle_button.clicked.connect(self.handle_personnel_guncelle)
         
+        # Hub tarayıcılarının döküm dosyalarını toplu aktarma
+        self.import_button = QPushButton("Tarayıcı Dosyası İçe Aktar (CSV)")
+        self.import_button.clicked.connect(self.handle_tarayici_import)
+        self.import_durum_label = QLabel("")
+        self.import_durum_label.setStyleSheet("color: #3b4a6b;")
+        
         form_v_layout.addLayout(form_layout)
         form_v_layout.addWidget(self.guncelle_button)
+        form_v_layout.addWidget(self.import_button)
+        form_v_layout.addWidget(self.import_durum_label)
         
         center_h_layout = QHBoxLayout()
         center_h_layout.addStretch()
@@ -577,12 +1081,57 @@ class CargoTrackingApp(QMainWindow):
         if not takip_no or not konum:
             QMessageBox.critical(self, "Hata", "Lütfen Takip Numarası ve Konum alanlarını doldurunuz.")
             return
+        # Geçmiş gerektirmeyen kontroller kuyruğa girmeden yapılır; hatalı giriş formda kalır
+        neden = bicim_nedeni(takip_no, durum) if self.db.dogrulama else None
+        if neden is not None:
+            QMessageBox.critical(self, "Hata", f"Kargo {takip_no} kaydedilemez ({neden}).")
+            self.personnel_takip_input.selectAll()
+            self.personnel_takip_input.setFocus()
+            return
 
-        self.db.add_log(takip_no, konum, durum)
-        QMessageBox.information(self, "Başarılı", f"Kargo {takip_no} için yeni durum ({durum}) başarıyla kaydedildi.")
+        # Kayıt sıralı yazma kuyruğuna girer; form bir sonraki taramaya hemen hazırdır
+        self.isler.yaz(
+            self.db.add_log, takip_no, konum, durum,
+            bitti=lambda _: self.statusBar().showMessage(
+                f"Kargo {takip_no} için yeni durum ({durum}) başarıyla kaydedildi.", 5000
+            ),
+            hata=lambda mesaj: self.handle_personnel_hatasi(takip_no, konum, durum, mesaj)
+        )
         
         self.personnel_takip_input.clear()
         self.personnel_konum_input.clear()
+        self.personnel_takip_input.setFocus()
+
+    def handle_personnel_hatasi(self, takip_no, konum, durum, mesaj):
+        """Geçmişe göre reddedilen (ör. geçersiz geçiş) olay, form boşsa düzeltilmek üzere geri yüklenir."""
+        if not self.personnel_takip_input.text().strip() and not self.personnel_konum_input.text().strip():
+            self.personnel_takip_input.setText(takip_no)
+            self.personnel_konum_input.setText(konum)
+            self.personnel_durum_combo.setCurrentText(durum)
+        QMessageBox.critical(self, "Hata", f"Kargo {takip_no} kaydedilemedi: {mesaj}")
+
+    def handle_tarayici_import(self):
+        """Tarayıcı döküm CSV'sini (takip_no, konum, durum[, tarih]) parça parça sisteme aktarır."""
+        yol, _ = QFileDialog.getOpenFileName(self, "Tarayıcı Dosyası Seç", "", "CSV Dosyaları (*.csv)")
+        if not yol:
+            return
+
+        self.import_button.setEnabled(False)
+        self.isler.yaz(
+            self.db.tarayici_dosyasi_aktar, yol,
+            ilerleme=lambda adet: self.import_durum_label.setText(f"{adet} olay aktarıldı..."),
+            bitti=self.handle_import_finished,
+            hata=self.handle_import_error
+        )
+
+    def handle_import_finished(self, adet):
+        self.import_button.setEnabled(True)
+        self.import_durum_label.setText(f"Son aktarım: {adet} olay")
+        QMessageBox.information(self, "Başarılı", f"{adet} tarama olayı başarıyla kaydedildi.")
+
+    def handle_import_error(self, mesaj):
+        self.import_button.setEnabled(True)
+        QMessageBox.critical(self, "Hata", f"Tarayıcı dosyası aktarılamadı: {mesaj}")
 
 
 # --- 5. Qt Style Sheet Tanımı (Açık Tema) ---
@@ -683,7 +1232,7 @@ QLabel h4 {
 /* ===============================
    TABLO
    =============================== */
-QTableWidget {
+QTableView {
     background-color: white;
     alternate-background-color: #f2f4f7;
     color: #0a1f44;
@@ -0,0 +1,178 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+TARIH_FORMATI = '%Y-%m-%d %H:%M'
+
+# --- Tarih Biçimleri ---
+# Her biçim sabit genişlikli bir şablondur: Y yıl, A ay, G gün, S saat, D dakika, N saniye
+# hanesi (rakam olmalı); diğer karakterler aynen eşleşir. Şablonlar birbirini dışlar, bu yüzden
+# her satırın biçimi satır satır tahmin edilmeden, karakter matrisi üzerinde maskelerle bulunur.
+TARIH_SABLONLARI = {
+    'iso': 'YYYY-AA-GG SS:DD',              # 2025-12-15 18:30 (TARIH_FORMATI)
+    'iso_saniyeli': 'YYYY-AA-GG SS:DD:NN',  # 2025-12-15 18:30:00 (SQLite / pandas çıktısı)
+    'tr_nokta': 'GG.AA.YYYY SS:DD',         # 15.12.2025 18:30
+    'tr_egik': 'GG/AA/YYYY SS:DD',          # 15/12/2025 18:30
+}
+_ALAN_HARFLERI = frozenset('YAGSDN')
+# En uzun şablondan bir fazla; son sütunu dolu metin hiçbir şablona uymaz
+_MATRIS_GENISLIGI = max(len(sablon) for sablon in TARIH_SABLONLARI.values()) + 1
+# Boş / çözülemeyen tarihin epoch dakikası (NaT ile aynı bit deseni)
+TARIH_YOK = np.iinfo(np.int64).min
+_DAKIKA_NS = 60 * 10 ** 9
+_AY_GUNLERI = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+# Çözülemeyen tarih raporunun kolonları (kaynak dosya, satır numarası, ham değer)
+TARIH_HATA_KOLONLARI = ['kaynak', 'satir', 'deger']
+# Gösterim metni önbelleği (epoch dakikası -> 'YYYY-MM-DD HH:MM'); 90 günlük veri ~130 bin dakikadır
+TARIH_METNI_ONBELLEGI = int(os.environ.get("KARGO_TARIH_METNI_ONBELLEGI", "262144"))
+
+
+def _karakter_sutunlari(metinler):
+    """Metinleri (karakter konumu, satır) kod matrisine çevirir: ASCII ise bayt, değilse UTF-32 kodları.
+
+    Her karakter konumu bitişik bir satırdır; şablon karşılaştırmaları sütun sütun hızlı yapılır.
+    """
+    try:
+        dizi = metinler.astype(f"S{_MATRIS_GENISLIGI}")
+        kodlar = dizi.view(np.uint8)
+    except UnicodeEncodeError:
+        dizi = metinler.astype(f"U{_MATRIS_GENISLIGI}")
+        kodlar = dizi.view(np.uint32)
+    return np.ascontiguousarray(kodlar.reshape(len(dizi), _MATRIS_GENISLIGI).T)
+
+
+def _sablon_maskesi(sutunlar, rakam, sablon):
+    maske = sutunlar[len(sablon)] == 0
+    for i, karakter in enumerate(sablon):
+        maske &= rakam[i] if karakter in _ALAN_HARFLERI else sutunlar[i] == ord(karakter)
+    return maske
+
+
+def _alan(sutunlar, sablon, harf):
+    deger = None
+    for i, karakter in enumerate(sablon):
+        if karakter == harf:
+            hane = sutunlar[i].astype(np.int32) - 48
+            deger = hane if deger is None else deger * 10 + hane
+    return deger
+
+
+def _gun_sayisi(yil, ay, gun):
+    """1970-01-01'den itibaren gün sayısı (proleptik Gregoryen takvim, vektörel)."""
+    yil = yil - (ay <= 2)
+    donem = yil // 400
+    donem_yili = yil - donem * 400
+    yil_gunu = (153 * (ay + np.where(ay > 2, -3, 9)) + 2) // 5 + gun - 1
+    donem_gunu = donem_yili * 365 + donem_yili // 4 - donem_yili // 100 + yil_gunu
+    return donem * 146097 + donem_gunu - 719468
+
+
+def _sablonu_coz(sutunlar, sablon):
+    """Şablona uyan satırların epoch dakikaları; takvimde olmayan gün/saat TARIH_YOK olur."""
+    yil, ay, gun, saat, dakika = (_alan(sutunlar, sablon, harf) for harf in 'YAGSD')
+    artik = (yil % 4 == 0) & ((yil % 100 != 0) | (yil % 400 == 0))
+    ay_gunu = _AY_GUNLERI[np.clip(ay, 0, 12)] + ((ay == 2) & artik)
+    gecerli = (ay >= 1) & (ay <= 12) & (gun >= 1) & (gun <= ay_gunu) & (saat < 24) & (dakika < 60)
+    if 'N' in sablon:
+        gecerli &= _alan(sutunlar, sablon, 'N') < 60
+    sonuc = _gun_sayisi(yil, ay, gun).astype(np.int64) * 1440 + saat * 60 + dakika
+    return np.where(gecerli, sonuc, TARIH_YOK)
+
+
+def _metin_dakikalari(metinler):
+    dakikalar = np.full(len(metinler), TARIH_YOK, dtype=np.int64)
+    if not len(metinler):
+        return dakikalar, np.zeros(0, dtype=bool)
+    sutunlar = _karakter_sutunlari(metinler)
+    bos = sutunlar[0] == 0
+    # Her şablon sadece önceki şablonlara uymayan satırlarda denenir (çoğunluk ilk şablondadır)
+    kalan = None
+    for sablon in TARIH_SABLONLARI.values():
+        alt = sutunlar if kalan is None else sutunlar[:, kalan]
+        maske = _sablon_maskesi(alt, (alt >= 48) & (alt <= 57), sablon)
+        if maske.all() and kalan is None:
+            return _sablonu_coz(sutunlar, sablon), bos
+        uyan = np.flatnonzero(maske)
+        if len(uyan):
+            satirlar = uyan if kalan is None else kalan[uyan]
+            dakikalar[satirlar] = _sablonu_coz(alt[:, uyan], sablon)
+        kalan = np.flatnonzero(~maske) if kalan is None else kalan[~maske]
+        if not len(kalan):
+            break
+    return dakikalar, bos
+
+
+def tarih_dakikalari(seri):
+    """Tarih metinlerini kanonik epoch dakikalarına (int64) çevirir.
+
+    Her satırın biçimi TARIH_SABLONLARI maskeleriyle bulunur ve grup kendi biçimiyle çözülür
+    (saniyeler atılır). (dakikalar, hatali) döndürür: boş değerler ve çözülemeyenler TARIH_YOK'tur;
+    hatali, boş olmayıp hiçbir biçime uymayan ya da takvimde olmayan satırları işaretler.
+    """
+    if pd.api.types.is_datetime64_any_dtype(seri):
+        degerler = seri.to_numpy(dtype='datetime64[m]')
+        return np.where(np.isnat(degerler), TARIH_YOK, degerler.view(np.int64)), np.zeros(len(seri), dtype=bool)
+    metinler = seri.to_numpy(dtype=object, na_value='')
+    dakikalar, bos = _metin_dakikalari(metinler)
+    hatali = (dakikalar == TARIH_YOK) & ~bos
+    if hatali.any():
+        # Baştaki/sondaki boşluklar (elle düzenlenmiş dosyalar) sadece uymayan satırlarda kırpılır
+        satirlar = np.flatnonzero(hatali)
+        kirpilmis = np.array([str(metin).strip() for metin in metinler[satirlar]], dtype=object)
+        dakikalar[satirlar], bos = _metin_dakikalari(kirpilmis)
+        hatali[satirlar] = (dakikalar[satirlar] == TARIH_YOK) & ~bos
+    return dakikalar, hatali
+
+
+def dakikalardan_tarihler(dakikalar):
+    """Epoch dakikalarını datetime64[ns] dizisine çevirir (TARIH_YOK -> NaT)."""
+    return np.where(dakikalar == TARIH_YOK, TARIH_YOK, dakikalar * _DAKIKA_NS).view('M8[ns]')
+
+
+def tarihleri_coz(seri, hatalar=None):
+    """Tarih kolonunu karışık (ISO + TR) biçimlerden, satır bazında doğru biçimle çözer.
+
+    Çözülemeyen (boş olmayan) değerler NaT olur; hatalar listesi verilirse bu satırlar
+    (satir = seri indeksi, deger = ham metin) DataFrame'i olarak listeye eklenir.
+    """
+    dakikalar, hatali = tarih_dakikalari(seri)
+    if hatalar is not None and hatali.any():
+        hatalar.append(pd.DataFrame({
+            'satir': seri.index[hatali], 'deger': seri.to_numpy(dtype=object)[hatali]
+        }))
+    return pd.Series(dakikalardan_tarihler(dakikalar), index=seri.index, name=seri.name)
+
+
+def tarih_hata_tablosu(kaynak, hatalar, satir_kaymasi=None):
+    """tarihleri_coz'un topladığı hataları TARIH_HATA_KOLONLARI tablosuna çevirir.
+
+    satir_kaymasi verilirse satir, indeks + kayma (dosyadaki satır numarası) olur; verilmezse boştur.
+    """
+    hata = pd.concat(hatalar, ignore_index=True)
+    satir = hata['satir'] + satir_kaymasi if satir_kaymasi is not None else pd.NA
+    return pd.DataFrame({'kaynak': kaynak, 'satir': satir, 'deger': hata['deger']}, columns=TARIH_HATA_KOLONLARI)
+
+
+# --- Gösterim Metinleri ---
+def tarih_metinleri(seri):
+    """Tarih kolonunu TARIH_FORMATI metinlerine çevirir (vektörel; strftime'dan çok daha hızlı)."""
+    degerler = seri.to_numpy(dtype='datetime64[m]')
+    if not len(degerler):
+        return np.empty(0, dtype=object)
+    metinler = np.char.replace(np.datetime_as_string(degerler, unit='m'), 'T', ' ').astype(object)
+    metinler[np.isnat(degerler)] = ''
+    return metinler
+
+
+@lru_cache(maxsize=TARIH_METNI_ONBELLEGI)
+def dakika_metni(dakika):
+    """Epoch dakikasının TARIH_FORMATI metni (önbellekli; aynı dakikadaki olaylar tek kez biçimlenir)."""
+    return str(np.datetime64(dakika, 'm')).replace('T', ' ')
+
+
+def tarih_metni(tarih):
+    """Tek bir Timestamp'in TARIH_FORMATI metni; boşsa None. Sorgu başına strftime yerine kullanılır."""
+    if tarih is None or tarih is pd.NaT or pd.isna(tarih):
+        return None
+    return dakika_metni(tarih.value // _DAKIKA_NS)
@@ -0,0 +1,190 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+from kargoDepolama import (
+    LOGLAR_DOSYASI, KULLANICILAR_DOSYASI, KARGOLAR_ANA_DOSYASI, LOG_KOLONLARI,
+    ANA_KOLONLARI, KULLANICI_KOLONLARI, VARSAYILAN_KULLANICILAR
+)
+
+# Kıyaslama ve yük testleri için gerçekçi, tekrarlanabilir (tohumlu) sentetik veri üretici
+SEHIRLER = [
+    "İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Adana", "Konya", "Gaziantep",
+    "Şanlıurfa", "Kocaeli", "Mersin", "Diyarbakır", "Hatay", "Manisa", "Kayseri",
+    "Samsun", "Balıkesir", "Kahramanmaraş", "Van", "Aydın", "Denizli", "Sakarya",
+    "Tekirdağ", "Muğla", "Eskişehir", "Mardin", "Trabzon", "Malatya", "Erzurum", "Sivas",
+]
+ADLAR = ["Ahmet", "Mehmet", "Ayşe", "Fatma", "Mustafa", "Zeynep", "Emre", "Elif", "Can", "Deniz",
+         "Berrin", "Esra", "Burak", "Selin", "Oğuz", "Gülşen", "İbrahim", "Şule", "Çağla", "Ömer"]
+SOYADLAR = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Aydın", "Öztürk", "Arslan",
+            "Doğan", "Kılıç", "Aslan", "Çetin", "Koç", "Kurt", "Özdemir", "Şimşek", "Polat"]
+SIRKETLER = ["Teknoloji A.Ş.", "Kitap Evi", "Tekstil Ltd.", "Elektronik A.Ş.", "Gıda San.",
+             "Mobilya Ltd.", "Kozmetik A.Ş.", "Oyuncak Dünyası", "Spor Mağazası", "Eczane"]
+
+# Durum akışı: Kabul -> 1-3 Transfer -> Merkeze Ulaştı -> Dağıtıma Çıktı
+#              -> (Adreste Bulunamadı -> Dağıtıma Çıktı)* -> Teslim Edildi
+KABUL, TRANSFER, MERKEZ, DAGITIM, TESLIM, ADRESTE_YOK = range(6)
+DURUM_ADLARI = np.array([
+    "Kabul Edildi", "Transfer Sürecinde", "Merkeze Ulaştı",
+    "Dağıtıma Çıktı", "Teslim Edildi", "Adreste Bulunamadı"
+], dtype=object)
+# Her durumdan önceki bekleme (dakika): log-normal medyan ve yayılım
+BEKLEME_MEDYAN_DK = np.array([0, 600, 480, 360, 240, 300])
+BEKLEME_YAYILIM = 0.6
+ADRESTE_YOK_ORANI = 0.08
+# Bir kargonun ortalama olay sayısı (kargo sayısını istenen olay sayısından tahmin etmek için)
+ORTALAMA_OLAY = 6.2
+TAKIP_NO_TABANI = 1_000_000_000
+YAZMA_PARCASI = 500_000
+
+
+def _konum_adlari():
+    """Konum kodu -> ad: şehir başına şube, transfer merkezi, ana merkez ve dağıtım birimi."""
+    turler = ["Şube", "Transfer Merkezi", "Ana Merkezi", "Dağıtım"]
+    return np.array([f"{sehir} {tur}" for sehir in SEHIRLER for tur in turler], dtype=object)
+
+
+def _olaylari_uret(kargo_sayisi, gun, rng):
+    """Tüm olayları sayısal dizilerle üretir: (kargo, dakika, konum kodu, durum kodu), tarih sıralı."""
+    transfer = rng.integers(1, 4, kargo_sayisi)
+    tekrar = np.where(rng.random(kargo_sayisi) < ADRESTE_YOK_ORANI, rng.integers(1, 3, kargo_sayisi), 0)
+    uzunluk = transfer + 4 + 2 * tekrar
+
+    kargo = np.repeat(np.arange(kargo_sayisi), uzunluk)
+    # Kargo içindeki adım numarası
+    adim = np.arange(len(kargo)) - np.repeat(np.cumsum(uzunluk) - uzunluk, uzunluk)
+    t = transfer[kargo]
+    q = adim - (t + 3)
+    durum = np.select(
+        [adim == 0, adim <= t, adim == t + 1, adim == t + 2, q < 0, q < 2 * tekrar[kargo]],
+        [KABUL, TRANSFER, MERKEZ, DAGITIM, DAGITIM, np.where(q % 2 == 0, ADRESTE_YOK, DAGITIM)],
+        TESLIM
+    )
+
+    kaynak_sehir = rng.integers(0, len(SEHIRLER), kargo_sayisi)[kargo]
+    hedef_sehir = rng.integers(0, len(SEHIRLER), kargo_sayisi)[kargo]
+    ara_sehir = rng.integers(0, len(SEHIRLER), len(kargo))
+    sehir = np.select([durum == KABUL, durum == TRANSFER], [kaynak_sehir, ara_sehir], hedef_sehir)
+    tur = np.select(
+        [durum == KABUL, durum == TRANSFER, durum == MERKEZ, durum == TESLIM], [0, 1, 2, 0], 3
+    )
+    konum = sehir * 4 + tur
+
+    # Kargolar son `gun` güne yayılır; son günlerde başlayanların akışı henüz sürmektedir
+    baslangic = rng.integers(0, gun * 24 * 60, kargo_sayisi)[kargo]
+    bekleme = np.rint(BEKLEME_MEDYAN_DK[durum] * rng.lognormal(0, BEKLEME_YAYILIM, len(kargo))).astype(np.int64)
+    bekleme[adim == 0] = 0
+    # Kargo içinde birikimli bekleme
+    toplam = np.cumsum(bekleme)
+    ilk = np.cumsum(uzunluk) - uzunluk
+    dakika = baslangic + toplam - np.repeat(toplam[ilk] - bekleme[ilk], uzunluk)
+    gecerli = dakika < gun * 24 * 60
+    kargo, dakika, konum, durum = kargo[gecerli], dakika[gecerli], konum[gecerli], durum[gecerli]
+    sira = np.argsort(dakika, kind='stable')
+    return kargo[sira], dakika[sira], konum[sira], durum[sira]
+
+
+def olay_tablosu(olay_sayisi, tohum=0, gun=90, baslangic='2025-10-01'):
+    """Yaklaşık olay_sayisi olaylık, tarih sıralı log tablosu (LOG_KOLONLARI; tarih Timestamp) üretir.
+
+    Dosya yazılmaz; doğrulama gibi bellek içi kıyaslamalar içindir. tohum bir np.random.Generator
+    da olabilir (çağıran aynı üreticiyle devam edebilir).
+    """
+    rng = np.random.default_rng(tohum)
+    kargo, dakika, konum, durum = _olaylari_uret(max(1, int(olay_sayisi / ORTALAMA_OLAY)), gun, rng)
+    return pd.DataFrame({
+        'takip_no': (TAKIP_NO_TABANI + kargo).astype(str).astype(object),
+        'tarih': pd.Timestamp(baslangic) + pd.to_timedelta(dakika, unit='m'),
+        'konum': _konum_adlari()[konum],
+        'durum': DURUM_ADLARI[durum],
+    })[LOG_KOLONLARI]
+
+
+def _tarih_metinleri(dakika, bitis, gun, tr_orani, rng):
+    """ISO ve (tr_orani kadar) TR formatlı ('15.12.2025 18:30' / '15/12/2025 18:30') tarih metinleri."""
+    tarih = (np.datetime64(bitis, 'm') - np.timedelta64(gun * 24 * 60, 'm')) + dakika.astype('timedelta64[m]')
+    iso = pd.Series(np.char.replace(np.datetime_as_string(tarih, unit='m'), 'T', ' '), dtype=object)
+    tr = rng.random(len(iso)) < tr_orani
+    if tr.any():
+        s = iso[tr].str
+        ayirici = np.where(rng.random(int(tr.sum())) < 0.5, '.', '/')
+        iso[tr] = s[8:10] + ayirici + s[5:7] + ayirici + s[0:4] + ' ' + s[11:16]
+    return iso.to_numpy()
+
+
+def veri_uret(veri_dizini, olay_sayisi, tohum=0, tr_orani=0.05, gun=90, bitis=None, personel=20):
+    """veri_dizini'ne kargolar_ana.csv, kargo_loglari.csv ve kullanicilar.csv yazar.
+
+    olay_sayisi yaklaşık log satırı sayısıdır (10 bin .. 10 milyon). Aynı tohum aynı veriyi üretir.
+    Üretilen kargo ve olay sayısını döndürür.
+    """
+    rng = np.random.default_rng(tohum)
+    bitis = pd.Timestamp(bitis or '2026-01-01 00:00')
+    os.makedirs(veri_dizini, exist_ok=True)
+    kargo_sayisi = max(1, int(round(olay_sayisi / ORTALAMA_OLAY)))
+
+    kargo, dakika, konum, durum = _olaylari_uret(kargo_sayisi, gun, rng)
+    takip_nolari = (TAKIP_NO_TABANI + rng.permutation(kargo_sayisi * 10)[:kargo_sayisi]).astype(str).astype(object)
+    konum_adlari = _konum_adlari()
+
+    # Loglar parça parça yazılır (10 milyon satırlık metin tablosu belleğe alınmaz)
+    log_yolu = os.path.join(veri_dizini, LOGLAR_DOSYASI)
+    for bas in range(0, max(len(kargo), 1), YAZMA_PARCASI):
+        dilim = slice(bas, bas + YAZMA_PARCASI)
+        pd.DataFrame({
+            'takip_no': takip_nolari[kargo[dilim]],
+            'tarih': _tarih_metinleri(dakika[dilim], bitis, gun, tr_orani, rng),
+            'konum': konum_adlari[konum[dilim]],
+            'durum': DURUM_ADLARI[durum[dilim]],
+        })[LOG_KOLONLARI].to_csv(log_yolu, index=False, mode='w' if bas == 0 else 'a', header=bas == 0)
+
+    # Ana tablo: her kargonun son durumu; hiç olayı olmayanlar (henüz kabul edilmemiş) yazılmaz
+    son = np.full(kargo_sayisi, -1)
+    son[kargo] = durum
+    var = son >= 0
+    bireysel = rng.random(kargo_sayisi) < 0.7
+    gonderici = np.where(
+        bireysel,
+        np.array(ADLAR, dtype=object)[rng.integers(0, len(ADLAR), kargo_sayisi)] + " "
+        + np.array(SOYADLAR, dtype=object)[rng.integers(0, len(SOYADLAR), kargo_sayisi)],
+        np.array(SIRKETLER, dtype=object)[rng.integers(0, len(SIRKETLER), kargo_sayisi)]
+    )
+    alici = (np.array(ADLAR, dtype=object)[rng.integers(0, len(ADLAR), kargo_sayisi)] + " "
+             + np.array(SOYADLAR, dtype=object)[rng.integers(0, len(SOYADLAR), kargo_sayisi)])
+    pd.DataFrame({
+        'takip_no': takip_nolari[var],
+        'gonderici_ad': gonderici[var],
+        'alici_ad': alici[var],
+        'mevcut_durum': DURUM_ADLARI[son[var]],
+    })[ANA_KOLONLARI].to_csv(os.path.join(veri_dizini, KARGOLAR_ANA_DOSYASI), index=False)
+
+    kullanicilar = pd.DataFrame(VARSAYILAN_KULLANICILAR)
+    ek = pd.DataFrame({
+        'kullanici_adi': [f"personel{i:03d}" for i in range(personel)],
+        'sifre': [f"{rng.integers(1000, 10000)}" for _ in range(personel)],
+        'rol': 'Personel',
+    })
+    pd.concat([kullanicilar, ek], ignore_index=True)[KULLANICI_KOLONLARI].to_csv(
+        os.path.join(veri_dizini, KULLANICILAR_DOSYASI), index=False
+    )
+    return {'kargo': int(var.sum()), 'olay': int(len(kargo))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik kargo/log verisi üretir")
+    parser.add_argument("veri_dizini")
+    parser.add_argument("--olay", type=int, default=100_000, help="Yaklaşık log satırı sayısı")
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--tr-orani", type=float, default=0.05, help="TR formatlı tarih oranı")
+    parser.add_argument("--gun", type=int, default=90, help="Verinin yayıldığı gün sayısı")
+    parser.add_argument("--bitis", default=None, help="Son olay anı üst sınırı (varsayılan 2026-01-01)")
+    args = parser.parse_args(argv)
+    ozet = veri_uret(args.veri_dizini, args.olay, args.tohum, args.tr_orani, args.gun, args.bitis)
+    print(f"{ozet['kargo']} kargo, {ozet['olay']} olay yazıldı: {args.veri_dizini}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
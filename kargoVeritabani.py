@@ -0,0 +1,501 @@
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+import pandas as pd
+
+from kargoDepolama import DepolamaMotoru, LOG_KOLONLARI, tarihleri_coz
+from kargoTarih import tarih_metni, tarih_hata_tablosu
+from kargoOnbellek import LRUOnbellek
+from kargoEta import EtaModeli, TESLIM_DURUMU
+from kargoPano import OperasyonPanosu, TAKILI_KARGO_SAATI
+from kargoArama import KargoAramaIndeksi, ARAMA_SONUC_SINIRI
+from kargoOlcum import olcum
+from kargoDogrulama import (
+    DOGRULAMA_VARSAYILAN, KARANTINA_DOSYASI, YUKLEME_KARANTINA_DOSYASI, KARANTINA_KOLONLARI,
+    olay_nedeni, ayir, karantina_tablosu, karantinaya_ekle, karantina_yaz
+)
+
+# Ortam değişkeniyle depolama motoru seçilebilir (csv / sqlite / ikili)
+VARSAYILAN_MOTOR = os.environ.get("KARGO_DEPOLAMA", "csv")
+
+# Toplu içe aktarımda tarayıcı dosyası bu kadar satırlık parçalar halinde okunur
+IMPORT_PARCA_BOYUTU = 200000
+TARAMA_KOLONLARI = ['takip_no', 'konum', 'durum', 'tarih']
+# Hazırlanmış takip sonuçlarının (durum, ETA, geçmiş satırları) önbellek kapasitesi
+ONBELLEK_BOYUTU = int(os.environ.get("KARGO_ONBELLEK_BOYUTU", "10000"))
+_HESAPLANMADI = object()
+# Yapıştırılan listelerde takip numaralarını ayıran karakterler
+TAKIP_NO_AYIRICI = re.compile(r'[\s,;]+')
+# Bundan fazla kargonun teslim edildiği toplu eklemelerde ETA modeli kargo bazında
+# güncellenmez, ilk kullanımda tüm log üzerinden yeniden kurulur
+ETA_TOPLU_ESIGI = 1000
+
+
+def motor_olustur(ad=None, veri_dizini=None):
+    """Adı verilen depolama motorunu oluşturur."""
+    ad = (ad or VARSAYILAN_MOTOR).lower()
+    if ad == 'csv':
+        from kargoCsvDepo import CsvDepolamaMotoru
+        return CsvDepolamaMotoru(veri_dizini)
+    if ad == 'sqlite':
+        from kargoSqliteDepo import SqliteDepolamaMotoru
+        return SqliteDepolamaMotoru(veri_dizini)
+    if ad == 'ikili':
+        from kargoIkiliDepo import IkiliDepolamaMotoru
+        return IkiliDepolamaMotoru(veri_dizini)
+    raise ValueError(f"Bilinmeyen depolama motoru: {ad}")
+
+
+# --- 1. Veritabanı Sınıfı (3 Tabloyu Depolama Motoru Üzerinden Yönetir) ---
+class CargoDatabase:
+    def __init__(self, motor=None, veri_dizini=None, yukle=True, onbellek_boyutu=ONBELLEK_BOYUTU):
+        if not isinstance(motor, DepolamaMotoru):
+            motor = motor_olustur(motor, veri_dizini)
+        self.motor = motor
+        # Arayüz, yükleme/yazma/sorguları arka plan iş parçacıklarında çalıştırır;
+        # motorlara aynı anda tek bir çağrı girer
+        self._kilit = threading.RLock()
+        # takip_no -> takip_sonucu(); sadece log eklenen kargonun kaydı geçersiz kılınır
+        self._sonuc_onbellegi = LRUOnbellek(onbellek_boyutu)
+        # Geçmiş loglardan öğrenilen teslim süresi modeli; ilk kullanımda kurulur
+        self.eta_modeli = EtaModeli()
+        self._eta_guncel = False
+        # Yönetici panosunun toplamları; ilk kullanımda kurulur, sonra olay başına güncellenir
+        self.pano = OperasyonPanosu()
+        self._pano_guncel = False
+        # Yazarken arama için takip_no / ad önek indeksi; ilk aramada kurulur, yeni kargolar eklenir
+        self.arama = KargoAramaIndeksi()
+        self._arama_guncel = False
+        # Toplu eklemelerde tarihi çözülemediği için alınmayan olaylar (bkz. tarih_hatalari)
+        self._ekleme_tarih_hatalari = []
+        # Giren olayların doğrulaması (bkz. kargoDogrulama); reddedilenler karantina dosyasına yazılır
+        self.dogrulama = DOGRULAMA_VARSAYILAN
+        self._ekleme_karantinasi = []
+        # Yüklenen logların doğrulama raporu; ilk istendiğinde hazırlanır
+        self._yukleme_karantinasi = None
+
+        # yukle=False ise load_data çağıran taraf (ör. arka plan işçisi) tarafından yapılır
+        if yukle:
+            self.load_data()
+
+    # Tablolar motorun sahip olduğu DataFrame'lerdir
+    @property
+    def kargo_df(self):
+        with self._kilit:
+            return self.motor.kargo_df
+
+    @property
+    def kullanicilar_df(self):
+        with self._kilit:
+            return self.motor.kullanicilar_df
+
+    @property
+    def kargolar_ana_df(self):
+        with self._kilit:
+            return self.motor.kargolar_ana_df
+
+    @olcum.olc('load_data')
+    def load_data(self, ilerleme=None):
+        """Depolama motorundaki üç tabloyu yükler (ilerleme: aşama metni alan geri çağırım)."""
+        with self._kilit:
+            self.motor.load_data(ilerleme)
+            self._sonuc_onbellegi.temizle()
+            self._eta_guncel = False
+            self._pano_guncel = False
+            self._arama_guncel = False
+            self._yukleme_karantinasi = None
+
+    @olcum.olc('yeni_loglari_yukle')
+    def yeni_loglari_yukle(self):
+        """Başka süreçlerin eklediği logları tablolara işler; etkilenen takip numaralarını döndürür.
+
+        Motor artımlı okuyamıyorsa (dosya sıkıştırıldı, yeniden yazıldı vb.) tam yükleme
+        yapılır ve None döner.
+        """
+        with self._kilit:
+            loglar = self.motor.yeni_loglari_oku()
+            if loglar is None:
+                self.load_data()
+                return None
+            if loglar.empty:
+                return set()
+            etkilenenler = set(loglar['takip_no'].unique())
+            self._sonuc_onbellegi.toplu_sil(etkilenenler)
+            self._eta_teslimatlarini_ekle(loglar)
+            if self._pano_guncel:
+                self.pano.olaylari_ekle(loglar)
+            self._yeni_kargolari_indeksle(etkilenenler)
+            return etkilenenler
+
+    @olcum.olc('get_user_credentials')
+    def get_user_credentials(self, user, password):
+        """Kullanıcıyı ve rolünü doğrular."""
+        with self._kilit:
+            return self.motor.get_user_credentials(user, password)
+
+    @olcum.olc('get_logs')
+    def get_logs(self, takip_no):
+        """Belirli bir takip numarasına ait logları çeker."""
+        with self._kilit:
+            return self.motor.get_logs(takip_no)
+
+    @olcum.olc('get_logs_many')
+    def get_logs_many(self, takip_nolar):
+        """Birçok takip numarasının loglarını tek geçişte çeker (LOG_KOLONLARI DataFrame'i)."""
+        nolar = [str(takip_no).strip() for takip_no in takip_nolar]
+        with self._kilit:
+            return self.motor.get_logs_many([takip_no for takip_no in nolar if takip_no])
+
+    @olcum.olc('get_status_many')
+    def get_status_many(self, takip_nolar, loglar=None):
+        """Her takip numarası için tek satır: son durum, ETA ve olay sayısı.
+
+        loglar, aynı numaralar için get_logs_many sonucu verilirse tekrar çekilmez.
+        Kolonlar: takip_no, bulundu, mevcut_durum, konum, son_tarih, olay_sayisi,
+        tahmini_teslim, alt, ust, kaynak.
+        """
+        nolar = list(dict.fromkeys(str(takip_no).strip() for takip_no in takip_nolar))
+        nolar = [takip_no for takip_no in nolar if takip_no]
+        if loglar is None:
+            loglar = self.get_logs_many(nolar)
+        # get_logs_many kargo içinde tarih sıralıdır: her kargonun son satırı son durumudur
+        son = loglar.drop_duplicates(subset='takip_no', keep='last')
+        with self._kilit:
+            self._eta_hazirla()
+            puanlar = self.eta_modeli.puanla(son)
+        puanlar['olay_sayisi'] = loglar.groupby('takip_no', sort=False).size().reindex(
+            puanlar['takip_no']).to_numpy()
+        sonuc = pd.DataFrame({'takip_no': pd.Series(nolar, dtype=object)}).merge(
+            puanlar.astype({'takip_no': object}), on='takip_no', how='left'
+        ).rename(columns={'durum': 'mevcut_durum'})
+        sonuc['bulundu'] = sonuc['mevcut_durum'].notna()
+        sonuc['olay_sayisi'] = sonuc['olay_sayisi'].fillna(0).astype('int64')
+        return sonuc[['takip_no', 'bulundu', 'mevcut_durum', 'konum', 'son_tarih', 'olay_sayisi',
+                      'tahmini_teslim', 'alt', 'ust', 'kaynak']]
+
+    @staticmethod
+    def takip_no_listesi_coz(metin):
+        """Yapıştırılmış metin ya da dosya içeriğinden takip numaralarını sırayla çıkarır.
+
+        Boşluk, virgül, noktalı virgül ve satır sonu ayırıcıdır; 'takip_no' başlığı atlanır.
+        """
+        return [parca for parca in TAKIP_NO_AYIRICI.split(metin) if parca and parca != 'takip_no']
+
+    @olcum.olc('add_log')
+    def add_log(self, takip_no, konum, durum):
+        """Operasyon personeli log ekleme."""
+        # Dakikaya kesilir (TARIH_FORMATI): tüm motorlar yeniden yüklemeden önce ve sonra aynı tarihi döndürür
+        tarih = pd.Timestamp(datetime.now()).floor('min')
+        with self._kilit:
+            if self.dogrulama:
+                self._olayi_dogrula(takip_no, tarih, konum, durum)
+            self._sonuc_onbellegi.sil(takip_no)
+            sonuc = self.motor.add_log(takip_no, tarih, konum, durum)
+            if self._pano_guncel:
+                self.pano.olay_ekle(takip_no, tarih, konum, durum)
+            self._yeni_kargolari_indeksle([takip_no])
+            # Teslimat, kargonun önceki olaylarını ETA modeline yeni örnek olarak ekler
+            if durum == TESLIM_DURUMU and self._eta_guncel:
+                self.eta_modeli.teslimat_ekle(self.motor.get_logs(takip_no), 1)
+            return sonuc
+
+    @olcum.olc('add_logs_bulk')
+    def add_logs_bulk(self, olaylar, kaynak='toplu ekleme', satir_kaymasi=None):
+        """Toplu tarama olaylarını ekler (DataFrame ya da (takip_no, konum, durum, tarih) demetleri).
+
+        Tüm grup vektörel işlenir ve depolamaya tek seferde yazılır; eklenen olay sayısını döndürür.
+        Tarihi dolu ama çözülemeyen olaylar eklenmez, kaynak adıyla tarih_hatalari'na yazılır.
+        Doğrulamadan geçemeyen olaylar da eklenmez, karantina dosyasına yazılır.
+        """
+        hatalar = []
+        loglar = self._olaylari_hazirla(olaylar, hatalar)
+        with self._kilit:
+            if hatalar:
+                self._ekleme_tarih_hatalari.append(tarih_hata_tablosu(kaynak, hatalar, satir_kaymasi))
+            if self.dogrulama and not loglar.empty:
+                loglar, reddedilen = ayir(loglar, self.motor.get_logs_many(loglar['takip_no'].unique()))
+                self._karantinaya_al(karantina_tablosu(reddedilen, kaynak, satir_kaymasi))
+            self._sonuc_onbellegi.toplu_sil(loglar['takip_no'].unique())
+            self.motor.add_logs_bulk(loglar)
+            self._eta_teslimatlarini_ekle(loglar)
+            if self._pano_guncel:
+                self.pano.olaylari_ekle(loglar)
+            self._yeni_kargolari_indeksle(loglar['takip_no'].unique())
+        return len(loglar)
+
+    def _olayi_dogrula(self, takip_no, tarih, konum, durum):
+        """Tek olayı kargonun son tarihli loguna göre doğrular; geçersizse karantinaya alıp ValueError fırlatır."""
+        loglar = [log for log in self.motor.get_logs(takip_no) or [] if not pd.isna(log['tarih'])]
+        neden = olay_nedeni(takip_no, tarih, konum, durum, loglar[-1] if loglar else None)
+        if neden is None:
+            return
+        olay = pd.DataFrame([(takip_no, tarih, konum, durum)], columns=LOG_KOLONLARI)
+        self._karantinaya_al(karantina_tablosu(olay.assign(neden=neden), 'add_log'))
+        raise ValueError(f"Kargo {takip_no} kaydedilmedi ({neden}).")
+
+    def _karantinaya_al(self, tablo):
+        if tablo.empty:
+            return
+        self._ekleme_karantinasi.append(tablo)
+        karantinaya_ekle(self.motor.dosya_yolu(KARANTINA_DOSYASI), tablo)
+
+    def dogrulama_hatalari(self):
+        """Doğrulamadan geçemeyen olaylar (KARANTINA_KOLONLARI): yüklenen loglar ve bu oturumdaki eklemeler.
+
+        Yüklenen loglar tabloda kalır, sadece raporlanır (YUKLEME_KARANTINA_DOSYASI); eklemelerde
+        reddedilenler kaydedilmez, KARANTINA_DOSYASI'na eklenir.
+        """
+        with self._kilit:
+            if self.dogrulama and self._yukleme_karantinasi is None:
+                self._yuklemeyi_dogrula()
+            parcalar = [tablo for tablo in [self._yukleme_karantinasi] + self._ekleme_karantinasi
+                        if tablo is not None and len(tablo)]
+        return pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame(columns=KARANTINA_KOLONLARI)
+
+    @olcum.olc('yuklemeyi_dogrula')
+    def _yuklemeyi_dogrula(self):
+        kargo_df = self.motor.kargo_df
+        loglar = kargo_df[LOG_KOLONLARI].assign(takip_no=self.motor.takip_no_metinleri(kargo_df['takip_no']))
+        _, reddedilen = ayir(loglar)
+        self._yukleme_karantinasi = karantina_tablosu(reddedilen, 'yükleme')
+        karantina_yaz(self.motor.dosya_yolu(YUKLEME_KARANTINA_DOSYASI), self._yukleme_karantinasi)
+
+    def _eta_teslimatlarini_ekle(self, loglar):
+        """Toplu eklemedeki teslimatları ETA modeline işler (çok sayıdaysa modeli bayat işaretler)."""
+        if not self._eta_guncel:
+            return
+        teslimler = loglar[(loglar['durum'] == TESLIM_DURUMU).to_numpy(dtype=bool)]
+        if teslimler.empty:
+            return
+        if teslimler['takip_no'].nunique() > ETA_TOPLU_ESIGI:
+            self._eta_guncel = False
+            return
+        for takip_no, grup in teslimler.groupby('takip_no', sort=False):
+            self.eta_modeli.teslimat_ekle(self.motor.get_logs(takip_no), len(grup))
+
+    @olcum.olc('tarayici_dosyasi_aktar')
+    def tarayici_dosyasi_aktar(self, yol, parca_boyutu=IMPORT_PARCA_BOYUTU, ilerleme=None):
+        """Tarayıcı döküm CSV'sini parça parça add_logs_bulk'tan geçirir; aktarılan olay sayısını döndürür."""
+        toplam = 0
+        for parca in pd.read_csv(yol, dtype=str, chunksize=parca_boyutu):
+            eksik = {'takip_no', 'konum', 'durum'} - set(parca.columns)
+            if eksik:
+                raise ValueError(f"Tarayıcı dosyasında eksik kolon(lar): {', '.join(sorted(eksik))}")
+            # read_csv parçalarının indeksi dosya boyunca devam eder; +2 başlık satırı içindir
+            toplam += self.add_logs_bulk(parca, os.path.basename(yol), 2)
+            if ilerleme is not None:
+                ilerleme(toplam)
+        return toplam
+
+    @staticmethod
+    def _olaylari_hazirla(olaylar, hatalar=None):
+        """Olayları LOG_KOLONLARI biçiminde, tarihleri çözülmüş bir DataFrame'e çevirir.
+
+        Tarihi çözülemeyen olaylar atılır (hatalar listesine eklenir).
+        """
+        if isinstance(olaylar, pd.DataFrame):
+            df = olaylar.copy()
+        else:
+            df = pd.DataFrame(list(olaylar), columns=TARAMA_KOLONLARI)
+        if 'tarih' not in df.columns:
+            df['tarih'] = pd.NaT
+
+        df['takip_no'] = df['takip_no'].astype(str).str.strip()
+        if not pd.api.types.is_datetime64_any_dtype(df['tarih']):
+            cozulemeyen = []
+            df['tarih'] = tarihleri_coz(df['tarih'], cozulemeyen)
+            if cozulemeyen:
+                # Bozuk tarih tarama anı sayılırsa olay yanlış sıraya girer; bu olaylar eklenmez
+                df = df[~df.index.isin(cozulemeyen[0]['satir'])].copy()
+                if hatalar is not None:
+                    hatalar.extend(cozulemeyen)
+        # Tarihi olmayan olaylar tarama anına yazılır
+        df['tarih'] = df['tarih'].fillna(pd.Timestamp(datetime.now()))
+        return df[LOG_KOLONLARI]
+
+    @olcum.olc('takip_sonucu')
+    def takip_sonucu(self, takip_no):
+        """get_logs + calculate_eta sonucunu JSON'a hazır bir sözlük olarak döndürür; kargo yoksa None.
+
+        Sonuçlar LRU önbellekte tutulur; dönen sözlük paylaşılır, değiştirilmemelidir.
+        """
+        # Hesaplama ile önbelleğe yazma arasında gelen bir add_log eski sonucu yazdırmasın diye kilit altında
+        with self._kilit:
+            sonuc = self._sonuc_onbellegi.al(takip_no, _HESAPLANMADI)
+            if sonuc is _HESAPLANMADI:
+                sonuc = self._takip_sonucunu_hazirla(takip_no)
+                self._sonuc_onbellegi.koy(takip_no, sonuc)
+            return sonuc
+
+    def tarih_hatalari(self):
+        """Yüklenen dosyalarda ve toplu eklemelerde çözülemeyen tarihler (kaynak, satir, deger)."""
+        with self._kilit:
+            parcalar = [self.motor.tarih_hatalari()] + self._ekleme_tarih_hatalari
+        dolu = [df for df in parcalar if len(df)]
+        return pd.concat(dolu, ignore_index=True) if dolu else parcalar[0]
+
+    def onbellek_istatistigi(self):
+        """Takip sonucu önbelleğinin boyut ve isabet/ıskalama/tahliye sayaçları."""
+        return self._sonuc_onbellegi.istatistik()
+
+    def _takip_sonucunu_hazirla(self, takip_no):
+        loglar = self.get_logs(takip_no)
+        if not loglar:
+            return None
+        son_log = loglar[-1]
+        return {
+            'takip_no': takip_no,
+            'mevcut_durum': son_log['durum'],
+            'konum': son_log['konum'],
+            'tahmini_teslim': self.calculate_eta(loglar),
+            'tahmin_araligi': self._tahmin_araligi(loglar),
+            'loglar': [
+                {
+                    # Aynı dakikanın metni tüm sorgularda bir kez biçimlenir (kargoTarih.dakika_metni)
+                    'tarih': tarih_metni(log['tarih']),
+                    'konum': log['konum'],
+                    'durum': log['durum'],
+                }
+                for log in loglar
+            ],
+        }
+
+    def _tahmin_araligi(self, loglar):
+        tahmin = self.eta_tahmini(loglar)
+        if tahmin is None:
+            return None
+        return {
+            'alt': tahmin['alt'].strftime('%d/%m/%Y %H:%M'),
+            'ust': tahmin['ust'].strftime('%d/%m/%Y %H:%M'),
+            'ornek': tahmin['ornek'],
+        }
+
+    def indeks_bilgisi(self):
+        """Takip indeksindeki kargo sayısı ve bellek kullanımı (bayt)."""
+        with self._kilit:
+            return self.motor.indeks_bilgisi()
+
+    def _eta_hazirla(self):
+        with self._kilit:
+            if not self._eta_guncel:
+                self.eta_modeli.olustur(self.motor.kargo_df)
+                self._eta_guncel = True
+
+    def eta_tahmini(self, loglar):
+        """Son olayın (konum, durum) geçmişine göre tahmin ve güven bandı; teslim edilmişse veya veri yoksa None."""
+        if not loglar or loglar[-1]['durum'] == TESLIM_DURUMU:
+            return None
+        son_log = loglar[-1]
+        son_log_dt = son_log['tarih']
+        if isinstance(son_log_dt, str):
+            son_log_dt = datetime.strptime(son_log_dt, '%Y-%m-%d %H:%M')
+        if pd.isna(son_log_dt):
+            return None
+        with self._kilit:
+            self._eta_hazirla()
+            return self.eta_modeli.tahmin(son_log['konum'], son_log['durum'], pd.Timestamp(son_log_dt))
+
+    @olcum.olc('calculate_eta')
+    def calculate_eta(self, loglar):
+        """Tahmini teslim tarihi hesaplama (F-006): geçmiş teslim sürelerinin medyanı."""
+        if not loglar:
+             return "-"
+        son_log_dt = loglar[-1]['tarih']
+        if isinstance(son_log_dt, str):
+            son_log_dt = datetime.strptime(son_log_dt, '%Y-%m-%d %H:%M')
+        if pd.isna(son_log_dt):
+            # Tarihi çözülemeyen son olaydan tahmin yapılamaz
+            return "-"
+
+        # Teslim edilmiş kargoda tahmin yerine teslim anı gösterilir
+        if loglar[-1]['durum'] == TESLIM_DURUMU:
+            return son_log_dt.strftime('%d/%m/%Y %H:%M')
+
+        tahmin = self.eta_tahmini(loglar)
+        if tahmin is None:
+            # Henüz hiç teslim edilmiş kargo yoksa eski sabit kural
+            tahmini_teslim = son_log_dt + timedelta(days=1)
+        else:
+            tahmini_teslim = tahmin['tahmini']
+        return tahmini_teslim.strftime('%d/%m/%Y %H:%M')
+
+    def _pano_hazirla(self):
+        with self._kilit:
+            if not self._pano_guncel:
+                self.pano.olustur(self.motor.kargo_df, self.motor.kargolar_ana_df, self.motor.takip_no_metinleri)
+                self._pano_guncel = True
+
+    @olcum.olc('pano_ozeti')
+    def pano_ozeti(self, esik_saat=TAKILI_KARGO_SAATI, simdi=None):
+        """Yönetici panosu: durum sayıları, konum başına saatlik taramalar ve takılı kargolar.
+
+        Toplamlar artımlı tutulduğundan tablo taranmaz (ilk çağrı hariç); bkz. kargoPano.
+        """
+        with self._kilit:
+            self._pano_hazirla()
+            return self.pano.ozet(esik_saat, simdi)
+
+    def log_parcalari(self, baslangic=None, bitis=None, parca_boyutu=100000):
+        """Motorun log dilimleri (bkz. DepolamaMotoru.log_parcalari); kilit sadece her dilim üretilirken
+        tutulur, uzun bir dışa aktarım sırasında eklemeler beklemez."""
+        parcalar = self.motor.log_parcalari(baslangic, bitis, parca_boyutu)
+        while True:
+            with self._kilit:
+                parca = next(parcalar, None)
+            if parca is None:
+                return
+            yield parca
+
+    def ana_kayitlari(self, takip_nolar):
+        """Verilen kargoların ana tablo satırları (ANA_KOLONLARI)."""
+        with self._kilit:
+            return self.motor.ana_kayitlari(takip_nolar)
+
+    def _arama_hazirla(self):
+        with self._kilit:
+            if not self._arama_guncel:
+                self.arama.olustur(self.motor.kargolar_ana_df)
+                self._arama_guncel = True
+
+    def _yeni_kargolari_indeksle(self, takip_nolar):
+        """Eklemeyle ana tabloda oluşan kargoları arama indeksine ekler (indeks kurulmadıysa bir şey yapmaz)."""
+        if not self._arama_guncel:
+            return
+        yeniler = [takip_no for takip_no in takip_nolar if not self.arama.iceriyor(takip_no)]
+        if yeniler:
+            self.arama.ekle(self.motor.ana_kayitlari(yeniler))
+
+    @olcum.olc('kargo_ara')
+    def kargo_ara(self, metin, limit=ARAMA_SONUC_SINIRI):
+        """Takip numarası ya da gönderici/alıcı adı önekiyle arama: (ana tablo satırları, toplam eşleşme).
+
+        Türkçe harfler katlanır ("sahin" Şahin'i bulur); birden çok kelime birlikte eşleşmelidir.
+        En fazla limit satır döner; bkz. kargoArama.
+        """
+        with self._kilit:
+            self._arama_hazirla()
+            toplam, nolar = self.arama.ara(metin, limit)
+            return self.motor.ana_kayitlari(nolar), toplam
+
+    @olcum.olc('acik_kargo_tahminleri')
+    def acik_kargo_tahminleri(self, takip_nolar=None):
+        """Teslim edilmemiş kargoların tahmini teslim anları (yönetici paneli için tek geçişte).
+
+        takip_nolar verilirse tablo taranmaz; sadece bu kargoların logları çekilip puanlanır
+        (harici eklemelerden sonra paneldeki satırları yenilemek için).
+        """
+        if takip_nolar is not None:
+            loglar = self.get_logs_many(takip_nolar)
+            with self._kilit:
+                self._eta_hazirla()
+                return self.eta_modeli.acik_kargolari_puanla(loglar)
+        with self._kilit:
+            self._eta_hazirla()
+            tahminler = self.eta_modeli.acik_kargolari_puanla(self.motor.kargo_df)
+            tahminler['takip_no'] = self.motor.takip_no_metinleri(tahminler['takip_no'])
+        return tahminler
+
+    def kapat(self):
+        with self._kilit:
+            self.motor.kapat()
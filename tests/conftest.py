@@ -0,0 +1,23 @@
+import os
+import sys
+import shutil
+
+import pytest
+
+# Modüller depo kökündedir (paket değildir)
+KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK_DIZIN)
+
+
+@pytest.fixture
+def veri_dizini(tmp_path):
+    """Depodaki data/ dosyalarının geçici kopyası (testler gerçek veriye yazmaz).
+
+    Uygulamanın yerel çalıştırmalarda ürettiği dosyalar (anlık görüntü, SQLite, ikili depo) kopyalanmaz.
+    """
+    hedef = tmp_path / "data"
+    shutil.copytree(
+        os.path.join(KOK_DIZIN, "data"), hedef,
+        ignore=shutil.ignore_patterns("*.snap", "kargo.db*", "ikili", ".kargo_*", "*.prom", "karantina*.csv")
+    )
+    return str(hedef)
@@ -0,0 +1,59 @@
+import os
+import pickle
+
+import pandas as pd
+import pytest
+
+from kargoDepolama import LOGLAR_DOSYASI
+from kargoCsvDepo import CsvDepolamaMotoru, ANLIK_GORUNTU_UZANTISI, ANLIK_GORUNTU_SIHRI
+
+
+def _yukle(veri_dizini, kompakt):
+    motor = CsvDepolamaMotoru(veri_dizini, kompakt=kompakt)
+    motor.load_data()
+    return motor
+
+
+@pytest.mark.parametrize('kompakt', [False, True])
+def test_goruntuden_yukleme_csv_ile_ayni(veri_dizini, kompakt):
+    with open(os.path.join(veri_dizini, LOGLAR_DOSYASI), 'a', encoding='utf-8') as f:
+        f.write("1234567890,bozuk tarih,Ankara Şube,Teslim Edildi\n")
+    csvden = _yukle(veri_dizini, kompakt)
+    assert os.path.exists(os.path.join(veri_dizini, LOGLAR_DOSYASI + ANLIK_GORUNTU_UZANTISI))
+    goruntuden = _yukle(veri_dizini, kompakt)
+    pd.testing.assert_frame_equal(goruntuden.kargo_df, csvden.kargo_df)
+    pd.testing.assert_frame_equal(goruntuden.kargolar_ana_df, csvden.kargolar_ana_df)
+    pd.testing.assert_frame_equal(goruntuden.kullanicilar_df, csvden.kullanicilar_df)
+    pd.testing.assert_frame_equal(goruntuden.tarih_hatalari(), csvden.tarih_hatalari())
+    assert goruntuden.get_logs('abc') == csvden.get_logs('abc')
+
+
+def test_degisen_csv_goruntuyu_gecersiz_kilar(veri_dizini):
+    _yukle(veri_dizini, False)
+    with open(os.path.join(veri_dizini, LOGLAR_DOSYASI), 'a', encoding='utf-8') as f:
+        f.write("5550001112,2025-12-17 09:00,İzmir Depo,Kabul Edildi\n")
+    motor = _yukle(veri_dizini, False)
+    assert [log['durum'] for log in motor.get_logs('5550001112')] == ['Kabul Edildi']
+
+
+class _Yukleyici:
+    """Unpickle edilirse işaret dosyası oluşturan nesne."""
+
+    def __init__(self, yol):
+        self.yol = yol
+
+    def __reduce__(self):
+        return (open, (self.yol, 'w'))
+
+
+def test_pickle_goruntu_yuklenmez(veri_dizini, tmp_path):
+    yol = os.path.join(veri_dizini, LOGLAR_DOSYASI)
+    isaret = str(tmp_path / "calisti")
+    with open(yol + ANLIK_GORUNTU_UZANTISI, 'wb') as f:
+        pickle.dump(_Yukleyici(isaret), f)
+    motor = _yukle(veri_dizini, False)
+    assert not os.path.exists(isaret)
+    assert len(motor.kargo_df) == 9
+    # Yavaş yoldan okunan dosyanın görüntüsü yeni biçimde yeniden yazılır
+    with open(yol + ANLIK_GORUNTU_UZANTISI, 'rb') as f:
+        assert f.read(len(ANLIK_GORUNTU_SIHRI)) == ANLIK_GORUNTU_SIHRI
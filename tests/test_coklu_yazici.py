@@ -0,0 +1,40 @@
+import os
+
+from kargoDepolama import KARGOLAR_GUNLUK_DOSYASI
+from kargoCsvDepo import CsvDepolamaMotoru
+from kargoCokluYazici import stres_surecleri, stres_takip_no, STRES_KONUMU
+
+SUREC_SAYISI = 4
+OLAY_SAYISI = 60
+
+
+def _yukle(veri_dizini):
+    motor = CsvDepolamaMotoru(veri_dizini, anlik_goruntu=False, coklu_yazici=True)
+    motor.load_data()
+    return motor
+
+
+def test_eszamanli_yazicilar_olay_kaybetmez(veri_dizini):
+    stres_surecleri(veri_dizini, SUREC_SAYISI, OLAY_SAYISI)
+
+    # Günlük, ana dosyayla birleştirilip silinir
+    motor = _yukle(veri_dizini)
+    motor._ana_tabloyu_sikistir()
+    motor.kapat()
+    assert not os.path.exists(os.path.join(veri_dizini, KARGOLAR_GUNLUK_DOSYASI))
+
+    motor = _yukle(veri_dizini)
+    try:
+        loglar = motor.kargo_df
+        stres = loglar[loglar['konum'] == STRES_KONUMU]
+        assert len(stres) == SUREC_SAYISI * OLAY_SAYISI
+        assert len(loglar) == 9 + SUREC_SAYISI * OLAY_SAYISI
+        yazilan = set(motor.takip_no_metinleri(stres['takip_no']))
+        ana = motor.kargolar_ana_df
+        assert not ana['takip_no'].duplicated().any()
+        for surec_no in range(SUREC_SAYISI):
+            beklenen = {stres_takip_no(surec_no, i) for i in range(OLAY_SAYISI)}
+            assert beklenen <= yazilan
+            assert beklenen <= set(ana['takip_no'])
+    finally:
+        motor.kapat()
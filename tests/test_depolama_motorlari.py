@@ -0,0 +1,166 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from kargoDepolama import LOG_KOLONLARI, LOGLAR_DOSYASI
+from kargoCsvDepo import CsvDepolamaMotoru
+from kargoVeritabani import CargoDatabase
+
+# Tüm depolama motorları aynı testlerden geçer; 'csv-kompakt' CSV motorunun kompakt şemasıdır
+MOTORLAR = ['csv', 'csv-kompakt', 'sqlite', 'ikili']
+
+
+def _ac(motor_adi, veri_dizini):
+    if motor_adi == 'csv-kompakt':
+        return CargoDatabase(CsvDepolamaMotoru(veri_dizini, kompakt=True))
+    return CargoDatabase(motor_adi, veri_dizini)
+
+
+@pytest.fixture(params=MOTORLAR)
+def motor_adi(request):
+    return request.param
+
+
+@pytest.fixture
+def db(motor_adi, veri_dizini):
+    veritabani = _ac(motor_adi, veri_dizini)
+    yield veritabani
+    veritabani.kapat()
+
+
+def _yeniden_ac(db, motor_adi, veri_dizini):
+    db.kapat()
+    return _ac(motor_adi, veri_dizini)
+
+
+def test_load_data(db):
+    loglar = db.kargo_df
+    assert len(loglar) == 9
+    assert pd.api.types.is_datetime64_any_dtype(loglar['tarih'])
+    assert set(db.motor.takip_no_metinleri(loglar['takip_no'])) == {'1234567890', '9876543210', 'abc'}
+    assert set(db.kargolar_ana_df['takip_no']) == {'1234567890', '9876543210', '1112223334', 'abc'}
+    assert list(db.kullanicilar_df['kullanici_adi']) == ['lojisfk', 'yonetici']
+
+
+def test_get_logs_tarih_sirali(db):
+    loglar = db.get_logs('1234567890')
+    assert [log['durum'] for log in loglar] == [
+        'Kabul Edildi', 'Transfer Sürecinde', 'Merkeze Ulaştı', 'Dağıtıma Çıktı'
+    ]
+    tarihler = [log['tarih'] for log in loglar]
+    assert tarihler == sorted(tarihler)
+    assert tarihler[0] == pd.Timestamp('2025-12-14 10:30')
+    assert all(log['takip_no'] == '1234567890' for log in loglar)
+
+
+def test_get_logs_bulunamayan_numara(db):
+    assert db.get_logs('5550000000') is None
+
+
+def test_add_log_yeni_ve_mevcut_kargo(db, motor_adi, veri_dizini):
+    assert db.add_log('5550001112', 'Ankara Şube', 'Kabul Edildi')
+    assert db.add_log('1234567890', 'Ankara Şube', 'Teslim Edildi')
+    yeni, mevcut = db.get_logs('5550001112'), db.get_logs('1234567890')
+    assert [log['durum'] for log in yeni] == ['Kabul Edildi']
+    assert len(mevcut) == 5 and mevcut[-1]['durum'] == 'Teslim Edildi'
+    # Tarih dakikaya kesilir (TARIH_FORMATI); yeniden yüklemeden sonra da aynı değer döner
+    tarih = yeni[0]['tarih']
+    assert tarih == tarih.floor('min')
+    ana = db.ana_kayitlari(['5550001112', '1234567890'])
+    assert list(ana['mevcut_durum']) == ['Kabul Edildi', 'Teslim Edildi']
+
+    db = _yeniden_ac(db, motor_adi, veri_dizini)
+    try:
+        assert db.get_logs('5550001112') == yeni
+        assert db.get_logs('1234567890') == mevcut
+        ana = db.ana_kayitlari(['5550001112', '1234567890'])
+        assert list(ana['mevcut_durum']) == ['Kabul Edildi', 'Teslim Edildi']
+        assert len(db.kargo_df) == 11
+    finally:
+        db.kapat()
+
+
+def test_pano_ozeti(db):
+    pano = db.pano_ozeti(esik_saat=1, simdi=pd.Timestamp('2025-12-20 00:00'))
+    durumlar = dict(zip(pano['durumlar']['durum'], pano['durumlar']['kargo']))
+    assert sum(durumlar.values()) == 4
+    # Ana tablodaki 'abc' gibi kodlanamayan numaralar da metin olarak sayılır
+    assert set(pano['takililar']['takip_no']) >= {'1234567890', '9876543210', 'abc'}
+
+
+def test_get_user_credentials(db):
+    assert db.get_user_credentials('lojisfk', '1234') == 'Personel'
+    assert db.get_user_credentials('yonetici', '4321') == 'Yonetici'
+    assert db.get_user_credentials('yonetici', '1234') is None
+    assert db.get_user_credentials('yok', '') is None
+
+
+def test_get_logs_many(db):
+    loglar = db.get_logs_many(['abc', '5550000000', '1234567890', 'abc'])
+    assert list(loglar.columns) == LOG_KOLONLARI
+    # İstek sırası (tekrarlar bir kez), kargo içinde tarih sırası; bulunamayan numaranın satırı olmaz
+    assert list(loglar['takip_no']) == ['abc'] * 3 + ['1234567890'] * 4
+    for takip_no, grup in loglar.groupby('takip_no', sort=False):
+        beklenen = pd.DataFrame(db.get_logs(takip_no), columns=LOG_KOLONLARI)
+        pd.testing.assert_frame_equal(
+            grup.reset_index(drop=True).astype(object), beklenen.astype(object), check_dtype=False
+        )
+    assert db.get_logs_many([]).empty
+
+
+@pytest.mark.parametrize('motor_adi', ['sqlite', 'ikili'])
+def test_csv_aktarimi_bir_kez(motor_adi, veri_dizini):
+    db = CargoDatabase(motor_adi, veri_dizini)
+    if motor_adi == 'sqlite':
+        assert db.motor._meta_oku('csv_aktarimi') is not None
+    db.kapat()
+    # Aktarımdan sonra CSV'ye yazılan satır motorun verisine girmez
+    with open(os.path.join(veri_dizini, LOGLAR_DOSYASI), 'a', encoding='utf-8') as f:
+        f.write("5550003334,2025-12-17 09:00,İzmir Depo,Kabul Edildi\n")
+    db = CargoDatabase(motor_adi, veri_dizini)
+    try:
+        assert db.get_logs('5550003334') is None
+        assert len(db.kargo_df) == 9
+    finally:
+        db.kapat()
+
+
+def test_sqlite_bos_dizinde_aktarim_yok(tmp_path):
+    db = CargoDatabase('sqlite', str(tmp_path / "data"))
+    try:
+        assert db.motor._meta_oku('csv_aktarimi') == 'yok'
+        assert db.kargo_df.empty
+        assert db.get_user_credentials('lojisfk', '1234') == 'Personel'
+    finally:
+        db.kapat()
+
+
+def test_acik_kargo_tahminleri_secili_kargolar(db):
+    tum = db.acik_kargo_tahminleri()
+    secili = db.acik_kargo_tahminleri(['1234567890', '5550000000', '9876543210'])
+    # Bulunamayan numara satır üretmez; seçili satırlar tam tablodakilerle aynıdır
+    assert set(secili['takip_no']) == {'1234567890', '9876543210'}
+    beklenen = tum[tum['takip_no'].isin(secili['takip_no'])].sort_values('takip_no').reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        secili.sort_values('takip_no').reset_index(drop=True).astype(object), beklenen.astype(object)
+    )
+
+
+def test_kumeli_get_logs_many_siralamasiz_ayni_sonuc(veri_dizini):
+    motorlar = []
+    for kumeli in (False, True):
+        # Her motor kendi kopyasına yazar; diğerinin eklediği satırları okumaz
+        dizin = f"{veri_dizini}_{int(kumeli)}"
+        shutil.copytree(veri_dizini, dizin)
+        motorlar.append(CsvDepolamaMotoru(dizin, anlik_goruntu=False, kumeli=kumeli))
+    for motor in motorlar:
+        motor.load_data()
+        # Tampondaki, kargo geçmişinden daha eski tarihli satır da doğru yere girmeli
+        motor.add_log('1234567890', pd.Timestamp('2025-12-14 09:00'), 'Ankara Şube', 'Kabul Edildi')
+        motor.add_log('5550001112', pd.Timestamp('2025-12-17 09:00'), 'İzmir Depo', 'Kabul Edildi')
+    nolar = ['9876543210', '5550001112', 'abc', '5550000000', '1234567890']
+    duz, kumeli = (motor.get_logs_many(nolar) for motor in motorlar)
+    assert list(kumeli.drop_duplicates('takip_no')['takip_no']) == ['9876543210', '5550001112', 'abc', '1234567890']
+    pd.testing.assert_frame_equal(kumeli.astype(object), duz.astype(object))
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from kargoDepolama import LOG_KOLONLARI
+from kargoDogrulama import NEDEN_DURUM, NEDEN_GECIS, NEDEN_TAKIP_NO, ayir, bicim_nedeni, olay_nedeni
+from kargoVeriUretici import olay_tablosu
+
+
+def test_bicim_nedeni_gecmise_bakmaz():
+    assert bicim_nedeni('1234567890', 'Teslim Edildi') is None
+    assert bicim_nedeni('abc', 'Kabul Edildi') == NEDEN_TAKIP_NO
+    assert bicim_nedeni('1234567890', 'Teslim Edilid') == NEDEN_DURUM
+    # Geçiş kuralı geçmiş ister; biçim kontrolünden geçen olay olay_nedeni'nde reddedilebilir
+    tarih = pd.Timestamp('2025-12-17 09:00')
+    assert olay_nedeni('1234567890', tarih, 'Ankara Şube', 'Teslim Edildi').startswith(NEDEN_GECIS)
+
+
+def test_uretilen_olaylar_gecerli():
+    olaylar = olay_tablosu(2000, tohum=1)
+    assert list(olaylar.columns) == LOG_KOLONLARI
+    assert olaylar['tarih'].is_monotonic_increasing
+    gecerli, reddedilen = ayir(olaylar)
+    assert reddedilen.empty and len(gecerli) == len(olaylar)
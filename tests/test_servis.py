@@ -0,0 +1,96 @@
+import json
+import asyncio
+
+import pytest
+
+from kargoVeritabani import CargoDatabase
+from kargoServis import TakipServisi, yuk_testi
+
+
+async def _ham_istek(host, port, veri):
+    """Ham HTTP isteği gönderir; (durum, JSON yanıt) döndürür."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(veri)
+        await writer.drain()
+        baslik_blogu = await reader.readuntil(b"\r\n\r\n")
+        satirlar = baslik_blogu.decode("latin-1").split("\r\n")
+        uzunluk = next(int(satir.split(":", 1)[1]) for satir in satirlar if satir.lower().startswith("content-length:"))
+        govde = await reader.readexactly(uzunluk)
+        return int(satirlar[0].split(" ")[1]), json.loads(govde)
+    finally:
+        writer.close()
+
+
+def _post(govde, uzunluk=None):
+    uzunluk = len(govde) if uzunluk is None else uzunluk
+    return (f"POST /track HTTP/1.1\r\nHost: test\r\nContent-Length: {uzunluk}\r\n"
+            "Connection: close\r\n\r\n").encode("latin-1") + govde
+
+
+@pytest.fixture
+def servis_calistir(veri_dizini):
+    """Servisi data/ kopyası üzerinde 0 numaralı portta başlatıp senaryo(host, port) coroutine'ini çalıştırır."""
+    db = CargoDatabase('csv', veri_dizini)
+
+    def calistir(senaryo):
+        async def ana():
+            servis = TakipServisi(db)
+            host, port = await servis.baslat("127.0.0.1", 0)
+            try:
+                return await senaryo(host, port)
+            finally:
+                await servis.kapat()
+        return asyncio.run(ana())
+
+    yield calistir
+    db.kapat()
+
+
+def test_eszamanli_yuk_istemcisi(servis_calistir):
+    nolar = ['1234567890', '9876543210', '5550000000']
+    ozet = servis_calistir(lambda host, port: yuk_testi(host, port, nolar, istemci=8, istek=10))
+    # Her istemci numaraları sırayla dolaşır: 10 istekte 4 + 3 bulunan, 3 bulunamayan
+    assert ozet['istek'] == 80
+    assert ozet['durumlar'] == {200: 56, 404: 24}
+
+
+def test_yuk_testi_bos_liste_reddedilir(servis_calistir):
+    with pytest.raises(ValueError):
+        servis_calistir(lambda host, port: yuk_testi(host, port, []))
+
+
+def test_tek_sorgu(servis_calistir):
+    async def senaryo(host, port):
+        return (
+            await _ham_istek(host, port, b"GET /track/1234567890 HTTP/1.1\r\nConnection: close\r\n\r\n"),
+            await _ham_istek(host, port, b"GET /track/5550000000 HTTP/1.1\r\nConnection: close\r\n\r\n"),
+        )
+    (durum, sonuc), (bulunamadi, _) = servis_calistir(senaryo)
+    assert durum == 200
+    assert sonuc['mevcut_durum'] == 'Dağıtıma Çıktı'
+    assert [log['durum'] for log in sonuc['loglar']][0] == 'Kabul Edildi'
+    assert bulunamadi == 404
+
+
+def test_toplu_sorgu(servis_calistir):
+    govde = json.dumps({"takip_nolar": ["1234567890", "abc", "5550000000"]}).encode("utf-8")
+    durum, yanit = servis_calistir(lambda host, port: _ham_istek(host, port, _post(govde)))
+    assert durum == 200
+    sonuclar = yanit['sonuclar']
+    assert list(sonuclar) == ["1234567890", "abc", "5550000000"]
+    assert sonuclar["1234567890"]['mevcut_durum'] == 'Dağıtıma Çıktı'
+    assert sonuclar["5550000000"] is None
+
+
+@pytest.mark.parametrize('istek', [
+    _post(b"{bozuk"),
+    _post(b'{"baska": []}'),
+    _post(b"{}", uzunluk="abc"),
+    _post(b"{}", uzunluk=-5),
+    b"BOZUK\r\n\r\n",
+])
+def test_hatali_istek_400(servis_calistir, istek):
+    durum, yanit = servis_calistir(lambda host, port: _ham_istek(host, port, istek))
+    assert durum == 400
+    assert 'hata' in yanit